@@ -0,0 +1,124 @@
+"""
+Precomputed sprite animation clips for combat.
+
+A combat attack flips the attacker between its attack and normal images
+six times, and a hit flashes the defender. Instead of looking up (and
+possibly decoding and rescaling) an image on every flip, each combatant's
+frames are resolved once at fight start into display-ready PhotoImages.
+Playback then only swaps the image shown by a retained CanvasSprite.
+"""
+from collections import namedtuple
+
+from frame_scheduler import Timeline
+from logger_utils import get_logger
+from sprite_atlas import sprite_exists
+from sprite_variants import split_variant_path, variant_path
+
+logger = get_logger(__name__)
+
+# One display-ready frame: the path it came from, its display size and its PhotoImage
+ClipFrame = namedtuple('ClipFrame', ['image_path', 'width', 'height', 'photo'])
+
+# Flips in an attack (attack -> normal, three times) and flashes in a hit
+ATTACK_TOGGLES = 3
+HIT_FLASHES = 2
+
+
+class AnimationClip:
+    """A fixed sequence of frames played on one sprite at a constant rate"""
+
+    def __init__(self, frames):
+        """
+        Initialize the clip.
+
+        Args:
+            frames: List of ClipFrame, in playback order
+        """
+        self.frames = list(frames)
+
+    def timeline(self, show_frame, frame_ms):
+        """Build a Timeline that shows each frame for frame_ms
+
+        Args:
+            show_frame: Callback taking a ClipFrame (e.g. a sprite's show_frame)
+            frame_ms: How long each frame stays on screen
+
+        Returns:
+            Timeline ready for FrameScheduler.play (more steps may be appended)
+        """
+        timeline = Timeline()
+        for frame in self.frames:
+            timeline.call(show_frame, frame).wait(frame_ms)
+        return timeline
+
+    def __len__(self):
+        return len(self.frames)
+
+
+class CombatantClips:
+    """Every frame one combatant shows during a fight
+
+    Attributes:
+        normal: ClipFrame for the idle pose
+        attack: AnimationClip flipping between attack and idle (None without attack art)
+        hit: AnimationClip flashing the sprite when damaged (None if the flash failed)
+        death: ClipFrame for the death pose (None without death art)
+        size: Display size the frames were built for
+    """
+
+    def __init__(self, normal, attack=None, hit=None, death=None, size=None):
+        self.normal = normal
+        self.attack = attack
+        self.hit = hit
+        self.death = death
+        self.size = size
+
+
+def _exists(image_path):
+    """Check that an image path (ignoring any variant suffix) names a real file"""
+    return bool(image_path) and sprite_exists(split_variant_path(image_path)[0])
+
+
+def load_frame(get_photo, image_path, size):
+    """Resolve one frame, returning None (and logging) if it cannot be loaded
+
+    Args:
+        get_photo: Callable (image_path, width, height) -> PhotoImage (e.g. SpriteCache.get_photo)
+        image_path: Image path, possibly naming a variant
+        size: Square display size
+    """
+    if not image_path:
+        return None
+    try:
+        return ClipFrame(image_path, size, size, get_photo(image_path, size, size))
+    except Exception as e:
+        logger.warning(f"Could not build clip frame '{image_path}': {e}")
+        return None
+
+
+def build_combatant_clips(get_photo, normal_image, size, attack_image=None, death_image=None):
+    """Precompute a combatant's frames for one fight
+
+    Args:
+        get_photo: Callable (image_path, width, height) -> PhotoImage
+        normal_image: Idle image path
+        size: Square display size of the combatant
+        attack_image: Attack image path (None or missing file: no attack clip)
+        death_image: Death image path (None or missing file: no death frame)
+
+    Returns:
+        CombatantClips, or None if even the idle frame cannot be loaded
+    """
+    normal = load_frame(get_photo, normal_image, size)
+    if normal is None:
+        return None
+
+    attack_frame = load_frame(get_photo, attack_image, size) if _exists(attack_image) else None
+    attack = AnimationClip([attack_frame, normal] * ATTACK_TOGGLES) if attack_frame else None
+
+    flash_frame = load_frame(get_photo, variant_path(normal_image, 'flash'), size)
+    hit = AnimationClip([flash_frame, normal] * HIT_FLASHES) if flash_frame else None
+
+    death = load_frame(get_photo, death_image, size) if _exists(death_image) else None
+
+    return CombatantClips(normal, attack, hit, death, size)
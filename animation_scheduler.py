@@ -0,0 +1,89 @@
+"""
+Speed-scaled scheduler for combat animations.
+
+Every combat delay (attack animations, jumps, sprite toggles, pauses between
+rounds) goes through one AnimationScheduler, which divides the delay by the
+current combat speed before handing it to root.after. In instant mode the
+combat code skips the animated rounds altogether and resolves the fight in
+one step.
+"""
+from logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Speed value meaning "resolve fights instantly"
+SPEED_INSTANT = 0
+
+# Selectable combat speeds, in the order the speed key cycles through them
+COMBAT_SPEEDS = (1, 2, 4, SPEED_INSTANT)
+
+
+def format_speed(speed):
+    """Get a display label for a combat speed (e.g. '2x' or 'Instant')"""
+    return 'Instant' if speed == SPEED_INSTANT else f"{speed}x"
+
+
+class AnimationScheduler:
+    """
+    Wraps a Tk scheduler and scales every delay by the combat speed.
+    """
+
+    def __init__(self, scheduler, speed=1):
+        """
+        Initialize the animation scheduler.
+
+        Args:
+            scheduler: Object with after() method (typically tkinter root)
+            speed: Combat speed, one of COMBAT_SPEEDS
+        """
+        self.scheduler = scheduler
+        self.speed = 1
+        self.set_speed(speed)
+
+    @property
+    def instant(self):
+        """True when fights should be resolved without animation"""
+        return self.speed == SPEED_INSTANT
+
+    def set_speed(self, speed):
+        """Set the combat speed
+
+        Args:
+            speed: One of COMBAT_SPEEDS
+        """
+        if speed not in COMBAT_SPEEDS:
+            raise ValueError(f"Unsupported combat speed: {speed}")
+        self.speed = speed
+        logger.info(f"Combat speed set to {format_speed(speed)}")
+
+    def cycle_speed(self):
+        """Switch to the next combat speed
+
+        Returns:
+            The new speed
+        """
+        index = COMBAT_SPEEDS.index(self.speed)
+        self.set_speed(COMBAT_SPEEDS[(index + 1) % len(COMBAT_SPEEDS)])
+        return self.speed
+
+    def scale(self, delay_ms):
+        """Scale a delay by the current speed (instant mode runs callbacks on the next tick)"""
+        if self.instant:
+            return 0
+        return int(delay_ms / self.speed)
+
+    def after(self, delay_ms, callback):
+        """Schedule a callback after a speed-scaled delay
+
+        Args:
+            delay_ms: Delay at 1x speed, in milliseconds
+            callback: Function to call
+
+        Returns:
+            The underlying scheduler's callback id
+        """
+        return self.scheduler.after(self.scale(delay_ms), callback)
+
+    def after_cancel(self, after_id):
+        """Cancel a callback scheduled with after()"""
+        self.scheduler.after_cancel(after_id)
@@ -4,7 +4,8 @@ Create a pixel art blacksmith background PNG
 from PIL import Image, ImageDraw
 import numpy as np
 import random
-import math
+
+import raster
 
 def create_blacksmith_background():
     """Create a pixel art fantasy blacksmith shop based on stone forge inspiration"""
@@ -38,47 +39,31 @@ def create_blacksmith_background():
     # Helper to draw pixel
     def draw_pixel(x, y, color):
         if 0 <= x < width and 0 <= y < height:
-            if len(color) == 4 and color[3] < 255:
-                current = canvas[y][x]
-                alpha = color[3] / 255.0
-                for c in range(3):
-                    canvas[y][x][c] = int(current[c] * (1 - alpha) + color[c] * alpha)
-                canvas[y][x][3] = 255
-            else:
-                canvas[y][x] = color
+            canvas[y][x] = color
+
+    xs, ys = raster.grid(canvas.shape)
 
     # === 1. STRUCTURE (Walls & Floor) ===
     floor_y = 45
     
-    # Back Wall (Stone Bricks)
-    for y in range(floor_y):
-        for x in range(width):
-            col = STONE_MID
-            # Brick pattern
-            if (y % 8 == 0) or ((y // 8) % 2 == 0 and x % 16 == 0) or ((y // 8) % 2 == 1 and (x + 8) % 16 == 0):
-                col = STONE_DARK
-            elif (x * y * 13) % 100 < 10:
-                col = STONE_LIGHT
-            draw_pixel(x, y, col)
+    # Back Wall (Stone Bricks): 0 = mid, 1 = mortar, 2 = speckle
+    wall_rows = slice(0, floor_y)
+    mortar = (ys % 8 == 0) | (((ys // 8) % 2 == 0) & (xs % 16 == 0)) | (((ys // 8) % 2 == 1) & ((xs + 8) % 16 == 0))
+    speckle = (xs * ys * 13) % 100 < 10
+    wall = np.where(mortar, 1, np.where(speckle, 2, 0))
+    canvas[wall_rows] = raster.palette_map(wall, [STONE_MID, STONE_DARK, STONE_LIGHT])[wall_rows]
             
-    # Floor (Stone Tiles)
-    for y in range(floor_y, height):
-        for x in range(width):
-            col = STONE_MID
-            # Perspective lines
-            if (x - width/2) * (y - floor_y + 10) % 400 < 10 or y % 10 == 0:
-                col = STONE_DARK
-            draw_pixel(x, y, col)
+    # Floor (Stone Tiles) with perspective lines
+    floor_rows = slice(floor_y, height)
+    tile_lines = ((xs - width/2) * (ys - floor_y + 10) % 400 < 10) | (ys % 10 == 0)
+    canvas[floor_rows] = raster.palette_map(tile_lines.astype(int), [STONE_MID, STONE_DARK])[floor_rows]
 
     # Roof Beams
     # Main horizontal beam
     beam_y = 15
-    for y in range(beam_y, beam_y + 6):
-        for x in range(width):
-            col = WOOD_MID
-            if y == beam_y + 5: col = WOOD_DARK # Shadow
-            if (x * 7) % 20 == 0: col = WOOD_DARK # Grain
-            draw_pixel(x, y, col)
+    beam = raster.rect_mask(canvas.shape, 0, beam_y, width, beam_y + 6)
+    raster.fill(canvas, beam, WOOD_MID)
+    raster.fill(canvas, beam & ((ys == beam_y + 5) | ((xs * 7) % 20 == 0)), WOOD_DARK)  # Shadow, grain
 
     # === 2. THE FORGE (Central Arch) ===
     arch_cx = width // 2
@@ -87,34 +72,24 @@ def create_blacksmith_background():
     arch_h = 25
     
     # Draw Arch Stones
-    for y in range(arch_cy - arch_h - 5, arch_cy + 1):
-        for x in range(arch_cx - arch_w - 5, arch_cx + arch_w + 5):
-            # Ellipse equation for arch
-            dx = (x - arch_cx)
-            dy = (y - arch_cy)
-            
-            # Outer curve
-            if (dx/(arch_w+4))**2 + (dy/(arch_h+4))**2 <= 1.0:
-                # Inner curve (hole)
-                if (dx/arch_w)**2 + (dy/arch_h)**2 > 1.0 or y > arch_cy:
-                    # This is the stone frame
-                    col = STONE_LIGHT
-                    # Radial lines for arch stones
-                    angle = math.atan2(dy, dx)
-                    if int(angle * 10) % 4 == 0:
-                        col = STONE_DARK
-                    draw_pixel(x, y, col)
-                else:
-                    # Inside the forge (Fire background)
-                    # Brick interior
-                    col = [50, 30, 20, 255]
-                    if (x + y) % 5 == 0: col = [40, 20, 10, 255]
-                    draw_pixel(x, y, col)
+    arch_box = raster.rect_mask(canvas.shape, arch_cx - arch_w - 5, arch_cy - arch_h - 5,
+                                arch_cx + arch_w + 5, arch_cy + 1)
+    outer = arch_box & raster.ellipse_mask(canvas.shape, arch_cx, arch_cy, arch_w + 4, arch_h + 4)
+    frame = outer & (~raster.ellipse_mask(canvas.shape, arch_cx, arch_cy, arch_w, arch_h) | (ys > arch_cy))
+    interior = outer & ~frame
+    # Radial lines for arch stones
+    angle = np.arctan2(ys - arch_cy, xs - arch_cx)
+    raster.fill(canvas, frame, STONE_LIGHT)
+    raster.fill(canvas, frame & (np.trunc(angle * 10).astype(int) % 4 == 0), STONE_DARK)
+    # Inside the forge (brick interior)
+    raster.fill(canvas, interior, [50, 30, 20, 255])
+    raster.fill(canvas, interior & ((xs + ys) % 5 == 0), [40, 20, 10, 255])
 
     # Fire (Realistic Flames: Blue -> White -> Yellow -> Red)
     fire_base_y = arch_cy
     FIRE_BLUE = [50, 100, 255, 255]
     FIRE_WHITE = [255, 255, 255, 255]
+    fire_colors = [FIRE_BLUE, FIRE_WHITE, FIRE_YELLOW, FIRE_RED]
     
     for x in range(arch_cx - 12, arch_cx + 13):
         # Calculate flame height based on position (higher in middle) and randomness
@@ -124,16 +99,11 @@ def create_blacksmith_background():
         
         h = random.randint(int(max_h * 0.7), max_h)
         
-        for y in range(fire_base_y - h, fire_base_y + 1):
-            # Gradient
-            rel_h = (fire_base_y - y) / h # 0 at bottom, 1 at top
-            
-            if rel_h < 0.15: col = FIRE_BLUE
-            elif rel_h < 0.4: col = FIRE_WHITE
-            elif rel_h < 0.7: col = FIRE_YELLOW
-            else: col = FIRE_RED
-            
-            draw_pixel(x, y, col)
+        # Gradient: 0 at bottom, 1 at top
+        flame_ys = np.arange(fire_base_y - h, fire_base_y + 1)
+        rel_h = (fire_base_y - flame_ys) / h
+        band = np.searchsorted([0.15, 0.4, 0.7], rel_h, side='right')
+        canvas[flame_ys, x] = raster.palette_map(band, fire_colors)
             
     # Glow on floor from fire
     for i in range(20):
@@ -146,62 +116,43 @@ def create_blacksmith_background():
     anvil_x = width // 2
     anvil_y = 52  # Moved down slightly
     
-    # Stone Base
-    for y in range(anvil_y + 4, anvil_y + 8):
-        for x in range(anvil_x - 10, anvil_x + 10):
-            # Circular base
-            if ((x - anvil_x)/10)**2 + ((y - (anvil_y+6))/3)**2 <= 1.0:
-                draw_pixel(x, y, STONE_LIGHT)
-                if x > anvil_x + 5: draw_pixel(x, y, STONE_DARK) # Shadow
+    # Stone Base (circular, shadow on the right)
+    base = (raster.rect_mask(canvas.shape, anvil_x - 10, anvil_y + 4, anvil_x + 10, anvil_y + 8) &
+            raster.ellipse_mask(canvas.shape, anvil_x, anvil_y + 6, 10, 3))
+    raster.fill(canvas, base, STONE_LIGHT)
+    raster.fill(canvas, base & (xs > anvil_x + 5), STONE_DARK)
                 
-    # Anvil Body
-    for y in range(anvil_y - 2, anvil_y + 5):
-        for x in range(anvil_x - 12, anvil_x + 12):
-            # Silhouette logic
-            draw = False
-            # Top
-            if y < anvil_y and abs(x - anvil_x) < 12: draw = True
-            # Neck
-            if y >= anvil_y and y < anvil_y + 3 and abs(x - anvil_x) < 5: draw = True
-            # Base
-            if y >= anvil_y + 3 and abs(x - anvil_x) < 8: draw = True
-            
-            if draw:
-                col = METAL_MID
-                if y == anvil_y - 2: col = METAL_LIGHT # Top surface
-                if x > anvil_x + 2: col = METAL_DARK # Shadow side
-                draw_pixel(x, y, col)
+    # Anvil Body: top, neck and base silhouette
+    offset = np.abs(xs - anvil_x)
+    body = raster.rect_mask(canvas.shape, anvil_x - 12, anvil_y - 2, anvil_x + 12, anvil_y + 5) & (
+        ((ys < anvil_y) & (offset < 12)) |
+        ((ys >= anvil_y) & (ys < anvil_y + 3) & (offset < 5)) |
+        ((ys >= anvil_y + 3) & (offset < 8)))
+    raster.fill(canvas, body, METAL_MID)
+    raster.fill(canvas, body & (ys == anvil_y - 2), METAL_LIGHT)  # Top surface
+    raster.fill(canvas, body & (xs > anvil_x + 2), METAL_DARK)  # Shadow side
 
     # === 4. CLUTTER & TOOLS ===
     
     # Barrel (Right)
     barrel_x = width - 20
     barrel_y = 45
-    for y in range(barrel_y, barrel_y + 15):
-        for x in range(barrel_x - 6, barrel_x + 6):
-            # Barrel curve
-            width_mod = 6
-            if y < barrel_y + 2 or y > barrel_y + 12: width_mod = 5
-            
-            if abs(x - barrel_x) < width_mod:
-                col = WOOD_MID
-                if x > barrel_x + 2: col = WOOD_DARK
-                # Metal bands
-                if y == barrel_y + 3 or y == barrel_y + 11:
-                    col = METAL_DARK
-                draw_pixel(x, y, col)
+    # Barrel curve: narrower at the top and bottom rims
+    barrel_half_width = np.where((ys < barrel_y + 2) | (ys > barrel_y + 12), 5, 6)
+    barrel = (raster.rect_mask(canvas.shape, barrel_x - 6, barrel_y, barrel_x + 6, barrel_y + 15) &
+              (np.abs(xs - barrel_x) < barrel_half_width))
+    raster.fill(canvas, barrel, WOOD_MID)
+    raster.fill(canvas, barrel & (xs > barrel_x + 2), WOOD_DARK)
+    raster.fill(canvas, barrel & ((ys == barrel_y + 3) | (ys == barrel_y + 11)), METAL_DARK)  # Metal bands
                 
     # Stool (Left)
     stool_x = 20
     stool_y = 48
     # Seat
-    for x in range(stool_x - 5, stool_x + 5):
-        draw_pixel(x, stool_y, WOOD_LIGHT)
-        draw_pixel(x, stool_y + 1, WOOD_DARK)
+    canvas[stool_y, stool_x - 5:stool_x + 5] = WOOD_LIGHT
+    canvas[stool_y + 1, stool_x - 5:stool_x + 5] = WOOD_DARK
     # Legs
-    for y in range(stool_y + 2, stool_y + 8):
-        draw_pixel(stool_x - 4, y, WOOD_MID)
-        draw_pixel(stool_x + 3, y, WOOD_MID)
+    canvas[stool_y + 2:stool_y + 8, [stool_x - 4, stool_x + 3]] = WOOD_MID
     
     # Swords on Wall (Display)
     for sx in [15, width - 15]:
@@ -209,61 +160,31 @@ def create_blacksmith_background():
         # Pommel
         draw_pixel(sx, sy, METAL_DARK)
         # Grip
-        draw_pixel(sx, sy + 1, WOOD_DARK)
-        draw_pixel(sx, sy + 2, WOOD_DARK)
+        canvas[sy + 1:sy + 3, sx] = WOOD_DARK
         # Crossguard
-        draw_pixel(sx - 2, sy + 3, METAL_DARK)
-        draw_pixel(sx - 1, sy + 3, METAL_DARK)
+        canvas[sy + 3, sx - 2:sx + 3] = METAL_DARK
         draw_pixel(sx, sy + 3, METAL_MID)
-        draw_pixel(sx + 1, sy + 3, METAL_DARK)
-        draw_pixel(sx + 2, sy + 3, METAL_DARK)
         # Blade
-        for i in range(12):
-            draw_pixel(sx, sy + 4 + i, METAL_LIGHT)
-            draw_pixel(sx - 1, sy + 4 + i, METAL_MID) # Shadow/Edge
+        canvas[sy + 4:sy + 16, sx] = METAL_LIGHT
+        canvas[sy + 4:sy + 16, sx - 1] = METAL_MID  # Shadow/Edge
             
     # Tongs hanging on wall (Left of arch)
     tx = arch_cx - 20
     ty = 30
-    for i in range(8):
-        draw_pixel(tx, ty + i, METAL_DARK)
-        draw_pixel(tx + 2, ty + i, METAL_DARK)
+    canvas[ty:ty + 8, [tx, tx + 2]] = METAL_DARK
     draw_pixel(tx + 1, ty + 2, METAL_DARK) # Hinge
 
     # === 5. LIGHTING ===
-    # Warm glow from the fire
-    for y in range(height):
-        for x in range(width):
-            # Distance from fire center
-            dist = ((x - arch_cx)**2 + (y - (arch_cy - 5))**2)**0.5
-            
-            if dist < 40:
-                intensity = int((40 - dist) * 4)
-                if intensity > 0:
-                    current = canvas[y][x]
-                    # Add orange/yellow tint
-                    # Cast to int to avoid overflow
-                    r = min(255, int(current[0]) + intensity)
-                    g = min(255, int(current[1]) + int(intensity * 0.6))
-                    b = min(255, int(current[2]) + int(intensity * 0.1))
-                    canvas[y][x] = [r, g, b, 255]
+    # Warm glow from the fire (orange/yellow tint)
+    dist = raster.distance_field(canvas.shape, arch_cx, arch_cy - 5)
+    intensity = np.where(dist < 40, ((40 - dist) * 4).astype(int), 0)
+    lit = intensity > 0
+    raster.add_clamped(canvas, lit, [intensity, (intensity * 0.6).astype(int), (intensity * 0.1).astype(int)])
 
     # Vignette
-    for y in range(height):
-        for x in range(width):
-            dist_center = ((x - width/2)**2 + (y - height/2)**2)**0.5
-            if dist_center > 45:
-                opacity = int((dist_center - 45) * 4)
-                if opacity > 180: opacity = 180
-                
-                current = canvas[y][x]
-                factor = (255 - opacity) / 255.0
-                canvas[y][x] = [
-                    int(current[0] * factor),
-                    int(current[1] * factor),
-                    int(current[2] * factor),
-                    255
-                ]
+    dist_center = raster.distance_field(canvas.shape, width/2, height/2)
+    opacity = np.minimum(((dist_center - 45) * 4).astype(int), 180)
+    raster.scale_rgb(canvas, dist_center > 45, (255 - opacity) / 255.0)
 
     # Save image
     img = Image.fromarray(canvas, 'RGBA')
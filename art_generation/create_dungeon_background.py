@@ -1,6 +1,8 @@
 from PIL import Image, ImageDraw
+import numpy as np
 import random
-import math
+
+import raster
 
 def create_dungeon_background(width=512, height=256, scale_factor=4):
     """Create a pixel art dungeon background with walls on top and stone floor on bottom"""
@@ -8,9 +10,6 @@ def create_dungeon_background(width=512, height=256, scale_factor=4):
     # Create base image at lower resolution for pixel art effect
     base_width = width // scale_factor
     base_height = height // scale_factor
-    img = Image.new('RGB', (base_width, base_height), (0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
     # Dungeon color palette
     colors = {
         # Wall colors
@@ -45,28 +44,16 @@ def create_dungeon_background(width=512, height=256, scale_factor=4):
     
     # Split canvas: top half = walls, bottom half = floor
     mid_height = base_height // 2
+    xs, ys = raster.grid((base_height, base_width))
     
     # ===== DRAW TOP HALF - DUNGEON WALLS =====
     
-    # Draw stone block walls
-    for y in range(0, mid_height):
-        for x in range(0, base_width):
-            # Create stone block pattern (8x8 blocks)
-            block_x = x // 8
-            block_y = y // 8
-            
-            # Mortar lines between blocks
-            if x % 8 == 0 or y % 8 == 0:
-                draw.point((x, y), fill=colors['wall_mortar'])
-            else:
-                # Vary stone color for texture
-                offset = (block_x * 3 + block_y * 7) % 5
-                if offset == 0:
-                    draw.point((x, y), fill=colors['wall_light'])
-                elif offset < 3:
-                    draw.point((x, y), fill=colors['wall_medium'])
-                else:
-                    draw.point((x, y), fill=colors['wall_dark'])
+    # Stone blocks (8x8) with mortar lines, stone color varied per block
+    wall_shade = (xs // 8 * 3 + ys // 8 * 7) % 5
+    wall = np.select([(xs % 8 == 0) | (ys % 8 == 0), wall_shade == 0, wall_shade < 3], [0, 1, 2], 3)
+    wall_colors = [colors['wall_mortar'], colors['wall_light'], colors['wall_medium'], colors['wall_dark']]
+    img = Image.fromarray(raster.palette_map(wall, wall_colors), 'RGB')  # Floor rows are replaced below
+    draw = ImageDraw.Draw(img)
     
     # Draw wall torches (2 torches)
     torch_positions = [
@@ -91,14 +78,13 @@ def create_dungeon_background(width=512, height=256, scale_factor=4):
         draw.ellipse([torch_x - 1, torch_y - 3, torch_x + 1, torch_y - 1], 
                     fill=colors['torch_flame_core'])
         
-        # Glow effect around torch (smaller radius)
-        for glow_y in range(torch_y - 7, torch_y + 10):
-            for glow_x in range(torch_x - 7, torch_x + 7):
-                if 0 <= glow_x < base_width and 0 <= glow_y < mid_height:
-                    distance = math.sqrt((glow_x - torch_x)**2 + (glow_y - torch_y)**2)
-                    if 4 < distance < 7:
-                        if random.random() < 0.15:
-                            draw.point((glow_x, glow_y), fill=colors['torch_glow'])
+        # Glow effect around torch (smaller radius): scattered pixels in a ring
+        distance = raster.distance_field((mid_height, base_width), torch_x, torch_y)
+        ring = (raster.rect_mask(distance.shape, torch_x - 7, torch_y - 7, torch_x + 7, torch_y + 10) &
+                (4 < distance) & (distance < 7))
+        for glow_y, glow_x in np.argwhere(ring):
+            if random.random() < 0.15:
+                draw.point((int(glow_x), int(glow_y)), fill=colors['torch_glow'])
     
     # Draw hanging chains (3 chains)
     chain_positions = [
@@ -140,25 +126,12 @@ def create_dungeon_background(width=512, height=256, scale_factor=4):
     
     # ===== DRAW BOTTOM HALF - STONE FLOOR =====
     
-    # Draw stone floor tiles
-    for y in range(mid_height, base_height):
-        for x in range(0, base_width):
-            # Create larger floor tile pattern (12x6 tiles)
-            tile_x = x // 12
-            tile_y = (y - mid_height) // 6
-            
-            # Mortar lines
-            if x % 12 == 0 or (y - mid_height) % 6 == 0:
-                draw.point((x, y), fill=colors['floor_mortar'])
-            else:
-                # Vary floor stone color
-                offset = (tile_x * 5 + tile_y * 3) % 5
-                if offset == 0:
-                    draw.point((x, y), fill=colors['floor_light'])
-                elif offset < 3:
-                    draw.point((x, y), fill=colors['floor_medium'])
-                else:
-                    draw.point((x, y), fill=colors['floor_dark'])
+    # Floor tiles (12x6) with mortar lines, stone color varied per tile
+    floor_ys = ys - mid_height
+    floor_shade = (xs // 12 * 5 + floor_ys // 6 * 3) % 5
+    floor = np.select([(xs % 12 == 0) | (floor_ys % 6 == 0), floor_shade == 0, floor_shade < 3], [0, 1, 2], 3)
+    floor_colors = [colors['floor_mortar'], colors['floor_light'], colors['floor_medium'], colors['floor_dark']]
+    img.paste(Image.fromarray(raster.palette_map(floor, floor_colors)[mid_height:], 'RGB'), (0, mid_height))
     
     # Scale up the image for final output
     img_scaled = img.resize((width, height), Image.Resampling.NEAREST)
@@ -3,6 +3,8 @@ from PIL import Image, ImageDraw
 import os
 import math
 
+import raster
+
 def create_sand_wyrm_art():
     width = 64
     height = 64
@@ -51,66 +53,45 @@ def create_sand_wyrm_art():
             else:
                 canvas[y][x] = color
 
+    xs, ys = raster.grid((height, width))
+
     def draw_circle(canvas, cx, cy, r, color):
-        for y in range(int(cy - r), int(cy + r + 1)):
-            for x in range(int(cx - r), int(cx + r + 1)):
-                if (x - cx)**2 + (y - cy)**2 <= r**2:
-                    draw_pixel(canvas, x, y, color)
+        raster.fill(canvas, raster.circle_mask(canvas.shape, cx, cy, r), color)
 
     def draw_segment(canvas, cx, cy, r, angle_deg=0):
         # Draw a segmented body part with shading
         # Angle determines the rotation of the segment plates
+        box = raster.rect_mask(canvas.shape, int(cx - r), int(cy - r), int(cx + r + 1), int(cy + r + 1))
+        dist = raster.distance_field(canvas.shape, cx, cy)
+        body = box & (dist <= r)
+        # Outline
+        rim = body & (dist > r - 1.5)
+        plate = body & ~rim
+        
+        # Calculate lighting
+        # Light comes from top-left
+        dx = xs - cx
+        dy = ys - cy
         
-        for y in range(int(cy - r), int(cy + r + 1)):
-            for x in range(int(cx - r), int(cx + r + 1)):
-                if 0 <= x < width and 0 <= y < height:
-                    dist = ((x - cx)**2 + (y - cy)**2)**0.5
-                    if dist <= r:
-                        # Outline
-                        if dist > r - 1.5:
-                            draw_pixel(canvas, x, y, ARMOR_OUTLINE)
-                            continue
-                            
-                        # Calculate lighting
-                        # Light comes from top-left
-                        dx = x - cx
-                        dy = y - cy
-                        
-                        # Rotate coordinates for texture alignment
-                        rad = math.radians(angle_deg)
-                        rot_x = dx * math.cos(rad) - dy * math.sin(rad)
-                        rot_y = dx * math.sin(rad) + dy * math.cos(rad)
-                        
-                        # Base color logic
-                        col = ARMOR_MID
-                        
-                        # Cylindrical shading (highlight on top-left side)
-                        # We use the rotated Y to simulate the segment ridges
-                        
-                        # Ridge at the "top" of the segment (relative to rotation)
-                        if rot_y < -r * 0.5:
-                            col = ARMOR_LIGHT
-                        elif rot_y > r * 0.5:
-                            col = ARMOR_DARK
-                        
-                        # Specular highlight
-                        if dist < r * 0.8 and rot_x < -r * 0.2 and rot_y < -r * 0.2:
-                            col = ARMOR_HIGHLIGHT
-                            
-                        # Deep shadow at bottom right
-                        if rot_x > r * 0.3 and rot_y > r * 0.3:
-                            col = ARMOR_SHADOW
-                            
-                        # Segment line (the gap between plates)
-                        # We simulate this by making the very bottom of the rotated segment dark
-                        if rot_y > r * 0.7:
-                            col = ARMOR_OUTLINE
-                            
-                        draw_pixel(canvas, x, y, col)
-                        
-                        # Texture spots (weathering)
-                        if (x * y * 13) % 47 < 2:
-                            draw_pixel(canvas, x, y, ARMOR_SHADOW)
+        # Rotate coordinates for texture alignment
+        rad = math.radians(angle_deg)
+        rot_x = dx * math.cos(rad) - dy * math.sin(rad)
+        rot_y = dx * math.sin(rad) + dy * math.cos(rad)
+        
+        # Base color, then each rule paints over the previous ones
+        raster.fill(canvas, plate, ARMOR_MID)
+        # Ridge at the "top" of the segment (relative to rotation), simulating segment ridges
+        raster.fill(canvas, plate & (rot_y < -r * 0.5), ARMOR_LIGHT)
+        raster.fill(canvas, plate & (rot_y > r * 0.5), ARMOR_DARK)
+        # Specular highlight
+        raster.fill(canvas, plate & (dist < r * 0.8) & (rot_x < -r * 0.2) & (rot_y < -r * 0.2), ARMOR_HIGHLIGHT)
+        # Deep shadow at bottom right
+        raster.fill(canvas, plate & (rot_x > r * 0.3) & (rot_y > r * 0.3), ARMOR_SHADOW)
+        # Segment line (the gap between plates) at the very bottom of the rotated segment
+        raster.fill(canvas, plate & (rot_y > r * 0.7), ARMOR_OUTLINE)
+        # Texture spots (weathering)
+        raster.fill(canvas, plate & ((xs * ys * 13) % 47 < 2), ARMOR_SHADOW)
+        raster.fill(canvas, rim, ARMOR_OUTLINE)
 
     def draw_spike(canvas, tip_x, tip_y, base_x, base_y, width_base):
         # Simple triangle spike
@@ -125,34 +106,15 @@ def create_sand_wyrm_art():
         py = vx / length * width_base
         
         # Triangle points: Tip, BaseLeft, BaseRight
-        p1 = (tip_x, tip_y)
-        p2 = (base_x + px, base_y + py)
-        p3 = (base_x - px, base_y - py)
-        
-        # Bounding box
-        min_x = int(min(p1[0], p2[0], p3[0]))
-        max_x = int(max(p1[0], p2[0], p3[0]))
-        min_y = int(min(p1[1], p2[1], p3[1]))
-        max_y = int(max(p1[1], p2[1], p3[1]))
+        points = [(tip_x, tip_y), (base_x + px, base_y + py), (base_x - px, base_y - py)]
         
-        for y in range(min_y, max_y + 1):
-            for x in range(min_x, max_x + 1):
-                # Barycentric coordinates or simple check
-                # Using simple check for pixel art
-                if 0 <= x < width and 0 <= y < height:
-                    # Check if point is inside triangle
-                    def sign(p1, p2, p3):
-                        return (p1[0] - p3[0]) * (p2[1] - p3[1]) - (p2[0] - p3[0]) * (p1[1] - p3[1])
-                    
-                    d1 = sign((x, y), p1, p2)
-                    d2 = sign((x, y), p2, p3)
-                    d3 = sign((x, y), p3, p1)
-                    
-                    has_neg = (d1 < 0) or (d2 < 0) or (d3 < 0)
-                    has_pos = (d1 > 0) or (d2 > 0) or (d3 > 0)
-                    
-                    if not (has_neg and has_pos):
-                        draw_pixel(canvas, x, y, ARMOR_LIGHT)
+        # Bounding box (truncated like the pixel loop it replaces)
+        min_x = int(min(x for x, _ in points))
+        max_x = int(max(x for x, _ in points))
+        min_y = int(min(y for _, y in points))
+        max_y = int(max(y for _, y in points))
+        box = raster.rect_mask(canvas.shape, min_x, min_y, max_x + 1, max_y + 1)
+        raster.fill(canvas, box & raster.polygon_mask(canvas.shape, points), ARMOR_LIGHT)
 
     # === DEFAULT POSE GENERATION ===
     # Giant worm arching out of the sand
@@ -4,7 +4,8 @@ Create a pixel art shop background PNG
 from PIL import Image, ImageDraw
 import numpy as np
 import random
-import math
+
+import raster
 
 def create_shop_background():
     """Create a pixel art fantasy shop interior"""
@@ -48,47 +49,25 @@ def create_shop_background():
             else:
                 canvas[y][x] = color
 
+    xs, ys = raster.grid(canvas.shape)
+
     # === 1. WALLS & FLOOR ===
     floor_y = 40 # Where the wall meets the floor
     
-    # Draw Wall (Stone bricks)
-    for y in range(floor_y):
-        for x in range(width):
-            # Base wall color
-            col = STONE_MID
-            
-            # Brick pattern
-            brick_h = 8
-            brick_w = 16
-            row = y // brick_h
-            offset = (row % 2) * (brick_w // 2)
-            
-            # Mortar lines
-            if y % brick_h == 0 or (x + offset) % brick_w == 0:
-                col = STONE_DARK
-            # Highlights
-            elif y % brick_h == 1 or (x + offset) % brick_w == 1:
-                col = STONE_LIGHT
-            # Texture
-            elif (x * y * 13) % 100 < 5:
-                col = STONE_DARK
-                
-            draw_pixel(x, y, col)
-            
-    # Draw Floor (Wood planks)
-    for y in range(floor_y, height):
-        for x in range(width):
-            # Perspective effect for planks?
-            # Simple horizontal planks for now
-            col = WOOD_MID
+    # Draw Wall (Stone bricks): 0 = base, 1 = mortar/texture, 2 = highlight
+    brick_h = 8
+    brick_w = 16
+    offset = ((ys // brick_h) % 2) * (brick_w // 2)
+    mortar = (ys % brick_h == 0) | ((xs + offset) % brick_w == 0)
+    highlight = (ys % brick_h == 1) | ((xs + offset) % brick_w == 1)
+    texture = (xs * ys * 13) % 100 < 5
+    wall = np.select([mortar, highlight, texture], [1, 2, 1], 0)
+    canvas[:floor_y] = raster.palette_map(wall, [STONE_MID, STONE_DARK, STONE_LIGHT])[:floor_y]
             
-            plank_h = 6
-            if (y - floor_y) % plank_h == 0:
-                col = WOOD_DARK
-            elif (x * y * 7) % 100 < 5: # Wood grain
-                col = WOOD_LIGHT
-                
-            draw_pixel(x, y, col)
+    # Draw Floor (Wood planks): 0 = base, 1 = plank gap, 2 = grain
+    plank_h = 6
+    floor = np.select([(ys - floor_y) % plank_h == 0, (xs * ys * 7) % 100 < 5], [1, 2], 0)
+    canvas[floor_y:] = raster.palette_map(floor, [WOOD_MID, WOOD_DARK, WOOD_LIGHT])[floor_y:]
 
     # === 2. SHELVES (Background) ===
     shelf_y_positions = [15, 28]
@@ -135,46 +114,23 @@ def create_shop_background():
 
     # === 3. COUNTER (Foreground) ===
     counter_top_y = 45
-    counter_height = height - counter_top_y
     
-    for y in range(counter_top_y, height):
-        for x in range(width):
-            # Counter takes up full width? Or maybe centered?
-            # Let's make it full width for the "shop view" feel
-            
-            # Counter Top Surface (perspective)
-            if y < counter_top_y + 5:
-                col = WOOD_LIGHT
-                if y == counter_top_y:
-                    col = WOOD_HIGHLIGHT # Edge highlight
-                elif (x * 3) % 20 == 0: # Wood grain
-                    col = WOOD_MID
-            # Counter Front Face
-            else:
-                col = WOOD_MID
-                # Vertical panels
-                if x % 32 == 0 or x % 32 == 31:
-                    col = WOOD_DARK
-                # Wood grain texture
-                elif (x * y * 17) % 100 < 5:
-                    col = WOOD_DARK
-                # Shadow under the lip
-                if y == counter_top_y + 5:
-                    col = SHADOW
-                    
-            draw_pixel(x, y, col)
+    # Counter Top Surface (perspective): 2 = edge highlight, 3 = grain, else light wood
+    top = np.select([ys == counter_top_y, (xs * 3) % 20 == 0], [2, 3], 1)
+    # Counter Front Face: vertical panels and grain texture on mid wood
+    front = np.where((xs % 32 == 0) | (xs % 32 == 31) | ((xs * ys * 17) % 100 < 5), 0, 3)
+    counter = raster.palette_map(np.where(ys < counter_top_y + 5, top, front),
+                                 [WOOD_DARK, WOOD_LIGHT, WOOD_HIGHLIGHT, WOOD_MID])
+    solid = raster.rect_mask(canvas.shape, 0, counter_top_y, width, height) & (ys != counter_top_y + 5)
+    canvas[solid] = counter[solid]
+    # Shadow under the lip (blended over the floor behind it)
+    raster.blend(canvas, raster.rect_mask(canvas.shape, 0, counter_top_y + 5, width, counter_top_y + 6), SHADOW)
 
     # === 4. LIGHTING/ATMOSPHERE ===
     # Vignette
-    for y in range(height):
-        for x in range(width):
-            dist_from_center = ((x - width/2)**2 + (y - height/2)**2)**0.5
-            max_dist = (width/2)**2 + (height/2)**2
-            
-            if dist_from_center > 40:
-                opacity = int((dist_from_center - 40) * 2)
-                if opacity > 150: opacity = 150
-                draw_pixel(x, y, [0, 0, 0, opacity])
+    dist_from_center = raster.distance_field(canvas.shape, width/2, height/2)
+    opacity = np.minimum(((dist_from_center - 40) * 2).astype(int), 150)
+    raster.blend(canvas, dist_from_center > 40, [0, 0, 0], opacity)
 
     # Save image
     img = Image.fromarray(canvas, 'RGBA')
@@ -8,6 +8,8 @@ Resolution: 64x64 scaled to 256x256
 from PIL import Image
 import numpy as np
 
+import raster
+
 # Color palette - translucent turquoise/cyan slime
 SLIME_CORE = np.array([60, 180, 170, 255])        # Core slime color
 SLIME_LIGHT = np.array([120, 220, 210, 255])      # Light slime highlights
@@ -35,78 +37,80 @@ MOUTH_SHADOW = np.array([40, 120, 120, 200])      # Mouth shadow
 
 MOTION_BLUR = np.array([80, 200, 190, 100])       # Motion blur effect
 
+def draw_round_eye(canvas, eye_x, eye_y, bottom, white_radius, pupil_side):
+    """Draw a round eye: dark ring, white, and a two-tone pupil
+
+    Args:
+        canvas: Canvas to draw on
+        eye_x, eye_y: Eye center
+        bottom: Row offset of the last drawn row (the eye spans -3..bottom)
+        white_radius: Radius where the ring ends and the white begins
+        pupil_side: Mask function of (dx, dy) selecting the dark half of the pupil
+    """
+    xs, ys = raster.grid(canvas.shape)
+    dx, dy = xs - eye_x, ys - eye_y
+    window = (dx >= -3) & (dx <= 3) & (dy >= -3) & (dy <= bottom)
+    dist = raster.distance_field(canvas.shape, eye_x, eye_y)
+    raster.fill(canvas, window & (white_radius < dist) & (dist < 3.5), EYE_OUTER)
+    raster.fill(canvas, window & (dist <= white_radius), EYE_WHITE)
+    pupil = window & (dist < 1.5)
+    raster.fill(canvas, pupil, EYE_IRIS)
+    raster.fill(canvas, pupil & pupil_side(dx, dy), EYE_PUPIL)
+
+
+def draw_bubble(canvas, x, y, rows, half_width, bright):
+    """Draw a bubble rising from its edge row at y
+
+    Args:
+        canvas: Canvas to draw on
+        x, y: Center of the bottom row
+        rows: Bubble height
+        half_width: Function of the row index giving the half width
+        bright: Mask function of (row, dx) for the bright part inside the edge
+    """
+    bubble, row, dx = raster.tapered_rows(canvas.shape, x, y, rows, half_width, step=-1)
+    raster.fill(canvas, bubble, BUBBLE_LIGHT)
+    raster.fill(canvas, bubble & bright(row, dx), BUBBLE_BRIGHT)
+    raster.fill(canvas, bubble & ((row == 0) | (np.abs(dx) == half_width(row))), BUBBLE_EDGE)
+
+
 def create_slime_default():
     """Create default Slime pose - blob sitting with cute face"""
     width, height = 64, 64
-    canvas = np.zeros((height, width, 4), dtype=np.uint8)
+    canvas = raster.new_canvas(width, height)
     
     center_x = 32
     center_y = 40
     
     # === MAIN SLIME BODY (rounded blob shape) ===
-    # Bottom portion (wider, flatter)
-    for y in range(15):
-        # Create rounded bottom
-        width_at_y = int(20 - (y * 0.3))
-        height_y = center_y + 10 - y
-        
-        for x in range(-width_at_y, width_at_y + 1):
-            body_x = center_x + x
-            body_y = height_y
-            
-            if 0 <= body_x < width and 0 <= body_y < height:
-                # Distance from center for shading
-                dist_from_center = abs(x)
-                
-                # Outer edge
-                if dist_from_center == width_at_y or y == 0:
-                    canvas[body_y][body_x] = SLIME_EDGE
-                # Left side (lighter)
-                elif x < -width_at_y // 2:
-                    if y < 5:
-                        canvas[body_y][body_x] = SLIME_LIGHT
-                    else:
-                        canvas[body_y][body_x] = SLIME_MID
-                # Right side (darker)
-                elif x > width_at_y // 2:
-                    canvas[body_y][body_x] = SLIME_DARK
-                # Center
-                else:
-                    if y < 8:
-                        canvas[body_y][body_x] = SLIME_CORE
-                    else:
-                        canvas[body_y][body_x] = SLIME_LIGHT
-    
-    # Top portion (rounded dome)
-    for y in range(20):
-        # Elliptical top
-        width_at_y = int(20 - (y ** 1.3) / 3.5)
-        if width_at_y < 1:
-            break
-        height_y = center_y - 5 - y
-        
-        for x in range(-width_at_y, width_at_y + 1):
-            body_x = center_x + x
-            body_y = height_y
-            
-            if 0 <= body_x < width and 0 <= body_y < height:
-                dist_from_center = abs(x)
-                
-                # Outer edge
-                if dist_from_center == width_at_y or y == 19:
-                    canvas[body_y][body_x] = SLIME_EDGE
-                # Top highlight area
-                elif y > 12 and dist_from_center < 8:
-                    canvas[body_y][body_x] = SLIME_LIGHT
-                # Left side (lighter)
-                elif x < 0:
-                    canvas[body_y][body_x] = SLIME_MID
-                # Right side (darker)
-                elif x > 5:
-                    canvas[body_y][body_x] = SLIME_DARK
-                # Center
-                else:
-                    canvas[body_y][body_x] = SLIME_CORE
+    # Bottom portion (wider, flatter) with a rounded bottom
+    half_width = lambda row: (20 - (row * 0.3)).astype(int)
+    bottom, row, x = raster.tapered_rows(canvas.shape, center_x, center_y + 10, 15, half_width, step=-1)
+    w = half_width(row)
+    raster.fill(canvas, bottom, SLIME_LIGHT)
+    # Center
+    raster.fill(canvas, bottom & (row < 8), SLIME_CORE)
+    # Left side (lighter)
+    raster.fill(canvas, bottom & (x < -w // 2), SLIME_MID)
+    raster.fill(canvas, bottom & (x < -w // 2) & (row < 5), SLIME_LIGHT)
+    # Right side (darker)
+    raster.fill(canvas, bottom & (x > w // 2), SLIME_DARK)
+    # Outer edge
+    raster.fill(canvas, bottom & ((np.abs(x) == w) | (row == 0)), SLIME_EDGE)
+    
+    # Top portion (rounded dome), elliptical top
+    half_width = lambda row: np.where(row < 20, (20 - (np.maximum(row, 0) ** 1.3) / 3.5).astype(int), 0)
+    dome, row, x = raster.tapered_rows(canvas.shape, center_x, center_y - 5, 20, half_width, step=-1)
+    dome &= half_width(row) >= 1
+    raster.fill(canvas, dome, SLIME_CORE)
+    # Right side (darker)
+    raster.fill(canvas, dome & (x > 5), SLIME_DARK)
+    # Left side (lighter)
+    raster.fill(canvas, dome & (x < 0), SLIME_MID)
+    # Top highlight area
+    raster.fill(canvas, dome & (row > 12) & (np.abs(x) < 8), SLIME_LIGHT)
+    # Outer edge
+    raster.fill(canvas, dome & ((np.abs(x) == half_width(row)) | (row == 19)), SLIME_EDGE)
     
     # === LARGE SHINE SPOT (top left) ===
     shine_positions = [
@@ -115,10 +119,7 @@ def create_slime_default():
         (center_x - 8, center_y - 13), (center_x - 7, center_y - 13), (center_x - 6, center_y - 13),
         (center_x - 7, center_y - 12)
     ]
-    
-    for sx, sy in shine_positions:
-        if 0 <= sx < width and 0 <= sy < height:
-            canvas[sy][sx] = SHINE_BRIGHT
+    raster.plot(canvas, shine_positions, SHINE_BRIGHT)
     
     # Shine glow
     shine_glow_positions = [
@@ -126,50 +127,22 @@ def create_slime_default():
         (center_x - 9, center_y - 16), (center_x - 8, center_y - 16), (center_x - 7, center_y - 16),
         (center_x - 6, center_y - 15), (center_x - 5, center_y - 14), (center_x - 5, center_y - 13)
     ]
-    
-    for sx, sy in shine_glow_positions:
-        if 0 <= sx < width and 0 <= sy < height:
-            if canvas[sy][sx][3] < 200:  # Don't overwrite existing bright areas
-                canvas[sy][sx] = SHINE_GLOW
+    glow = raster.point_mask(canvas.shape, *zip(*shine_glow_positions))
+    raster.fill(canvas, glow & (canvas[..., 3] < 200), SHINE_GLOW)  # Don't overwrite existing bright areas
     
     # === INTERNAL BUBBLES ===
     # Large bubble (left side)
     large_bubble_x = center_x - 10
     large_bubble_y = center_y - 5
-    
-    for by in range(5):
-        bubble_width = 3 - by // 2
-        for bx in range(-bubble_width, bubble_width + 1):
-            b_x = large_bubble_x + bx
-            b_y = large_bubble_y - by
-            if 0 <= b_x < width and 0 <= b_y < height:
-                if by == 0 or abs(bx) == bubble_width:
-                    canvas[b_y][b_x] = BUBBLE_EDGE
-                elif by < 2 and bx <= 0:
-                    canvas[b_y][b_x] = BUBBLE_BRIGHT
-                else:
-                    canvas[b_y][b_x] = BUBBLE_LIGHT
+    draw_bubble(canvas, large_bubble_x, large_bubble_y, 5, lambda row: 3 - row // 2,
+                lambda row, dx: (row < 2) & (dx <= 0))
     
     # Small bubble highlights on large bubble
-    if 0 <= large_bubble_x - 1 < width and 0 <= large_bubble_y - 3 < height:
-        canvas[large_bubble_y - 3][large_bubble_x - 1] = SHINE_BRIGHT
+    raster.plot(canvas, [(large_bubble_x - 1, large_bubble_y - 3)], SHINE_BRIGHT)
     
     # Medium bubble (right side)
-    med_bubble_x = center_x + 8
-    med_bubble_y = center_y - 2
-    
-    for by in range(4):
-        bubble_width = 2 - by // 2
-        for bx in range(-bubble_width, bubble_width + 1):
-            b_x = med_bubble_x + bx
-            b_y = med_bubble_y - by
-            if 0 <= b_x < width and 0 <= b_y < height:
-                if by == 0 or abs(bx) == bubble_width:
-                    canvas[b_y][b_x] = BUBBLE_EDGE
-                elif by < 2:
-                    canvas[b_y][b_x] = BUBBLE_LIGHT
-                else:
-                    canvas[b_y][b_x] = BUBBLE_BRIGHT
+    draw_bubble(canvas, center_x + 8, center_y - 2, 4, lambda row: 2 - row // 2,
+                lambda row, dx: row >= 2)
     
     # Small bubbles scattered
     small_bubble_positions = [
@@ -181,57 +154,25 @@ def create_slime_default():
     for sbx, sby in small_bubble_positions:
         if 0 <= sbx < width and 0 <= sby < height:
             canvas[sby][sbx] = BUBBLE_BRIGHT
-            if sbx + 1 < width:
-                canvas[sby][sbx + 1] = BUBBLE_LIGHT
-            if sby - 1 >= 0:
-                canvas[sby - 1][sbx] = BUBBLE_LIGHT
+            raster.plot(canvas, [(sbx + 1, sby), (sbx, sby - 1)], BUBBLE_LIGHT)
     
     # === EYES (cute round eyes) ===
     eye_y = center_y - 8
-    left_eye_x = center_x - 6
-    right_eye_x = center_x + 6
-    
-    for eye_x in [left_eye_x, right_eye_x]:
-        # Outer ring
-        for ey in range(-3, 4):
-            for ex in range(-3, 4):
-                e_x = eye_x + ex
-                e_y = eye_y + ey
-                if 0 <= e_x < width and 0 <= e_y < height:
-                    dist = (ex ** 2 + ey ** 2) ** 0.5
-                    if 2.5 < dist < 3.5:
-                        canvas[e_y][e_x] = EYE_OUTER
-                    elif dist <= 2.5:
-                        if dist < 1.5:
-                            # Pupil
-                            if ey >= 0:
-                                canvas[e_y][e_x] = EYE_PUPIL
-                            else:
-                                canvas[e_y][e_x] = EYE_IRIS
-                        else:
-                            # White
-                            canvas[e_y][e_x] = EYE_WHITE
+    
+    for eye_x in [center_x - 6, center_x + 6]:
+        # Pupil looks down
+        draw_round_eye(canvas, eye_x, eye_y, 3, 2.5, lambda dx, dy: dy >= 0)
         
         # Eye shine
-        if 0 <= eye_x - 1 < width and 0 <= eye_y - 2 < height:
-            canvas[eye_y - 2][eye_x - 1] = EYE_SHINE
-            canvas[eye_y - 1][eye_x - 1] = EYE_SHINE
+        raster.plot(canvas, [(eye_x - 1, eye_y - 2), (eye_x - 1, eye_y - 1)], EYE_SHINE)
     
     # === MOUTH (simple smile) ===
     mouth_y = center_y - 2
     
     # Curved smile
-    mouth_positions = [
-        (center_x - 4, mouth_y), (center_x - 3, mouth_y + 1),
-        (center_x - 2, mouth_y + 1), (center_x - 1, mouth_y + 1),
-        (center_x, mouth_y + 1), (center_x + 1, mouth_y + 1),
-        (center_x + 2, mouth_y + 1), (center_x + 3, mouth_y + 1),
-        (center_x + 4, mouth_y)
-    ]
-    
-    for mx, my in mouth_positions:
-        if 0 <= mx < width and 0 <= my < height:
-            canvas[my][mx] = MOUTH_LINE
+    mouth_positions = [(center_x - 4, mouth_y), (center_x + 4, mouth_y)]
+    mouth_positions += [(center_x + dx, mouth_y + 1) for dx in range(-3, 4)]
+    raster.plot(canvas, mouth_positions, MOUTH_LINE)
     
     # === SMALL SHINE SPOTS (scattered on surface) ===
     tiny_shine_positions = [
@@ -239,10 +180,7 @@ def create_slime_default():
         (center_x - 4, center_y + 4), (center_x + 8, center_y + 2),
         (center_x, center_y - 18)
     ]
-    
-    for tsx, tsy in tiny_shine_positions:
-        if 0 <= tsx < width and 0 <= tsy < height:
-            canvas[tsy][tsx] = SHINE_BRIGHT
+    raster.plot(canvas, tiny_shine_positions, SHINE_BRIGHT)
     
     return canvas
 
@@ -250,85 +188,49 @@ def create_slime_default():
 def create_slime_attack():
     """Create attack Slime pose - lunging forward with determined face"""
     width, height = 64, 64
-    canvas = np.zeros((height, width, 4), dtype=np.uint8)
+    canvas = raster.new_canvas(width, height)
+    xs, ys = raster.grid(canvas.shape)
     
     center_x = 28  # Shifted for lunge
     center_y = 38
     
     # === MAIN SLIME BODY (stretched/lunging forward) ===
     # Bottom portion (stretched forward)
-    for y in range(12):
-        width_at_y = int(22 - (y * 0.4))
-        height_y = center_y + 8 - y
-        
-        for x in range(-width_at_y, width_at_y + 1):
-            body_x = center_x + x
-            body_y = height_y
-            
-            if 0 <= body_x < width and 0 <= body_y < height:
-                dist_from_center = abs(x)
-                
-                # Outer edge
-                if dist_from_center == width_at_y or y == 0:
-                    canvas[body_y][body_x] = SLIME_EDGE
-                # Left side
-                elif x < -width_at_y // 2:
-                    canvas[body_y][body_x] = SLIME_MID
-                # Right side
-                elif x > width_at_y // 2:
-                    canvas[body_y][body_x] = SLIME_DARK
-                # Center
-                else:
-                    canvas[body_y][body_x] = SLIME_CORE
-    
-    # Top portion (tilted forward for lunge)
-    for y in range(22):
-        width_at_y = int(22 - (y ** 1.2) / 3.2)
-        if width_at_y < 1:
-            break
-        height_y = center_y - 4 - y
-        # Shift forward as we go up
-        x_shift = -y // 3
-        
-        for x in range(-width_at_y, width_at_y + 1):
-            body_x = center_x + x + x_shift
-            body_y = height_y
-            
-            if 0 <= body_x < width and 0 <= body_y < height:
-                dist_from_center = abs(x)
-                
-                # Outer edge
-                if dist_from_center == width_at_y or y == 21:
-                    canvas[body_y][body_x] = SLIME_EDGE
-                # Top highlight
-                elif y > 15 and dist_from_center < 8:
-                    canvas[body_y][body_x] = SLIME_LIGHT
-                # Left side
-                elif x < 0:
-                    canvas[body_y][body_x] = SLIME_MID
-                # Right side
-                elif x > 8:
-                    canvas[body_y][body_x] = SLIME_DARK
-                # Center
-                else:
-                    canvas[body_y][body_x] = SLIME_CORE
+    half_width = lambda row: (22 - (row * 0.4)).astype(int)
+    bottom, row, x = raster.tapered_rows(canvas.shape, center_x, center_y + 8, 12, half_width, step=-1)
+    w = half_width(row)
+    raster.fill(canvas, bottom, SLIME_CORE)
+    # Left side
+    raster.fill(canvas, bottom & (x < -w // 2), SLIME_MID)
+    # Right side
+    raster.fill(canvas, bottom & (x > w // 2), SLIME_DARK)
+    # Outer edge
+    raster.fill(canvas, bottom & ((np.abs(x) == w) | (row == 0)), SLIME_EDGE)
+    
+    # Top portion (tilted forward for lunge), shifting forward as we go up
+    half_width = lambda row: np.where(row < 22, (22 - (np.maximum(row, 0) ** 1.2) / 3.2).astype(int), 0)
+    dome, row, x = raster.tapered_rows(canvas.shape, center_x, center_y - 4, 22, half_width, step=-1,
+                                       shift=lambda row: -row // 3)
+    dome &= half_width(row) >= 1
+    raster.fill(canvas, dome, SLIME_CORE)
+    # Right side
+    raster.fill(canvas, dome & (x > 8), SLIME_DARK)
+    # Left side
+    raster.fill(canvas, dome & (x < 0), SLIME_MID)
+    # Top highlight
+    raster.fill(canvas, dome & (row > 15) & (np.abs(x) < 8), SLIME_LIGHT)
+    # Outer edge
+    raster.fill(canvas, dome & ((np.abs(x) == half_width(row)) | (row == 21)), SLIME_EDGE)
     
     # === FRONT EXTENSION (pseudopod reaching) ===
-    for ext in range(10):
-        ext_x = center_x - 12 - ext
-        ext_y = center_y - 2 + ext // 3
-        ext_height = 4 - ext // 4
-        
-        for ey in range(-ext_height, ext_height + 1):
-            e_x = ext_x
-            e_y = ext_y + ey
-            if 0 <= e_x < width and 0 <= e_y < height:
-                if abs(ey) == ext_height or ext == 9:
-                    canvas[e_y][e_x] = SLIME_EDGE
-                elif ey < 0:
-                    canvas[e_y][e_x] = SLIME_MID
-                else:
-                    canvas[e_y][e_x] = SLIME_LIGHT
+    # One column per step, drifting down and thinning toward the tip
+    ext = (center_x - 12) - xs
+    ey = ys - (center_y - 2 + ext // 3)
+    ext_height = 4 - ext // 4
+    pseudopod = (ext >= 0) & (ext < 10) & (np.abs(ey) <= ext_height)
+    raster.fill(canvas, pseudopod, SLIME_LIGHT)
+    raster.fill(canvas, pseudopod & (ey < 0), SLIME_MID)
+    raster.fill(canvas, pseudopod & ((np.abs(ey) == ext_height) | (ext == 9)), SLIME_EDGE)
     
     # === LARGE SHINE SPOT (top, shifted for angle) ===
     shine_positions = [
@@ -337,10 +239,7 @@ def create_slime_attack():
         (center_x - 12, center_y - 16), (center_x - 11, center_y - 16), (center_x - 10, center_y - 16),
         (center_x - 11, center_y - 15)
     ]
-    
-    for sx, sy in shine_positions:
-        if 0 <= sx < width and 0 <= sy < height:
-            canvas[sy][sx] = SHINE_BRIGHT
+    raster.plot(canvas, shine_positions, SHINE_BRIGHT)
     
     # Shine glow
     shine_glow_positions = [
@@ -348,44 +247,18 @@ def create_slime_attack():
         (center_x - 13, center_y - 19), (center_x - 12, center_y - 19), (center_x - 11, center_y - 19),
         (center_x - 10, center_y - 18), (center_x - 9, center_y - 17), (center_x - 9, center_y - 16)
     ]
-    
-    for sx, sy in shine_glow_positions:
-        if 0 <= sx < width and 0 <= sy < height:
-            if canvas[sy][sx][3] < 200:
-                canvas[sy][sx] = SHINE_GLOW
+    glow = raster.point_mask(canvas.shape, *zip(*shine_glow_positions))
+    raster.fill(canvas, glow & (canvas[..., 3] < 200), SHINE_GLOW)
     
     # === INTERNAL BUBBLES (distorted from motion) ===
     # Large bubble
-    large_bubble_x = center_x - 8
-    large_bubble_y = center_y - 6
-    
-    for by in range(6):
-        bubble_width = 3 - by // 3
-        for bx in range(-bubble_width, bubble_width + 1):
-            b_x = large_bubble_x + bx
-            b_y = large_bubble_y - by
-            if 0 <= b_x < width and 0 <= b_y < height:
-                if by == 0 or abs(bx) == bubble_width:
-                    canvas[b_y][b_x] = BUBBLE_EDGE
-                elif by < 2:
-                    canvas[b_y][b_x] = BUBBLE_BRIGHT
-                else:
-                    canvas[b_y][b_x] = BUBBLE_LIGHT
+    draw_bubble(canvas, center_x - 8, center_y - 6, 6, lambda row: 3 - row // 3,
+                lambda row, dx: row < 2)
     
     # Medium bubbles
-    med_bubble_positions = [(center_x + 6, center_y - 4), (center_x - 3, center_y + 2)]
-    
-    for mbx, mby in med_bubble_positions:
-        for by in range(3):
-            bubble_width = 2 - by // 2
-            for bx in range(-bubble_width, bubble_width + 1):
-                b_x = mbx + bx
-                b_y = mby - by
-                if 0 <= b_x < width and 0 <= b_y < height:
-                    if by == 0 or abs(bx) == bubble_width:
-                        canvas[b_y][b_x] = BUBBLE_EDGE
-                    else:
-                        canvas[b_y][b_x] = BUBBLE_LIGHT
+    for mbx, mby in [(center_x + 6, center_y - 4), (center_x - 3, center_y + 2)]:
+        draw_bubble(canvas, mbx, mby, 3, lambda row: 2 - row // 2,
+                    lambda row, dx: np.zeros_like(row + dx, dtype=bool))
     
     # Small bubbles
     small_bubble_positions = [
@@ -393,39 +266,17 @@ def create_slime_attack():
         (center_x + 2, center_y + 4), (center_x + 10, center_y - 2),
         (center_x - 6, center_y - 14)
     ]
-    
-    for sbx, sby in small_bubble_positions:
-        if 0 <= sbx < width and 0 <= sby < height:
-            canvas[sby][sbx] = BUBBLE_BRIGHT
+    raster.plot(canvas, small_bubble_positions, BUBBLE_BRIGHT)
     
     # === EYES (determined expression) ===
     eye_y = center_y - 10
-    left_eye_x = center_x - 8
-    right_eye_x = center_x + 4
-    
-    for eye_x in [left_eye_x, right_eye_x]:
-        # Outer ring (slightly narrowed for determination)
-        for ey in range(-3, 3):
-            for ex in range(-3, 4):
-                e_x = eye_x + ex
-                e_y = eye_y + ey
-                if 0 <= e_x < width and 0 <= e_y < height:
-                    dist = (ex ** 2 + ey ** 2) ** 0.5
-                    if 2.3 < dist < 3.5:
-                        canvas[e_y][e_x] = EYE_OUTER
-                    elif dist <= 2.3:
-                        if dist < 1.5:
-                            # Pupil (looking forward)
-                            if ex < 0:
-                                canvas[e_y][e_x] = EYE_PUPIL
-                            else:
-                                canvas[e_y][e_x] = EYE_IRIS
-                        else:
-                            canvas[e_y][e_x] = EYE_WHITE
+    
+    for eye_x in [center_x - 8, center_x + 4]:
+        # Slightly narrowed for determination, pupil looking forward
+        draw_round_eye(canvas, eye_x, eye_y, 2, 2.3, lambda dx, dy: dx < 0)
         
         # Eye shine
-        if 0 <= eye_x - 1 < width and 0 <= eye_y - 2 < height:
-            canvas[eye_y - 2][eye_x - 1] = EYE_SHINE
+        raster.plot(canvas, [(eye_x - 1, eye_y - 2)], EYE_SHINE)
     
     # === MOUTH (determined/attacking expression) ===
     mouth_y = center_y - 3
@@ -438,30 +289,17 @@ def create_slime_attack():
         (center_x - 5, mouth_y + 1), (center_x - 4, mouth_y + 2), (center_x - 3, mouth_y + 2),
         (center_x - 2, mouth_y + 2), (center_x - 1, mouth_y + 1), (center_x, mouth_y + 1)
     ]
+    raster.plot(canvas, mouth_positions, MOUTH_LINE)
     
-    for mx, my in mouth_positions:
-        if 0 <= mx < width and 0 <= my < height:
-            canvas[my][mx] = MOUTH_LINE
-    
-    # Mouth interior shadow
-    for mx in range(center_x - 4, center_x):
-        for my in range(mouth_y, mouth_y + 2):
-            if 0 <= mx < width and 0 <= my < height:
-                if canvas[my][mx][3] == 0:
-                    canvas[my][mx] = MOUTH_SHADOW
+    # Mouth interior shadow (only where nothing is drawn yet)
+    interior = raster.rect_mask(canvas.shape, center_x - 4, mouth_y, center_x, mouth_y + 2)
+    raster.fill(canvas, interior & (canvas[..., 3] == 0), MOUTH_SHADOW)
     
     # === MOTION BLUR (trailing behind) ===
-    for mb in range(12):
-        blur_x = center_x + 15 + mb
-        blur_y = center_y - 5 + mb // 4
-        blur_height = 8 - mb // 3
-        
-        for by in range(-blur_height, blur_height + 1):
-            b_x = blur_x
-            b_y = blur_y + by
-            if 0 <= b_x < width and 0 <= b_y < height:
-                if canvas[b_y][b_x][3] == 0:
-                    canvas[b_y][b_x] = MOTION_BLUR
+    # One column per step behind the body, on empty pixels only
+    mb = xs - (center_x + 15)
+    blur = (mb >= 0) & (mb < 12) & (np.abs(ys - (center_y - 5 + mb // 4)) <= 8 - mb // 3)
+    raster.fill(canvas, blur & (canvas[..., 3] == 0), MOTION_BLUR)
     
     # === SMALL SHINE SPOTS ===
     tiny_shine_positions = [
@@ -469,10 +307,7 @@ def create_slime_attack():
         (center_x - 4, center_y + 3), (center_x + 8, center_y),
         (center_x - 8, center_y - 20)
     ]
-    
-    for tsx, tsy in tiny_shine_positions:
-        if 0 <= tsx < width and 0 <= tsy < height:
-            canvas[tsy][tsx] = SHINE_BRIGHT
+    raster.plot(canvas, tiny_shine_positions, SHINE_BRIGHT)
     
     return canvas
 
@@ -11,358 +11,186 @@ Palette: Brown, tan, cream scales with darker diamond patterns
 from PIL import Image
 import numpy as np
 
+import raster
+
+# Color palette - inspired by rattlesnake
+SCALE_BROWN = [139, 90, 43, 255]      # Dark brown scales
+SCALE_TAN = [180, 140, 90, 255]       # Medium tan
+SCALE_LIGHT = [210, 180, 140, 255]    # Light tan/cream
+SCALE_CREAM = [230, 210, 170, 255]    # Belly cream
+SCALE_DARK = [90, 60, 30, 255]        # Very dark brown
+PATTERN_BLACK = [40, 30, 20, 255]     # Diamond pattern
+RATTLE_TAN = [200, 170, 120, 255]     # Rattle segments
+RATTLE_DARK = [120, 90, 50, 255]      # Rattle shadows
+EYE_YELLOW = [220, 200, 60, 255]      # Yellow eye
+EYE_BLACK = [20, 20, 20, 255]         # Pupil
+TONGUE_RED = [200, 50, 50, 255]       # Forked tongue
+FANG_WHITE = [240, 240, 230, 255]     # Fangs
+MOUTH_DARK = [30, 20, 15, 255]        # Open mouth
+
+CENTER_X = 32
+CENTER_Y = 32
+
+
+def coil_mask(shape, cx, cy, radii, angles, scale_x, scale_y):
+    """Pixels covered by an elliptical coil, sampled every degree and every radius step"""
+    rad = np.radians(np.asarray(angles))[:, None]
+    r = np.asarray(radii)[None, :]
+    xs = (cx + r * scale_x * np.cos(rad)).astype(int)
+    ys = (cy + r * scale_y * np.sin(rad)).astype(int)
+    return raster.point_mask(shape, xs, ys)
+
+
+def draw_coils(canvas):
+    """Draw the three body coils shared by both poses"""
+    xs, ys = raster.grid(canvas.shape)
+    scale_bands = raster.palette_map((xs + ys) % 6 // 2, [SCALE_BROWN, SCALE_TAN, SCALE_LIGHT])
+
+    # Bottom coil (largest) with diamond patterns away from the middle
+    bottom = coil_mask(canvas.shape, CENTER_X, CENTER_Y + 12, range(18, 26), range(360), 1, 0.4)
+    canvas[bottom] = scale_bands[bottom]
+    raster.fill(canvas, bottom & ((xs // 4 + ys // 4) % 3 == 0) & (np.abs(xs - CENTER_X) > 10), PATTERN_BLACK)
+
+    # Middle coil
+    middle = coil_mask(canvas.shape, CENTER_X, CENTER_Y, range(15, 22), range(360), 0.7, 0.4)
+    canvas[middle] = scale_bands[middle]
+    raster.fill(canvas, middle & ((xs // 4 + ys // 3) % 3 == 0), PATTERN_BLACK)
+
+    # Top coil (head/neck area)
+    top = coil_mask(canvas.shape, CENTER_X - 5, CENTER_Y - 8, range(12, 18), range(180, 360), 0.6, 0.3)
+    raster.fill(canvas, top, SCALE_LIGHT)
+    raster.fill(canvas, top & ((xs + ys) % 6 < 3), SCALE_TAN)
+
+
+def draw_eye(canvas, x, y):
+    """Draw a pit viper eye: yellow diamond, dark rim, black pupil"""
+    xs, ys = raster.grid(canvas.shape)
+    dx, dy = np.abs(xs - x), np.abs(ys - y)
+    raster.fill(canvas, dx + dy < 3, SCALE_DARK)
+    raster.fill(canvas, dx + dy < 2, EYE_YELLOW)
+    raster.fill(canvas, (dx < 2) & (dy < 2), EYE_BLACK)
+
+
+def draw_rattle(canvas):
+    """Draw the segmented rattle tail shared by both poses"""
+    xs, ys = raster.grid(canvas.shape)
+    rattle_start_x = CENTER_X + 20
+    rattle_start_y = CENTER_Y - 8
+
+    # Rattle segments (8 roughly oval segments, alternating light/dark)
+    for segment in range(8):
+        seg_x = rattle_start_x + segment * 3
+        seg_y = rattle_start_y - segment // 2
+        dx, dy = np.abs(xs - seg_x), np.abs(ys - seg_y)
+        oval = (dx <= 2) & (dy <= 3) & (dx * 1.5 + dy < 4)
+        inner, outer = (RATTLE_TAN, RATTLE_DARK) if segment % 2 == 0 else (RATTLE_DARK, SCALE_BROWN)
+        raster.fill(canvas, oval & (dy < 2), inner)
+        raster.fill(canvas, oval & (dy >= 2), outer)
+
+    # Rattle tip (pointed end)
+    tip_x = rattle_start_x + 24
+    tip_y = rattle_start_y - 4
+    dx, dy = xs - tip_x, np.abs(ys - tip_y)
+    raster.fill(canvas, (dx >= 0) & (dx < 2) & (dy <= 2 - dx), RATTLE_TAN)
+
+
+def draw_belly(canvas):
+    """Draw segmented belly scales on the bottom coil"""
+    xs, ys = raster.grid(canvas.shape)
+    dist_sq = (xs - CENTER_X) ** 2 + ((ys - CENTER_Y - 12) * 2) ** 2
+    area = raster.rect_mask(canvas.shape, CENTER_X - 12, CENTER_Y + 8, CENTER_X + 12, CENTER_Y + 20)
+    raster.fill(canvas, area & (dist_sq < 400) & (dist_sq > 300) & (ys % 2 == 0), SCALE_CREAM)
+
 
 def create_viper_default():
     """Create the default coiled viper pose."""
-    width, height = 64, 64
-    canvas = np.zeros((height, width, 4), dtype=np.uint8)
-    
-    # Color palette - inspired by rattlesnake
-    SCALE_BROWN = [139, 90, 43, 255]      # Dark brown scales
-    SCALE_TAN = [180, 140, 90, 255]       # Medium tan
-    SCALE_LIGHT = [210, 180, 140, 255]    # Light tan/cream
-    SCALE_CREAM = [230, 210, 170, 255]    # Belly cream
-    SCALE_DARK = [90, 60, 30, 255]        # Very dark brown
-    PATTERN_BLACK = [40, 30, 20, 255]     # Diamond pattern
-    RATTLE_TAN = [200, 170, 120, 255]     # Rattle segments
-    RATTLE_DARK = [120, 90, 50, 255]      # Rattle shadows
-    EYE_YELLOW = [220, 200, 60, 255]      # Yellow eye
-    EYE_BLACK = [20, 20, 20, 255]         # Pupil
-    TONGUE_RED = [200, 50, 50, 255]       # Forked tongue
-    
-    center_x = 32
-    center_y = 32
+    canvas = raster.new_canvas(64, 64)
     
     # === BODY COILS (three main coils) ===
-    # Bottom coil (largest)
-    for angle in range(360):
-        rad = np.radians(angle)
-        for r in range(18, 26):
-            x = int(center_x + r * np.cos(rad))
-            y = int(center_y + 12 + r * 0.4 * np.sin(rad))
-            if 0 <= x < width and 0 <= y < height:
-                # Scale pattern
-                pattern_val = (x + y) % 6
-                if pattern_val < 2:
-                    canvas[y][x] = SCALE_BROWN
-                elif pattern_val < 4:
-                    canvas[y][x] = SCALE_TAN
-                else:
-                    canvas[y][x] = SCALE_LIGHT
-                
-                # Diamond patterns
-                if (x // 4 + y // 4) % 3 == 0 and abs(x - center_x) > 10:
-                    canvas[y][x] = PATTERN_BLACK
-    
-    # Middle coil
-    for angle in range(360):
-        rad = np.radians(angle)
-        for r in range(15, 22):
-            x = int(center_x + r * 0.7 * np.cos(rad))
-            y = int(center_y + r * 0.4 * np.sin(rad))
-            if 0 <= x < width and 0 <= y < height:
-                pattern_val = (x + y) % 6
-                if pattern_val < 2:
-                    canvas[y][x] = SCALE_BROWN
-                elif pattern_val < 4:
-                    canvas[y][x] = SCALE_TAN
-                else:
-                    canvas[y][x] = SCALE_LIGHT
-                
-                if (x // 4 + y // 3) % 3 == 0:
-                    canvas[y][x] = PATTERN_BLACK
-    
-    # Top coil (head area)
-    for angle in range(180, 360):
-        rad = np.radians(angle)
-        for r in range(12, 18):
-            x = int(center_x - 5 + r * 0.6 * np.cos(rad))
-            y = int(center_y - 8 + r * 0.3 * np.sin(rad))
-            if 0 <= x < width and 0 <= y < height:
-                pattern_val = (x + y) % 6
-                if pattern_val < 3:
-                    canvas[y][x] = SCALE_TAN
-                else:
-                    canvas[y][x] = SCALE_LIGHT
+    draw_coils(canvas)
     
     # === HEAD (triangular viper head) ===
-    head_x = center_x - 8
-    head_y = center_y - 12
+    head_x = CENTER_X - 8
+    head_y = CENTER_Y - 12
     
-    # Head base (wide triangular shape)
-    for dy in range(12):
-        head_width = 8 - dy // 2
-        for dx in range(-head_width, head_width + 1):
-            hx = head_x + dx
-            hy = head_y + dy
-            if 0 <= hx < width and 0 <= hy < height:
-                if dy < 4:
-                    # Top of head - darker
-                    canvas[hy][hx] = SCALE_BROWN if abs(dx) > 2 else SCALE_TAN
-                else:
-                    # Snout area
-                    canvas[hy][hx] = SCALE_TAN if abs(dx) > 1 else SCALE_LIGHT
+    # Head base (wide triangular shape): darker top of head, lighter snout
+    head, row, dx = raster.tapered_rows(canvas.shape, head_x, head_y, 12, lambda row: 8 - row // 2)
+    raster.fill(canvas, head & (row < 4), SCALE_TAN)
+    raster.fill(canvas, head & (row < 4) & (np.abs(dx) > 2), SCALE_BROWN)
+    raster.fill(canvas, head & (row >= 4), SCALE_LIGHT)
+    raster.fill(canvas, head & (row >= 4) & (np.abs(dx) > 1), SCALE_TAN)
     
     # Eyes (distinctive pit viper eyes)
     for eye_offset in [-4, 4]:
-        for dy in range(-2, 3):
-            for dx in range(-2, 3):
-                eye_x = head_x + eye_offset + dx
-                eye_y = head_y + 3 + dy
-                if 0 <= eye_x < width and 0 <= eye_y < height:
-                    if abs(dx) + abs(dy) < 3:
-                        canvas[eye_y][eye_x] = EYE_YELLOW if abs(dx) + abs(dy) < 2 else SCALE_DARK
-                    if abs(dx) < 2 and abs(dy) < 2:
-                        canvas[eye_y][eye_x] = EYE_BLACK
+        draw_eye(canvas, head_x + eye_offset, head_y + 3)
     
     # Nostrils
-    for nostril_x in [head_x - 2, head_x + 2]:
-        nostril_y = head_y + 8
-        if 0 <= nostril_x < width and 0 <= nostril_y < height:
-            canvas[nostril_y][nostril_x] = SCALE_DARK
+    raster.plot(canvas, [(head_x - 2, head_y + 8), (head_x + 2, head_y + 8)], SCALE_DARK)
     
     # === RATTLE (distinctive segmented rattle tail) ===
-    rattle_start_x = center_x + 20
-    rattle_start_y = center_y - 8
-    
-    # Rattle segments (8 segments)
-    for segment in range(8):
-        seg_x = rattle_start_x + segment * 3
-        seg_y = rattle_start_y - segment // 2
-        
-        # Each segment is roughly oval
-        for dy in range(-3, 4):
-            for dx in range(-2, 3):
-                rx = seg_x + dx
-                ry = seg_y + dy
-                if 0 <= rx < width and 0 <= ry < height:
-                    if abs(dx) * 1.5 + abs(dy) < 4:
-                        # Alternating light/dark segments
-                        if segment % 2 == 0:
-                            canvas[ry][rx] = RATTLE_TAN if abs(dy) < 2 else RATTLE_DARK
-                        else:
-                            canvas[ry][rx] = RATTLE_DARK if abs(dy) < 2 else SCALE_BROWN
-    
-    # Rattle tip (pointed end)
-    tip_x = rattle_start_x + 24
-    tip_y = rattle_start_y - 4
-    for dy in range(-2, 3):
-        for dx in range(2):
-            tx = tip_x + dx
-            ty = tip_y + dy
-            if 0 <= tx < width and 0 <= ty < height and abs(dy) <= 2 - dx:
-                canvas[ty][tx] = RATTLE_TAN
+    draw_rattle(canvas)
     
     # === BELLY SCALES (visible on coils) ===
-    for y in range(center_y + 8, center_y + 20):
-        for x in range(center_x - 12, center_x + 12):
-            if 0 <= x < width and 0 <= y < height:
-                # Check if we're on the body
-                dist_sq = (x - center_x) ** 2 + ((y - center_y - 12) * 2) ** 2
-                if dist_sq < 400 and dist_sq > 300:
-                    # Segmented belly scales
-                    if y % 2 == 0:
-                        canvas[y][x] = SCALE_CREAM
+    draw_belly(canvas)
     
     return canvas
 
 
 def create_viper_attack():
     """Create the striking viper attack animation - same coiled body with head raised and mouth open."""
-    width, height = 64, 64
-    canvas = np.zeros((height, width, 4), dtype=np.uint8)
-    
-    # Color palette - same as default
-    SCALE_BROWN = [139, 90, 43, 255]
-    SCALE_TAN = [180, 140, 90, 255]
-    SCALE_LIGHT = [210, 180, 140, 255]
-    SCALE_CREAM = [230, 210, 170, 255]
-    SCALE_DARK = [90, 60, 30, 255]
-    PATTERN_BLACK = [40, 30, 20, 255]
-    RATTLE_TAN = [200, 170, 120, 255]
-    RATTLE_DARK = [120, 90, 50, 255]
-    EYE_YELLOW = [220, 200, 60, 255]
-    EYE_BLACK = [20, 20, 20, 255]
-    TONGUE_RED = [200, 50, 50, 255]
-    FANG_WHITE = [240, 240, 230, 255]
-    MOUTH_DARK = [30, 20, 15, 255]
-    
-    center_x = 32
-    center_y = 32
+    canvas = raster.new_canvas(64, 64)
     
     # === BODY COILS (same as default - three main coils) ===
-    # Bottom coil (largest)
-    for angle in range(360):
-        rad = np.radians(angle)
-        for r in range(18, 26):
-            x = int(center_x + r * np.cos(rad))
-            y = int(center_y + 12 + r * 0.4 * np.sin(rad))
-            if 0 <= x < width and 0 <= y < height:
-                # Scale pattern
-                pattern_val = (x + y) % 6
-                if pattern_val < 2:
-                    canvas[y][x] = SCALE_BROWN
-                elif pattern_val < 4:
-                    canvas[y][x] = SCALE_TAN
-                else:
-                    canvas[y][x] = SCALE_LIGHT
-                
-                # Diamond patterns
-                if (x // 4 + y // 4) % 3 == 0 and abs(x - center_x) > 10:
-                    canvas[y][x] = PATTERN_BLACK
-    
-    # Middle coil
-    for angle in range(360):
-        rad = np.radians(angle)
-        for r in range(15, 22):
-            x = int(center_x + r * 0.7 * np.cos(rad))
-            y = int(center_y + r * 0.4 * np.sin(rad))
-            if 0 <= x < width and 0 <= y < height:
-                pattern_val = (x + y) % 6
-                if pattern_val < 2:
-                    canvas[y][x] = SCALE_BROWN
-                elif pattern_val < 4:
-                    canvas[y][x] = SCALE_TAN
-                else:
-                    canvas[y][x] = SCALE_LIGHT
-                
-                if (x // 4 + y // 3) % 3 == 0:
-                    canvas[y][x] = PATTERN_BLACK
-    
-    # Top coil (neck area - but no head here)
-    for angle in range(180, 360):
-        rad = np.radians(angle)
-        for r in range(12, 18):
-            x = int(center_x - 5 + r * 0.6 * np.cos(rad))
-            y = int(center_y - 8 + r * 0.3 * np.sin(rad))
-            if 0 <= x < width and 0 <= y < height:
-                pattern_val = (x + y) % 6
-                if pattern_val < 3:
-                    canvas[y][x] = SCALE_TAN
-                else:
-                    canvas[y][x] = SCALE_LIGHT
+    draw_coils(canvas)
     
     # === NECK EXTENSION (connecting to raised head) ===
     # Extend neck upward and to the left
-    for ny in range(12):
-        neck_width = 4 - ny // 4
-        for nx in range(-neck_width, neck_width + 1):
-            neck_x = center_x - 8 - ny // 2 + nx
-            neck_y = center_y - 12 - ny
-            if 0 <= neck_x < width and 0 <= neck_y < height:
-                canvas[neck_y][neck_x] = SCALE_TAN if abs(nx) < 2 else SCALE_BROWN
+    neck, row, dx = raster.tapered_rows(canvas.shape, CENTER_X - 8, CENTER_Y - 12, 12,
+                                        lambda row: 4 - row // 4, step=-1, shift=lambda row: -(row // 2))
+    raster.fill(canvas, neck, SCALE_BROWN)
+    raster.fill(canvas, neck & (np.abs(dx) < 2), SCALE_TAN)
     
     # === HEAD (raised up and to the left with open mouth) ===
-    head_x = center_x - 14
-    head_y = center_y - 28
+    head_x = CENTER_X - 14
+    head_y = CENTER_Y - 28
     
     # Upper jaw (triangular)
-    for dy in range(8):
-        head_width = 6 - dy // 2
-        for dx in range(-head_width, head_width + 1):
-            hx = head_x + dx
-            hy = head_y + dy
-            if 0 <= hx < width and 0 <= hy < height:
-                if dy < 3:
-                    canvas[hy][hx] = SCALE_BROWN if abs(dx) > 2 else SCALE_TAN
-                else:
-                    canvas[hy][hx] = SCALE_TAN if abs(dx) > 1 else SCALE_LIGHT
-    
-    # Lower jaw (open mouth)
-    for dy in range(6):
-        jaw_width = 5 - dy // 2
-        for dx in range(-jaw_width, jaw_width + 1):
-            jx = head_x + dx
-            jy = head_y + 8 + dy
-            if 0 <= jx < width and 0 <= jy < height:
-                if dy < 2:
-                    # Mouth interior (dark)
-                    canvas[jy][jx] = MOUTH_DARK if abs(dx) < 3 else SCALE_TAN
-                else:
-                    # Lower jaw scales
-                    canvas[jy][jx] = SCALE_TAN if abs(dx) > 1 else SCALE_LIGHT
+    jaw, row, dx = raster.tapered_rows(canvas.shape, head_x, head_y, 8, lambda row: 6 - row // 2)
+    raster.fill(canvas, jaw & (row < 3), SCALE_TAN)
+    raster.fill(canvas, jaw & (row < 3) & (np.abs(dx) > 2), SCALE_BROWN)
+    raster.fill(canvas, jaw & (row >= 3), SCALE_LIGHT)
+    raster.fill(canvas, jaw & (row >= 3) & (np.abs(dx) > 1), SCALE_TAN)
+    
+    # Lower jaw (open mouth): dark mouth interior, then lower jaw scales
+    jaw, row, dx = raster.tapered_rows(canvas.shape, head_x, head_y + 8, 6, lambda row: 5 - row // 2)
+    raster.fill(canvas, jaw & (row < 2), SCALE_TAN)
+    raster.fill(canvas, jaw & (row < 2) & (np.abs(dx) < 3), MOUTH_DARK)
+    raster.fill(canvas, jaw & (row >= 2), SCALE_LIGHT)
+    raster.fill(canvas, jaw & (row >= 2) & (np.abs(dx) > 1), SCALE_TAN)
     
     # Eyes (fierce, yellow)
     for eye_offset in [-3, 3]:
-        for dy in range(-2, 3):
-            for dx in range(-2, 3):
-                eye_x = head_x + eye_offset + dx
-                eye_y = head_y + 2 + dy
-                if 0 <= eye_x < width and 0 <= eye_y < height:
-                    if abs(dx) + abs(dy) < 3:
-                        canvas[eye_y][eye_x] = EYE_YELLOW if abs(dx) + abs(dy) < 2 else SCALE_DARK
-                    if abs(dx) < 2 and abs(dy) < 2:
-                        canvas[eye_y][eye_x] = EYE_BLACK
+        draw_eye(canvas, head_x + eye_offset, head_y + 2)
     
     # Fangs (prominent, pointing down)
     for fang_offset in [-2, 2]:
-        for fy in range(5):
-            fang_x = head_x + fang_offset
-            fang_y = head_y + 8 + fy
-            if 0 <= fang_x < width and 0 <= fang_y < height:
-                canvas[fang_y][fang_x] = FANG_WHITE if fy < 4 else SCALE_DARK
+        fang_x = head_x + fang_offset
+        canvas[head_y + 8:head_y + 12, fang_x] = FANG_WHITE
+        canvas[head_y + 12, fang_x] = SCALE_DARK
     
     # Forked tongue (extended from mouth)
     tongue_x = head_x
     tongue_y = head_y + 10
     # Main tongue
-    for ty in range(6):
-        for tx in range(-1, 2):
-            tong_x = tongue_x + tx
-            tong_y = tongue_y + ty
-            if 0 <= tong_x < width and 0 <= tong_y < height:
-                canvas[tong_y][tong_x] = TONGUE_RED
-    
+    canvas[tongue_y:tongue_y + 6, tongue_x - 1:tongue_x + 2] = TONGUE_RED
     # Fork tips
-    for fork_offset in [-2, 2]:
-        for fy in range(2):
-            fork_x = tongue_x + fork_offset
-            fork_y = tongue_y + 5 + fy
-            if 0 <= fork_x < width and 0 <= fork_y < height:
-                canvas[fork_y][fork_x] = TONGUE_RED
+    canvas[tongue_y + 5:tongue_y + 7, [tongue_x - 2, tongue_x + 2]] = TONGUE_RED
     
     # === RATTLE (same as default) ===
-    rattle_start_x = center_x + 20
-    rattle_start_y = center_y - 8
-    
-    # Rattle segments (8 segments)
-    for segment in range(8):
-        seg_x = rattle_start_x + segment * 3
-        seg_y = rattle_start_y - segment // 2
-        
-        # Each segment is roughly oval
-        for dy in range(-3, 4):
-            for dx in range(-2, 3):
-                rx = seg_x + dx
-                ry = seg_y + dy
-                if 0 <= rx < width and 0 <= ry < height:
-                    if abs(dx) * 1.5 + abs(dy) < 4:
-                        # Alternating light/dark segments
-                        if segment % 2 == 0:
-                            canvas[ry][rx] = RATTLE_TAN if abs(dy) < 2 else RATTLE_DARK
-                        else:
-                            canvas[ry][rx] = RATTLE_DARK if abs(dy) < 2 else SCALE_BROWN
-    
-    # Rattle tip (pointed end)
-    tip_x = rattle_start_x + 24
-    tip_y = rattle_start_y - 4
-    for dy in range(-2, 3):
-        for dx in range(2):
-            tx = tip_x + dx
-            ty = tip_y + dy
-            if 0 <= tx < width and 0 <= ty < height and abs(dy) <= 2 - dx:
-                canvas[ty][tx] = RATTLE_TAN
+    draw_rattle(canvas)
     
     # === BELLY SCALES (visible on coils) ===
-    for y in range(center_y + 8, center_y + 20):
-        for x in range(center_x - 12, center_x + 12):
-            if 0 <= x < width and 0 <= y < height:
-                # Check if we're on the body
-                dist_sq = (x - center_x) ** 2 + ((y - center_y - 12) * 2) ** 2
-                if dist_sq < 400 and dist_sq > 300:
-                    # Segmented belly scales
-                    if y % 2 == 0:
-                        canvas[y][x] = SCALE_CREAM
+    draw_belly(canvas)
     
     return canvas
 
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Art Generation Driver
+Runs every create_*.py generator in this directory across a process pool.
+
+Each generator runs in its own scratch directory, so generators written for
+any working directory ('art/...' from the project root, '../art/...' from
+this folder, or a bare file name from inside art/) land in the same place.
+The files a generator writes are then moved into art/ atomically (temp file
++ rename), so the game never sees a half-written PNG.
+
+A cache in art_generation/.cache/ records the SHA-256 of each generator's
+source and of the files it produced. Unchanged generators whose outputs are
+still intact are skipped, so after a palette tweak only the edited scripts
+run again (or all of them, after an edit to a shared helper module such as
+raster.py). When two generators write the same file, the one that sorts last
+wins and the other is told its copy was overwritten.
+
+Usage:
+    python art_generation/generate_art.py              # regenerate what changed
+    python art_generation/generate_art.py --force      # regenerate everything
+    python art_generation/generate_art.py slime wagon  # only matching generators
+    python art_generation/generate_art.py --jobs 4
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import runpy
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+GENERATOR_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(GENERATOR_DIR)
+ART_DIR = os.path.join(PROJECT_ROOT, 'art')
+CACHE_DIR = os.path.join(GENERATOR_DIR, '.cache')
+CACHE_FILE = 'art_cache.json'
+
+# Bump to invalidate every cached result (e.g. when the driver changes how outputs are collected)
+CACHE_VERSION = 1
+
+# Helper modules the generators import; editing one reruns every generator
+SHARED_MODULES = ('raster.py',)
+
+
+def discover_generators(generator_dir=GENERATOR_DIR, only=None):
+    """Find the generator scripts
+
+    Args:
+        generator_dir: Directory holding create_*.py scripts
+        only: Optional list of substrings; keep scripts whose name contains any of them
+
+    Returns:
+        Sorted list of script file names
+    """
+    scripts = sorted(name for name in os.listdir(generator_dir)
+                     if name.startswith('create_') and name.endswith('.py'))
+    if only:
+        scripts = [name for name in scripts if any(pattern in name for pattern in only)]
+    return scripts
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _shared_source(generator_dir):
+    """Concatenated source of the shared helper modules present in generator_dir"""
+    source = b''
+    for name in SHARED_MODULES:
+        path = os.path.join(generator_dir, name)
+        if os.path.isfile(path):
+            with open(path, 'rb') as f:
+                source += name.encode() + b'\0' + f.read()
+    return source
+
+
+def _script_hash(script_path, shared_source=b''):
+    with open(script_path, 'rb') as f:
+        return _sha256(f.read() + shared_source + str(CACHE_VERSION).encode())
+
+
+def _snapshot(directory):
+    """Map file name -> bytes for every file in a directory"""
+    files = {}
+    if os.path.isdir(directory):
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            if os.path.isfile(path):
+                with open(path, 'rb') as f:
+                    files[name] = f.read()
+    return files
+
+
+def run_generator(script_path, art_dir, scratch_root):
+    """Run one generator in a scratch directory and collect what it wrote
+
+    Runs in a worker process. Nothing is written to art/ here; the parent
+    process moves the returned files into place.
+
+    Args:
+        script_path: Absolute path of the create_*.py script
+        art_dir: Real art directory (copied in for generators that read existing art)
+        scratch_root: Directory to create the scratch directory in
+
+    Returns:
+        Dict with script, success, seconds, outputs (file name -> bytes),
+        output (captured stdout/stderr) and error
+    """
+    script = os.path.basename(script_path)
+    scratch = tempfile.mkdtemp(prefix=script[:-3] + '_', dir=scratch_root)
+    # 'art/x.png' and '../art/x.png' from the scratch working dir, or plain 'x.png' in it
+    workdir = os.path.join(scratch, 'art_generation')
+    art_dirs = [os.path.join(workdir, 'art'), os.path.join(scratch, 'art'), workdir]
+
+    with open(script_path, 'r', encoding='utf-8') as f:
+        reads_art = 'Image.open' in f.read()
+    for directory in art_dirs[:2]:
+        if reads_art and os.path.isdir(art_dir):
+            shutil.copytree(art_dir, directory)
+        else:
+            os.makedirs(directory)
+    before = [_snapshot(directory) for directory in art_dirs]
+
+    captured = io.StringIO()
+    previous_cwd = os.getcwd()
+    start = time.perf_counter()
+    result = {'script': script, 'success': True, 'outputs': {}, 'error': None}
+    # Like `python create_x.py`, let the script import its sibling helper modules
+    script_dir = os.path.dirname(script_path)
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+    try:
+        os.chdir(workdir)
+        with contextlib.redirect_stdout(captured), contextlib.redirect_stderr(captured):
+            runpy.run_path(script_path, run_name='__main__')
+    except BaseException as e:  # Generators may call sys.exit()
+        if not (isinstance(e, SystemExit) and e.code in (None, 0)):
+            result['success'] = False
+            result['error'] = f"{type(e).__name__}: {e}"
+    finally:
+        os.chdir(previous_cwd)
+    result['seconds'] = time.perf_counter() - start
+    result['output'] = captured.getvalue()
+
+    # Anything new or changed in the scratch directories is an output
+    for directory, original in zip(art_dirs, before):
+        for name, data in _snapshot(directory).items():
+            if original.get(name) != data:
+                result['outputs'][name] = data
+    shutil.rmtree(scratch, ignore_errors=True)
+    return result
+
+
+def write_atomic(path, data):
+    """Write a file via a temp file and rename so readers never see a partial file"""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+def _load_cache(cache_path):
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if cache.get('version') == CACHE_VERSION else {'version': CACHE_VERSION, 'scripts': {}}
+    except (OSError, ValueError):
+        return {'version': CACHE_VERSION, 'scripts': {}}
+
+
+def _is_up_to_date(entry, script_hash, art_dir):
+    """Check a cache entry against the script and the files it produced"""
+    if not entry or entry.get('hash') != script_hash:
+        return False
+    if not entry.get('outputs') and not entry.get('overwritten'):
+        return False
+    for name, digest in entry['outputs'].items():
+        try:
+            with open(os.path.join(art_dir, name), 'rb') as f:
+                if _sha256(f.read()) != digest:
+                    return False
+        except OSError:
+            return False
+    return True
+
+
+def _install_outputs(ran, script_hashes, cache, art_dir):
+    """Move generated files into art/ and record them in the cache
+
+    Generators are installed in name order, so when two of them write the
+    same file the later one wins, whether it ran now or in an earlier build.
+    """
+    owners = {}
+    for script, entry in cache['scripts'].items():
+        for name in entry.get('outputs', {}):
+            owners[name] = script
+
+    for result in sorted(ran, key=lambda r: r['script']):
+        script = result['script']
+        cache['scripts'].pop(script, None)
+        if not result['success'] or not result['outputs']:
+            continue
+
+        outputs, overwritten = {}, []
+        for name, data in sorted(result['outputs'].items()):
+            owner = owners.get(name)
+            if owner is not None and owner != script and owner > script:
+                overwritten.append(name)
+                print(f"  ⚠ {name} from {script} is overwritten by {owner}")
+                continue
+            if owner is not None and owner != script and owner in cache['scripts']:
+                cache['scripts'][owner]['outputs'].pop(name, None)
+                cache['scripts'][owner].setdefault('overwritten', []).append(name)
+                print(f"  ⚠ {name} from {owner} is overwritten by {script}")
+            write_atomic(os.path.join(art_dir, name), data)
+            outputs[name] = _sha256(data)
+            owners[name] = script
+
+        cache['scripts'][script] = {'hash': script_hashes[script], 'outputs': outputs}
+        if overwritten:
+            cache['scripts'][script]['overwritten'] = overwritten
+
+
+def generate_art(generator_dir=GENERATOR_DIR, art_dir=ART_DIR, cache_dir=CACHE_DIR,
+                 jobs=None, force=False, only=None, verbose=False):
+    """Run all changed generators in parallel and install their outputs
+
+    Args:
+        generator_dir: Directory holding create_*.py scripts
+        art_dir: Where generated images go
+        cache_dir: Where the build cache and scratch directories live
+        jobs: Worker processes (default: CPU count)
+        force: Ignore the cache and run every generator
+        only: Optional list of substrings to select generators
+        verbose: Print each generator's own output
+
+    Returns:
+        List of result dicts (one per generator), with 'skipped' set for cache hits
+    """
+    os.makedirs(art_dir, exist_ok=True)
+    os.makedirs(cache_dir, exist_ok=True)
+    cache_path = os.path.join(cache_dir, CACHE_FILE)
+    cache = _load_cache(cache_path)
+
+    scripts = discover_generators(generator_dir, only)
+    shared_source = _shared_source(generator_dir)
+    results = []
+    pending = {}
+    for script in scripts:
+        script_hash = _script_hash(os.path.join(generator_dir, script), shared_source)
+        if not force and _is_up_to_date(cache['scripts'].get(script), script_hash, art_dir):
+            results.append({'script': script, 'success': True, 'skipped': True, 'seconds': 0.0,
+                            'outputs': cache['scripts'][script]['outputs']})
+        else:
+            pending[script] = script_hash
+
+    print(f"🎨 {len(scripts)} generators: {len(pending)} to run, {len(scripts) - len(pending)} up to date")
+    if not pending:
+        return results
+
+    start = time.perf_counter()
+    ran = []
+    # Spawned (not forked) workers, so a parent with running threads cannot deadlock them
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count(), mp_context=context) as pool:
+        futures = [pool.submit(run_generator, os.path.join(generator_dir, script), art_dir, cache_dir)
+                   for script in pending]
+        for future in as_completed(futures):
+            result = future.result()
+            result['skipped'] = False
+            if result['success'] and result['outputs']:
+                status, detail = '✓', ', '.join(sorted(result['outputs']))
+            elif result['success']:
+                status, detail = '⚠', 'wrote no images'
+            else:
+                status, detail = '✗', result['error']
+            print(f"  {status} {result['script']:<50} {result['seconds']:6.2f}s  {detail}")
+            if verbose or not result['success']:
+                for line in result['output'].splitlines():
+                    print(f"      {line}")
+            ran.append(result)
+
+    _install_outputs(ran, pending, cache, art_dir)
+    results.extend(ran)
+    write_atomic(cache_path, json.dumps(cache, indent=1, sort_keys=True).encode('utf-8'))
+
+    failed = [r for r in ran if not r['success']]
+    print(f"\n⏱  Ran {len(ran)} generators in {time.perf_counter() - start:.2f}s wall time "
+          f"({sum(r['seconds'] for r in ran):.2f}s total); {len(failed)} failed")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regenerate game art from the create_*.py generators")
+    parser.add_argument('only', nargs='*', help="only run generators whose name contains one of these")
+    parser.add_argument('--jobs', '-j', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--force', '-f', action='store_true', help="ignore the cache and run every generator")
+    parser.add_argument('--verbose', '-v', action='store_true', help="show each generator's output")
+    args = parser.parse_args(argv)
+
+    results = generate_art(jobs=args.jobs, force=args.force, only=args.only, verbose=args.verbose)
+    return 1 if any(not r['success'] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
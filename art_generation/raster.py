@@ -0,0 +1,254 @@
+"""
+Raster Primitives
+Vectorized NumPy building blocks shared by the create_*.py art generators.
+
+The generators draw on small RGBA canvases (usually 64x64 or 128x64) shaped
+(height, width, 4). Instead of visiting every pixel in a Python loop, these
+helpers compute a boolean mask (or a value field) for the whole canvas at
+once and apply it with a single indexed assignment.
+
+Conventions:
+    - Coordinates are (x, y) with y pointing down, like canvas[y][x]
+    - Masks and fields have the canvas' (height, width) shape
+    - Colors are [r, g, b, a] lists or arrays with values 0-255
+    - Boxes are half-open: x0 <= x < x1 and y0 <= y < y1, like range()
+"""
+
+import numpy as np
+
+# 4x4 Bayer matrix for ordered dithering (thresholds 0-15)
+BAYER_4X4 = np.array([
+    [0, 8, 2, 10],
+    [12, 4, 14, 6],
+    [3, 11, 1, 9],
+    [15, 7, 13, 5],
+])
+
+
+def new_canvas(width, height):
+    """Create a fully transparent RGBA canvas"""
+    return np.zeros((height, width, 4), dtype=np.uint8)
+
+
+def grid(shape):
+    """Get broadcastable pixel coordinate arrays
+
+    Args:
+        shape: Canvas (or mask) shape; only the first two entries are used
+
+    Returns:
+        (xs, ys): xs has shape (1, width), ys has shape (height, 1)
+    """
+    ys, xs = np.ogrid[:shape[0], :shape[1]]
+    return xs, ys
+
+
+def rect_mask(shape, x0, y0, x1, y1):
+    """Mask of the half-open box x0 <= x < x1, y0 <= y < y1"""
+    xs, ys = grid(shape)
+    return (xs >= x0) & (xs < x1) & (ys >= y0) & (ys < y1)
+
+
+def ellipse_mask(shape, cx, cy, rx, ry):
+    """Mask of pixels with ((x - cx) / rx)^2 + ((y - cy) / ry)^2 <= 1"""
+    xs, ys = grid(shape)
+    return ((xs - cx) / rx) ** 2 + ((ys - cy) / ry) ** 2 <= 1.0
+
+
+def circle_mask(shape, cx, cy, r):
+    """Mask of pixels within r of (cx, cy), edge included"""
+    xs, ys = grid(shape)
+    return (xs - cx) ** 2 + (ys - cy) ** 2 <= r ** 2
+
+
+def distance_field(shape, cx, cy, scale_x=1.0, scale_y=1.0):
+    """Distance of every pixel from (cx, cy)
+
+    Args:
+        shape: Canvas shape
+        cx, cy: Center point
+        scale_x, scale_y: Axis stretch (e.g. scale_y=2 squashes the field into an ellipse)
+
+    Returns:
+        Float array with the canvas' (height, width) shape
+    """
+    xs, ys = grid(shape)
+    return (((xs - cx) * scale_x) ** 2 + ((ys - cy) * scale_y) ** 2) ** 0.5
+
+
+def polygon_mask(shape, points):
+    """Mask of a convex polygon, edges included
+
+    A pixel is inside when it lies on the same side of every edge (or on an
+    edge), which is the classic per-pixel sign test done for all pixels at once.
+
+    Args:
+        shape: Canvas shape
+        points: Polygon corners [(x, y), ...] in either winding order
+    """
+    xs, ys = grid(shape)
+    has_neg = np.zeros(shape[:2], dtype=bool)
+    has_pos = np.zeros(shape[:2], dtype=bool)
+    for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1]):
+        side = (xs - x2) * (y1 - y2) - (x1 - x2) * (ys - y2)
+        has_neg |= side < 0
+        has_pos |= side > 0
+    return ~(has_neg & has_pos)
+
+
+def tapered_rows(shape, x, y, rows, half_width, step=1, shift=None):
+    """A shape built from horizontal spans, one per row, like a hand-drawn blob or jaw
+
+    Args:
+        shape: Canvas shape
+        x, y: Center of the first row
+        rows: Number of rows
+        half_width: Function of the row index array giving each row's half width
+            (spans cover center - half_width .. center + half_width; negative means empty)
+        step: 1 to stack rows downward from y, -1 to stack them upward
+        shift: Optional function of the row index array giving each row's horizontal shift
+
+    Returns:
+        (mask, row, dx): the shape, plus each pixel's row index and its offset
+        from its row's center
+    """
+    xs, ys = grid(shape)
+    row = (ys - y) * step
+    dx = xs - x - (shift(row) if shift else 0)
+    mask = (row >= 0) & (row < rows) & (np.abs(dx) <= half_width(row))
+    return mask, row, dx
+
+
+def point_mask(shape, xs, ys):
+    """Mask of the given pixel coordinates, ignoring any outside the canvas
+
+    Handy for shapes traced as point clouds (e.g. rings sampled by angle and
+    radius), where many samples land on the same pixel.
+    """
+    xs, ys = np.asarray(xs).ravel(), np.asarray(ys).ravel()
+    inside = (xs >= 0) & (xs < shape[1]) & (ys >= 0) & (ys < shape[0])
+    mask = np.zeros(shape[:2], dtype=bool)
+    mask[ys[inside], xs[inside]] = True
+    return mask
+
+
+def outline(mask):
+    """Pixels of a mask that touch a pixel outside it (4-neighbourhood)
+
+    Pixels on the canvas border count as touching the outside.
+    """
+    padded = np.pad(mask, 1, constant_values=False)
+    interior = (padded[:-2, 1:-1] & padded[2:, 1:-1] &
+                padded[1:-1, :-2] & padded[1:-1, 2:])
+    return mask & ~interior
+
+
+def ordered_dither(shape, density):
+    """Bayer-dithered mask covering roughly `density` of the pixels
+
+    Args:
+        shape: Canvas shape
+        density: Fraction of pixels to set, 0.0-1.0 (scalar or per-pixel array)
+    """
+    height, width = shape[:2]
+    reps = (-(-height // 4), -(-width // 4))
+    thresholds = (np.tile(BAYER_4X4, reps)[:height, :width] + 0.5) / 16.0
+    return thresholds < density
+
+
+def palette_map(indices, palette):
+    """Turn an array of palette indices into pixels
+
+    Args:
+        indices: Integer array of palette positions
+        palette: List of colors (all RGBA or all RGB)
+
+    Returns:
+        uint8 array of shape indices.shape + (channels,)
+    """
+    return np.asarray(palette, dtype=np.uint8)[indices]
+
+
+def fill(canvas, mask, color):
+    """Paint every masked pixel with an opaque (or replacing) color"""
+    canvas[mask] = color
+
+
+def plot(canvas, points, color):
+    """Paint a list of (x, y) points, skipping any outside the canvas"""
+    if not points:
+        return
+    xs, ys = np.asarray(points).T
+    inside = (xs >= 0) & (xs < canvas.shape[1]) & (ys >= 0) & (ys < canvas.shape[0])
+    canvas[ys[inside], xs[inside]] = color
+
+
+def blend(canvas, mask, color, alpha=None, keep_alpha=False):
+    """Mix a color over the masked pixels
+
+    Matches the generators' per-pixel blend: each channel becomes
+    int(current * (1 - a) + color * a).
+
+    Args:
+        canvas: RGBA canvas to modify
+        mask: Pixels to blend
+        color: [r, g, b] or [r, g, b, a]
+        alpha: Opacity 0-255, scalar or per-pixel array (default: color's alpha)
+        keep_alpha: Keep the larger of the old and new alpha instead of making pixels opaque
+    """
+    if alpha is None:
+        alpha = color[3]
+    alpha = np.broadcast_to(np.asarray(alpha), mask.shape)[mask]
+    weight = (alpha / 255.0)[:, None]
+    current = canvas[mask]
+    mixed = current[:, :3] * (1 - weight) + np.asarray(color[:3]) * weight
+    canvas[mask, :3] = mixed.astype(np.uint8)
+    if keep_alpha:
+        canvas[mask, 3] = np.maximum(current[:, 3], alpha)
+    else:
+        canvas[mask, 3] = 255
+
+
+def alpha_composite(dst, src, x=0, y=0):
+    """Composite an RGBA layer over a canvas ("over" operator), in place
+
+    Args:
+        dst: Canvas to draw on
+        src: RGBA layer; may be smaller than dst and is clipped at the edges
+        x, y: Where the layer's top-left corner goes on dst
+    """
+    height, width = dst.shape[:2]
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + src.shape[1], width), min(y + src.shape[0], height)
+    if x0 >= x1 or y0 >= y1:
+        return
+    top = src[y0 - y:y1 - y, x0 - x:x1 - x].astype(np.float64) / 255.0
+    bottom = dst[y0:y1, x0:x1].astype(np.float64) / 255.0
+
+    src_a, dst_a = top[..., 3:], bottom[..., 3:]
+    out_a = src_a + dst_a * (1 - src_a)
+    safe_a = np.where(out_a > 0, out_a, 1)
+    out_rgb = (top[..., :3] * src_a + bottom[..., :3] * dst_a * (1 - src_a)) / safe_a
+    result = np.concatenate([out_rgb, out_a], axis=-1)
+    dst[y0:y1, x0:x1] = np.rint(result * 255).astype(np.uint8)
+
+
+def add_clamped(canvas, mask, amounts):
+    """Brighten masked pixels, clamping at 255, and make them opaque
+
+    Args:
+        canvas: RGBA canvas to modify
+        mask: Pixels to brighten
+        amounts: Per-channel [r, g, b] additions, each a scalar or a per-pixel array
+    """
+    for channel, amount in enumerate(amounts):
+        amount = np.broadcast_to(np.asarray(amount), mask.shape)[mask]
+        canvas[mask, channel] = np.minimum(255, canvas[mask, channel].astype(np.int64) + amount)
+    canvas[mask, 3] = 255
+
+
+def scale_rgb(canvas, mask, factors):
+    """Darken (or lighten) masked pixels by a per-pixel factor, truncating like int()"""
+    factors = np.broadcast_to(np.asarray(factors), mask.shape)[mask]
+    canvas[mask, :3] = (canvas[mask, :3] * factors[:, None]).astype(np.uint8)
+    canvas[mask, 3] = 255
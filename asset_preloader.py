@@ -0,0 +1,284 @@
+"""
+Background asset preloader for the Monster Game GUI.
+
+At startup nothing is decoded ahead of time, so the first combat, shop visit
+and fireworks sequence each pay disk and decode costs on the Tk main thread.
+The preloader decodes those sprites into PIL images on a worker thread and
+hands them back to the main thread (via root.after) where the PhotoImages are
+created and stored in the shared SpriteCache.
+"""
+import queue
+import threading
+import time
+
+import config
+from game_logic import load_store
+from image_cache import decode_sprite
+from logger_utils import get_logger
+from sprite_atlas import sprite_exists
+from sprite_variants import monster_sprite_path
+
+logger = get_logger(__name__)
+
+# Number of frames in the victory fireworks sequence (art/victory_fireworks_{n}.png)
+FIREWORKS_FRAMES = 4
+
+
+def combat_sprite_sizes(monster, base_size, image_path=None):
+    """Get the (hero, monster) sprite sizes used by combat and encounters
+
+    The Dragon final boss is drawn config.DRAGON_BOSS_SCALE times larger to
+    show its high-resolution art. Combat, the encounter screen and the
+    preloader all size sprites through this function.
+
+    Args:
+        monster: Monster data dictionary
+        base_size: Base sprite size for the canvas
+        image_path: Monster image being shown (default: the monster's art)
+
+    Returns:
+        Tuple of (hero_size, monster_size)
+    """
+    image_path = image_path if image_path is not None else monster.get('art', '')
+    is_dragon_boss = (monster.get('finalboss', False) and
+                      'dragon_endboss' in str(image_path).lower())
+    monster_size = int(base_size * config.DRAGON_BOSS_SCALE) if is_dragon_boss else base_size
+    return base_size, monster_size
+
+
+def collect_character_assets(game_state, base_size):
+    """Collect sprite requests for hero and monster art
+
+    Args:
+        game_state: GameState with loaded heros and monsters
+        base_size: Combat sprite size for the canvas
+
+    Returns:
+        List of (image_path, width, height) tuples
+    """
+    requests = []
+
+    for hero in game_state.heros.values():
+        if not isinstance(hero, dict):
+            continue
+        # Main menu shows the hero at natural size, combat at sprite size
+        if hero.get('art'):
+            requests.append((hero['art'], None, None))
+        for field in ('art', 'art_attack'):
+            if hero.get(field):
+                requests.append((hero[field], base_size, base_size))
+
+    requests.extend(collect_monster_assets(game_state.monsters.values(), base_size))
+    return requests
+
+
+def collect_monster_assets(monsters, base_size):
+    """Collect sprite requests for monster art at combat size
+
+    Args:
+        monsters: Iterable of monster data dictionaries
+        base_size: Combat sprite size for the canvas
+
+    Returns:
+        List of (image_path, width, height) tuples
+    """
+    requests = []
+
+    for monster in monsters:
+        if not isinstance(monster, dict):
+            continue
+        _, monster_size = combat_sprite_sizes(monster, base_size)
+        for field in ('art', 'art_attack', 'attack_art'):
+            if monster.get(field):
+                requests.append((monster_sprite_path(monster, monster[field]), monster_size, monster_size))
+
+    return requests
+
+
+def collect_store_assets(store_data, layout_size_callback):
+    """Collect sprite requests for store item art
+
+    Args:
+        store_data: Parsed store.yaml (category -> list of items)
+        layout_size_callback: Function mapping an image count to the
+                              show_images size (None for natural size)
+
+    Returns:
+        List of (image_path, width, height) tuples
+    """
+    requests = []
+
+    for items in (store_data or {}).values():
+        if not isinstance(items, list):
+            continue
+
+        # Selecting an item shows it alone at natural size
+        art_by_class = {}
+        for item in items:
+            art = item.get('ascii_art')
+            if art:
+                requests.append((art, None, None))
+                art_by_class.setdefault(item.get('class'), []).append(art)
+
+        # Category listings show every item a class can buy ('All' items included)
+        shared_art = art_by_class.get('All', [])
+        for item_class, class_art in art_by_class.items():
+            listing = class_art if item_class == 'All' else class_art + shared_art
+            size = layout_size_callback(len(listing))
+            if size is not None:
+                requests.extend((art, size, size) for art in listing)
+
+    return requests
+
+
+def collect_fireworks_assets():
+    """Collect sprite requests for the final boss victory fireworks"""
+    return [(f'art/victory_fireworks_{frame}.png', None, None)
+            for frame in range(1, FIREWORKS_FRAMES + 1)]
+
+
+class AssetPreloader:
+    """
+    Decodes sprites on a worker thread and feeds them into a SpriteCache.
+
+    The worker only touches PIL and the filesystem. Finished images are
+    passed through a queue and drained on the Tk main thread by a polling
+    callback scheduled with root.after, which creates the PhotoImages.
+    """
+
+    def __init__(self, sprite_cache, scheduler, progress_callback=None,
+                 poll_interval_ms=30, max_per_poll=4):
+        """
+        Initialize the preloader.
+
+        Args:
+            sprite_cache: SpriteCache receiving the decoded sprites
+            scheduler: Object with after() method (typically tkinter root)
+            progress_callback: Function called as (loaded, total) on the main thread (optional)
+            poll_interval_ms: Delay between main-thread queue drains
+            max_per_poll: Maximum sprites converted to PhotoImages per drain
+        """
+        self.sprite_cache = sprite_cache
+        self.scheduler = scheduler
+        self.progress_callback = progress_callback
+        self.poll_interval_ms = poll_interval_ms
+        self.max_per_poll = max_per_poll
+
+        self._results = queue.Queue()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._started_at = None
+
+        self.total = 0
+        self.loaded = 0
+        self.failed = 0
+        self.finished = False
+
+    def start(self, requests, store_path=None, layout_size_callback=None):
+        """Start preloading in the background
+
+        Args:
+            requests: List of (image_path, width, height) tuples to decode
+            store_path: Store file to read item art from on the worker (optional, loaded
+                like the shop loads it: from the content bundle for store.yaml)
+            layout_size_callback: Maps item counts to show_images sizes (needed with store_path)
+        """
+        # De-duplicate while keeping order (earlier requests are needed sooner)
+        pending = list(dict.fromkeys(requests))
+
+        self.total = len(pending)
+        self.finished = False
+        self._started_at = time.perf_counter()
+
+        self._thread = threading.Thread(
+            target=self._worker,
+            args=(pending, store_path, layout_size_callback),
+            name="AssetPreloader",
+            daemon=True
+        )
+        self._thread.start()
+        self.scheduler.after(self.poll_interval_ms, self._poll)
+
+    def stop(self):
+        """Ask the worker thread to stop after the current sprite"""
+        self._stop_event.set()
+
+    def _worker(self, pending, store_path, layout_size_callback):
+        """Decode sprites off the main thread (PIL only, never Tk)"""
+        if store_path:
+            try:
+                store_data = load_store(store_path)
+                seen = set(pending)
+                store_requests = [r for r in dict.fromkeys(collect_store_assets(store_data, layout_size_callback))
+                                  if r not in seen]
+                pending.extend(store_requests)
+                # Let the main thread know the total grew
+                self._results.put(('total', len(store_requests)))
+            except Exception as e:
+                logger.warning(f"Asset preloader could not read {store_path}: {e}")
+
+        for image_path, width, height in pending:
+            if self._stop_event.is_set():
+                break
+            try:
+                if not sprite_exists(image_path):
+                    raise FileNotFoundError(image_path)
+                img = decode_sprite(image_path, width, height)
+                self._results.put(('image', (image_path, width, height, img)))
+            except Exception as e:
+                logger.debug(f"Asset preloader skipped {image_path}: {e}")
+                self._results.put(('failed', image_path))
+
+        self._results.put(('done', None))
+
+    def _poll(self):
+        """Move decoded sprites into the cache (runs on the Tk main thread)"""
+        handled = 0
+        done = False
+
+        while handled < self.max_per_poll:
+            try:
+                kind, payload = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == 'total':
+                self.total += payload
+                continue
+            if kind == 'done':
+                done = True
+                break
+
+            if kind == 'image':
+                image_path, width, height, img = payload
+                if not self.sprite_cache.contains(image_path, width, height):
+                    self.sprite_cache.put(image_path, img, width, height)
+                    handled += 1
+                self.loaded += 1
+            else:
+                self.failed += 1
+
+            if self.progress_callback:
+                self.progress_callback(self.loaded + self.failed, self.total)
+
+        if done:
+            self.finished = True
+            elapsed_ms = (time.perf_counter() - self._started_at) * 1000
+            logger.info(f"Asset preloader finished: {self.loaded} sprites loaded, "
+                        f"{self.failed} skipped in {elapsed_ms:.0f}ms")
+            return
+
+        self.scheduler.after(self.poll_interval_ms, self._poll)
+
+    def get_progress(self):
+        """Get preloading progress
+
+        Returns:
+            Dict with loaded, failed, total and finished
+        """
+        return {
+            'loaded': self.loaded,
+            'failed': self.failed,
+            'total': self.total,
+            'finished': self.finished
+        }
@@ -88,6 +88,46 @@ class GameBuilder:
             else:
                 print(f"  Warning: {yaml_file} not found (may not be required)")
     
+    def compile_content_bundle(self):
+        """Validate content YAML and compile it into the bundled content file"""
+        self.print_step("Compiling content bundle...")
+        
+        from content_bundle import ContentError, compile_bundle
+        
+        try:
+            bundle_path = compile_bundle()
+        except ContentError as e:
+            self.print_error(f"Content validation failed: {e}")
+            return False
+        
+        self.data_files.append((bundle_path, '.'))
+        self.print_success(f"Compiled {Path(bundle_path).name}")
+        return True
+    
+    def build_sprite_atlases(self):
+        """Pack art/ into atlas pages and bundle them instead of the separate PNGs"""
+        self.print_step("Packing sprite atlases...")
+        
+        from sprite_atlas import ATLAS_DIR, build_atlases
+        
+        try:
+            manifest = build_atlases()
+        except (OSError, ValueError) as e:
+            self.print_error(f"Atlas packing failed, bundling art/ as separate files: {e}")
+            return
+        
+        # Replace the whole art/ directory with the atlas plus any files it does not cover
+        art_dir = self.project_root / 'art'
+        self.data_files = [entry for entry in self.data_files if entry != (str(art_dir), 'art')]
+        self.data_files.append((str(self.project_root / ATLAS_DIR), ATLAS_DIR))
+        unpacked = [path for path in sorted(art_dir.iterdir())
+                    if path.is_file() and f"art/{path.name}" not in manifest['sprites']]
+        for path in unpacked:
+            self.data_files.append((str(path), 'art'))
+        
+        self.print_success(f"Packed {len(manifest['sprites'])} sprites into "
+                           f"{len(manifest['pages'])} atlas pages ({len(unpacked)} other art files)")
+    
     def check_dependencies(self):
         """Check if all required tools and packages are installed"""
         self.print_step("Checking dependencies...")
@@ -373,6 +413,14 @@ Enjoy the game!
         # Step 2: Clean previous builds
         self.clean_build_artifacts()
         
+        # Step 2b: Compile content bundle (validates all YAML)
+        if not self.compile_content_bundle():
+            print("\n[FAIL] Build aborted: Invalid content")
+            return False
+        
+        # Step 2c: Pack sprite atlases
+        self.build_sprite_atlases()
+        
         # Step 3: Generate spec file
         self.generate_spec_file()
         
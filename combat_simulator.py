@@ -0,0 +1,366 @@
+"""
+Headless Monte Carlo combat simulator for balance testing.
+
+Runs many fights for every hero template in heros/ against every monster in
+monsters/, across hero levels and the store gear from store.yaml, without
+the Tk UI. Fights follow the GUI combat rules (game_logic.fight_round with
+gui_rules=True) and are simulated in vectorized batches; matchups are spread
+over a multiprocessing pool. Requires NumPy (a development dependency only).
+
+Usage:
+    python combat_simulator.py --fights 10000 --levels 1-10 --seed 42
+    python combat_simulator.py --hero "Destroyer Dan" --monster Dragon --csv results.csv
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import sys
+import time
+
+import numpy as np
+
+import config
+from game_logic import damage_calculator_batch, load_store, load_yaml_dir
+
+# Hero HP-remaining percentiles reported for each matchup (as % of max HP)
+HP_PERCENTILES = (10, 25, 50, 75, 90)
+
+# Safety cap; minimum damage is 1 so real fights always end well before this
+MAX_ROUNDS = 1000
+
+
+def parse_levels(spec):
+    """Parse a level spec like '1-5,8,10' into a sorted list of levels
+
+    Args:
+        spec: Comma separated levels and inclusive ranges
+
+    Returns:
+        Sorted list of unique levels
+
+    Raises:
+        ValueError: If the spec is malformed or contains levels below 1
+    """
+    levels = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            start, end = (int(value) for value in part.split('-', 1))
+            levels.update(range(start, end + 1))
+        else:
+            levels.add(int(part))
+
+    if not levels or min(levels) < 1:
+        raise ValueError(f"Invalid level spec: {spec!r}")
+    return sorted(levels)
+
+
+def build_loadouts(hero_class, store_data):
+    """Build the gear loadouts a hero class can buy from the store
+
+    Args:
+        hero_class: Hero class name (e.g. 'Warrior')
+        store_data: Parsed store.yaml
+
+    Returns:
+        List of loadout dicts with weapon, armour, attack_bonus and defense_bonus
+        (the first entry is the hero's starting gear)
+    """
+    def class_items(category):
+        return [item for item in store_data.get(category, [])
+                if item.get('class') in (hero_class, 'All')]
+
+    weapons = [None] + [item for item in class_items('Weapons') if 'attack' in item]
+    armours = [None] + [item for item in class_items('Armour') if 'defense' in item]
+
+    loadouts = []
+    for weapon in weapons:
+        for armour in armours:
+            loadouts.append({
+                'weapon': weapon['name'] if weapon else None,
+                'armour': armour['name'] if armour else None,
+                'attack_bonus': weapon.get('attack', 0) if weapon else None,
+                'defense_bonus': armour.get('defense', 0) if armour else None,
+            })
+    return loadouts
+
+
+def loadout_label(loadout):
+    """Describe a loadout for reports"""
+    parts = [name for name in (loadout['weapon'], loadout['armour']) if name]
+    return ' + '.join(parts) if parts else 'starting gear'
+
+
+def scale_hero(hero, level, loadout=None):
+    """Get hero combat stats at a level with an optional store loadout
+
+    Level-ups add the config LEVEL_UP_* bonuses (as GameGUI.hero_level does),
+    and store gear replaces the starting gear bonus like ShopGUI purchases.
+
+    Args:
+        hero: Hero template from heros/
+        level: Hero level to simulate
+        loadout: Loadout from build_loadouts (None for starting gear)
+
+    Returns:
+        Dict with level, hp, attack and defense
+    """
+    levels_gained = level - hero.get('level', 1)
+    attack = hero.get('attack', 1) + levels_gained * config.LEVEL_UP_ATTACK_BONUS
+    defense = hero.get('defense', 0) + levels_gained * config.LEVEL_UP_DEFENSE_BONUS
+    hp = hero.get('maxhp', hero.get('hp', 1)) + levels_gained * config.LEVEL_UP_HP_BONUS
+
+    if loadout:
+        if loadout['attack_bonus'] is not None:
+            attack += loadout['attack_bonus']
+        if loadout['defense_bonus'] is not None:
+            defense += loadout['defense_bonus']
+
+    return {'level': level, 'hp': hp, 'attack': attack, 'defense': defense}
+
+
+def in_encounter_window(hero_level, monster_level):
+    """Check whether a monster can be encountered at a hero level
+
+    Mirrors MonsterEncounterGUI._get_candidate_monsters.
+    """
+    return max(1, hero_level - 2) <= monster_level <= hero_level + 1
+
+
+def simulate_matchup(hero_stats, monster_stats, fights, rng):
+    """Simulate many fights between one hero and one monster in parallel
+
+    Args:
+        hero_stats: Dict with level, hp, attack and defense
+        monster_stats: Dict with level, hp, attack and defense
+        fights: Number of fights to run
+        rng: numpy.random.Generator
+
+    Returns:
+        Dict with wins, win_rate, mean_rounds, hp_remaining_mean and the
+        hero HP-remaining percentiles (as % of max HP)
+    """
+    hero_hp = np.full(fights, hero_stats['hp'], dtype=np.int64)
+    monster_hp = np.full(fights, monster_stats['hp'], dtype=np.int64)
+    rounds = np.zeros(fights, dtype=np.int64)
+    active = np.arange(fights)
+
+    hero_level, monster_level = hero_stats['level'], monster_stats['level']
+
+    for _ in range(MAX_ROUNDS):
+        if active.size == 0:
+            break
+        count = active.size
+
+        # Both damage rolls are made up front, like the GUI combat round
+        variance = rng.uniform(config.DAMAGE_VARIANCE_MIN, config.DAMAGE_VARIANCE_MAX, size=(2, count))
+        hero_damage = damage_calculator_batch(hero_stats['attack'], monster_stats['defense'],
+                                              hero_level, monster_level, variance=variance[0])
+        monster_damage = damage_calculator_batch(monster_stats['attack'], hero_stats['defense'],
+                                                 monster_level, hero_level, variance=variance[1])
+        hero_first = rng.random(count) < 0.5
+
+        h_hp = hero_hp[active]
+        m_hp = monster_hp[active]
+
+        # First strike, then a counter-attack only from survivors
+        m_hp = np.where(hero_first, m_hp - hero_damage, m_hp)
+        h_hp = np.where(~hero_first, h_hp - monster_damage, h_hp)
+        h_hp = np.where(hero_first & (m_hp > 0), h_hp - monster_damage, h_hp)
+        m_hp = np.where(~hero_first & (h_hp > 0), m_hp - hero_damage, m_hp)
+
+        hero_hp[active] = np.maximum(h_hp, 0)
+        monster_hp[active] = np.maximum(m_hp, 0)
+        rounds[active] += 1
+
+        still_fighting = (h_hp > 0) & (m_hp > 0)
+        active = active[still_fighting]
+
+    wins = (monster_hp <= 0) & (hero_hp > 0)
+    hp_remaining_pct = hero_hp * 100.0 / hero_stats['hp']
+
+    result = {
+        'fights': fights,
+        'wins': int(wins.sum()),
+        'win_rate': float(wins.mean()),
+        'mean_rounds': float(rounds.mean()),
+        'hp_remaining_mean': float(hp_remaining_pct.mean()),
+    }
+    for percentile, value in zip(HP_PERCENTILES, np.percentile(hp_remaining_pct, HP_PERCENTILES)):
+        result[f'hp_p{percentile}'] = float(value)
+    return result
+
+
+def build_matchups(heros, monsters, store_data, levels, include_gear=True,
+                   all_matchups=False, hero_filter=None, monster_filter=None):
+    """Build every (hero, level, loadout, monster) combination to simulate
+
+    Args:
+        heros: Hero templates keyed by name
+        monsters: Monster templates keyed by name
+        store_data: Parsed store.yaml
+        levels: Hero levels to simulate
+        include_gear: Whether to simulate store loadouts (otherwise starting gear only)
+        all_matchups: Include monsters outside the encounter level window
+        hero_filter: Only include heroes whose name contains this text (optional)
+        monster_filter: Only include monsters whose name contains this text (optional)
+
+    Returns:
+        List of matchup dicts
+    """
+    matchups = []
+
+    for hero_name, hero in heros.items():
+        if hero_filter and hero_filter.lower() not in hero_name.lower():
+            continue
+        hero_class = hero.get('class', '')
+        loadouts = build_loadouts(hero_class, store_data) if include_gear else [None]
+
+        for level in levels:
+            for loadout in loadouts:
+                hero_stats = scale_hero(hero, level, loadout)
+                for monster_name, monster in monsters.items():
+                    if monster_filter and monster_filter.lower() not in monster_name.lower():
+                        continue
+                    monster_level = monster.get('level', 1)
+                    if not all_matchups and not in_encounter_window(level, monster_level):
+                        continue
+                    matchups.append({
+                        'hero': hero_name,
+                        'hero_class': hero_class,
+                        'loadout': loadout_label(loadout) if loadout else 'starting gear',
+                        'hero_stats': hero_stats,
+                        'monster': monster_name,
+                        'monster_stats': {
+                            'level': monster_level,
+                            'hp': monster.get('maxhp', monster.get('hp', 1)),
+                            'attack': monster.get('attack', 1),
+                            'defense': monster.get('defense', 0),
+                        },
+                    })
+    return matchups
+
+
+def _run_matchup(task):
+    """Pool worker: simulate one matchup with its own seed sequence"""
+    matchup, fights, seed_sequence = task
+    rng = np.random.default_rng(seed_sequence)
+    result = simulate_matchup(matchup['hero_stats'], matchup['monster_stats'], fights, rng)
+
+    return {
+        'hero': matchup['hero'],
+        'hero_class': matchup['hero_class'],
+        'level': matchup['hero_stats']['level'],
+        'loadout': matchup['loadout'],
+        'monster': matchup['monster'],
+        'monster_level': matchup['monster_stats']['level'],
+        **result,
+    }
+
+
+def run_simulation(matchups, fights, seed=None, workers=None):
+    """Simulate all matchups, in parallel when more than one worker is used
+
+    Each matchup gets an independent random stream spawned from the seed,
+    so results are reproducible regardless of worker count.
+
+    Args:
+        matchups: Matchups from build_matchups
+        fights: Fights per matchup
+        seed: Seed for reproducible runs (None for random)
+        workers: Worker processes (default: CPU count, 1 runs in-process)
+
+    Returns:
+        List of result dicts in matchup order
+    """
+    seeds = np.random.SeedSequence(seed).spawn(len(matchups))
+    tasks = [(matchup, fights, child) for matchup, child in zip(matchups, seeds)]
+
+    workers = workers or multiprocessing.cpu_count()
+    if workers <= 1 or len(tasks) <= 1:
+        return [_run_matchup(task) for task in tasks]
+
+    # Spawned workers start from a clean interpreter instead of forking the
+    # parent (and whatever threads or NumPy state it holds) on every platform
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with multiprocessing.get_context('spawn').Pool(processes=workers) as pool:
+        return list(pool.imap(_run_matchup, tasks, chunksize=chunksize))
+
+
+def format_table(results):
+    """Format simulation results as a text table"""
+    header = (f"{'Hero':<20} {'Lvl':>3} {'Loadout':<34} {'Monster':<28} {'MLvl':>4} "
+              f"{'Win%':>6} {'Rounds':>6} {'HP% p10/p50/p90':>17}")
+    lines = [header, "-" * len(header)]
+    for r in results:
+        hp_dist = f"{r['hp_p10']:.0f}/{r['hp_p50']:.0f}/{r['hp_p90']:.0f}"
+        lines.append(f"{r['hero'][:20]:<20} {r['level']:>3} {r['loadout'][:34]:<34} "
+                     f"{r['monster'][:28]:<28} {r['monster_level']:>4} "
+                     f"{r['win_rate'] * 100:>5.1f}% {r['mean_rounds']:>6.1f} {hp_dist:>17}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Headless Monte Carlo combat simulator")
+    parser.add_argument('--fights', type=int, default=2000, help="Fights per matchup (default: 2000)")
+    parser.add_argument('--levels', default='1-10', help="Hero levels, e.g. '1-5,8' (default: 1-10)")
+    parser.add_argument('--seed', type=int, default=None, help="Seed for reproducible results")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--hero', default=None, help="Only simulate heroes whose name contains this text")
+    parser.add_argument('--monster', default=None, help="Only simulate monsters whose name contains this text")
+    parser.add_argument('--no-gear', action='store_true', help="Only simulate starting gear")
+    parser.add_argument('--all-matchups', action='store_true',
+                        help="Include monsters outside the encounter level window")
+    parser.add_argument('--csv', default=None, help="Write results to a CSV file")
+    parser.add_argument('--json', default=None, help="Write results to a JSON file")
+    args = parser.parse_args(argv)
+
+    try:
+        levels = parse_levels(args.levels)
+    except ValueError as e:
+        parser.error(str(e))
+
+    heros = load_yaml_dir('heros')
+    monsters = load_yaml_dir('monsters')
+    store_data = load_store(config.FILE_STORE)
+
+    matchups = build_matchups(heros, monsters, store_data, levels,
+                              include_gear=not args.no_gear,
+                              all_matchups=args.all_matchups,
+                              hero_filter=args.hero,
+                              monster_filter=args.monster)
+    if not matchups:
+        print("No matchups to simulate (check --hero/--monster/--levels)")
+        return 1
+
+    start = time.perf_counter()
+    results = run_simulation(matchups, args.fights, seed=args.seed, workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    print(format_table(results))
+    total_fights = len(matchups) * args.fights
+    print(f"\n{len(matchups)} matchups, {total_fights:,} fights in {elapsed:.1f}s "
+          f"({total_fights / elapsed * 60:,.0f} fights/minute)")
+
+    if args.csv:
+        with open(args.csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+            writer.writeheader()
+            writer.writerows(results)
+        print(f"Results written to {args.csv}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.json}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -25,6 +25,9 @@ BUTTON_HEIGHT = 2
 # Text Area
 TEXT_AREA_WIDTH = 80
 TEXT_AREA_HEIGHT = 15
+TEXT_SCROLLBACK_LINES = 2000     # Oldest lines are trimmed beyond this (0 = unlimited)
+TEXT_SCROLLBACK_TRIM_BATCH = 200 # Lines allowed over the limit before one batched trim
+TEXT_TRANSCRIPT_ENABLED = False  # Also append all printed text to logs/transcript_*.txt
 
 # ============================================================================
 # TIMING CONSTANTS (milliseconds)
@@ -42,6 +45,9 @@ HERO_ATTACK_ANIMATION_DELAY = 1500
 MONSTER_ATTACK_ANIMATION_DELAY = 1500
 COMBAT_ROUND_DELAY = 2000
 DEATH_ANIMATION_DELAY = 2000
+ENTRANCE_ANIMATION_DURATION = 600  # Hero and monster slide-in on encounters
+ANIMATION_FPS = 30       # Frame scheduler tick rate for canvas animations
+COMBAT_SPEED = 1         # Combat animation speed: 1, 2, 4 or 0 (instant, shows only a summary)
 
 # ============================================================================
 # GAME MECHANICS CONSTANTS
@@ -67,9 +73,17 @@ MAX_LEVEL_DIFFERENCE = 5         # Cap level modifier at ±5 levels
 MAX_DEFENSE_REDUCTION = 0.85     # Maximum damage reduction from defense (85%)
 DEFENSE_SCALING_FACTOR = 15      # Used in defense percentage calculation
 
+# Random Number Generation
+RNG_SEED = None                  # Set to an int to replay a session exactly (None = random seed)
+
 # Monster Encounter System
 ELITE_ENCOUNTER_CHANCE = 0.10    # 10% chance for elite encounter
 ELITE_STAT_MULTIPLIER = 1.5      # Elite monsters have 1.5x stats
+ELITE_GLOW_COLOR = '#ff00ff'     # Glow around elite sprites (matches COLOR_ELITE)
+ELITE_GLOW_RADIUS = 4            # Glow width in display pixels
+ELITE_GLOW_OPACITY = 0.8         # Glow strength (0.0 to 1.0)
+ELITE_TINT_STRENGTH = 0.25       # How far elite sprites are tinted toward the glow color
+DRAGON_BOSS_SCALE = 1.8          # Dragon final boss sprite size relative to normal monsters
 
 # Quest System
 QUEST_LEVEL_RANGE_MIN = -2       # Can accept quests for monsters (hero_level - 2)
@@ -94,6 +108,8 @@ AUDIO_BUFFER_SIZE = 512
 AUDIO_CHANNELS = 8               # Number of simultaneous sound channels
 MUSIC_VOLUME_DEFAULT = 0.5       # Background music volume (0.0 to 1.0)
 SFX_VOLUME_DEFAULT = 0.8         # Sound effects volume (0.0 to 1.0)
+SOUND_CACHE_MAX_BYTES = 32 * 1024 * 1024  # Decoded PCM kept in the sound bank, LRU beyond this
+SOUND_PRELOAD_AT_STARTUP = True  # Decode every sound effect on a background thread at startup
 
 # ============================================================================
 # COLOR SCHEME
@@ -119,6 +135,7 @@ COLOR_SUCCESS = '#00ff00'         # Green for success messages
 COLOR_WARNING = '#ffff00'         # Yellow for warnings
 COLOR_QUEST = '#87ceeb'           # Sky blue for quests
 COLOR_ELITE = '#ff00ff'           # Magenta for elite encounters
+TEXT_COLOR_CACHE_SIZE = 1024      # Colorized lines memoized (menus repeat constantly)
 
 # Biome Fallback Colors
 COLOR_BIOME_GRASSLAND = '#4a7c59'
@@ -216,6 +233,17 @@ REQUIRED_PACKAGES = {
 IMAGE_DEFAULT_SIZE = (200, 150)
 IMAGE_SINGLE_SIZE = (400, 300)
 
+# Sprite Cache (decoded + scaled sprites kept in memory)
+SPRITE_CACHE_MAX_BYTES = 32 * 1024 * 1024  # 32 MB budget, LRU eviction beyond this
+
+# Sprite Variants (derived in memory from base sprites, see sprite_variants.py)
+DAMAGE_FLASH_COLOR = '#ffffff'   # Color a sprite flashes when hit
+DAMAGE_FLASH_STRENGTH = 0.7      # How far the flash washes the sprite out (0.0 to 1.0)
+BIOME_TINT_STRENGTH = 0.5        # Strength of 'tint:<biome>' recolors
+
+# Sprite Atlas (art/ packed into a few pages at build time, see sprite_atlas.py)
+ATLAS_MAX_SIZE = 2048  # Atlas page width and height limit in pixels
+
 # Layout Types
 LAYOUT_SINGLE = "single"
 LAYOUT_HORIZONTAL = "horizontal"
@@ -230,6 +258,19 @@ LAYOUT_AUTO = "auto"
 SOUND_BLACKSMITH_HAMMER = 'smith-hammer.mp3'
 SOUND_BLACKSMITH_SHARPEN = 'blacksmith-sharpen.mp3'
 
+# ============================================================================
+# DATA FILE CONSTANTS
+# ============================================================================
+
+# YAML parse cache (keyed on path, mtime and size)
+YAML_CACHE_MAX_FILES = 256       # Parsed documents kept in memory, LRU beyond this
+
+# Save slots
+SAVE_INDEX_FILENAME = 'index.json'  # Sidecar summary of every save in saves/
+SAVE_FORMAT = 'yaml'             # 'yaml' (readable) or 'binary' (compact, checksummed .sav)
+AUTOSAVE_AFTER_FIGHT = False     # Record each fight in saves/autosave.journal
+AUTOSAVE_COMPACT_EVERY = 20      # Journal appends before rewriting it as one snapshot
+
 # ============================================================================
 # GAME BALANCE NOTES
 # ============================================================================
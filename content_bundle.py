@@ -0,0 +1,315 @@
+"""
+Compiled content bundle for the Monster Game.
+
+Startup used to parse every YAML file in monsters/ and heros/ and the shop,
+tavern and story screens re-parsed their YAML each time they opened. The
+content compiler validates all of that YAML once and writes a single
+versioned binary bundle (pickle). At runtime the bundle is read into memory
+once and each section is unpickled on request, which is much faster than the
+pure-Python YAML loader and hands every caller its own copy of the data.
+
+The bundle records a format version, a hash of the validation schema and a
+manifest of (mtime, size) for every source file. If any of those no longer
+match, the bundle is ignored and the YAML files are loaded instead, so
+editing content during development never requires a rebuild.
+
+Compile the bundle with:
+    python content_bundle.py
+"""
+import hashlib
+import os
+import pickle
+import sys
+
+import yaml
+
+from logger_utils import get_logger
+from resource_utils import changed_resources, get_resource_path, list_resource_files, resource_signature
+from yaml_utils import load_yaml_file
+
+logger = get_logger(__name__)
+
+# Bump when the bundle layout changes
+CONTENT_BUNDLE_VERSION = 1
+
+# Bundle file, relative to the project root
+CONTENT_BUNDLE_FILE = 'content.bundle'
+
+# Content sections: directories merge every YAML file, single files load as-is
+SECTION_DIRS = {
+    'monsters': 'monsters',
+    'heros': 'heros',
+}
+SECTION_FILES = {
+    'store': 'store.yaml',
+    'tavern': 'tavern.yaml',
+    'story': 'story.yaml',
+}
+
+# Fields every entry must have. Changing this changes the schema hash,
+# which invalidates bundles compiled against the old rules.
+REQUIRED_FIELDS = {
+    'monsters': ('name', 'hp', 'attack', 'defense', 'level'),
+    'heros': ('class', 'hp', 'attack', 'defense', 'level'),
+    'store': ('name', 'cost'),
+    'tavern': ('name', 'cost'),
+}
+
+
+class ContentError(Exception):
+    """Raised when content YAML fails validation"""
+
+
+def schema_hash():
+    """Hash of the bundle version and validation rules"""
+    schema = repr((CONTENT_BUNDLE_VERSION, sorted(SECTION_DIRS.items()),
+                   sorted(SECTION_FILES.items()), sorted(REQUIRED_FIELDS.items())))
+    return hashlib.sha256(schema.encode('utf-8')).hexdigest()
+
+
+def _source_files():
+    """List (section, relative_path) for every content source file"""
+    sources = []
+    for section, directory in SECTION_DIRS.items():
+        files = list_resource_files(directory, '.yaml') + list_resource_files(directory, '.yml')
+        for fname in sorted(files):
+            sources.append((section, f"{directory}/{fname}"))
+    for section, rel_path in SECTION_FILES.items():
+        if os.path.isfile(get_resource_path(rel_path)):
+            sources.append((section, rel_path))
+    return sources
+
+
+def _read_yaml(rel_path):
+    return load_yaml_file(get_resource_path(rel_path))
+
+
+def _check_fields(section, label, entry):
+    """Check that an entry is a mapping with the section's required fields"""
+    if not isinstance(entry, dict):
+        raise ContentError(f"{label}: expected a mapping, got {type(entry).__name__}")
+    missing = [field for field in REQUIRED_FIELDS.get(section, ()) if field not in entry]
+    if missing:
+        raise ContentError(f"{label}: missing {', '.join(missing)}")
+
+
+def validate_section(section, data, source='<content>'):
+    """Validate the data of one content section
+
+    Args:
+        section: Section name (e.g. 'monsters', 'store')
+        data: Parsed YAML data for the section
+        source: File name used in error messages
+
+    Raises:
+        ContentError: If the data does not match the schema
+    """
+    if section == 'story':
+        if not isinstance(data, dict):
+            raise ContentError(f"{source}: expected a mapping of story sections")
+        return
+
+    if not isinstance(data, dict):
+        raise ContentError(f"{source}: expected a mapping at the top level")
+
+    if section in SECTION_DIRS:
+        for key, entry in data.items():
+            _check_fields(section, f"{source}: {key}", entry)
+    else:
+        # Store and tavern: categories holding lists of items
+        for category, items in data.items():
+            if not isinstance(items, list):
+                raise ContentError(f"{source}: {category} should be a list")
+            for i, item in enumerate(items):
+                _check_fields(section, f"{source}: {category}[{i}]", item)
+
+
+def load_yaml_sources():
+    """Load and validate every content section from YAML
+
+    Returns:
+        Tuple of (sections dict, manifest dict of relative path -> (mtime_ns, size))
+
+    Raises:
+        ContentError: If a file fails validation or cannot be parsed
+    """
+    sections = {section: {} for section in SECTION_DIRS}
+    manifest = {}
+    for section, rel_path in _source_files():
+        manifest[rel_path] = resource_signature(rel_path)
+        try:
+            data = _read_yaml(rel_path)
+        except yaml.YAMLError as e:
+            raise ContentError(f"{rel_path}: YAML parsing error: {e}") from e
+        if data is None:
+            data = {}
+        validate_section(section, data, rel_path)
+        if section in SECTION_DIRS:
+            sections[section].update(data)
+        else:
+            sections[section] = data
+    return sections, manifest
+
+
+def compile_bundle(output_path=None):
+    """Validate all content YAML and write the binary bundle
+
+    Args:
+        output_path: Where to write the bundle (default: CONTENT_BUNDLE_FILE in the project)
+
+    Returns:
+        Path of the written bundle
+
+    Raises:
+        ContentError: If any content fails validation (no bundle is written)
+    """
+    output_path = output_path or get_resource_path(CONTENT_BUNDLE_FILE)
+    sections, manifest = load_yaml_sources()
+
+    bundle = {
+        'version': CONTENT_BUNDLE_VERSION,
+        'schema_hash': schema_hash(),
+        'manifest': manifest,
+        # Each section is pickled on its own so loads hand out fresh copies
+        'sections': {name: pickle.dumps(data, pickle.HIGHEST_PROTOCOL) for name, data in sections.items()},
+    }
+
+    temp_path = output_path + '.tmp'
+    with open(temp_path, 'wb') as fh:
+        pickle.dump(bundle, fh, pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, output_path)
+
+    logger.info(f"Compiled content bundle: {len(manifest)} files -> {output_path}")
+    return output_path
+
+
+def _is_fresh(bundle):
+    """Check a loaded bundle against the version, schema and source files"""
+    if not isinstance(bundle, dict):
+        return False
+    if bundle.get('version') != CONTENT_BUNDLE_VERSION or bundle.get('schema_hash') != schema_hash():
+        return False
+
+    manifest = bundle.get('manifest', {})
+    current = [rel_path for _, rel_path in _source_files()]
+    if sorted(current) != sorted(manifest):
+        return False
+    return not changed_resources(manifest)
+
+
+class ContentStore:
+    """
+    Serves content sections from the compiled bundle, or from YAML when the
+    bundle is missing or stale.
+    """
+
+    def __init__(self, bundle_path=None):
+        """
+        Initialize the content store.
+
+        Args:
+            bundle_path: Path to the compiled bundle (default: CONTENT_BUNDLE_FILE in the project)
+        """
+        self.bundle_path = bundle_path or get_resource_path(CONTENT_BUNDLE_FILE)
+        self._sections = None  # Pickled section bytes from a fresh bundle
+        self._checked = False
+
+    def _load_bundle(self):
+        """Read the bundle into memory once, keeping it only if fresh"""
+        if self._checked:
+            return self._sections
+        self._checked = True
+
+        try:
+            with open(self.bundle_path, 'rb') as fh:
+                bundle = pickle.load(fh)
+        except FileNotFoundError:
+            logger.debug(f"No content bundle at {self.bundle_path}, using YAML")
+            return None
+        except Exception as e:
+            logger.warning(f"Could not read content bundle {self.bundle_path}: {e}")
+            return None
+
+        if not _is_fresh(bundle):
+            logger.info("Content bundle is stale, using YAML (run content_bundle.py to rebuild)")
+            return None
+
+        self._sections = bundle['sections']
+        logger.debug(f"Loaded content bundle with {len(self._sections)} sections")
+        return self._sections
+
+    def using_bundle(self):
+        """Check whether content is being served from the compiled bundle"""
+        return self._load_bundle() is not None
+
+    def invalidate(self):
+        """Forget the loaded bundle so the next request checks it again"""
+        self._sections = None
+        self._checked = False
+
+    def get(self, section):
+        """Get a content section
+
+        Args:
+            section: Section name ('monsters', 'heros', 'store', 'tavern' or 'story')
+
+        Returns:
+            A fresh copy of the section data (callers may modify it)
+        """
+        sections = self._load_bundle()
+        if sections is not None and section in sections:
+            return pickle.loads(sections[section])
+        return self._load_yaml_section(section)
+
+    @staticmethod
+    def _load_yaml_section(section):
+        """YAML fallback for a single section"""
+        if section in SECTION_DIRS:
+            result = {}
+            for source_section, rel_path in _source_files():
+                if source_section == section:
+                    result.update(_read_yaml(rel_path) or {})
+            return result
+        if section in SECTION_FILES:
+            rel_path = SECTION_FILES[section]
+            if not os.path.isfile(get_resource_path(rel_path)):
+                return {}
+            return _read_yaml(rel_path) or {}
+        raise KeyError(f"Unknown content section: {section}")
+
+
+_content_store = None
+
+
+def get_content_store():
+    """Get the shared content store"""
+    global _content_store
+    if _content_store is None:
+        _content_store = ContentStore()
+    return _content_store
+
+
+def get_content(section):
+    """Get a content section from the shared store
+
+    Args:
+        section: Section name ('monsters', 'heros', 'store', 'tavern' or 'story')
+
+    Returns:
+        A fresh copy of the section data
+    """
+    return get_content_store().get(section)
+
+
+def main():
+    try:
+        path = compile_bundle()
+    except ContentError as e:
+        print(f"Content validation failed: {e}")
+        return 1
+    print(f"Content bundle written to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,333 @@
+"""
+Fixed-rate frame scheduler for canvas animations.
+
+Animations used to be chains of self-rescheduling root.after lambdas (jump
+steps, attack toggles, entrance slides, fireworks, the wagon, the blacksmith
+work sequence). Each chain had its own timer, none could be cancelled, and
+overlapping animations piled up callbacks. The FrameScheduler runs a single
+root.after tick at a fixed rate while anything is playing. On each tick every
+active animation computes its state, and all resulting canvas updates are
+applied together in one pass; updates with the same key are coalesced so a
+sprite is moved at most once per frame.
+
+Animations are built from:
+    Tween     - interpolates a value over a duration and passes it to a callback
+    Timeline  - plays tweens, waits and calls one after another
+
+Each animation can belong to a group (e.g. 'combat' or 'encounter') so a
+screen can cancel everything it started when the player leaves it.
+"""
+import time
+
+import config
+from logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+def linear(t):
+    """Linear easing"""
+    return t
+
+
+def ease_out_quad(t):
+    """Quadratic ease-out: fast start, slow finish"""
+    return 1 - (1 - t) ** 2
+
+
+class _Frame:
+    """Canvas updates collected during one tick, applied in one pass"""
+
+    def __init__(self):
+        self._updates = {}  # key -> (callback, args), in first-insertion order
+        self.coalesced = 0
+
+    def set(self, key, callback, *args):
+        """Queue an update; a later update with the same key replaces it"""
+        if key in self._updates:
+            self.coalesced += 1
+        self._updates[key] = (callback, args)
+
+    def defer(self, callback, *args):
+        """Queue a call that is never coalesced"""
+        self._updates[object()] = (callback, args)
+
+    def apply(self):
+        for callback, args in self._updates.values():
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.error(f"Animation update failed: {e}")
+
+
+class Animation:
+    """
+    Base class for anything the FrameScheduler can play.
+
+    update() returns None while the animation is running, or the (clock)
+    time at which it finished so a Timeline can start the next item exactly
+    on time instead of at the next tick.
+    """
+
+    def __init__(self):
+        self.group = None
+        self.start_time = None
+        self.cancelled = False
+
+    def start(self, now):
+        self.start_time = now
+
+    def update(self, now, frame):
+        raise NotImplementedError
+
+    def cancel(self):
+        """Stop the animation; its remaining updates and callbacks never run"""
+        self.cancelled = True
+
+
+class Tween(Animation):
+    """
+    Interpolates a value from start to end over a duration.
+    """
+
+    def __init__(self, duration_ms, on_update, start=0.0, end=1.0, easing=linear, key=None, on_complete=None):
+        """
+        Initialize the tween.
+
+        Args:
+            duration_ms: Length of the tween (0 jumps straight to the end value)
+            on_update: Function called as (value) once per frame
+            start, end: Value range
+            easing: Function mapping progress 0..1 to eased progress
+            key: Coalescing key for the update (e.g. the sprite being moved)
+            on_complete: Function called after the final value is applied
+        """
+        super().__init__()
+        self.duration = duration_ms / 1000.0
+        self.on_update = on_update
+        self.from_value = start
+        self.to_value = end
+        self.easing = easing
+        self.key = key if key is not None else self
+        self.on_complete = on_complete
+
+    def update(self, now, frame):
+        elapsed = now - self.start_time
+        progress = 1.0 if self.duration <= 0 else min(1.0, elapsed / self.duration)
+        value = self.from_value + (self.to_value - self.from_value) * self.easing(progress)
+        frame.set(self.key, self.on_update, value)
+        if progress < 1.0:
+            return None
+        if self.on_complete:
+            frame.defer(self.on_complete)
+        return self.start_time + self.duration
+
+
+class _Wait(Animation):
+    def __init__(self, duration_ms):
+        super().__init__()
+        self.duration = duration_ms / 1000.0
+
+    def update(self, now, frame):
+        end_time = self.start_time + self.duration
+        return end_time if now >= end_time else None
+
+
+class _Call(Animation):
+    def __init__(self, callback, args):
+        super().__init__()
+        self.callback = callback
+        self.args = args
+
+    def update(self, now, frame):
+        frame.defer(self.callback, *self.args)
+        return self.start_time
+
+
+class Timeline(Animation):
+    """
+    Plays animations, waits and calls in sequence.
+
+    Build it with chained calls:
+        Timeline().call(show_attack).wait(250).call(show_normal).tween(...)
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.items = []
+        self._index = 0
+        self._cursor = None
+
+    def add(self, animation):
+        """Append an animation (Tween or nested Timeline)"""
+        self.items.append(animation)
+        return self
+
+    def tween(self, *args, **kwargs):
+        """Append a Tween (same arguments as Tween)"""
+        return self.add(Tween(*args, **kwargs))
+
+    def wait(self, duration_ms):
+        """Append a pause"""
+        return self.add(_Wait(duration_ms))
+
+    def call(self, callback, *args):
+        """Append a function call"""
+        return self.add(_Call(callback, args))
+
+    def start(self, now):
+        super().start(now)
+        self._index = 0
+        self._cursor = now
+        if self.items:
+            self.items[0].start(now)
+
+    def update(self, now, frame):
+        while self._index < len(self.items):
+            finished_at = self.items[self._index].update(now, frame)
+            if finished_at is None:
+                return None
+            # Start the next item when this one ended, not at the current tick
+            self._cursor = finished_at
+            self._index += 1
+            if self._index < len(self.items):
+                self.items[self._index].start(finished_at)
+        return self._cursor
+
+
+class FrameScheduler:
+    """
+    Drives every active animation from one fixed-rate tick.
+    """
+
+    def __init__(self, scheduler, fps=None, clock=time.perf_counter):
+        """
+        Initialize the frame scheduler.
+
+        Args:
+            scheduler: Object with after() method (typically tkinter root)
+            fps: Ticks per second (default: config.ANIMATION_FPS)
+            clock: Function returning the current time in seconds
+        """
+        self.scheduler = scheduler
+        self.frame_ms = max(1, round(1000 / (fps or config.ANIMATION_FPS)))
+        self.clock = clock
+        self._active = []
+        self._ticking = False
+        self._next_tick = None
+        self.reset_stats()
+
+    def play(self, animation, group=None):
+        """Start an animation on the next tick
+
+        Args:
+            animation: Tween or Timeline
+            group: Name used to cancel related animations together
+
+        Returns:
+            The animation (keep it to cancel it individually)
+        """
+        animation.group = group
+        animation.cancelled = False
+        animation.start(self.clock())
+        self._active.append(animation)
+        if not self._ticking:
+            self._ticking = True
+            self._next_tick = self.clock()
+            self.scheduler.after(0, self._tick)
+        return animation
+
+    def cancel(self, group):
+        """Cancel every animation in a group
+
+        Returns:
+            Number of animations cancelled
+        """
+        count = 0
+        for animation in self._active:
+            if animation.group == group and not animation.cancelled:
+                animation.cancel()
+                count += 1
+        self.cancelled += count
+        return count
+
+    def cancel_all(self):
+        """Cancel every active animation (e.g. when the screen changes)"""
+        count = 0
+        for animation in self._active:
+            if not animation.cancelled:
+                animation.cancel()
+                count += 1
+        self.cancelled += count
+        return count
+
+    def is_active(self, group=None):
+        """Check whether anything (or anything in a group) is still playing"""
+        return any(not animation.cancelled and (group is None or animation.group == group)
+                   for animation in self._active)
+
+    def _tick(self):
+        """Advance all animations by one frame and apply their updates"""
+        tick_start = self.clock()
+        frame = _Frame()
+
+        still_running = []
+        for animation in self._active:
+            if animation.cancelled:
+                continue
+            try:
+                if animation.update(tick_start, frame) is None:
+                    still_running.append(animation)
+            except Exception as e:
+                logger.error(f"Dropping animation in group '{animation.group}': {e}")
+        # Animations started by this frame's callbacks are appended to _active
+        self._active = still_running
+        frame.apply()
+        self._active = [a for a in self._active if not a.cancelled]
+
+        elapsed_ms = (self.clock() - tick_start) * 1000
+        self.frames += 1
+        self.coalesced += frame.coalesced
+        self.total_frame_ms += elapsed_ms
+        self.max_frame_ms = max(self.max_frame_ms, elapsed_ms)
+        if tick_start - self._next_tick > self.frame_ms / 1000.0:
+            self.late_frames += 1
+
+        if not self._active:
+            self._ticking = False
+            return
+
+        # Fixed rate: aim for the next slot, skipping slots we are already past
+        frame_seconds = self.frame_ms / 1000.0
+        self._next_tick += frame_seconds
+        now = self.clock()
+        if self._next_tick < now:
+            self._next_tick = now + frame_seconds
+        self.scheduler.after(int((self._next_tick - now) * 1000), self._tick)
+
+    def reset_stats(self):
+        """Reset frame-time statistics"""
+        self.frames = 0
+        self.late_frames = 0
+        self.coalesced = 0
+        self.cancelled = 0
+        self.total_frame_ms = 0.0
+        self.max_frame_ms = 0.0
+
+    def get_stats(self):
+        """Get frame-time statistics
+
+        Returns:
+            Dict with frames, late_frames (ticks more than a frame behind
+            schedule), avg_frame_ms/max_frame_ms (time spent in a tick),
+            coalesced updates, cancelled animations and active animations
+        """
+        return {
+            'frames': self.frames,
+            'late_frames': self.late_frames,
+            'avg_frame_ms': self.total_frame_ms / self.frames if self.frames else 0.0,
+            'max_frame_ms': self.max_frame_ms,
+            'coalesced': self.coalesced,
+            'cancelled': self.cancelled,
+            'active': len(self._active),
+        }
@@ -1,11 +1,20 @@
+import logging
 import os
-import yaml
 import random
 from typing import Dict, Any
 
 import config
 from logger_utils import get_logger
 from resource_utils import get_resource_path
+from content_bundle import SECTION_DIRS, get_content
+from yaml_utils import load_yaml_file
+
+# NumPy is optional: only the batch/balance APIs need it, and it is
+# excluded from the bundled game executable.
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 logger = get_logger(__name__)
 
@@ -20,7 +29,10 @@ def load_yaml_dir(dir_path: str) -> Dict[str, Any]:
 
     Each YAML file is expected to contain a mapping where the top-level key
     is the entity name (this mirrors the existing repo convention).
+    Content directories are served from the compiled content bundle.
     """
+    if dir_path in SECTION_DIRS:
+        return get_content(dir_path)
     result = {}
     full_dir = _join_repo_path(dir_path)
     if not os.path.isdir(full_dir):
@@ -29,33 +41,26 @@ def load_yaml_dir(dir_path: str) -> Dict[str, Any]:
         if not (fname.endswith('.yaml') or fname.endswith('.yml')):
             continue
         path = os.path.join(dir_path, fname)
-        with open(get_resource_path(path), 'r', encoding='utf-8') as fh:
-            data = yaml.safe_load(fh) or {}
-            # data is expected to be a mapping; update the result
-            result.update(data)
+        data = load_yaml_file(get_resource_path(path)) or {}
+        # data is expected to be a mapping; update the result
+        result.update(data)
     return result
 
 
 def load_store(file_path: str = 'store.yaml') -> Dict[str, Any]:
+    if file_path == 'store.yaml':
+        return get_content('store')
     resolved_path = get_resource_path(file_path)
     if not os.path.isfile(resolved_path):
         return {}
-    with open(resolved_path, 'r', encoding='utf-8') as fh:
-        return yaml.safe_load(fh) or {}
+    return load_yaml_file(resolved_path) or {}
 
 
-def damage_calculator(attack: int, defense: int, attacker_level: int = 1, defender_level: int = 1) -> int:
-    """Improved damage calculator with level consideration and reduced variance
-    
-    Key improvements:
-    - Reduced randomness (80-120% instead of 100-200%)
-    - Level differential matters (±15% per level difference)
-    - Percentage-based defense (prevents complete immunity)
-    - Minimum damage scales with level
-    - More predictable combat flow
+def _apply_damage_formula(attack, defense, attacker_level, defender_level, variance):
+    """Apply the damage formula for a given variance roll.
+
+    Returns a tuple of (damage, level_modifier, defense_percentage).
     """
-    # Base damage with controlled randomness (80-120% of attack)
-    variance = random.uniform(config.DAMAGE_VARIANCE_MIN, config.DAMAGE_VARIANCE_MAX)
     base_damage = attack * variance
     
     # Level differential bonus/penalty (±15% per level difference, capped at ±75%)
@@ -72,33 +77,148 @@ def damage_calculator(attack: int, defense: int, attacker_level: int = 1, defend
     # Minimum damage scales with attacker level
     min_damage = max(1, (attacker_level + 1) // 2)
     
-    result = max(min_damage, int(round(final_damage)))
+    return max(min_damage, int(round(final_damage))), level_modifier, defense_percentage
+
+
+def damage_calculator(attack: int, defense: int, attacker_level: int = 1, defender_level: int = 1,
+                      rng=None) -> int:
+    """Improved damage calculator with level consideration and reduced variance
+    
+    This is the single damage engine used by both the GUI combat system and
+    the headless game logic.
+    
+    Key improvements:
+    - Reduced randomness (80-120% instead of 100-200%)
+    - Level differential matters (±15% per level difference)
+    - Percentage-based defense (prevents complete immunity)
+    - Minimum damage scales with level
+    - More predictable combat flow
+    
+    Pass a dedicated random stream as `rng` (see rng_service) for
+    reproducible rolls; the global `random` module is used otherwise.
+    """
+    rng = rng if rng is not None else random
+    
+    # Base damage with controlled randomness (80-120% of attack)
+    variance = rng.uniform(config.DAMAGE_VARIANCE_MIN, config.DAMAGE_VARIANCE_MAX)
+    
+    result, level_modifier, defense_percentage = _apply_damage_formula(
+        attack, defense, attacker_level, defender_level, variance)
     
-    logger.debug(f"Damage calculation: attack={attack}, defense={defense}, "
-                 f"attacker_level={attacker_level}, defender_level={defender_level}, "
-                 f"variance={variance:.2f}, level_modifier={level_modifier:.2f}, "
-                 f"defense_reduction={defense_percentage:.2%}, final_damage={result}")
+    # Only build the debug message when debug logging is actually enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Damage calculation: attack={attack}, defense={defense}, "
+                     f"attacker_level={attacker_level}, defender_level={defender_level}, "
+                     f"variance={variance:.2f}, level_modifier={level_modifier:.2f}, "
+                     f"defense_reduction={defense_percentage:.2%}, final_damage={result}")
     
     return result
 
 
-def fight_round(hero: Dict[str, Any], monster: Dict[str, Any]) -> Dict[str, Any]:
+def damage_calculator_batch(attack, defense, attacker_level=1, defender_level=1, rng=None, variance=None):
+    """Vectorized damage_calculator for many rolls at once (requires NumPy).
+    
+    All arguments broadcast together, so a single matchup can be rolled
+    thousands of times or thousands of matchups rolled once each.
+    
+    Args:
+        attack: Attack value(s)
+        defense: Defense value(s)
+        attacker_level: Attacker level(s)
+        defender_level: Defender level(s)
+        rng: numpy.random.Generator for the variance rolls (default: fresh generator)
+        variance: Fixed variance multiplier(s) to use instead of random rolls
+        
+    Returns:
+        numpy int64 array of damage values
+        
+    Raises:
+        ImportError: If NumPy is not installed
+    """
+    if np is None:
+        raise ImportError("damage_calculator_batch requires numpy (pip install numpy)")
+    
+    attack = np.asarray(attack, dtype=np.float64)
+    defense = np.asarray(defense, dtype=np.float64)
+    attacker_level = np.asarray(attacker_level, dtype=np.int64)
+    defender_level = np.asarray(defender_level, dtype=np.int64)
+    shape = np.broadcast_shapes(attack.shape, defense.shape, attacker_level.shape, defender_level.shape)
+    
+    if variance is None:
+        rng = rng if rng is not None else np.random.default_rng()
+        variance = rng.uniform(config.DAMAGE_VARIANCE_MIN, config.DAMAGE_VARIANCE_MAX, size=shape)
+    
+    base_damage = attack * variance
+    
+    level_diff = np.clip(attacker_level - defender_level, -config.MAX_LEVEL_DIFFERENCE, config.MAX_LEVEL_DIFFERENCE)
+    base_damage = base_damage * (1.0 + level_diff * config.LEVEL_MODIFIER_PER_LEVEL)
+    
+    defense_percentage = np.minimum(config.MAX_DEFENSE_REDUCTION, defense / (defense + config.DEFENSE_SCALING_FACTOR))
+    final_damage = base_damage * (1 - defense_percentage)
+    
+    min_damage = np.maximum(1, (attacker_level + 1) // 2)
+    
+    # np.rint rounds half to even, matching Python's round()
+    return np.maximum(min_damage, np.rint(final_damage).astype(np.int64))
+
+
+def fight_round(hero: Dict[str, Any], monster: Dict[str, Any], rng=None,
+                gui_rules: bool = False) -> Dict[str, Any]:
     """Perform a single combat round between hero and monster.
 
+    By default the hero strikes first and both combatants always attack.
+    With `gui_rules` the round follows the GUI combat instead: initiative is
+    a coin flip, both damage rolls are made up front, and a combatant killed
+    by the first strike does not counter-attack (its damage is reported as 0).
+    The result then also carries a `hero_first` flag.
+
     Returns a dict with the damage done and updated hp values. Does not
     perform any I/O or sleeps — the caller (UI) controls presentation.
+    An optional `rng` stream makes the round reproducible.
     """
+    rng = rng if rng is not None else random
+    
     # Get levels for damage calculation
     hero_level = hero.get('level', 1)
     monster_level = monster.get('level', 1)
     
-    hero_damage = damage_calculator(hero.get('attack', 1), monster.get('defense', 0), hero_level, monster_level)
-    monster['hp'] = max(0, monster.get('hp', 0) - hero_damage)
+    if not gui_rules:
+        hero_damage = damage_calculator(hero.get('attack', 1), monster.get('defense', 0), hero_level, monster_level, rng)
+        monster['hp'] = max(0, monster.get('hp', 0) - hero_damage)
+
+        monster_damage = damage_calculator(monster.get('attack', 1), hero.get('defense', 0), monster_level, hero_level, rng)
+        hero['hp'] = max(0, hero.get('hp', 0) - monster_damage)
 
-    monster_damage = damage_calculator(monster.get('attack', 1), hero.get('defense', 0), monster_level, hero_level)
-    hero['hp'] = max(0, hero.get('hp', 0) - monster_damage)
+        return {
+            'hero_damage': hero_damage,
+            'monster_damage': monster_damage,
+            'hero_hp': hero['hp'],
+            'monster_hp': monster['hp'],
+            'hero_dead': hero['hp'] <= 0,
+            'monster_dead': monster['hp'] <= 0,
+        }
+    
+    # Random initiative - determine who attacks first this round
+    hero_first = rng.choice([True, False])
+    
+    hero_damage = damage_calculator(hero.get('attack', 1), monster.get('defense', 0), hero_level, monster_level, rng)
+    monster_damage = damage_calculator(monster.get('attack', 1), hero.get('defense', 0), monster_level, hero_level, rng)
+    
+    if hero_first:
+        monster['hp'] = max(0, monster.get('hp', 0) - hero_damage)
+        if monster['hp'] > 0:
+            hero['hp'] = max(0, hero.get('hp', 0) - monster_damage)
+        else:
+            monster_damage = 0
+    else:
+        hero['hp'] = max(0, hero.get('hp', 0) - monster_damage)
+        if hero['hp'] > 0:
+            monster['hp'] = max(0, monster.get('hp', 0) - hero_damage)
+        else:
+            hero_damage = 0
 
     result = {
+        'hero_first': hero_first,
         'hero_damage': hero_damage,
         'monster_damage': monster_damage,
         'hero_hp': hero['hp'],
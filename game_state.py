@@ -2,6 +2,9 @@ import os
 import yaml
 from logger_utils import get_logger
 from resource_utils import get_resource_path, list_resource_files
+from monster_catalog import MonsterCatalog
+from content_bundle import get_content_store
+from yaml_utils import load_yaml_file
 
 logger = get_logger(__name__)
 
@@ -10,6 +13,7 @@ class GameState:
     def __init__(self):
         self.hero = {}
         self.monsters = {}
+        self.monster_catalog = None  # MonsterCatalog index over monsters
         self.heros = {}
         self.hero_defaults = {}
         self.choices = {}
@@ -34,12 +38,11 @@ def yaml_file_to_dictionary(file, target_dict):
         The updated target_dict
     """
     try:
-        with open(get_resource_path(file), encoding='utf-8') as fh:
-            fh_yaml = yaml.safe_load(fh)
-            if fh_yaml and isinstance(fh_yaml, dict):
-                target_dict.update(fh_yaml)
-            else:
-                logger.warning(f"Empty or invalid YAML structure in {file}")
+        fh_yaml = load_yaml_file(get_resource_path(file))
+        if fh_yaml and isinstance(fh_yaml, dict):
+            target_dict.update(fh_yaml)
+        else:
+            logger.warning(f"Empty or invalid YAML structure in {file}")
     except FileNotFoundError:
         logger.error(f"YAML file not found: {file}")
     except yaml.YAMLError as e:
@@ -65,20 +68,21 @@ def hero_status(hero):
     logger.info("")
 
 
-def initialize_game_state():
-    """Initialize game state by loading monsters and heroes from YAML files.
-    
+def _load_yaml_content(state):
+    """Load monsters and heros YAML files into the state (bundle fallback).
+
+    Args:
+        state: GameState to fill
+
     Returns:
-        GameState object with loaded data
+        True if both directories loaded, False if loading stopped early
     """
-    state = GameState()
-
     # Load monsters with error handling
     try:
         monsters_dir = _get_project_path('monsters')
         if not os.path.isdir(monsters_dir):
             logger.error(f"Monsters directory not found: {monsters_dir}")
-            return state
+            return False
         
         # Use resource_utils to list YAML files
         files = list_resource_files('monsters', '.yaml') + list_resource_files('monsters', '.yml')
@@ -87,17 +91,17 @@ def initialize_game_state():
             state.monsters = yaml_file_to_dictionary(file_path, state.monsters)
     except OSError as e:
         logger.error(f"Error accessing monsters directory: {e}")
-        return state
+        return False
     except Exception as e:
         logger.error(f"Unexpected error loading monsters: {e}")
-        return state
+        return False
 
     # Load heros with error handling
     try:
         heros_dir = _get_project_path('heros')
         if not os.path.isdir(heros_dir):
             logger.error(f"Heros directory not found: {heros_dir}")
-            return state
+            return False
         
         # Use resource_utils to list YAML files
         files = list_resource_files('heros', '.yaml') + list_resource_files('heros', '.yml')
@@ -106,11 +110,35 @@ def initialize_game_state():
             state.heros = yaml_file_to_dictionary(file_path, state.heros)
     except OSError as e:
         logger.error(f"Error accessing heros directory: {e}")
-        return state
+        return False
     except Exception as e:
         logger.error(f"Unexpected error loading heros: {e}")
+        return False
+
+    return True
+
+
+def initialize_game_state():
+    """Initialize game state by loading monsters and heroes.
+
+    Content comes from the compiled content bundle when it is up to date,
+    otherwise from the YAML files.
+    
+    Returns:
+        GameState object with loaded data
+    """
+    state = GameState()
+
+    content = get_content_store()
+    if content.using_bundle():
+        state.monsters = content.get('monsters')
+        state.heros = content.get('heros')
+    elif not _load_yaml_content(state):
         return state
 
+    # Index monsters by biome and level for encounters and quests
+    state.monster_catalog = MonsterCatalog(state.monsters)
+
     state.hero_defaults = state.heros
     i = 1
     for hero in state.heros:
@@ -9,6 +9,7 @@ from pathlib import Path
 import config
 from logger_utils import get_logger
 from resource_utils import get_resource_path
+from sound_bank import SoundBank, is_music_file
 
 logger = get_logger(__name__)
 
@@ -20,11 +21,16 @@ class Audio:
         self.initialized = False
         self.background_music_playing = False
         self.current_background_music = None
-        self.sound_cache = {}  # Cache for sound effects
+        self.sound_bank = SoundBank()  # Indexed sounds/ + decoded effect cache
         self.music_volume = config.MUSIC_VOLUME_DEFAULT
         self.sfx_volume = config.SFX_VOLUME_DEFAULT
         
         self._initialize_mixer()
+        
+        if self.initialized:
+            self.sound_bank.scan()
+            if config.SOUND_PRELOAD_AT_STARTUP:
+                self.sound_bank.preload()
     
     def _initialize_mixer(self):
         """Initialize pygame mixer with optimal settings"""
@@ -113,20 +119,12 @@ class Audio:
             return False
             
         try:
-            # Resolve resource path for bundled execution
-            sound_path = get_resource_path(f'sounds/{sound_file}')
-            if not os.path.exists(sound_path):
-                logger.error(f"Sound file not found: {sound_path}")
+            # Decoded sounds come from the bank (indexed once at startup)
+            sound = self.sound_bank.get(sound_file)
+            if sound is None:
+                logger.error(f"Sound file not found: sounds/{sound_file}")
                 return False
             
-            # Use cached sound or load new one
-            if sound_file not in self.sound_cache:
-                sound = mixer.Sound(sound_path)
-                self.sound_cache[sound_file] = sound
-                logger.debug(f"Loaded sound effect into cache: {sound_file}")
-            else:
-                sound = self.sound_cache[sound_file]
-            
             # Set volume and play
             volume_level = volume if volume is not None else self.sfx_volume
             sound.set_volume(volume_level)
@@ -153,6 +151,21 @@ class Audio:
             logger.error(f"Could not play sound effect '{sound_file}': {e}")
             return False
     
+    def preload_sound_effects(self, sound_files):
+        """
+        Decode sound effects into the cache on a background thread
+        
+        Args:
+            sound_files: Names of sound files in sounds/ directory
+        
+        Returns:
+            The loader thread, or None if there was nothing to load
+        """
+        if not self.initialized:
+            return None
+        
+        return self.sound_bank.preload(sound_files)
+    
     def play_sound(self, name):
         """
         Legacy method for backwards compatibility
@@ -162,12 +175,7 @@ class Audio:
             return
             
         # Check if this is background music (longer audio files)
-        music_keywords = ['music', 'background', 'bgm', 'theme', 'ambient']
-        sound_file_lower = name.lower()
-        
-        is_background_music = any(keyword in sound_file_lower for keyword in music_keywords)
-        
-        if is_background_music or name == 'start.mp3':
+        if is_music_file(name):
             # Treat as background music
             self.play_background_music(name, loop=True)
         else:
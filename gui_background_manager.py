@@ -6,12 +6,12 @@ Extracted from gui_main.py to reduce complexity and improve maintainability.
 """
 
 import tkinter as tk
-from PIL import Image, ImageTk
+from PIL import ImageTk
 import random
 
 import config
+from image_cache import decode_sprite
 from logger_utils import get_logger
-from resource_utils import get_resource_path
 from game_enums import BiomeType
 
 logger = get_logger(__name__)
@@ -28,10 +28,15 @@ class BackgroundManager:
     - Location-specific backgrounds (shop, town)
     - Teleportation functionality with exclusion logic
     - Canvas background management
+    
+    Backgrounds are decoded and scaled to the canvas size once, then kept in
+    a pinned cache. Switching backgrounds only points the single background
+    canvas item at another cached image, leaving foreground items untouched.
     """
     
     def __init__(self, image_canvas, audio_manager=None, print_text_callback=None, 
-                 lock_interface_callback=None, clear_text_callback=None, main_menu_callback=None):
+                 lock_interface_callback=None, clear_text_callback=None, main_menu_callback=None,
+                 photo_factory=None, rng=None):
         """
         Initialize the Background Manager.
         
@@ -42,6 +47,9 @@ class BackgroundManager:
             lock_interface_callback: Function to lock UI during operations (optional)
             clear_text_callback: Function to clear text display (optional)
             main_menu_callback: Function to return to main menu (optional)
+            photo_factory: Callable turning a PIL image into a display image
+                           (default: ImageTk.PhotoImage)
+            rng: Random stream for teleport destinations (default: global random module)
         """
         self.image_canvas = image_canvas
         self.audio = audio_manager
@@ -49,6 +57,7 @@ class BackgroundManager:
         self.lock_interface = lock_interface_callback or self._default_lock_interface
         self.clear_text = clear_text_callback or self._default_clear_text
         self.main_menu = main_menu_callback or self._default_main_menu
+        self.rng = rng if rng is not None else random
         
         # Biome state tracking
         self.current_biome = BiomeType.GRASSLAND
@@ -57,6 +66,11 @@ class BackgroundManager:
         # Background image reference (prevent garbage collection)
         self.bg_photo = None
         
+        # Pre-scaled background cache (path -> PhotoImage), never evicted
+        self.photo_factory = photo_factory or ImageTk.PhotoImage
+        self.background_cache = {}
+        self.bg_item_id = None
+        
         # Biome configuration
         self.biome_configs = {
             BiomeType.GRASSLAND: {
@@ -106,33 +120,71 @@ class BackgroundManager:
         """Default main menu function if none provided"""
         pass
     
+    def _get_background_photo(self, background_path):
+        """Get the canvas-sized image for a background, loading it on first use
+        
+        Args:
+            background_path: Path to the background image file
+            
+        Returns:
+            PhotoImage scaled to the canvas dimensions
+        """
+        photo = self.background_cache.get(background_path)
+        if photo is None:
+            bg_img = decode_sprite(background_path, config.CANVAS_WIDTH, config.CANVAS_HEIGHT)
+            photo = self.photo_factory(bg_img)
+            self.background_cache[background_path] = photo
+        return photo
+    
+    def warm_background_cache(self):
+        """Load all biome and location backgrounds so later swaps never touch the disk"""
+        background_paths = list(config.BIOME_BACKGROUNDS.values()) + [
+            config.BACKGROUND_SHOP,
+            config.BACKGROUND_BLACKSMITH,
+            config.BACKGROUND_TAVERN
+        ]
+        
+        for background_path in background_paths:
+            try:
+                self._get_background_photo(background_path)
+            except Exception as e:
+                logger.warning(f"Could not preload background {background_path}: {e}")
+    
+    def _background_item_exists(self):
+        """Check whether the background canvas item is still on the canvas"""
+        if self.bg_item_id is None:
+            return False
+        try:
+            return bool(self.image_canvas.type(self.bg_item_id))
+        except tk.TclError:
+            return False
+    
     def set_background_image(self, background_path, fallback_color='#4a7c59'):
         """Set a custom background image for the canvas
         
+        Reuses the existing background canvas item, so foreground images
+        stay on the canvas.
+        
         Args:
             background_path: Path to the background image file
             fallback_color: Hex color to use if image loading fails
         """
         try:
-            # Resolve resource path for bundled execution
-            resolved_path = get_resource_path(background_path)
-            
-            # Use fixed canvas dimensions
-            canvas_width = config.CANVAS_WIDTH
-            canvas_height = config.CANVAS_HEIGHT
-                
-            # Load and resize the background image
-            bg_img = Image.open(resolved_path)
-            bg_img_resized = bg_img.resize((canvas_width, canvas_height), Image.Resampling.NEAREST)
-            self.bg_photo = ImageTk.PhotoImage(bg_img_resized)
+            self.bg_photo = self._get_background_photo(background_path)
             
-            # Clear canvas and draw new background
-            self.image_canvas.delete("all")
-            self.image_canvas.create_image(0, 0, image=self.bg_photo, anchor='nw', tags="background")
+            if self._background_item_exists():
+                self.image_canvas.itemconfig(self.bg_item_id, image=self.bg_photo, state='normal')
+            else:
+                self.bg_item_id = self.image_canvas.create_image(
+                    0, 0, image=self.bg_photo, anchor='nw', tags="background")
+                # Keep the background beneath any foreground images
+                self.image_canvas.tag_lower("background")
             
         except Exception as e:
             self.print_text(f"Warning: Could not load background image {background_path}: {e}")
             # Fallback to solid color
+            if self._background_item_exists():
+                self.image_canvas.itemconfig(self.bg_item_id, state='hidden')
             self.image_canvas.configure(bg=fallback_color)
     
     def set_biome_background(self, biome_name='grassland'):
@@ -165,11 +217,11 @@ class BackgroundManager:
     
     def set_shop_background(self):
         """Set the shop-specific background (not part of biome system)"""
-        self.set_background_image('art/shop_background.png', '#654321')
+        self.set_background_image(config.BACKGROUND_SHOP, '#654321')
     
     def set_blacksmith_background(self):
         """Set the blacksmith-specific background (not part of biome system)"""
-        self.set_background_image('art/blacksmith_background.png', '#404050')
+        self.set_background_image(config.BACKGROUND_BLACKSMITH, '#404050')
     
     def set_town_background(self):
         """Set the town-specific background"""
@@ -179,7 +231,7 @@ class BackgroundManager:
     
     def set_tavern_background(self):
         """Set the tavern-specific background"""
-        self.set_background_image('art/tavern_background.png', '#3D2B1F')
+        self.set_background_image(config.BACKGROUND_TAVERN, '#3D2B1F')
     
     def cycle_biomes(self, available_biomes=None):
         """Cycle through available biomes for testing/debugging
@@ -263,7 +315,7 @@ class BackgroundManager:
                 self.print_text("💡 Explore and level up to unlock new biomes!")
         
         # Select random biome from remaining options
-        new_biome = random.choice(other_biomes)
+        new_biome = self.rng.choice(other_biomes)
         
         # Set the new biome
         self.set_biome_background(new_biome)
@@ -416,26 +468,5 @@ class BackgroundManager:
     
     def initialize_default_background(self):
         """Initialize the default background (called during startup)"""
-        try:
-            # Resolve resource path for bundled execution
-            resolved_path = get_resource_path('art/grassy_background.png')
-            
-            # Use fixed canvas dimensions (800x400)
-            canvas_width = 800
-            canvas_height = 400
-                
-            # Load the grassy background image
-            bg_img = Image.open(resolved_path)
-            
-            # Resize to fixed canvas dimensions
-            bg_img_resized = bg_img.resize((canvas_width, canvas_height), Image.Resampling.NEAREST)
-            self.bg_photo = ImageTk.PhotoImage(bg_img_resized)
-            
-            # Clear canvas and draw background
-            self.image_canvas.delete("all")
-            self.image_canvas.create_image(0, 0, image=self.bg_photo, anchor='nw', tags="background")
-            
-        except Exception as e:
-            self.print_text(f"Warning: Could not load background image: {e}")
-            # Fallback to solid color
-            self.image_canvas.configure(bg='#4a7c59')
\ No newline at end of file
+        self.warm_background_cache()
+        self.set_background_image(config.BIOME_BACKGROUNDS['grassland'], '#4a7c59')
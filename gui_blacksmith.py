@@ -4,6 +4,10 @@ Blacksmith system for GUI - provides services instead of selling items
 from typing import TYPE_CHECKING
 
 import config
+from frame_scheduler import Timeline
+
+# Frame scheduler group for the work sequence
+BLACKSMITH_ANIMATION_GROUP = 'blacksmith'
 
 if TYPE_CHECKING:
     from gui_interfaces import GameContextProtocol
@@ -43,8 +47,9 @@ class BlacksmithGUI:
     
     def open(self):
         """Open blacksmith shop"""
-        # Set the blacksmith-specific background
+        # Set the blacksmith-specific background on an empty stage
         self.gui.set_blacksmith_background()
+        self.gui._clear_foreground_images()
         
         self.gui.clear_text()
         self.gui.lock_interface()
@@ -172,24 +177,20 @@ class BlacksmithGUI:
             f"\"There! Perfect craftsmanship!\" 👨‍🔧"
         ]
         
-        def show_work_step(step=0):
-            if step < len(work_messages):
-                if step == 0:
-                    self.gui.clear_text()
-                    self.gui.print_text("⚒️  ENHANCEMENT IN PROGRESS  ⚒️")
-                    self.gui.print_text("=" * 60)
-                
-                self.gui.print_text(f"\n{work_messages[step]}")
-                
-                # Continue to next step after delay
-                delay = 1500 if step in [2, 3] else 1000  # Longer delay for dramatic effect
-                self.gui.root.after(delay, lambda: show_work_step(step + 1))
-            else:
-                # Show final result
-                self._show_enhancement_result(service, old_value, new_value)
+        self.gui.clear_text()
+        self.gui.print_text("⚒️  ENHANCEMENT IN PROGRESS  ⚒️")
+        self.gui.print_text("=" * 60)
+        
+        timeline = Timeline()
+        for step, message in enumerate(work_messages):
+            timeline.call(self.gui.print_text, f"\n{message}")
+            # Continue to next step after delay
+            timeline.wait(1500 if step in [2, 3] else 1000)  # Longer delay for dramatic effect
         
-        # Start the work sequence
-        show_work_step()
+        # Show final result
+        timeline.call(self._show_enhancement_result, service, old_value, new_value)
+        self.gui.frame_scheduler.cancel(BLACKSMITH_ANIMATION_GROUP)
+        self.gui.frame_scheduler.play(timeline, group=BLACKSMITH_ANIMATION_GROUP)
     
     def _show_enhancement_result(self, service, old_value, new_value):
         """Show the final enhancement result"""
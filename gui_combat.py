@@ -3,9 +3,18 @@ Combat system for GUI
 """
 import random
 from typing import Callable, Dict, Any, Optional
+from game_logic import damage_calculator, fight_round
 from gui_interfaces import GameContextProtocol
 from logger_utils import get_logger
-from resource_utils import resource_exists, get_resource_path
+from sprite_atlas import sprite_exists
+from sprite_variants import monster_sprite_path
+from content_bundle import get_content
+from frame_scheduler import FrameScheduler, Timeline, Tween
+from animation_clips import build_combatant_clips
+from asset_preloader import combat_sprite_sizes
+
+# Frame scheduler group for every combat animation
+COMBAT_ANIMATION_GROUP = 'combat'
 
 logger = get_logger(__name__)
 
@@ -18,16 +27,23 @@ class CombatGUI:
                  audio,
                  interface_control,
                  timer,
-                 game_state):
+                 game_state,
+                 rng=None,
+                 frames=None):
         """Initialize combat system with specific dependencies.
         
         Args:
             text_display: Object with print_text(), clear_text(), print_combat_damage(), _print_colored_parts()
-            image_display: Object with show_image(), _clear_foreground_images(), _add_canvas_image(), _get_canvas_dimensions()
+            image_display: Object with show_image(), _clear_foreground_images(), _add_canvas_image(), _create_sprite(),
+                _get_canvas_dimensions() and optionally _get_sprite_photo() (enables precomputed animation clips)
             audio: Object with play_sound_effect() method
             interface_control: Object with lock_interface(), unlock_interface() methods
-            timer: Object with after() method for scheduling callbacks (typically tkinter root)
+            timer: Object with after() method for scheduling callbacks (typically an
+                AnimationScheduler; fights resolve in one step when its instant flag is set).
+                Its wrapped `scheduler`, if any, runs cutscenes and held screens at normal speed
             game_state: Object with game state data
+            rng: Random stream for combat rolls (default: global random module)
+            frames: FrameScheduler that plays the sprite animations (default: one ticking on timer)
         """
         self.text_display = text_display
         self.image_display = image_display
@@ -35,6 +51,26 @@ class CombatGUI:
         self.interface_control = interface_control
         self.timer = timer
         self.game_state = game_state
+        self.rng = rng if rng is not None else random
+        self.frames = frames if frames is not None else FrameScheduler(timer)
+
+    def _scaled(self, delay_ms):
+        """Scale an animation duration by the combat speed (if the timer has one)"""
+        scale = getattr(self.timer, 'scale', None)
+        return scale(delay_ms) if scale else delay_ms
+
+    def _after_unscaled(self, delay_ms, callback):
+        """Schedule a callback at normal speed
+        
+        Combat speed only applies inside fights; the death hold, fireworks and
+        the wagon/Shiva cutscene always run in real time.
+        """
+        scheduler = getattr(self.timer, 'scheduler', self.timer)
+        return scheduler.after(delay_ms, callback)
+
+    def _play(self, animation):
+        """Play a combat animation on the frame scheduler"""
+        return self.frames.play(animation, group=COMBAT_ANIMATION_GROUP)
     
     def fight(self, hero, monster, callback):
         """Execute fight with GUI updates and attack animations"""
@@ -67,11 +103,15 @@ class CombatGUI:
         if hero['hp'] <= 0 or monster['hp'] <= 0:
             self._end_combat()
             return
+
+        if getattr(self.timer, 'instant', False):
+            self._resolve_fight_instantly()
+            return
         
         self.text_display.print_text(f"--- Round {self.round_num} ---")
         
         # Random initiative - determine who attacks first this round
-        hero_goes_first = random.choice([True, False])
+        hero_goes_first = self.rng.choice([True, False])
         
         # Calculate damage for both attacks (with level consideration)
         hero_level = hero.get('level', 1)
@@ -94,11 +134,35 @@ class CombatGUI:
             self.timer.after(1500, lambda: self._complete_monster_attack_start_hero(
                 monster_damage, hero_damage, monster, hero, f"💀 {monster['name']} attacks for {{damage}} damage!", self.round_num))
 
+    def _resolve_fight_instantly(self):
+        """Resolve the remaining rounds without animation and show a summary"""
+        hero = self.current_hero
+        monster = self.current_monster
+        first_round = self.round_num
+        damage_dealt = 0
+        damage_taken = 0
+
+        while hero['hp'] > 0 and monster['hp'] > 0:
+            result = fight_round(hero, monster, self.rng, gui_rules=True)
+            damage_dealt += result['hero_damage']
+            damage_taken += result['monster_damage']
+            self.round_num += 1
+
+        rounds = self.round_num - first_round
+        self.text_display.print_text(f"⏩ {rounds} rounds resolved instantly")
+        self.text_display.print_text(f"⚡ You dealt {damage_dealt} damage")
+        self.text_display.print_text(f"💀 {monster['name']} dealt {damage_taken} damage")
+        self._finish_round_status(hero, monster, self.round_num - 1)
+        self._end_combat()
+
     def _end_combat(self):
         """End combat and show results"""
         hero = self.current_hero
         monster = self.current_monster
         
+        # Stop any attack animation still playing so it cannot redraw over the result
+        self.frames.cancel(COMBAT_ANIMATION_GROUP)
+        
         result = 'won' if hero['hp'] > 0 else 'lost'
         
         # Check if this is a final boss victory for special animation
@@ -128,7 +192,7 @@ class CombatGUI:
                 self._show_hero_death_in_combat(hero)
                 
                 # Hold death scene for 3 seconds, then transition
-                self.timer.after(3000, lambda: self._complete_death_sequence(result))
+                self._after_unscaled(3000, lambda: self._complete_death_sequence(result))
     
     def _show_combat_options(self):
         """Show combat options menu after auto-combat rounds"""
@@ -215,7 +279,7 @@ class CombatGUI:
         self._finish_round_status(hero, monster, self.round_num)
         
         # 50% chance of monster attack response
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             self.text_display.print_text(f"\n⚠️ {monster['name']} seizes the moment to attack!")
             self.timer.after(1000, self._monster_attack_response)
         else:
@@ -242,6 +306,7 @@ class CombatGUI:
         """Complete the monster's response attack"""
         self.text_display.print_combat_damage("💀 {monster} attacks for {damage} damage!", damage, monster['name'])
         hero['hp'] = max(0, hero['hp'] - damage)
+        self._play_hit_flash('hero')
         
         self._finish_round_status(hero, monster, self.round_num)
         
@@ -252,7 +317,7 @@ class CombatGUI:
 
     def _attempt_run(self):
         """Attempt to run from combat"""
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             self.text_display.print_text("\n🏃 You escaped successfully!")
             self.interface_control.unlock_interface()
             self.fight_callback('run')
@@ -266,13 +331,13 @@ class CombatGUI:
         hero_image_path = hero.get('art', '')
         
         try:
-            if hero_image_path and resource_exists(hero_image_path):
+            if hero_image_path and sprite_exists(hero_image_path):
                 self.current_hero_image = hero_image_path
             else:
                 # Fallback to class-based path if art field missing
                 hero_class = hero.get('class', 'Warrior').lower()
                 fallback_path = f"art/{hero_class.capitalize()}.png"
-                if resource_exists(fallback_path):
+                if sprite_exists(fallback_path):
                     self.current_hero_image = fallback_path
                 else:
                     self.current_hero_image = 'art/crossed_swords.png'
@@ -283,8 +348,8 @@ class CombatGUI:
         # Get monster image path
         if 'art' in monster and monster['art']:
             try:
-                if resource_exists(monster['art']):
-                    self.current_monster_image = monster['art']
+                if sprite_exists(monster['art']):
+                    self.current_monster_image = monster_sprite_path(monster, monster['art'])
                 else:
                     self.current_monster_image = 'art/crossed_swords.png'
             except (OSError, TypeError) as e:
@@ -295,6 +360,12 @@ class CombatGUI:
         
         # Store monster data for Dragon boss detection
         self.current_monster_data = monster
+        self.current_hero_data = hero
+        
+        # New fight: fresh sprites, and animation clips built for this pair
+        self.hero_sprite = self.monster_sprite = None
+        self.combat_clips = {}
+        self.combat_clip_sizes = None
         
         # Use custom display logic for Dragon boss sizing
         self._display_combat_images_with_sizing()
@@ -319,23 +390,16 @@ class CombatGUI:
     
     def _display_combat_images_with_sizing(self):
         """Display hero and monster images with special Dragon boss sizing"""
-        # Clear existing foreground images
-        self.image_display._clear_foreground_images()
-        
         # Get canvas dimensions for positioning
         canvas_width, canvas_height = self.image_display._get_canvas_dimensions()
         
         # Calculate final positions (same logic as encounter system)
         base_img_size = min(canvas_width // 3, canvas_height // 2, 120)
         
-        # Special handling for double-resolution Dragon final boss
+        # Larger size for the double-resolution Dragon final boss
         monster_data = getattr(self, 'current_monster_data', {})
-        is_dragon_boss = (monster_data.get('finalboss', False) and 
-                         'dragon_endboss' in self.current_monster_image.lower())
-        
-        # Use larger size for Dragon boss to show its high-resolution art
-        hero_img_size = base_img_size
-        monster_img_size = int(base_img_size * 1.8) if is_dragon_boss else base_img_size
+        hero_img_size, monster_img_size = combat_sprite_sizes(monster_data, base_img_size,
+                                                              self.current_monster_image)
         
         spacing_x = canvas_width // 3
         start_y = (canvas_height - max(hero_img_size, monster_img_size)) // 2
@@ -356,21 +420,109 @@ class CombatGUI:
         self.combat_monster_x = monster_final_x
         self.combat_y = final_y
         
+        # Frames are built once per fight (again only if the canvas size changed)
+        if getattr(self, 'combat_clip_sizes', None) != (hero_img_size, monster_img_size):
+            self._build_combat_clips()
+        
         # Display both images with appropriate sizes
-        self.image_display._add_canvas_image(
+        self._place_combat_sprites()
+    
+    def _build_combat_clips(self):
+        """Precompute both combatants' attack, hit-flash and death frames for this fight"""
+        self.combat_clips = {}
+        self.combat_clip_sizes = (self.hero_img_size, self.monster_img_size)
+        get_photo = getattr(self.image_display, '_get_sprite_photo', None)
+        if get_photo is None:
+            return
+        
+        hero = getattr(self, 'current_hero_data', {})
+        monster = getattr(self, 'current_monster_data', {})
+        self.combat_clips['hero'] = build_combatant_clips(
+            get_photo, self.current_hero_image, self.hero_img_size,
+            attack_image=self._get_hero_attack_image(hero),
+            death_image=self._get_hero_death_image(hero))
+        monster_death = monster.get('art_death')
+        self.combat_clips['monster'] = build_combatant_clips(
+            get_photo, self.current_monster_image, self.monster_img_size,
+            attack_image=self._get_monster_attack_image(monster),
+            death_image=monster_sprite_path(monster, monster_death) if monster_death else None)
+    
+    def _get_clips(self, attacker_type):
+        """Get a combatant's precomputed clips (None if they could not be built)"""
+        return getattr(self, 'combat_clips', {}).get(attacker_type)
+    
+    def _get_hero_attack_image(self, hero):
+        """Get the hero's attack image path from YAML or the class-based fallback"""
+        attack_image_path = hero.get('art_attack', '')
+        if not attack_image_path:
+            # Fallback to class-based path if art_attack field missing
+            hero_class = hero.get('class', 'Warrior').lower()
+            attack_image_path = f"art/{hero_class}_attack.png"
+        return attack_image_path
+    
+    def _get_monster_attack_image(self, monster):
+        """Get the monster's attack image path (check both field names for compatibility)"""
+        attack_art_path = monster.get('art_attack') or monster.get('attack_art')
+        return monster_sprite_path(monster, attack_art_path) if attack_art_path else None
+    
+    def _get_hero_death_image(self, hero):
+        """Get the hero's death image path from YAML or the class-based fallback"""
+        death_image_path = hero.get('art_death', '')
+        if not death_image_path:
+            # Fallback to class-based path if art_death field missing
+            hero_class = hero.get('class', 'Warrior').lower()
+            death_image_path = f"art/{hero_class}_death.png"
+        return death_image_path
+    
+    def _place_combat_sprites(self):
+        """Put both sprites at their combat positions showing their idle images
+        
+        Sprites still on the canvas are moved and re-skinned in place; they are
+        only recreated when missing (e.g. at fight start or after a screen change).
+        """
+        if not self._ensure_combat_sprites():
+            return
+        for attacker_type, sprite, x, image, size in (
+                ('hero', self.hero_sprite, self.combat_hero_x, self.current_hero_image, self.hero_img_size),
+                ('monster', self.monster_sprite, self.combat_monster_x, self.current_monster_image, self.monster_img_size)):
+            sprite.move_to(x, self.combat_y)
+            clips = self._get_clips(attacker_type)
+            if clips and clips.normal.image_path == image and clips.size == size:
+                sprite.show_frame(clips.normal)
+            else:
+                sprite.set_image(image, size, size)
+    
+    def _create_combat_sprites(self):
+        """Create hero and monster sprites at the current combat positions
+        
+        Animation frames then move or re-skin these sprites instead of
+        clearing and redrawing the canvas.
+        """
+        self.image_display._clear_foreground_images()
+        self.hero_sprite = self.image_display._create_sprite(
             self.current_hero_image, 
-            hero_final_x, 
-            final_y, 
-            hero_img_size, 
-            hero_img_size
+            self.combat_hero_x, 
+            self.combat_y, 
+            self.hero_img_size, 
+            self.hero_img_size
         )
-        self.image_display._add_canvas_image(
+        self.monster_sprite = self.image_display._create_sprite(
             self.current_monster_image, 
-            monster_final_x, 
-            final_y, 
-            monster_img_size, 
-            monster_img_size
+            self.combat_monster_x, 
+            self.combat_y, 
+            self.monster_img_size, 
+            self.monster_img_size
         )
+    
+    def _ensure_combat_sprites(self):
+        """Recreate combat sprites if they are missing or were cleared from the canvas"""
+        hero_sprite = getattr(self, 'hero_sprite', None)
+        monster_sprite = getattr(self, 'monster_sprite', None)
+        if (hero_sprite is None or monster_sprite is None or
+                not hero_sprite.is_alive() or not monster_sprite.is_alive()):
+            self._create_combat_sprites()
+            return False
+        return True
 
     def _show_hero_attack_animation(self, hero):
         """Show hero attack animation with jump forward, attack, and jump back"""
@@ -385,9 +537,8 @@ class CombatGUI:
         # Store original position
         self.hero_original_x = self.combat_hero_x
         
-        # Animate jump in 3 steps (150ms total)
-        self._jump_step(self.combat_hero_x, jump_distance, 3, 0, 'hero', 
-                       lambda: self._start_hero_attack_after_jump(hero))
+        # Animate jump (150ms total)
+        self._animate_jump('hero', jump_distance, lambda: self._start_hero_attack_after_jump(hero))
     
     def _start_hero_attack_after_jump(self, hero):
         """Start hero attack animation after jump forward"""
@@ -395,107 +546,69 @@ class CombatGUI:
         hero_attack_sound = self._get_hero_attack_sound(hero)
         self.audio.play_sound_effect(hero_attack_sound)
         
-        # Get attack image from YAML or construct fallback
-        attack_image_path = hero.get('art_attack', '')
-        
-        try:
-            if not attack_image_path:
-                # Fallback to class-based path if art_attack field missing
-                hero_class = hero.get('class', 'Warrior').lower()
-                attack_image_path = f"art/{hero_class}_attack.png"
-            
-            if resource_exists(attack_image_path):
-                # Start the toggle animation sequence
-                self._toggle_hero_attack_animation(0, attack_image_path, self.current_hero_image)
-            else:
-                # Fallback - jump back without attack animation
-                self._animate_hero_jump_back()
-        except Exception as e:
-            # Fallback - jump back without attack animation
-            self._animate_hero_jump_back()
-    
-    def _toggle_hero_attack_animation(self, toggle_count, attack_image, normal_image):
-        """Toggle between normal and attack images for hero"""
-        if toggle_count < 6:  # 3 complete toggles (normal->attack->normal = 6 steps)
-            # Clear and redraw with appropriate image
-            self.image_display._clear_foreground_images()
-            
-            if toggle_count % 2 == 0:
-                # Even count: show attack image
-                hero_image = attack_image
-            else:
-                # Odd count: show normal image
-                hero_image = normal_image
-            
-            # Display with custom sizing for Dragon boss
-            self.image_display._add_canvas_image(
-                hero_image, 
-                self.combat_hero_x, 
-                self.combat_y, 
-                self.hero_img_size, 
-                self.hero_img_size
-            )
-            self.image_display._add_canvas_image(
-                self.current_monster_image, 
-                self.combat_monster_x, 
-                self.combat_y, 
-                self.monster_img_size, 
-                self.monster_img_size
-            )
-            
-            # Schedule next toggle after 250ms (quarter second)
-            self.timer.after(250, lambda: self._toggle_hero_attack_animation(
-                toggle_count + 1, attack_image, normal_image))
+        clips = self._get_clips('hero')
+        if clips and clips.attack:
+            # Start the toggle animation sequence
+            self._toggle_hero_attack_animation()
         else:
-            # Animation complete - jump back
+            # No attack art - jump back without attack animation
             self._animate_hero_jump_back()
     
+    def _toggle_hero_attack_animation(self):
+        """Toggle between attack and normal images for hero, then jump back"""
+        self._play(self._build_toggle_timeline('hero').call(self._animate_hero_jump_back))
+
+    def _build_toggle_timeline(self, attacker_type):
+        """Build the attack toggle: 3 complete toggles (attack->normal = 6 steps), 250ms each
+        
+        Plays the attacker's precomputed attack clip, so each step only swaps
+        the image shown by the retained sprite.
+        """
+        clip = self._get_clips(attacker_type).attack
+        return clip.timeline(lambda frame: self._show_attacker_frame(attacker_type, frame), self._scaled(250))
+
+    def _show_attacker_frame(self, attacker_type, frame):
+        """Show a precomputed frame on a combatant's sprite (keeps custom Dragon boss sizing)"""
+        self._ensure_combat_sprites()
+        sprite = self.hero_sprite if attacker_type == 'hero' else self.monster_sprite
+        if sprite:
+            sprite.show_frame(frame)
+    
+    def _play_hit_flash(self, attacker_type):
+        """Flash a combatant's sprite after it takes damage"""
+        clips = self._get_clips(attacker_type)
+        if clips and clips.hit and not getattr(self.timer, 'instant', False):
+            self._play(clips.hit.timeline(lambda frame: self._show_attacker_frame(attacker_type, frame),
+                                          self._scaled(80)))
+    
     def _animate_hero_jump_back(self):
         """Animate hero jumping back to original position"""
         # Calculate distance to jump back
         jump_distance = self.hero_original_x - self.combat_hero_x
         
-        # Animate jump back in 3 steps (150ms total)
-        self._jump_step(self.combat_hero_x, jump_distance, 3, 0, 'hero', 
-                       self._display_combat_images_with_sizing)
+        # Animate jump back (150ms total)
+        self._animate_jump('hero', jump_distance, self._display_combat_images_with_sizing)
     
-    def _jump_step(self, start_x, total_distance, total_steps, current_step, attacker_type, callback):
-        """Animate a single jump step"""
-        if current_step < total_steps:
-            # Calculate new position
-            step_distance = total_distance // total_steps
-            new_x = start_x + step_distance
-            
-            # Update position
-            if attacker_type == 'hero':
-                self.combat_hero_x = new_x
-            else:  # monster
-                self.combat_monster_x = new_x
-            
-            # Redraw images at new position
-            self.image_display._clear_foreground_images()
-            self.image_display._add_canvas_image(
-                self.current_hero_image, 
-                self.combat_hero_x, 
-                self.combat_y, 
-                self.hero_img_size, 
-                self.hero_img_size
-            )
-            self.image_display._add_canvas_image(
-                self.current_monster_image, 
-                self.combat_monster_x, 
-                self.combat_y, 
-                self.monster_img_size, 
-                self.monster_img_size
-            )
-            
-            # Schedule next step after 50ms
-            self.timer.after(50, lambda: self._jump_step(
-                new_x, total_distance - step_distance, total_steps, current_step + 1, 
-                attacker_type, callback))
-        else:
-            # Jump complete - call callback
-            callback()
+    def _animate_jump(self, attacker_type, distance, callback):
+        """Slide the attacker horizontally by distance over 150ms, then call callback"""
+        start_x = self.combat_hero_x if attacker_type == 'hero' else self.combat_monster_x
+        self._play(Tween(self._scaled(150), lambda x: self._jump_to(attacker_type, int(x)),
+                         start=start_x, end=start_x + distance,
+                         key=('jump', attacker_type), on_complete=callback))
+
+    def _jump_to(self, attacker_type, new_x):
+        """Apply one jump frame"""
+        # Update position
+        if attacker_type == 'hero':
+            self.combat_hero_x = new_x
+        else:  # monster
+            self.combat_monster_x = new_x
+        
+        # Move the jumping sprite to its new position
+        if self._ensure_combat_sprites():
+            sprite = self.hero_sprite if attacker_type == 'hero' else self.monster_sprite
+            if sprite:
+                sprite.move_to(new_x, self.combat_y)
 
     def _complete_hero_attack(self, damage, monster, message_template):
         """Complete hero attack after animation - show damage text"""
@@ -505,6 +618,7 @@ class CombatGUI:
         base_message = message_template.replace("{damage}", "")
         self.text_display.print_combat_damage(base_message, damage, "Hero")
         monster['hp'] = max(0, monster['hp'] - damage)
+        self._play_hit_flash('monster')
         
         # Return to normal display
         self._return_to_monster_view(monster)
@@ -517,6 +631,7 @@ class CombatGUI:
         base_message = message_template.replace("{damage}", "")
         self.text_display.print_combat_damage(base_message, hero_damage, "Hero")
         monster['hp'] = max(0, monster['hp'] - hero_damage)
+        self._play_hit_flash('monster')
         
         # Check if monster is still alive to counter-attack
         if monster['hp'] <= 0:
@@ -541,6 +656,7 @@ class CombatGUI:
         base_message = message_template.replace("{damage}", "")
         self.text_display.print_combat_damage(base_message, hero_damage, "Hero")
         monster['hp'] = max(0, monster['hp'] - hero_damage)
+        self._play_hit_flash('monster')
         
         # Finish round and show status, then continue to next round
         self._finish_round_status(hero, monster, round_num)
@@ -569,9 +685,8 @@ class CombatGUI:
         # Store original position
         self.monster_original_x = self.combat_monster_x
         
-        # Animate jump in 3 steps (150ms total)
-        self._jump_step(self.combat_monster_x, jump_distance, 3, 0, 'monster', 
-                       lambda: self._start_monster_attack_after_jump(monster))
+        # Animate jump (150ms total)
+        self._animate_jump('monster', jump_distance, lambda: self._start_monster_attack_after_jump(monster))
     
     def _start_monster_attack_after_jump(self, monster):
         """Start monster attack animation after jump forward"""
@@ -579,68 +694,25 @@ class CombatGUI:
         attack_sound = self._get_monster_attack_sound(monster)
         self.audio.play_sound_effect(attack_sound, max_duration_ms=3000)
         
-        # Get monster attack image if available - check both field names for compatibility
-        attack_art_path = monster.get('art_attack') or monster.get('attack_art')
-        
-        if attack_art_path:
-            try:
-                if resource_exists(attack_art_path):
-                    # Start the toggle animation sequence
-                    self._toggle_monster_attack_animation(0, attack_art_path, self.current_monster_image)
-                else:
-                    # No attack art - jump back without animation
-                    self._animate_monster_jump_back()
-            except Exception as e:
-                # Fallback - jump back without animation
-                self._animate_monster_jump_back()
+        clips = self._get_clips('monster')
+        if clips and clips.attack:
+            # Start the toggle animation sequence
+            self._toggle_monster_attack_animation()
         else:
             # No attack art - jump back without animation
             self._animate_monster_jump_back()
     
-    def _toggle_monster_attack_animation(self, toggle_count, attack_image, normal_image):
-        """Toggle between normal and attack images for monster"""
-        if toggle_count < 6:  # 3 complete toggles (normal->attack->normal = 6 steps)
-            # Clear and redraw with appropriate image
-            self.image_display._clear_foreground_images()
-            
-            if toggle_count % 2 == 0:
-                # Even count: show attack image
-                monster_image = attack_image
-            else:
-                # Odd count: show normal image
-                monster_image = normal_image
-            
-            # Display with custom sizing for Dragon boss
-            self.image_display._add_canvas_image(
-                self.current_hero_image, 
-                self.combat_hero_x, 
-                self.combat_y, 
-                self.hero_img_size, 
-                self.hero_img_size
-            )
-            self.image_display._add_canvas_image(
-                monster_image, 
-                self.combat_monster_x, 
-                self.combat_y, 
-                self.monster_img_size, 
-                self.monster_img_size
-            )
-            
-            # Schedule next toggle after 250ms (quarter second)
-            self.timer.after(250, lambda: self._toggle_monster_attack_animation(
-                toggle_count + 1, attack_image, normal_image))
-        else:
-            # Animation complete - jump back
-            self._animate_monster_jump_back()
+    def _toggle_monster_attack_animation(self):
+        """Toggle between attack and normal images for monster, then jump back"""
+        self._play(self._build_toggle_timeline('monster').call(self._animate_monster_jump_back))
     
     def _animate_monster_jump_back(self):
         """Animate monster jumping back to original position"""
         # Calculate distance to jump back
         jump_distance = self.monster_original_x - self.combat_monster_x
         
-        # Animate jump back in 3 steps (150ms total)
-        self._jump_step(self.combat_monster_x, jump_distance, 3, 0, 'monster', 
-                       self._display_combat_images_with_sizing)
+        # Animate jump back (150ms total)
+        self._animate_jump('monster', jump_distance, self._display_combat_images_with_sizing)
 
     def _complete_monster_attack_start_hero(self, monster_damage, hero_damage, monster, hero, message_template, round_num):
         """Complete monster attack and start hero counter-attack"""
@@ -650,6 +722,7 @@ class CombatGUI:
         base_message = message_template.replace("{damage}", "")
         self.text_display.print_combat_damage(base_message, monster_damage, monster['name'])
         hero['hp'] = max(0, hero['hp'] - monster_damage)
+        self._play_hit_flash('hero')
         
         # Check if hero is still alive to counter-attack
         if hero['hp'] <= 0:
@@ -674,6 +747,7 @@ class CombatGUI:
         base_message = message_template.replace("{damage}", "")
         self.text_display.print_combat_damage(base_message, hero_damage, "Hero")
         monster['hp'] = max(0, monster['hp'] - hero_damage)
+        self._play_hit_flash('monster')
         
         # Finish round and show status, then continue to next round
         self._finish_round_status(hero, monster, round_num)
@@ -697,6 +771,7 @@ class CombatGUI:
         base_message = message_template.replace("{damage}", "")
         self.text_display.print_combat_damage(base_message, monster_damage, monster['name'])
         hero['hp'] = max(0, hero['hp'] - monster_damage)
+        self._play_hit_flash('hero')
         
         # Finish round and show status, then continue to next round
         self._finish_round_status(hero, monster, round_num)
@@ -720,6 +795,7 @@ class CombatGUI:
         base_message = message_template.replace("{damage}", "")
         self.text_display.print_combat_damage(base_message, monster_damage, monster['name'])
         hero['hp'] = max(0, hero['hp'] - monster_damage)
+        self._play_hit_flash('hero')
         
         # Finish round and show status, then continue to next round
         self._finish_round_status(hero, monster, round_num)
@@ -771,28 +847,8 @@ class CombatGUI:
             self.image_display._add_canvas_image('art/crossed_swords.png', 2 * spacing_x - img_size // 2, start_y, img_size, img_size)
 
     def calculate_damage(self, attack, defense, attacker_level=1, defender_level=1):
-        """Improved damage calculation with level consideration"""
-        import random
-        
-        # Base damage with controlled randomness (80-120% of attack)
-        variance = random.uniform(0.8, 1.2)
-        base_damage = attack * variance
-        
-        # Level differential bonus/penalty (±15% per level difference, capped at ±75%)
-        level_diff = max(-5, min(5, attacker_level - defender_level))
-        level_modifier = 1.0 + (level_diff * 0.15)
-        base_damage *= level_modifier
-        
-        # Defense as damage reduction percentage (diminishing returns)
-        defense_percentage = defense / (defense + 15)
-        defense_percentage = min(0.85, defense_percentage)  # Cap at 85% reduction
-        
-        final_damage = base_damage * (1 - defense_percentage)
-        
-        # Minimum damage scales with attacker level
-        min_damage = max(1, (attacker_level + 1) // 2)
-        
-        return max(min_damage, int(round(final_damage)))
+        """Damage calculation with level consideration (delegates to game_logic)"""
+        return damage_calculator(attack, defense, attacker_level, defender_level, self.rng)
     
     def _start_victory_fireworks_animation(self):
         """Start epic victory fireworks animation for final boss defeat"""
@@ -803,22 +859,20 @@ class CombatGUI:
         self.audio.play_sound_effect('win-fireworks.mp3')
         
         # Start fireworks animation sequence - 4 frames, 1.5 seconds each
-        self._show_fireworks_frame(1)
+        timeline = Timeline()
+        for frame_number in range(1, 5):
+            timeline.call(self._show_fireworks_frame, frame_number).wait(1500)
+        # Animation complete - show final victory screen and end
+        self._play(timeline.call(self._complete_victory_animation))
     
     def _show_fireworks_frame(self, frame_number):
-        """Show specific fireworks frame and schedule next one"""
+        """Show specific fireworks frame"""
         try:
-            # Show the fireworks frame
             self.image_display.show_image(f'art/victory_fireworks_{frame_number}.png')
-            
-            if frame_number < 4:
-                # Schedule next frame after 1.5 seconds
-                self.timer.after(1500, lambda: self._show_fireworks_frame(frame_number + 1))
-            else:
-                # Animation complete - show final victory screen and end
-                self.timer.after(1500, self._complete_victory_animation)
         except Exception as e:
-            # Fallback if fireworks images not found
+            # Fallback if fireworks images not found - skip the remaining frames
+            logger.debug(f"Fireworks frame {frame_number} unavailable: {e}")
+            self.frames.cancel(COMBAT_ANIMATION_GROUP)
             self._complete_victory_animation()
     
     def _complete_victory_animation(self):
@@ -835,16 +889,18 @@ class CombatGUI:
     def _show_hero_death_in_combat(self, hero):
         """Replace hero image with death image in combat display, keeping monster visible"""
         try:
-            # Get death image from YAML or construct fallback
-            death_image_path = hero.get('art_death', '')
+            clips = self._get_clips('hero')
+            if clips and clips.death:
+                # Swap in the precomputed death frame on the retained sprite
+                self.current_hero_image = clips.death.image_path
+                self._show_attacker_frame('hero', clips.death)
+                return
             
-            if not death_image_path:
-                # Fallback to class-based path if art_death field missing
-                hero_class = hero.get('class', 'Warrior').lower()
-                death_image_path = f"art/{hero_class}_death.png"
+            # Get death image from YAML or construct fallback
+            death_image_path = self._get_hero_death_image(hero)
             
             # Check if death image exists
-            if not resource_exists(death_image_path):
+            if not sprite_exists(death_image_path):
                 logger.debug(f"Death image not found: {death_image_path}, using generic")
                 death_image_path = 'art/you_lost.png'
             
@@ -904,12 +960,12 @@ class CombatGUI:
         hero_x = spacing_x - base_img_size // 2
         hero_y = start_y
         
-        self.image_display._add_canvas_image(hero_image_path, hero_x, hero_y, tags='hero')
+        self.image_display._add_canvas_image(hero_image_path, hero_x, hero_y, tags=('foreground', 'hero'))
         
         # Display wagon on the right side (will animate left)
         wagon_start_x = canvas_width - 50  # Start from right edge
         wagon_y = start_y
-        wagon_image_id = self.image_display._add_canvas_image('art/wagon.png', wagon_start_x, wagon_y, tags='wagon')
+        wagon_image_id = self.image_display._add_canvas_image('art/wagon.png', wagon_start_x, wagon_y, tags=('foreground', 'wagon'))
         
         # Play honk sound before wagon starts moving
         self.audio.play_sound_effect('honk.mp3')
@@ -920,23 +976,16 @@ class CombatGUI:
         # Start wagon animation
         self._animate_wagon(wagon_image_id, wagon_start_x, wagon_y, target_x, hero, hero_class, hero_x, hero_y)
     
-    def _animate_wagon(self, wagon_id, current_x, wagon_y, target_x, hero, hero_class, hero_x, hero_y):
+    def _animate_wagon(self, wagon_id, start_x, wagon_y, target_x, hero, hero_class, hero_x, hero_y):
         """Animate wagon moving left towards hero"""
-        step_size = 10  # Pixels per frame
+        # 10 pixels per 33ms frame (about 300 pixels per second)
+        duration_ms = max(0, start_x - target_x) * 33 / 10
+        canvas = self.image_display.image_canvas
         
-        if current_x > target_x:
-            # Continue moving left
-            new_x = current_x - step_size
-            
-            # Update wagon position on canvas
-            canvas = self.image_display.image_canvas
-            canvas.coords(wagon_id, new_x, wagon_y)
-            
-            # Schedule next frame (30 FPS = ~33ms per frame)
-            self.timer.after(33, lambda: self._animate_wagon(wagon_id, new_x, wagon_y, target_x, hero, hero_class, hero_x, hero_y))
-        else:
-            # Wagon has reached hero - trigger death
-            self._trigger_wagon_death(hero, hero_class, hero_x, hero_y)
+        # Wagon has reached hero - trigger death
+        self._play(Tween(duration_ms, lambda x: canvas.coords(wagon_id, int(x), wagon_y),
+                         start=start_x, end=target_x, key=('wagon', wagon_id),
+                         on_complete=lambda: self._trigger_wagon_death(hero, hero_class, hero_x, hero_y)))
     
     def _trigger_wagon_death(self, hero, hero_class, hero_x, hero_y):
         """Trigger hero death after wagon collision"""
@@ -973,10 +1022,10 @@ class CombatGUI:
         canvas.delete('hero')
         
         # Add death image at same position as hero was
-        self.image_display._add_canvas_image(death_image_path, hero_x, hero_y, tags='hero_death')
+        self.image_display._add_canvas_image(death_image_path, hero_x, hero_y, tags=('foreground', 'hero_death'))
         
         # After a delay, trigger the Shiva divine intervention scene (4.5 seconds to give time to read)
-        self.timer.after(8000, self._show_shiva_divine_intervention)
+        self._after_unscaled(8000, self._show_shiva_divine_intervention)
     
     def _show_shiva_divine_intervention(self):
         """Show Shiva's divine intervention after wagon death"""
@@ -1015,15 +1064,12 @@ class CombatGUI:
     
     def _show_isekai_story(self):
         """Display the Isekai story section after accepting Shiva's quest"""
-        import yaml
-        
         # Lock interface during story display
         self.interface_control.lock_interface()
         
         try:
-            # Load story from YAML file
-            with open(get_resource_path('story.yaml'), 'r', encoding='utf-8') as f:
-                story_data = yaml.safe_load(f)
+            # Load story (content bundle or YAML)
+            story_data = get_content('story')
             
             isekai_lines = story_data.get('Isekai', [])
             
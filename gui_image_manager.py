@@ -9,12 +9,113 @@ import tkinter as tk
 from PIL import Image, ImageTk
 
 import config
+from image_cache import SpriteCache
 from logger_utils import get_logger
 from resource_utils import get_resource_path
 
 logger = get_logger(__name__)
 
 
+class CanvasSprite:
+    """
+    Handle to an image item that stays on the canvas between animation frames.
+    
+    Animations create the sprite once and then move it or swap its image,
+    instead of deleting and recreating canvas items every frame.
+    """
+    
+    def __init__(self, image_manager, canvas_id, image_path, x, y, width=None, height=None, photo=None):
+        """
+        Initialize the sprite handle.
+        
+        Args:
+            image_manager: ImageManager that owns the canvas and sprite cache
+            canvas_id: Canvas item ID of the image
+            image_path: Path of the image currently displayed
+            x, y: Current top-left position on the canvas
+            width, height: Display size (None for natural size)
+            photo: PhotoImage currently displayed (kept to prevent garbage collection)
+        """
+        self.image_manager = image_manager
+        self.canvas = image_manager.image_canvas
+        self.canvas_id = canvas_id
+        self.image_path = image_path
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.photo = photo
+    
+    def is_alive(self):
+        """Check whether the canvas item still exists (e.g. not cleared by a screen change)"""
+        try:
+            return bool(self.canvas.type(self.canvas_id))
+        except tk.TclError:
+            return False
+    
+    def move_to(self, x, y):
+        """Move the sprite to an absolute canvas position"""
+        self.x = x
+        self.y = y
+        try:
+            self.canvas.coords(self.canvas_id, x, y)
+        except tk.TclError as e:
+            logger.debug(f"Could not move sprite {self.canvas_id}: {e}")
+    
+    def move(self, dx, dy):
+        """Move the sprite relative to its current position"""
+        self.move_to(self.x + dx, self.y + dy)
+    
+    def set_image(self, image_path, width=None, height=None):
+        """Swap the displayed image without recreating the canvas item
+        
+        Args:
+            image_path: Path to the new image file
+            width, height: Display size (default: keep the sprite's current size)
+        """
+        if width is None and height is None:
+            width, height = self.width, self.height
+        
+        if image_path == self.image_path and (width, height) == (self.width, self.height):
+            return
+        
+        try:
+            photo = self.image_manager.sprite_cache.get_photo(image_path, width, height)
+            self.canvas.itemconfig(self.canvas_id, image=photo)
+        except Exception as e:
+            logger.error(f"Failed to swap sprite image to '{image_path}': {e}")
+            return
+        
+        self.photo = photo
+        self.image_path = image_path
+        self.width = width
+        self.height = height
+    
+    def show_frame(self, frame):
+        """Show a precomputed animation frame (see animation_clips.ClipFrame)
+        
+        Unlike set_image, this never touches the sprite cache: the frame
+        already carries its PhotoImage, so playback is a single itemconfig.
+        """
+        try:
+            self.canvas.itemconfig(self.canvas_id, image=frame.photo)
+        except tk.TclError as e:
+            logger.debug(f"Could not show frame on sprite {self.canvas_id}: {e}")
+            return
+        
+        self.photo = frame.photo
+        self.image_path = frame.image_path
+        self.width = frame.width
+        self.height = frame.height
+    
+    def delete(self):
+        """Remove the sprite from the canvas"""
+        try:
+            self.canvas.delete(self.canvas_id)
+        except tk.TclError as e:
+            logger.debug(f"Could not delete sprite {self.canvas_id}: {e}")
+
+
 class ImageManager:
     """
     Manages image display, layout, and canvas operations for the Monster Game GUI.
@@ -25,20 +126,23 @@ class ImageManager:
     - Canvas image management and cleanup
     - ASCII art text rendering
     - Foreground/background image layering
+    - Decoded sprite caching (see image_cache.SpriteCache)
     """
     
-    def __init__(self, image_canvas, print_text_callback=None):
+    def __init__(self, image_canvas, print_text_callback=None, sprite_cache=None):
         """
         Initialize the Image Manager.
         
         Args:
             image_canvas: The tkinter Canvas widget for image display
             print_text_callback: Function to call for error messages (optional)
+            sprite_cache: SpriteCache to use for decoded sprites (optional)
         """
         self.image_canvas = image_canvas
         self.canvas_images = []  # Keep references to prevent garbage collection
         self.current_image_layout = "single"
         self.print_text = print_text_callback or self._default_print_text
+        self.sprite_cache = sprite_cache if sprite_cache is not None else SpriteCache()
         
     def _default_print_text(self, text, color='#ff0000'):
         """Default print function if none provided"""
@@ -72,9 +176,9 @@ class ImageManager:
                 return
             
             # Handle image files - center the image on the canvas at natural size
-            # First, get the original image dimensions
-            with Image.open(resolved_path) as img:
-                img_width, img_height = img.size
+            # First, get the original image dimensions (decodes into the sprite cache)
+            photo = self.sprite_cache.get_photo(image_path)
+            img_width, img_height = photo.width(), photo.height()
             
             # Calculate center position based on actual canvas size
             center_x = (canvas_width - img_width) // 2
@@ -132,9 +236,10 @@ class ImageManager:
         # Determine layout and positions based on number of images and canvas size
         num_images = len(image_paths)
         
+        img_size = self.get_layout_image_size(num_images)
+        
         if num_images == 2:
             # Side by side
-            img_size = min(canvas_width // 3, canvas_height // 2, 120)
             spacing_x = canvas_width // 3
             start_y = (canvas_height - img_size) // 2
             
@@ -147,7 +252,6 @@ class ImageManager:
             size = (img_size, img_size)
         elif num_images == 3:
             # Triangle layout
-            img_size = min(canvas_width // 4, canvas_height // 3, 100)
             center_x = canvas_width // 2
             positions = [(center_x - img_size//2, 20), 
                         (center_x//2 - img_size//2, canvas_height - img_size - 20), 
@@ -155,7 +259,6 @@ class ImageManager:
             size = (img_size, img_size)
         elif num_images == 4:
             # 2x2 grid
-            img_size = min(canvas_width // 3, canvas_height // 3, 100)
             spacing_x = canvas_width // 3
             spacing_y = canvas_height // 2
             positions = [(spacing_x//2, spacing_y//2 - img_size//2), 
@@ -167,7 +270,6 @@ class ImageManager:
             # Grid layout for more images
             cols = 3 if num_images <= 6 else 4
             rows = (num_images + cols - 1) // cols
-            img_size = min(canvas_width // (cols + 1), canvas_height // (rows + 1), 80)
             
             positions = []
             spacing_x = canvas_width // (cols + 1)
@@ -188,6 +290,30 @@ class ImageManager:
         
         self.current_image_layout = layout
     
+    def get_layout_image_size(self, num_images):
+        """Get the square image size show_images uses for a given number of images
+        
+        Args:
+            num_images: Number of images being displayed together
+            
+        Returns:
+            Image size in pixels, or None for a single image (natural size)
+        """
+        canvas_width, canvas_height = self.get_canvas_dimensions()
+        
+        if num_images <= 1:
+            return None
+        if num_images == 2:
+            return min(canvas_width // 3, canvas_height // 2, 120)
+        if num_images == 3:
+            return min(canvas_width // 4, canvas_height // 3, 100)
+        if num_images == 4:
+            return min(canvas_width // 3, canvas_height // 3, 100)
+        
+        cols = 3 if num_images <= 6 else 4
+        rows = (num_images + cols - 1) // cols
+        return min(canvas_width // (cols + 1), canvas_height // (rows + 1), 80)
+    
     def add_canvas_image(self, image_path, x, y, width=None, height=None, tags="foreground"):
         """Add an image to the canvas at the specified position
         
@@ -201,17 +327,8 @@ class ImageManager:
             Canvas item ID or None if failed
         """
         try:
-            # Resolve resource path for bundled execution
-            resolved_path = get_resource_path(image_path)
-            
-            # Load image
-            img = Image.open(resolved_path)
-            
-            # Resize only if dimensions are specified
-            if width is not None and height is not None:
-                img = img.resize((width, height), Image.Resampling.NEAREST)
-            
-            photo = ImageTk.PhotoImage(img)
+            # Reuse the decoded and scaled sprite if it is already cached
+            photo = self.sprite_cache.get_photo(image_path, width, height)
             
             # Add to canvas
             canvas_id = self.image_canvas.create_image(x, y, image=photo, anchor='nw', tags=tags)
@@ -226,11 +343,38 @@ class ImageManager:
             self.print_text(f"Failed to add canvas image {image_path}: {e}")
             return None
     
+    def create_sprite(self, image_path, x, y, width=None, height=None, tags="foreground"):
+        """Add an image to the canvas and return a handle for animating it
+        
+        Args:
+            image_path: Path to the image file
+            x, y: Position on canvas
+            width, height: Target size (if None, uses natural image size)
+            tags: Canvas tags for the image
+            
+        Returns:
+            CanvasSprite handle or None if failed
+        """
+        canvas_id = self.add_canvas_image(image_path, x, y, width, height, tags)
+        if canvas_id is None:
+            return None
+        
+        photo = self.canvas_images[-1] if self.canvas_images else None
+        return CanvasSprite(self, canvas_id, image_path, x, y, width, height, photo)
+    
     def clear_foreground_images(self):
         """Clear all foreground images from canvas"""
         self.image_canvas.delete("foreground")
         self.canvas_images.clear()
     
+    def get_cache_stats(self):
+        """Get sprite cache statistics
+        
+        Returns:
+            Dict with hits, misses, evictions, entries, bytes and hit_rate
+        """
+        return self.sprite_cache.get_stats()
+    
     def show_story_text(self, text_lines, font_size=24, text_color='#ffffff', 
                        shadow_color='#000000', line_spacing=40):
         """
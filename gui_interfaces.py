@@ -148,6 +148,7 @@ class GameContextProtocol(Protocol):
     audio: AudioProtocol
     background_manager: BackgroundManagerProtocol
     root: TimerProtocol
+    frame_scheduler: Any
     
     # Subsystems (for cross-module communication)
     combat: Any
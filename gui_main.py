@@ -5,11 +5,11 @@ import tkinter as tk
 from tkinter import scrolledtext
 from PIL import Image, ImageTk
 from time import sleep
-import yaml
 
 import config
 from logger_utils import get_logger
-from resource_utils import get_resource_path, resource_exists
+from sprite_atlas import sprite_exists
+from content_bundle import get_content
 from game_state import initialize_game_state
 from game_enums import BiomeType
 from gui_audio import Audio
@@ -23,9 +23,16 @@ from gui_quests import QuestManager
 from gui_save_load import SaveLoadManager
 from gui_town import TownGUI
 from gui_tavern import TavernGUI
+from gui_text_sink import TextSink, default_transcript_path
+from text_colorizer import colorize
 from gui_image_manager import ImageManager
 from gui_background_manager import BackgroundManager
 from gui_achievements import AchievementManager
+from rng_service import RNGService, STREAM_COMBAT, STREAM_TELEPORT
+from animation_scheduler import AnimationScheduler, format_speed
+from frame_scheduler import FrameScheduler
+from asset_preloader import (AssetPreloader, collect_character_assets,
+                             collect_fireworks_assets)
 
 logger = get_logger(__name__)
 
@@ -62,6 +69,9 @@ class GameGUI:
         
         # Game state
         self.game_state = None
+        self.rng_service = RNGService()
+        self.animation_scheduler = AnimationScheduler(self.root, speed=config.COMBAT_SPEED)
+        self.frame_scheduler = FrameScheduler(self.root)
         self.audio = Audio()
         self.voice = VoiceManager()
         self.combat: CombatGUI = None
@@ -123,6 +133,10 @@ class GameGUI:
         )
         self.text_area.pack(padx=10, pady=5, fill=tk.BOTH, expand=True)
         
+        # Lines printed during a handler are inserted together on the next idle tick
+        transcript_path = default_transcript_path() if config.TEXT_TRANSCRIPT_ENABLED else None
+        self.text_sink = TextSink(self.text_area, self.root, transcript_path=transcript_path)
+        
         # Button frame container
         self.button_frame = tk.Frame(self.root, bg=config.COLOR_BACKGROUND)
         self.button_frame.pack(fill=tk.X, padx=10, pady=10)
@@ -142,7 +156,8 @@ class GameGUI:
             print_text_callback=self.print_text,
             lock_interface_callback=self.lock_interface,
             clear_text_callback=self.clear_text,
-            main_menu_callback=self.main_menu
+            main_menu_callback=self.main_menu,
+            rng=self.rng_service.stream(STREAM_TELEPORT)
         )
         
         # Link background manager to image manager for floor offset positioning
@@ -213,10 +228,18 @@ class GameGUI:
         """Add an image to the canvas at the specified position"""
         return self.image_manager.add_canvas_image(image_path, x, y, width, height, tags)
     
+    def _create_sprite(self, image_path, x, y, width=None, height=None, tags="foreground"):
+        """Add an image to the canvas and return a movable sprite handle"""
+        return self.image_manager.create_sprite(image_path, x, y, width, height, tags)
+    
     def _clear_foreground_images(self):
         """Clear all foreground images from canvas"""
         self.image_manager.clear_foreground_images()
     
+    def _get_sprite_photo(self, image_path, width=None, height=None):
+        """Get a display-ready sprite from the sprite cache (for precomputed animation frames)"""
+        return self.image_manager.sprite_cache.get_photo(image_path, width, height)
+    
     def _create_buttons(self, count):
         """Create the specified number of buttons in rows of 3"""
         # Clear existing buttons
@@ -315,109 +338,13 @@ class GameGUI:
         self.image_manager.load_image_to_label(image_path, label, size)
     
     def print_text(self, text, color='#00ff00'):
-        """Print text to the text area with color support"""
-        self.text_area.config(state=tk.NORMAL)  # Temporarily enable for writing
-        
+        """Print text to the text area with color support (buffered until idle)"""
         # Process text for variable coloring
-        colored_text = self._process_text_colors(text)
-        
-        # Insert text with appropriate colors
-        for text_part, text_color in colored_text:
-            # Create or get color tag
-            tag_name = f"color_{text_color.replace('#', '')}"
-            self.text_area.tag_config(tag_name, foreground=text_color)
-            
-            # Insert text with color tag
-            start_index = self.text_area.index(tk.END + "-1c")
-            self.text_area.insert(tk.END, text_part)
-            end_index = self.text_area.index(tk.END + "-1c")
-            self.text_area.tag_add(tag_name, start_index, end_index)
-        
-        # Add newline with default color
-        self.text_area.insert(tk.END, '\n')
-        self.text_area.see(tk.END)
-        self.text_area.config(state=tk.DISABLED)  # Disable again
-        self.root.update()
+        self.text_sink.write_line(self._process_text_colors(text))
     
     def _process_text_colors(self, text):
         """Process text and return list of (text, color) tuples"""
-        import re
-        
-        # Define color mapping for different types of variables
-        color_patterns = {
-            # Health and HP related
-            r'\b(\d+)\s*HP\b': config.COLOR_HP,
-            r'\bhp:\s*(\d+)': config.COLOR_HP,
-            r'\b(\d+)/(\d+)\s*HP\b': config.COLOR_HP,
-            
-            # Damage numbers
-            r'\b(\d+)\s*damage\b': config.COLOR_DAMAGE,
-            r'\bfor\s+(\d+)\s+damage': config.COLOR_DAMAGE,
-            
-            # Gold and currency
-            r'💰\s*(\d+)': config.COLOR_GOLD,
-            r'\b(\d+)\s*gold\b': config.COLOR_GOLD,
-            
-            # Experience and levels
-            r'\bLevel\s*(\d+)': config.COLOR_LEVEL,
-            r'\blevel:\s*(\d+)': config.COLOR_LEVEL,
-            r'\b(\d+)\s*XP\b': config.COLOR_XP,
-            r'\bxp:\s*(\d+)': config.COLOR_XP,
-            
-            # Attack and Defense stats
-            r'\bAttack:\s*(\d+)': config.COLOR_ATTACK,
-            r'\battack:\s*(\d+)': config.COLOR_ATTACK,
-            r'\bDefense:\s*(\d+)': config.COLOR_DEFENSE,
-            r'\bdefense:\s*(\d+)': config.COLOR_DEFENSE,
-            
-            # Names and important identifiers
-            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\b': '#ffaa00',  # Orange for character names (2+ words)
-            r'⚔️\s*([^!]+)!': '#ffaa00',  # Orange for monster names in encounters
-        }
-        
-        result = []
-        last_end = 0
-        
-        # Find all matches and sort by position
-        all_matches = []
-        for pattern, color in color_patterns.items():
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                all_matches.append((match.start(), match.end(), match.group(), color))
-        
-        # Sort matches by start position
-        all_matches.sort()
-        
-        # Remove overlapping matches (keep first one)
-        filtered_matches = []
-        for start, end, group, color in all_matches:
-            # Check if this match overlaps with any previous match
-            overlap = False
-            for prev_start, prev_end, _, _ in filtered_matches:
-                if start < prev_end and end > prev_start:  # Overlapping
-                    overlap = True
-                    break
-            if not overlap:
-                filtered_matches.append((start, end, group, color))
-        
-        # Build result with colored segments
-        for start, end, group, color in filtered_matches:
-            # Add text before match with default color
-            if start > last_end:
-                result.append((text[last_end:start], '#00ff00'))
-            
-            # Add matched text with special color
-            result.append((text[start:end], color))
-            last_end = end
-        
-        # Add remaining text with default color
-        if last_end < len(text):
-            result.append((text[last_end:], '#00ff00'))
-        
-        # If no matches found, return entire text with default color
-        if not result:
-            result.append((text, '#00ff00'))
-        
-        return result
+        return list(colorize(text))
     
     def print_combat_damage(self, message, damage_amount, attacker_name):
         """Print combat damage with extra visual emphasis"""
@@ -480,40 +407,30 @@ class GameGUI:
         self._print_colored_parts(parts)
     
     def _print_colored_parts(self, parts):
-        """Internal method to print pre-processed colored parts"""
-        self.text_area.config(state=tk.NORMAL)
-        
-        for text_part, text_color in parts:
-            if text_part:  # Only process non-empty strings
-                # Create or get color tag
-                tag_name = f"color_{text_color.replace('#', '')}"
-                self.text_area.tag_config(tag_name, foreground=text_color)
-                
-                # Insert text with color tag
-                start_index = self.text_area.index(tk.END + "-1c")
-                self.text_area.insert(tk.END, text_part)
-                end_index = self.text_area.index(tk.END + "-1c")
-                self.text_area.tag_add(tag_name, start_index, end_index)
-        
-        # Add newline
-        self.text_area.insert(tk.END, '\n')
-        self.text_area.see(tk.END)
-        self.text_area.config(state=tk.DISABLED)
-        self.root.update()
+        """Internal method to print pre-processed colored parts (buffered until idle)"""
+        self.text_sink.write_line(parts)
+    
+    def flush_text(self):
+        """Show buffered text immediately (before blocking or direct text_area writes)"""
+        self.text_sink.flush()
+        self.root.update_idletasks()
     
     def clear_text(self):
-        """Clear the text area"""
-        self.text_area.config(state=tk.NORMAL)  # Temporarily enable for clearing
-        self.text_area.delete(1.0, tk.END)
-        self.text_area.config(state=tk.DISABLED)  # Disable again
+        """Clear the text area, dropping any buffered text"""
+        self.text_sink.clear()
 
     def _handle_keypress(self, event):
         """Handle keyboard shortcuts"""
+        key = event.keysym.lower()
+
+        # Combat speed can be changed mid-fight, while the interface is locked
+        if key == 'f':
+            self._cycle_combat_speed()
+            return
+
         if not self.keyboard_enabled:
             return
         
-        key = event.keysym.lower()
-        
         # Universal shortcuts
         if key == 'escape':
             self._handle_escape()
@@ -565,6 +482,11 @@ class GameGUI:
         elif key == 'b':
             self._cycle_biomes()
 
+    def _cycle_combat_speed(self):
+        """Switch to the next combat speed (1x → 2x → 4x → Instant)"""
+        speed = self.animation_scheduler.cycle_speed()
+        self.print_text(f"⏩ Combat speed: {format_speed(speed)}")
+
     def _handle_escape(self):
         """Handle ESC key - go back or show main menu"""
         # For now, just show main menu - can be enhanced later
@@ -601,6 +523,9 @@ class GameGUI:
    + - Volume up
    - - Volume down
 
+⚔️ Combat:
+   F - Combat speed (1x → 2x → 4x → Instant)
+
 🏜️ Testing:
    B - Cycle biomes (Grassland → Desert → Dungeon → Ocean → Town)
 
@@ -616,6 +541,7 @@ class GameGUI:
         # Also update any active encounter screens
         if hasattr(self, 'monster_encounter') and self.monster_encounter:
             self.monster_encounter.set_background(next_biome)
+            self.monster_encounter.prefetch_encounter_assets()
     
     def teleport_to_random_biome(self):
         """Teleport to a random biome different from the current one"""
@@ -835,8 +761,10 @@ class GameGUI:
             image_display=self,
             audio=self.audio,
             interface_control=self,
-            timer=self.root,
-            game_state=self.game_state
+            timer=self.animation_scheduler,
+            game_state=self.game_state,
+            rng=self.rng_service.stream(STREAM_COMBAT),
+            frames=self.frame_scheduler
         )
         self.shop = ShopGUI(self)
         self.blacksmith = BlacksmithGUI(self)
@@ -848,21 +776,44 @@ class GameGUI:
         self.tavern = TavernGUI(self)
         self.achievements = AchievementManager(game_state=self.game_state)
         
+        # Decode combat, shop and fireworks art in the background
+        self._start_asset_preloader()
+        
         # Show story prologue first
         self.show_story_prologue()
     
+    def _start_asset_preloader(self):
+        """Start decoding hero, monster, store and fireworks art off the main thread"""
+        combat_size = self.image_manager.get_layout_image_size(2)
+        requests = collect_character_assets(self.game_state, combat_size) + collect_fireworks_assets()
+        
+        self.asset_preloader = AssetPreloader(
+            self.image_manager.sprite_cache,
+            self.root,
+            progress_callback=self._on_asset_preload_progress
+        )
+        self.asset_preloader.start(
+            requests,
+            store_path=config.FILE_STORE,
+            layout_size_callback=self.image_manager.get_layout_image_size
+        )
+    
+    def _on_asset_preload_progress(self, done, total):
+        """Report asset preloading progress"""
+        logger.debug(f"Preloaded {done}/{total} sprites")
+    
     def show_story_prologue(self):
         """Display the story prologue before the title screen"""
         try:
-            # Load story from YAML file
-            with open(get_resource_path('story.yaml'), 'r', encoding='utf-8') as f:
-                story_data = yaml.safe_load(f)
+            # Load story (content bundle or YAML)
+            story_data = get_content('story')
             
             prologue_lines = story_data.get('Prologue', [])
             
             if prologue_lines:
                 # Set attractive story background image
                 self.background_manager.set_background_image('art/story_background.png')
+                self.image_manager.clear_foreground_images()
                 
                 # Display story text on canvas
                 self.image_manager.show_story_text(
@@ -959,6 +910,7 @@ class GameGUI:
                     self.quest_manager.initialize_hero_quests(self.game_state.hero)
                     
                     self.print_text(f"\n✓ You chose: {hero_name}!\n")
+                    self.flush_text()
                     sleep(0.5)
                     self.main_menu()
             elif choice == 4:
@@ -1017,6 +969,7 @@ class GameGUI:
             ]
             self._print_colored_parts(stat_parts)
             
+            self.flush_text()
             sleep(3)  # Give more time to read the level up message
 
     
@@ -1025,6 +978,12 @@ class GameGUI:
         """Check for level up event first"""
         self.hero_level()
         
+        # Warm the next encounter's sprites and sounds if biome or level changed
+        self.monster_encounter.prefetch_encounter_assets()
+        
+        # Stop animations left over from the previous screen
+        self.frame_scheduler.cancel_all()
+        
         # Reset to default grassy background when returning to main menu
         self.reset_background()
         
@@ -1064,6 +1023,7 @@ class GameGUI:
                         hp_color = '#ff4444'  # Red for critical
                         hp_font = ('Consolas', 10)
                     
+                    self.text_sink.flush()  # Keep buffered lines above this one
                     self.text_area.config(state=tk.NORMAL)
                     self.text_area.insert(tk.END, hp_text, 'hp_label')
                     self.text_area.tag_config('hp_label', foreground='#00ff00')
@@ -1091,6 +1051,7 @@ class GameGUI:
                 xp_current = str(value)
                 xp_max = str(self.game_state.hero['level']*5)
                 
+                self.text_sink.flush()  # Keep buffered lines above this one
                 self.text_area.config(state=tk.NORMAL)
                 self.text_area.insert(tk.END, xp_text, 'default_color')
                 self.text_area.tag_config('default_color', foreground='#00ff00')
@@ -1459,7 +1420,7 @@ class GameGUI:
                 death_image_path = f"art/{hero_class}_death.png"
             
             # Try to load class-specific death image
-            if resource_exists(death_image_path):
+            if sprite_exists(death_image_path):
                 self.show_image(death_image_path)
             else:
                 # Fallback to generic you_lost image if class-specific doesn't exist
@@ -2,15 +2,22 @@
 Monster encounter system for GUI
 """
 import os
-import random
 from typing import TYPE_CHECKING
 
 import config
+from asset_preloader import AssetPreloader, collect_monster_assets, combat_sprite_sizes
+from frame_scheduler import Tween, ease_out_quad
 from logger_utils import get_logger
-from resource_utils import resource_exists
+from monster_catalog import get_monster_catalog
+from sprite_atlas import sprite_exists
+from sprite_variants import monster_sprite_path
+from rng_service import STREAM_ENCOUNTERS, get_stream
 
 logger = get_logger(__name__)
 
+# Frame scheduler group for the entrance animation
+ENCOUNTER_ANIMATION_GROUP = 'encounter'
+
 if TYPE_CHECKING:
     from gui_interfaces import GameContextProtocol
 
@@ -24,6 +31,7 @@ class MonsterEncounterGUI:
             gui: Game context providing UI, state, and subsystem access
         """
         self.gui = gui
+        self.rng = get_stream(gui, STREAM_ENCOUNTERS)
     
     def set_background(self, biome_name):
         """Set background for monster encounters (called when biome changes)"""
@@ -77,6 +85,8 @@ class MonsterEncounterGUI:
             (monster['name'], "#ffaa00"),
             (f" {encounter_desc}! {emoji}\n", "#ffffff")
         ]
+        if monster.get('elite'):
+            encounter_parts[1:1] = [("Elite ", config.COLOR_ELITE)]
         self.gui._print_colored_parts(encounter_parts)
         
         # Show current quest summary before the fight
@@ -171,6 +181,7 @@ class MonsterEncounterGUI:
         """Handle when player chooses to fight the monster"""
         # Lock interface immediately when fight is chosen to prevent double-clicks
         self.gui.lock_interface()
+        self.gui.frame_scheduler.cancel(ENCOUNTER_ANIMATION_GROUP)
         
         # Create callback for after the fight is complete
         after_fight_callback = self._create_after_fight_callback(monster, monster_type)
@@ -180,6 +191,7 @@ class MonsterEncounterGUI:
     
     def _handle_run_choice(self, monster):
         """Handle when player chooses to run away"""
+        self.gui.frame_scheduler.cancel(ENCOUNTER_ANIMATION_GROUP)
         self._attempt_run_away(monster)
     
     def _create_after_fight_callback(self, monster, monster_type):
@@ -195,6 +207,8 @@ class MonsterEncounterGUI:
             else:
                 self._handle_defeat()
             
+            self._autosave()
+            
             # Check if game is over (0 lives left)
             if self.gui.check_game_over():
                 # Don't return to main menu if game is over - let game over screen stay
@@ -214,6 +228,12 @@ class MonsterEncounterGUI:
         
         return after_fight
     
+    def _autosave(self):
+        """Record the fight outcome in the autosave journal (if enabled)"""
+        manager = getattr(self.gui, 'save_load_manager', None)
+        if config.AUTOSAVE_AFTER_FIGHT and manager is not None:
+            manager.autosave(self.gui.game_state.hero, getattr(self.gui, 'current_biome', None))
+    
     def _handle_victory(self, monster, monster_type):
         """Handle victory rewards and quest completion"""
         hero = self.gui.game_state.hero
@@ -357,7 +377,7 @@ class MonsterEncounterGUI:
         self.gui.lock_interface()
         
         # 50% chance of monster getting an attack in
-        monster_attacks = random.choice([True, False])
+        monster_attacks = self.rng.choice([True, False])
         
         if monster_attacks:
             self.gui.print_text("\n🏃 You try to run away...")
@@ -374,10 +394,8 @@ class MonsterEncounterGUI:
             base_img_size = min(canvas_width // 3, canvas_height // 2, 120)
             
             # Special handling for Dragon boss
-            is_dragon_boss = (monster.get('finalboss', False) and 
-                             'dragon_endboss' in self.current_monster_image.lower())
-            hero_img_size = base_img_size
-            monster_img_size = int(base_img_size * 1.8) if is_dragon_boss else base_img_size
+            hero_img_size, monster_img_size = combat_sprite_sizes(monster, base_img_size,
+                                                                  self.current_monster_image)
             
             spacing_x = canvas_width // 3
             start_y = (canvas_height - max(hero_img_size, monster_img_size)) // 2
@@ -461,7 +479,7 @@ class MonsterEncounterGUI:
                 hero_image_path = f"art/{hero_class.capitalize()}.png"
             
             # Check if hero image exists
-            if resource_exists(hero_image_path):
+            if sprite_exists(hero_image_path):
                 image_paths.append(hero_image_path)
             else:
                 # Use crossed swords as fallback for hero
@@ -473,8 +491,8 @@ class MonsterEncounterGUI:
         # Get monster image path
         if 'art' in monster and monster['art']:
             try:
-                if resource_exists(monster['art']):
-                    image_paths.append(monster['art'])
+                if sprite_exists(monster['art']):
+                    image_paths.append(monster_sprite_path(monster, monster['art']))
                 else:
                     # Use crossed swords as fallback for monster
                     image_paths.append('art/crossed_swords.png')
@@ -503,14 +521,10 @@ class MonsterEncounterGUI:
         # Calculate final positions (same as horizontal layout in show_images)
         base_img_size = min(canvas_width // 3, canvas_height // 2, 120)
         
-        # Special handling for double-resolution Dragon final boss
+        # Larger size for the double-resolution Dragon final boss
         monster_data = getattr(self, 'current_monster_data', {})
-        is_dragon_boss = (monster_data.get('finalboss', False) and 
-                         'dragon_endboss' in self.current_monster_image.lower())
-        
-        # Use larger size for Dragon boss to show its high-resolution art
-        hero_img_size = base_img_size
-        monster_img_size = int(base_img_size * 1.8) if is_dragon_boss else base_img_size
+        hero_img_size, monster_img_size = combat_sprite_sizes(monster_data, base_img_size,
+                                                              self.current_monster_image)
         
         spacing_x = canvas_width // 3
         start_y = (canvas_height - max(hero_img_size, monster_img_size)) // 2
@@ -528,16 +542,9 @@ class MonsterEncounterGUI:
         hero_start_x = -hero_img_size  # Off-screen left
         monster_start_x = canvas_width  # Off-screen right
         
-        # Animation parameters
-        self.animation_step = 0
-        self.animation_steps = 15  # Number of animation frames (reduced for faster entrance)
         self.hero_current_x = hero_start_x
         self.monster_current_x = monster_start_x
         
-        # Calculate movement per step
-        self.hero_step_x = (hero_final_x - hero_start_x) / self.animation_steps
-        self.monster_step_x = (monster_final_x - monster_start_x) / self.animation_steps
-        
         # Store final positions and image sizes for animation
         self.hero_final_x = hero_final_x
         self.monster_final_x = monster_final_x
@@ -545,20 +552,19 @@ class MonsterEncounterGUI:
         self.hero_img_size = hero_img_size
         self.monster_img_size = monster_img_size
         
-        # Start the animation
-        self._update_entrance_animation()
+        # Start the animation (600ms, with ease-out for a smoother entrance)
+        self.gui.frame_scheduler.cancel(ENCOUNTER_ANIMATION_GROUP)
+        self.gui.frame_scheduler.play(
+            Tween(config.ENTRANCE_ANIMATION_DURATION, self._update_entrance_animation,
+                  easing=ease_out_quad, key='entrance', on_complete=self._finish_entrance_animation),
+            group=ENCOUNTER_ANIMATION_GROUP)
     
-    def _update_entrance_animation(self):
-        """Update one frame of the entrance animation"""
-        # Clear previous frame
-        self.gui._clear_foreground_images()
-        
-        # Calculate animation progress (0.0 to 1.0)
-        progress = self.animation_step / self.animation_steps
-        
-        # Apply easing for smoother animation (ease-out effect)
-        eased_progress = 1 - (1 - progress) ** 2
+    def _update_entrance_animation(self, eased_progress):
+        """Update one frame of the entrance animation
         
+        Args:
+            eased_progress: Eased animation progress (0.0 to 1.0)
+        """
         # Calculate current positions using eased progress
         hero_start_x = -self.hero_img_size
         monster_start_x = self.gui._get_canvas_dimensions()[0]
@@ -566,50 +572,44 @@ class MonsterEncounterGUI:
         self.hero_current_x = hero_start_x + (self.hero_final_x - hero_start_x) * eased_progress
         self.monster_current_x = monster_start_x + (self.monster_final_x - monster_start_x) * eased_progress
         
-        # Add hero image at current position
-        hero_id = self.gui._add_canvas_image(
-            self.current_hero_image, 
-            int(self.hero_current_x), 
-            self.final_y, 
-            self.hero_img_size, 
-            self.hero_img_size
-        )
-        
-        # Add monster image at current position (larger for Dragon boss)
-        monster_id = self.gui._add_canvas_image(
-            self.current_monster_image, 
-            int(self.monster_current_x), 
-            self.final_y, 
-            self.monster_img_size, 
-            self.monster_img_size
-        )
-        
-        # Continue animation or finish
-        self.animation_step += 1
-        if self.animation_step < self.animation_steps:
-            # Schedule next frame
-            self.gui.root.after(40, self._update_entrance_animation)  # 40ms per frame for smoother animation
-        else:
-            # Animation complete - ensure final positions are exact
+        # Move the hero and monster sprites (created on the first frame)
+        self._place_entrance_sprites(int(self.hero_current_x), int(self.monster_current_x))
+    
+    def _finish_entrance_animation(self):
+        """Animation complete - ensure final positions are exact"""
+        self._place_entrance_sprites(self.hero_final_x, self.monster_final_x)
+        
+        # Optional: Play a subtle encounter sound when animation completes
+        # (You can uncomment this if you want sound feedback)
+        # self.gui.audio.play_sound_effect('encounter.mp3')
+
+    def _place_entrance_sprites(self, hero_x, monster_x):
+        """Position the entrance sprites, creating them if they are not on the canvas yet"""
+        hero_sprite = getattr(self, 'hero_sprite', None)
+        monster_sprite = getattr(self, 'monster_sprite', None)
+        
+        if (hero_sprite is None or monster_sprite is None or
+                not hero_sprite.is_alive() or not monster_sprite.is_alive()):
             self.gui._clear_foreground_images()
-            self.gui._add_canvas_image(
+            self.hero_sprite = self.gui._create_sprite(
                 self.current_hero_image, 
-                self.hero_final_x, 
+                hero_x, 
                 self.final_y, 
                 self.hero_img_size, 
                 self.hero_img_size
             )
-            self.gui._add_canvas_image(
+            # Monster sprite is larger for Dragon boss
+            self.monster_sprite = self.gui._create_sprite(
                 self.current_monster_image, 
-                self.monster_final_x, 
+                monster_x, 
                 self.final_y, 
                 self.monster_img_size, 
                 self.monster_img_size
             )
-            
-            # Optional: Play a subtle encounter sound when animation completes
-            # (You can uncomment this if you want sound feedback)
-            # self.gui.audio.play_sound_effect('encounter.mp3')
+            return
+        
+        hero_sprite.move_to(hero_x, self.final_y)
+        monster_sprite.move_to(monster_x, self.final_y)
 
     def _display_vs_stats(self, hero, monster):
         """Display hero and monster stats side by side"""
@@ -728,30 +728,93 @@ class MonsterEncounterGUI:
             ]
             self.gui._print_colored_parts(no_quest_parts)
 
-    def _select_random_monster(self):
-        """Select random monster based on current biome from YAML biome field"""
-        import random
-        current_biome = getattr(self.gui, 'current_biome', 'grassland')
-        hero_level = self.gui.game_state.hero['level']
+    def _get_candidate_monsters(self, biome=None, hero_level=None):
+        """Get the monsters an encounter can pick from
         
-        # Get all monsters for this biome
-        biome_specific_monsters = [
-            (key, value) for key, value in self.gui.game_state.monsters.items()
-            if value.get('biome', 'grassland') == current_biome
-        ]
+        Args:
+            biome: Biome to search (default: current biome)
+            hero_level: Hero level to match (default: current hero level)
+            
+        Returns:
+            List of (monster_key, monster_data) tuples
+        """
+        current_biome = biome or getattr(self.gui, 'current_biome', 'grassland')
+        if hero_level is None:
+            hero_level = self.gui.game_state.hero['level']
         
-        # Try to find level-appropriate monsters in current biome first
         # Reasonable level range: maximum 1 level above, minimum 2 levels below (but never below 1)
-        level_appropriate_monsters = [
-            (key, value) for key, value in biome_specific_monsters
-            if value['level'] <= hero_level + 1 and value['level'] >= max(1, hero_level - 2)
-        ]
+        catalog = get_monster_catalog(self.gui.game_state)
+        return catalog.in_level_range(max(1, hero_level - 2), hero_level + 1, biome=current_biome)
+    
+    def _select_random_monster(self):
+        """Select random monster based on current biome from YAML biome field"""
+        # Try to find level-appropriate monsters in current biome first
+        level_appropriate_monsters = self._get_candidate_monsters()
         
         if level_appropriate_monsters:
-            key, value = random.choice(level_appropriate_monsters)
+            key, value = self.rng.choice(level_appropriate_monsters)
             monster_data = value.copy()
+            self._roll_elite(monster_data)
             return (key, monster_data)
         
         # No level-appropriate monsters found in this biome
         return None
-
+    
+    def _roll_elite(self, monster):
+        """Turn an encounter into an elite one at config.ELITE_ENCOUNTER_CHANCE odds
+        
+        Elite monsters have their stats multiplied by config.ELITE_STAT_MULTIPLIER
+        and are drawn with the elite glow. The final boss is never elite.
+        
+        Args:
+            monster: Copy of the monster data for this encounter (modified in place)
+        """
+        if monster.get('finalboss') or self.rng.random() >= config.ELITE_ENCOUNTER_CHANCE:
+            return
+        monster['elite'] = True
+        for stat in ('hp', 'maxhp', 'attack', 'defense'):
+            if stat in monster:
+                monster[stat] = int(monster[stat] * config.ELITE_STAT_MULTIPLIER)
+    
+    def prefetch_encounter_assets(self):
+        """Warm sprites and sounds for every monster the next encounter could pick
+        
+        Runs whenever the biome or hero level changes, so starting a fight
+        finds everything already decoded. Decoding happens off the main thread.
+        """
+        hero = self.gui.game_state.hero
+        if not hero or 'level' not in hero:
+            return
+        
+        current_biome = getattr(self.gui, 'current_biome', 'grassland')
+        hero_image = hero.get('art')
+        prefetch_key = (current_biome, hero['level'], hero_image)
+        if prefetch_key == getattr(self, '_prefetch_key', None):
+            return
+        self._prefetch_key = prefetch_key
+        
+        candidates = [monster for _, monster in self._get_candidate_monsters(current_biome, hero['level'])]
+        combat_size = self.gui.image_manager.get_layout_image_size(2)
+        
+        requests = [(hero[field], combat_size, combat_size)
+                    for field in ('art', 'art_attack') if hero.get(field)]
+        requests.extend(collect_monster_assets(candidates, combat_size))
+        
+        # Skip sprites that are already cached
+        sprite_cache = self.gui.image_manager.sprite_cache
+        requests = [r for r in requests if not sprite_cache.contains(*r)]
+        
+        previous = getattr(self, 'prefetcher', None)
+        if previous and not previous.finished:
+            previous.stop()
+        
+        if requests:
+            self.prefetcher = AssetPreloader(sprite_cache, self.gui.root)
+            self.prefetcher.start(requests)
+        
+        sounds = [self._get_monster_attack_sound(monster) for monster in candidates]
+        sounds.append(hero.get('attack_sound') or 'punch.mp3')
+        self.gui.audio.preload_sound_effects(sounds)
+        
+        logger.debug(f"Prefetching {len(requests)} sprites and {len(sounds)} sounds "
+                     f"for {len(candidates)} {current_biome} monsters")
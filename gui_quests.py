@@ -1,10 +1,11 @@
 """
 Quest system for the monster game
 """
-import random
 from typing import TYPE_CHECKING
 
 import config
+from monster_catalog import get_monster_catalog
+from rng_service import STREAM_QUESTS, get_stream
 
 if TYPE_CHECKING:
     from gui_interfaces import GameContextProtocol
@@ -54,6 +55,7 @@ class QuestManager:
             gui: Game context providing access to game_state, current_biome, and subsystems
         """
         self.gui = gui
+        self.rng = get_stream(gui, STREAM_QUESTS)
         
     def initialize_hero_quests(self, hero):
         """Initialize quest list in hero object if not present"""
@@ -104,23 +106,17 @@ class QuestManager:
         # 1. Current biome
         # 2. Level range (same as encounter system: hero_level - 2 to hero_level + 1)
         # 3. Not already a quest target
+        catalog = get_monster_catalog(self.gui.game_state)
+        min_level = max(1, hero_level + config.QUEST_LEVEL_RANGE_MIN)
+        max_level = hero_level + config.QUEST_LEVEL_RANGE_MAX
+        
+        biome_level_monsters = catalog.in_level_range(min_level, max_level, biome=current_biome)
         available_biome_monsters = [
-            (key, value) for key, value in monsters.items()
-            if (value.get('biome', 'grassland') == current_biome and 
-                value['level'] <= hero_level + config.QUEST_LEVEL_RANGE_MAX and
-                value['level'] >= max(1, hero_level + config.QUEST_LEVEL_RANGE_MIN) and
-                key not in existing_quest_targets)
+            (key, value) for key, value in biome_level_monsters
+            if key not in existing_quest_targets
         ]
         
         if not available_biome_monsters:
-            # Check if there are level-appropriate monsters in this biome
-            biome_level_monsters = [
-                (key, value) for key, value in monsters.items()
-                if (value.get('biome', 'grassland') == current_biome and
-                    value['level'] <= hero_level + config.QUEST_LEVEL_RANGE_MAX and
-                    value['level'] >= max(1, hero_level + config.QUEST_LEVEL_RANGE_MIN))
-            ]
-            
             if biome_level_monsters:
                 # All level-appropriate monsters in biome have quests
                 return "NO_QUESTS_AVAILABLE_BIOME"
@@ -128,10 +124,8 @@ class QuestManager:
                 # No level-appropriate monsters in this biome
                 # Try any biome with level-appropriate monsters
                 available_all_monsters = [
-                    (key, value) for key, value in monsters.items()
-                    if (key not in existing_quest_targets and
-                        value['level'] <= hero_level + config.QUEST_LEVEL_RANGE_MAX and
-                        value['level'] >= max(1, hero_level + config.QUEST_LEVEL_RANGE_MIN))
+                    (key, value) for key, value in catalog.in_level_range(min_level, max_level)
+                    if key not in existing_quest_targets
                 ]
                 
                 if not available_all_monsters:
@@ -139,12 +133,12 @@ class QuestManager:
                     return "NO_QUESTS_AVAILABLE_LEVEL"
                 else:
                     # Pick from any level-appropriate monster
-                    monster_name, monster_data = random.choice(
+                    monster_name, monster_data = self.rng.choice(
                         available_all_monsters
                     )
         else:
             # Pick a random monster from available biome monsters
-            monster_name, monster_data = random.choice(
+            monster_name, monster_data = self.rng.choice(
                 available_biome_monsters
             )
         
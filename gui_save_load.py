@@ -1,16 +1,35 @@
 """
 Save/Load system for the monster game using YAML
 """
+import copy
+import json
 import os
-import yaml
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
+import config
 from logger_utils import get_logger
 from resource_utils import ensure_writable_dir
+from save_format import (AutosaveJournal, decode_save, encode_save, join_save_sections,
+                         read_journal, split_save_sections)
+from save_writer import SaveWriter, write_file_atomic
+from yaml_utils import dump_yaml, load_yaml_file
 
 logger = get_logger(__name__)
 
+# Bump when the index entry layout changes (old indexes are rebuilt)
+SAVE_INDEX_VERSION = 1
+
+# Save file types
+SAVE_EXTENSION_YAML = '.yaml'
+SAVE_EXTENSION_BINARY = '.sav'
+AUTOSAVE_EXTENSION = '.journal'
+SAVE_EXTENSIONS = (SAVE_EXTENSION_YAML, SAVE_EXTENSION_BINARY, AUTOSAVE_EXTENSION)
+AUTOSAVE_NAME = 'autosave'
+
+# Save summary fields shown on the save/load screens
+SAVE_SUMMARY_FIELDS = ('hero_name', 'hero_class', 'level', 'save_date', 'current_biome')
+
 if TYPE_CHECKING:
     from gui_interfaces import GameContextProtocol
 
@@ -25,6 +44,8 @@ class SaveLoadManager:
             gui: Game context providing UI, state, and subsystem access
         """
         self.gui = gui
+        self._autosave_journal = None  # AutosaveJournal, created on first autosave
+        self._save_writer = None  # SaveWriter, created on first background save
         # Ensure writable saves directory (handles PyInstaller bundle)
         saves_path = ensure_writable_dir("saves")
         self.saves_dir = Path(saves_path)
@@ -52,35 +73,42 @@ class SaveLoadManager:
             logger.error(f"Could not create saves directory: {e}")
     
     def get_available_saves(self):
-        """Get list of available save files"""
+        """Get list of available save files
+
+        Save summaries come from the sidecar index; only saves that are new
+        or changed since they were indexed (by mtime and size) get parsed.
+        """
         try:
+            index = self._load_save_index()
+            changed = False
             save_files = []
-            for file_path in self.saves_dir.glob("*.yaml"):
+            seen = set()
+            for file_path in self._iter_save_files():
+                seen.add(file_path.name)
                 try:
-                    # Load basic info from save file
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        # Use UnsafeLoader to handle legacy saves with python tags if necessary
-                        # But prefer SafeLoader for security. If SafeLoader fails, try FullLoader
-                        try:
-                            save_data = yaml.safe_load(f)
-                        except yaml.constructor.ConstructorError:
-                            # Fallback for saves with python objects (like BiomeType enum)
-                            f.seek(0)
-                            save_data = yaml.load(f, Loader=yaml.Loader)
+                    stat = file_path.stat()
+                    signature = [stat.st_mtime_ns, stat.st_size]
+                    entry = index.get(file_path.name)
+                    if entry is None or entry.get('signature') != signature:
+                        save_data = self._read_save_file(file_path, copy_result=False)
+                        entry = self._summarize_save(save_data, signature)
+                        index[file_path.name] = entry
+                        changed = True
                     
-                    save_info = {
-                        'filename': file_path.name,
-                        'path': file_path,
-                        'hero_name': save_data.get('hero', {}).get('name', 'Unknown'),
-                        'hero_class': save_data.get('hero', {}).get('class', 'Unknown'),
-                        'level': save_data.get('hero', {}).get('level', 1),
-                        'save_date': save_data.get('save_metadata', {}).get('save_date', 'Unknown'),
-                        'current_biome': save_data.get('game_state', {}).get('current_biome', 'grassland')
-                    }
+                    save_info = {key: entry[key] for key in SAVE_SUMMARY_FIELDS}
+                    save_info['filename'] = file_path.name
+                    save_info['path'] = file_path
                     save_files.append(save_info)
                 except Exception as e:
                     logger.warning(f"Could not read save file {file_path}: {e}")
             
+            # Forget saves deleted outside the game
+            for filename in set(index) - seen:
+                del index[filename]
+                changed = True
+            if changed:
+                self._write_save_index(index)
+            
             # Sort by save date (most recent first)
             save_files.sort(key=lambda x: x['save_date'], reverse=True)
             return save_files
@@ -88,56 +116,134 @@ class SaveLoadManager:
             logger.error(f"Error getting save files: {e}")
             return []
     
-    def save_game(self, hero, current_biome=None, save_name=None):
-        """Save current game state to YAML file with atomic write safety"""
+    def _iter_save_files(self):
+        """Yield every YAML save, binary save and autosave journal"""
+        for extension in SAVE_EXTENSIONS:
+            yield from self.saves_dir.glob(f"*{extension}")
+    
+    @staticmethod
+    def _read_save_file(save_path, copy_result=True):
+        """Read save data from a YAML save, binary save or autosave journal"""
+        save_path = Path(save_path)
+        if save_path.suffix == SAVE_EXTENSION_BINARY:
+            with open(save_path, 'rb') as f:
+                return decode_save(f.read())
+        if save_path.suffix == AUTOSAVE_EXTENSION:
+            return join_save_sections(read_journal(save_path))
+        # Legacy saves with python tags (like BiomeType enum) fall back to the full loader
+        return load_yaml_file(save_path, allow_python_tags=True, copy_result=copy_result)
+    
+    @staticmethod
+    def _summarize_save(save_data, signature):
+        """Build the index entry for a save from its data"""
+        hero = save_data.get('hero', {})
+        return {
+            'signature': signature,
+            'hero_name': hero.get('name', 'Unknown'),
+            'hero_class': hero.get('class', 'Unknown'),
+            'level': hero.get('level', 1),
+            'save_date': str(save_data.get('save_metadata', {}).get('save_date', 'Unknown')),
+            'current_biome': str(save_data.get('game_state', {}).get('current_biome', 'grassland'))
+        }
+    
+    def _load_save_index(self):
+        """Load the save index (empty if missing, unreadable or outdated)"""
+        index_path = self.saves_dir / config.SAVE_INDEX_FILENAME
         try:
-            # Generate save name if not provided
-            if save_name is None:
-                hero_name = hero.get('name', 'Hero')
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                save_name = f"{hero_name}_{timestamp}.yaml"
-            elif not save_name.endswith('.yaml'):
-                save_name += '.yaml'
-            
-            # Prepare save data structure
-            # Ensure Enums are converted to strings for YAML serialization
-            current_biome_val = current_biome or getattr(self.gui, 'current_biome', 'grassland')
-            if hasattr(current_biome_val, 'value'):
-                current_biome_val = current_biome_val.value
-                
-            last_biome_val = getattr(self.gui, 'last_biome', 'grassland')
-            if hasattr(last_biome_val, 'value'):
-                last_biome_val = last_biome_val.value
+            with open(index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Rebuilding unreadable save index: {e}")
+            return {}
+        if not isinstance(data, dict) or data.get('version') != SAVE_INDEX_VERSION:
+            return {}
+        return data.get('saves', {})
+    
+    def _write_save_index(self, index):
+        """Write the save index atomically"""
+        index_path = self.saves_dir / config.SAVE_INDEX_FILENAME
+        temp_path = index_path.with_suffix('.json.tmp')
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': SAVE_INDEX_VERSION, 'saves': index}, f, default=str)
+            os.replace(temp_path, index_path)
+        except OSError as e:
+            logger.warning(f"Could not write save index: {e}")
+    
+    def _update_save_index(self, filename, save_data=None):
+        """Add/refresh (save_data given) or remove (None) one save in the index"""
+        index = self._load_save_index()
+        if save_data is None:
+            if index.pop(filename, None) is None:
+                return
+        else:
+            stat = (self.saves_dir / filename).stat()
+            index[filename] = self._summarize_save(save_data, [stat.st_mtime_ns, stat.st_size])
+        self._write_save_index(index)
+    
+    def _build_save_data(self, hero, current_biome, save_name):
+        """Build the save dictionary for the current game"""
+        # Ensure Enums are converted to strings for serialization
+        current_biome_val = current_biome or getattr(self.gui, 'current_biome', 'grassland')
+        if hasattr(current_biome_val, 'value'):
+            current_biome_val = current_biome_val.value
             
-            save_data = {
-                'hero': self._prepare_hero_data(hero),
-                'game_state': {
-                    'current_biome': str(current_biome_val),
-                    'last_biome': str(last_biome_val)
-                },
-                'save_metadata': {
-                    'save_date': datetime.now().isoformat(),
-                    'game_version': '1.0',
-                    'save_name': save_name
-                }
+        last_biome_val = getattr(self.gui, 'last_biome', 'grassland')
+        if hasattr(last_biome_val, 'value'):
+            last_biome_val = last_biome_val.value
+        
+        save_data = {
+            'hero': self._prepare_hero_data(hero),
+            'game_state': {
+                'current_biome': str(current_biome_val),
+                'last_biome': str(last_biome_val)
+            },
+            'save_metadata': {
+                'save_date': datetime.now().isoformat(),
+                'game_version': '1.0',
+                'save_name': save_name
             }
+        }
+        
+        # Add achievements data if available
+        if hasattr(self.gui, 'achievements') and self.gui.achievements:
+            save_data['achievements'] = self.gui.achievements.save_to_dict()
+        
+        return save_data
+    
+    @staticmethod
+    def _resolve_save_name(hero, save_name, save_format):
+        """Generate a save name if needed and add the format's extension"""
+        extension = SAVE_EXTENSION_BINARY if save_format == 'binary' else SAVE_EXTENSION_YAML
+        if save_name is None:
+            hero_name = hero.get('name', 'Hero')
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            return f"{hero_name}_{timestamp}{extension}"
+        if not save_name.endswith(extension):
+            save_name += extension
+        return save_name
+    
+    def save_game(self, hero, current_biome=None, save_name=None, save_format=None):
+        """Save current game state with atomic write safety
+        
+        Args:
+            hero: Hero dictionary
+            current_biome: Biome to record (default: the GUI's current biome)
+            save_name: File name (default: hero name and timestamp)
+            save_format: 'yaml' or 'binary' (default: config.SAVE_FORMAT)
+        """
+        try:
+            save_format = save_format or config.SAVE_FORMAT
+            save_name = self._resolve_save_name(hero, save_name, save_format)
+            save_data = self._build_save_data(hero, current_biome, save_name)
             
-            # Add achievements data if available
-            if hasattr(self.gui, 'achievements') and self.gui.achievements:
-                save_data['achievements'] = self.gui.achievements.save_to_dict()
-            
-            # Atomic write: Save to temp file first, then rename
+            # Atomic write: temp file, fsync, then os.replace
             final_path = self.saves_dir / save_name
-            temp_path = final_path.with_suffix('.tmp')
+            write_file_atomic(final_path, self._get_save_encoder(save_format)(save_data))
             
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                yaml.dump(save_data, f, default_flow_style=False, allow_unicode=True, indent=2)
-                
-            # Rename temp file to final file (atomic operation on POSIX, usually safe on Windows)
-            if temp_path.exists():
-                if final_path.exists():
-                    final_path.unlink() # Remove existing file if overwriting
-                temp_path.rename(final_path)
+            self._update_save_index(save_name, save_data)
             
             return {
                 'success': True,
@@ -150,16 +256,102 @@ class SaveLoadManager:
                 'error': str(e)
             }
     
+    def save_game_async(self, hero, current_biome=None, save_name=None, save_format=None, callback=None):
+        """Save without blocking the UI
+        
+        The save data is deep-copied here on the main thread, so nested lists
+        and dicts the game keeps mutating (completed quests, kill counts) are
+        not shared with the writer; encoding and the atomic write happen on
+        the SaveWriter thread. Back-to-back saves to the
+        same file are coalesced so only the newest snapshot is written.
+        
+        Args:
+            hero, current_biome, save_name, save_format: As for save_game()
+            callback: Function called as (result) on the main thread, with the
+                same result dict save_game() returns
+        """
+        save_format = save_format or config.SAVE_FORMAT
+        save_name = self._resolve_save_name(hero, save_name, save_format)
+        save_data = copy.deepcopy(self._build_save_data(hero, current_biome, save_name))
+        final_path = self.saves_dir / save_name
+        
+        def on_written(result):
+            if result['success']:
+                self._update_save_index(save_name, save_data)
+                result = {'success': True, 'filename': save_name, 'path': final_path}
+            else:
+                result = {'success': False, 'error': result['error']}
+            if callback:
+                callback(result)
+        
+        if self._save_writer is None:
+            self._save_writer = SaveWriter(self.gui.root)
+        self._save_writer.submit(final_path, save_data, self._get_save_encoder(save_format), on_written)
+    
+    def flush_pending_saves(self, timeout=5.0):
+        """Wait for background saves to reach disk (call before exiting)
+        
+        Returns:
+            True if nothing is left unwritten
+        """
+        if self._save_writer is None:
+            return True
+        finished = self._save_writer.flush(timeout)
+        if not finished:
+            logger.warning("Timed out waiting for background saves to finish")
+        return finished
+    
+    @staticmethod
+    def _get_save_encoder(save_format):
+        """Get the function that turns save data into file bytes"""
+        if save_format == 'binary':
+            return encode_save
+        return lambda save_data: dump_yaml(
+            save_data, default_flow_style=False, allow_unicode=True, indent=2).encode('utf-8')
+    
+    def autosave(self, hero, current_biome=None):
+        """Record the game in the autosave journal
+        
+        Only the save sections that changed since the last autosave are
+        appended; the journal is compacted every config.AUTOSAVE_COMPACT_EVERY
+        autosaves. The save index picks the journal up by its mtime.
+        
+        Returns:
+            Result dict with 'success' and 'bytes' written
+        """
+        try:
+            save_name = AUTOSAVE_NAME + AUTOSAVE_EXTENSION
+            if self._autosave_journal is None:
+                self._autosave_journal = AutosaveJournal(self.saves_dir / save_name)
+            
+            save_data = self._build_save_data(hero, current_biome, save_name)
+            written = self._autosave_journal.write(split_save_sections(save_data))
+            return {'success': True, 'bytes': written}
+        except Exception as e:
+            logger.warning(f"Autosave failed: {e}")
+            return {'success': False, 'error': str(e)}
+    
+    def export_save_yaml(self, save_path, export_path=None):
+        """Export any save (binary, journal or YAML) as a readable YAML file
+        
+        Args:
+            save_path: Save to export
+            export_path: Output path (default: same name with a .yaml suffix)
+        """
+        try:
+            save_path = Path(save_path)
+            export_path = Path(export_path) if export_path else save_path.with_suffix(SAVE_EXTENSION_YAML)
+            save_data = self._read_save_file(save_path)
+            with open(export_path, 'w', encoding='utf-8') as f:
+                dump_yaml(save_data, f, default_flow_style=False, allow_unicode=True, indent=2)
+            return {'success': True, 'path': export_path}
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+    
     def load_game(self, save_path):
-        """Load game state from YAML file"""
+        """Load game state from a YAML save, binary save or autosave journal"""
         try:
-            with open(save_path, 'r', encoding='utf-8') as f:
-                try:
-                    save_data = yaml.safe_load(f)
-                except yaml.constructor.ConstructorError:
-                    # Fallback for saves with python objects
-                    f.seek(0)
-                    save_data = yaml.load(f, Loader=yaml.Loader)
+            save_data = self._read_save_file(save_path)
             
             # Validate save data structure
             if not isinstance(save_data, dict):
@@ -202,6 +394,7 @@ class SaveLoadManager:
             
             if save_path.exists():
                 save_path.unlink()
+                self._update_save_index(save_path.name)
                 return {'success': True}
             else:
                 return {'success': False, 'error': 'Save file not found'}
@@ -392,7 +585,8 @@ class SaveLoadManager:
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
         default_name = f"{hero_name}_L{hero_level}_{current_biome}"
         
-        self.gui.print_text(f"\nSave as: {default_name}.yaml")
+        extension = SAVE_EXTENSION_BINARY if config.SAVE_FORMAT == 'binary' else SAVE_EXTENSION_YAML
+        self.gui.print_text(f"\nSave as: {default_name}{extension}")
         self.gui.print_text("Save location: saves/")
         
         # Show existing saves
@@ -413,28 +607,33 @@ class SaveLoadManager:
         
         def on_save_choice(choice):
             if choice == 1:
-                # Perform save
-                result = self.save_game(hero, current_biome, default_name)
-                
-                if result['success']:
-                    success_parts = [
-                        ("✅ Game saved successfully! ", "#00ff00"),
-                        (f"File: {result['filename']}", "#ffffff")
-                    ]
-                    self.gui._print_colored_parts(success_parts)
-                    self.gui.audio.play_sound_effect('success.mp3')  # Play success sound if available
-                else:
-                    error_parts = [
-                        ("❌ Save failed: ", "#ff6666"),
-                        (result['error'], "#ffffff")
-                    ]
-                    self.gui._print_colored_parts(error_parts)
-                
-                self.gui.root.after(2500, self.gui.main_menu)
+                # Perform save in the background; report when it is on disk.
+                # The buttons stay locked until the write has finished.
+                self.gui.lock_interface()
+                self.gui.print_text("\n💾 Saving...")
+                self.save_game_async(hero, current_biome, default_name, callback=on_saved)
             else:
                 # Cancel save
                 self.gui.main_menu()
         
+        def on_saved(result):
+            if result['success']:
+                success_parts = [
+                    ("✅ Game saved successfully! ", "#00ff00"),
+                    (f"File: {result['filename']}", "#ffffff")
+                ]
+                self.gui._print_colored_parts(success_parts)
+                self.gui.audio.play_sound_effect('success.mp3')  # Play success sound if available
+            else:
+                error_parts = [
+                    ("❌ Save failed: ", "#ff6666"),
+                    (result['error'], "#ffffff")
+                ]
+                self.gui._print_colored_parts(error_parts)
+            
+            self.gui.unlock_interface()
+            self.gui.root.after(2500, self.gui.main_menu)
+        
         self.gui.set_buttons(["💾 Save Game", "❌ Cancel"], on_save_choice)
     
     def show_load_interface(self):
@@ -1,10 +1,10 @@
 """
 Shop system for GUI
 """
-import yaml
 import os
 from typing import TYPE_CHECKING
-from resource_utils import get_resource_path, resource_exists
+from sprite_atlas import sprite_exists
+from content_bundle import get_content
 
 if TYPE_CHECKING:
     from gui_interfaces import GameContextProtocol
@@ -28,8 +28,9 @@ class ShopGUI:
         if self.store_data is None:
             self._load_store()
         
-        # Set the shop-specific background
+        # Set the shop-specific background on an empty stage
         self.gui.set_shop_background()
+        self.gui._clear_foreground_images()
         
         self.gui.clear_text()
         #self.gui.show_image('art/pymart.txt')
@@ -42,10 +43,9 @@ class ShopGUI:
         self._select_category()
     
     def _load_store(self):
-        """Load store data from YAML"""
+        """Load store data from the content bundle (or YAML)"""
         try:
-            with open(get_resource_path('store.yaml'), 'r', encoding='utf-8') as f:
-                self.store_data = yaml.safe_load(f)
+            self.store_data = get_content('store')
         except Exception as e:
             self.gui.print_text(f"❌ Error loading store: {e}")
             self.store_data = {}
@@ -110,7 +110,7 @@ class ShopGUI:
         # Show multiple images of available items using the same logic as show_category_preview
         item_images = []
         for item in available_items:
-            if 'ascii_art' in item and resource_exists(item['ascii_art']):
+            if 'ascii_art' in item and sprite_exists(item['ascii_art']):
                 item_images.append(item['ascii_art'])
         
         if item_images:
@@ -142,7 +142,7 @@ class ShopGUI:
             if choice <= len(available_items):
                 # Buy selected item and show its image
                 selected_item = available_items[choice - 1]
-                if 'ascii_art' in selected_item and resource_exists(selected_item['ascii_art']):
+                if 'ascii_art' in selected_item and sprite_exists(selected_item['ascii_art']):
                     self.gui.show_image(selected_item['ascii_art'])
                 self._purchase_item(selected_item)
             elif choice == len(available_items) + 1:
@@ -180,7 +180,7 @@ class ShopGUI:
         hero['gold'] -= item_cost
         
         # Show item art if available
-        if 'ascii_art' in item and resource_exists(item['ascii_art']):
+        if 'ascii_art' in item and sprite_exists(item['ascii_art']):
             self.gui.show_image(item['ascii_art'])
         
         self.gui.clear_text()
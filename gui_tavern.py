@@ -1,10 +1,10 @@
 """
 Tavern system for GUI - drink purchasing and atmosphere
 """
-import yaml
 import os
 from typing import TYPE_CHECKING
-from resource_utils import resource_exists, get_resource_path
+from sprite_atlas import sprite_exists
+from content_bundle import get_content
 
 if TYPE_CHECKING:
     from gui_interfaces import GameContextProtocol
@@ -27,8 +27,9 @@ class TavernGUI:
         if self.tavern_data is None:
             self._load_tavern()
         
-        # Set the tavern-specific background
+        # Set the tavern-specific background on an empty stage
         self.gui.set_tavern_background()
+        self.gui._clear_foreground_images()
         
         self.gui.clear_text()
         self.gui.print_text("\n🍺 Welcome to The Prancing Pony Tavern! 🍺\n")
@@ -46,10 +47,9 @@ class TavernGUI:
         self._show_drinks()
     
     def _load_tavern(self):
-        """Load tavern data from YAML"""
+        """Load tavern data from the content bundle (or YAML)"""
         try:
-            with open(get_resource_path('tavern.yaml'), 'r', encoding='utf-8') as f:
-                self.tavern_data = yaml.safe_load(f)
+            self.tavern_data = get_content('tavern')
         except Exception as e:
             self.gui.print_text(f"❌ Error loading tavern menu: {e}")
             self.tavern_data = {}
@@ -77,9 +77,9 @@ class TavernGUI:
         for drink in drinks:
             # Use sudsy beer image for beer drinks, or fallback to any art specified
             if 'beer' in drink['name'].lower():
-                if resource_exists('art/sudsy_beer.png'):
+                if sprite_exists('art/sudsy_beer.png'):
                     drink_images.append('art/sudsy_beer.png')
-            elif 'ascii_art' in drink and resource_exists(drink['ascii_art']):
+            elif 'ascii_art' in drink and sprite_exists(drink['ascii_art']):
                 drink_images.append(drink['ascii_art'])
         
         if drink_images:
@@ -116,9 +116,9 @@ class TavernGUI:
                 # Buy selected drink and show its image
                 selected_drink = drinks[choice - 1]
                 # Show beer image for beer drinks
-                if 'beer' in selected_drink['name'].lower() and resource_exists('art/sudsy_beer.png'):
+                if 'beer' in selected_drink['name'].lower() and sprite_exists('art/sudsy_beer.png'):
                     self.gui.show_image('art/sudsy_beer.png')
-                elif 'ascii_art' in selected_drink and resource_exists(selected_drink['ascii_art']):
+                elif 'ascii_art' in selected_drink and sprite_exists(selected_drink['ascii_art']):
                     self.gui.show_image(selected_drink['ascii_art'])
                 self._purchase_drink(selected_drink)
             elif choice == len(drinks) + 1:
@@ -161,9 +161,9 @@ class TavernGUI:
         hero['gold'] -= drink_cost
         
         # Show drink art if available
-        if 'beer' in drink['name'].lower() and resource_exists('art/sudsy_beer.png'):
+        if 'beer' in drink['name'].lower() and sprite_exists('art/sudsy_beer.png'):
             self.gui.show_image('art/sudsy_beer.png')
-        elif 'ascii_art' in drink and resource_exists(drink['ascii_art']):
+        elif 'ascii_art' in drink and sprite_exists(drink['ascii_art']):
             self.gui.show_image(drink['ascii_art'])
         
         self.gui.clear_text()
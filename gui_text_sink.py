@@ -0,0 +1,145 @@
+"""
+Buffered text output for the game's text area.
+
+print_text used to configure a tag, insert each segment separately and
+force a full root.update() for every line, so a screen printing dozens of
+lines did dozens of event-loop passes and redraws. The TextSink collects
+lines during a handler and writes them all with a single Text.insert call
+(alternating text and tag tuples) on the next idle tick. Color tags are
+configured once per color for the life of the widget.
+
+The sink also bounds the scrollback: once the text area holds more than
+the limit plus a trim batch, the oldest lines (and the tag ranges on them)
+are deleted in one go, so insert and see(END) stay cheap over long
+sessions. Everything flushed can optionally be appended to a plain-text
+transcript file.
+"""
+import os
+import tkinter as tk
+from datetime import datetime
+
+import config
+from logger_utils import get_logger
+from resource_utils import ensure_writable_dir
+
+logger = get_logger(__name__)
+
+
+class TextSink:
+    """
+    Collects colored text segments and flushes them in one insert.
+    """
+
+    def __init__(self, text_area, scheduler, max_lines=None, trim_batch=None, transcript_path=None):
+        """
+        Initialize the text sink.
+
+        Args:
+            text_area: tkinter Text widget (kept read-only between flushes)
+            scheduler: Object with after_idle() method (typically tkinter root)
+            max_lines: Scrollback limit (default: config.TEXT_SCROLLBACK_LINES, 0 = unlimited)
+            trim_batch: Extra lines allowed before trimming back to max_lines
+                (default: config.TEXT_SCROLLBACK_TRIM_BATCH)
+            transcript_path: File to append all printed text to (optional)
+        """
+        self.text_area = text_area
+        self.scheduler = scheduler
+        self.max_lines = config.TEXT_SCROLLBACK_LINES if max_lines is None else max_lines
+        self.trim_batch = config.TEXT_SCROLLBACK_TRIM_BATCH if trim_batch is None else trim_batch
+        self.transcript_path = transcript_path
+        self._transcript = None
+        self.trimmed_lines = 0
+        self._pending = []        # Alternating text, tag tuple arguments for Text.insert
+        self._color_tags = {}     # color -> tag name, configured once
+        self._flush_scheduled = False
+
+    def _get_color_tag(self, color):
+        """Get the tag for a color, configuring it on first use"""
+        tag_name = self._color_tags.get(color)
+        if tag_name is None:
+            tag_name = f"color_{color.replace('#', '')}"
+            self.text_area.tag_config(tag_name, foreground=color)
+            self._color_tags[color] = tag_name
+        return tag_name
+
+    def write_line(self, parts):
+        """Queue one line of colored segments
+
+        Args:
+            parts: List of (text, color) tuples; a newline is added at the end
+        """
+        for text_part, color in parts:
+            if text_part:
+                self._pending.append(text_part)
+                self._pending.append((self._get_color_tag(color),))
+        self._pending.append('\n')
+        self._pending.append(())
+
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.scheduler.after_idle(self.flush)
+
+    def has_pending(self):
+        """Check whether any text is waiting to be flushed"""
+        return bool(self._pending)
+
+    def flush(self):
+        """Insert all queued text now (one insert, one scroll)"""
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+
+        pending = self._pending
+        self._pending = []
+        self.text_area.config(state=tk.NORMAL)
+        self.text_area.insert(tk.END, *pending)
+        self._trim_scrollback()
+        self.text_area.see(tk.END)
+        self.text_area.config(state=tk.DISABLED)
+
+        if self.transcript_path:
+            self._write_transcript(''.join(pending[::2]))
+
+    def _trim_scrollback(self):
+        """Delete the oldest lines once the limit plus one batch is exceeded"""
+        if not self.max_lines:
+            return
+        # Output always ends with a newline, so the last line is the empty one after it
+        line_count = int(self.text_area.index('end-1c').split('.')[0]) - 1
+        if line_count <= self.max_lines + self.trim_batch:
+            return
+        excess = line_count - self.max_lines
+        # Deleting the text also removes every tag range on it
+        self.text_area.delete('1.0', f'{excess + 1}.0')
+        self.trimmed_lines += excess
+
+    def _write_transcript(self, text):
+        """Append flushed text to the transcript file"""
+        try:
+            if self._transcript is None:
+                self._transcript = open(self.transcript_path, 'a', encoding='utf-8')
+            self._transcript.write(text)
+            self._transcript.flush()
+        except OSError as e:
+            logger.warning(f"Disabling text transcript {self.transcript_path}: {e}")
+            self.transcript_path = None
+
+    def close(self):
+        """Flush remaining text and close the transcript"""
+        self.flush()
+        if self._transcript is not None:
+            self._transcript.close()
+            self._transcript = None
+
+    def clear(self):
+        """Drop queued text and empty the text area"""
+        self._pending = []
+        self.text_area.config(state=tk.NORMAL)
+        self.text_area.delete(1.0, tk.END)
+        self.text_area.config(state=tk.DISABLED)
+
+
+def default_transcript_path():
+    """Get a timestamped transcript path in the logs directory"""
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    return os.path.join(ensure_writable_dir('logs'), f'transcript_{timestamp}.txt')
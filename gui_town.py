@@ -5,10 +5,10 @@ Town GUI for the monster game - handles town menu and activities
 
 import tkinter as tk
 from tkinter import scrolledtext
-import random
 import os
 from typing import TYPE_CHECKING
-from resource_utils import resource_exists
+from sprite_atlas import sprite_exists
+from rng_service import STREAM_TOWN, get_stream
 
 import config
 from game_enums import BiomeType
@@ -27,20 +27,22 @@ class TownGUI:
             gui: Game context providing UI, state, and subsystem access
         """
         self.gui = gui
+        self.rng = get_stream(gui, STREAM_TOWN)
     
     def enter_town(self):
         """Enter the town and show town menu"""
         self.gui.clear_text()
         self.gui.lock_interface()
         
-        # Set town background
+        # Set town background (background swaps keep foreground images, so clear them here)
         self.gui.set_town_background()
+        self.gui._clear_foreground_images()
         
         # Ensure biome is set to town
         self.gui.current_biome = BiomeType.TOWN
         
         # 10% chance of goblin assault
-        if random.random() < 0.10:
+        if self.rng.random() < 0.10:
             self._goblin_assault()
             return
         
@@ -197,7 +199,7 @@ class TownGUI:
         goblin_image_path = 'art/goblin_monster.png'
         
         # Check if goblin image exists
-        if resource_exists(goblin_image_path):
+        if sprite_exists(goblin_image_path):
             # Display two goblins using the same method as monster encounters
             self.gui.image_manager.show_images([goblin_image_path, goblin_image_path])
         
@@ -0,0 +1,192 @@
+"""
+Decoded sprite cache for the Monster Game GUI.
+
+Combat and encounter animations redraw the same hero/monster sprites many
+times per second. This module keeps the decoded, scaled bitmaps in memory
+(keyed by path and target size) so repeated frames reuse them instead of
+reopening and rescaling the PNG from disk.
+
+Paths may name a runtime variant ('art/slime_monster.png#elite', see
+sprite_variants.py); the variant is derived in memory from the base bitmap
+(served from the decoded atlas pages) and cached under its own
+(base, variants, size) key.
+"""
+from collections import OrderedDict
+
+from PIL import Image, ImageTk
+
+import config
+from logger_utils import get_logger
+from resource_utils import get_resource_path
+from sprite_atlas import get_atlas_store
+from sprite_variants import apply_variants, split_variant_path
+
+logger = get_logger(__name__)
+
+
+def decode_sprite(image_path, width=None, height=None):
+    """Load an image and scale it for canvas display.
+
+    Sprites packed into the sprite atlas are cut from the decoded atlas page;
+    anything else is read from disk. Variants named in the path are applied
+    after scaling, so glows keep the same width at every display size. Only
+    touches PIL (never Tk), so it is safe to call from worker threads.
+
+    Args:
+        image_path: Relative path to the image file (e.g. 'art/slime_monster.png'
+                    or 'art/slime_monster.png#elite')
+        width, height: Target size (if None, keeps the natural image size)
+
+    Returns:
+        PIL.Image.Image with pixel data fully loaded
+
+    Raises:
+        ValueError: If the path names an unknown variant
+    """
+    base_path, variants = split_variant_path(image_path)
+    img = get_atlas_store().get(base_path)
+    if img is None:
+        with Image.open(get_resource_path(base_path)) as source:
+            source.load()
+            img = source.copy()
+
+    # Resize only if dimensions are specified
+    if width is not None and height is not None:
+        img = img.resize((width, height), Image.Resampling.NEAREST)
+
+    return apply_variants(img, variants)
+
+
+class SpriteCache:
+    """
+    Size-keyed LRU cache of decoded sprites ready for canvas display.
+
+    Entries are keyed by (path, variants, width, height) and hold the Tk
+    PhotoImage built from the scaled (and possibly recolored) bitmap. The cache tracks its approximate memory
+    use (4 bytes per pixel) and evicts least recently used sprites once
+    the configured budget is exceeded.
+
+    Items already placed on the canvas keep their own PhotoImage reference,
+    so evicting a sprite never blanks an image that is currently displayed.
+    """
+
+    def __init__(self, max_bytes=None, photo_factory=None):
+        """
+        Initialize the sprite cache.
+
+        Args:
+            max_bytes: Memory budget in bytes (default: config.SPRITE_CACHE_MAX_BYTES)
+            photo_factory: Callable turning a PIL image into a display image
+                           (default: ImageTk.PhotoImage)
+        """
+        self.max_bytes = max_bytes if max_bytes is not None else config.SPRITE_CACHE_MAX_BYTES
+        self.photo_factory = photo_factory or ImageTk.PhotoImage
+
+        self._entries = OrderedDict()  # key -> (photo, size_in_bytes)
+        self.current_bytes = 0
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(image_path, width=None, height=None):
+        """Build the cache key for a sprite (or sprite variant) at a given display size"""
+        base_path, variants = split_variant_path(image_path)
+        return (base_path, variants, width, height)
+
+    def get_photo(self, image_path, width=None, height=None):
+        """Get a display-ready image, decoding it from disk on a cache miss
+
+        Args:
+            image_path: Relative path to the image file
+            width, height: Target size (if None, uses natural image size)
+
+        Returns:
+            PhotoImage for the scaled sprite
+
+        Raises:
+            OSError: If the image cannot be opened or decoded
+            ValueError: If the path names an unknown variant
+        """
+        key = self.make_key(image_path, width, height)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+        self.misses += 1
+        img = decode_sprite(image_path, width, height)
+        return self.put(image_path, img, width, height)
+
+    def put(self, image_path, pil_image, width=None, height=None):
+        """Insert an already decoded sprite into the cache
+
+        Must be called from the Tk main thread (creates a PhotoImage).
+
+        Args:
+            image_path: Relative path the sprite was loaded from
+            pil_image: Decoded (and already scaled) PIL image
+            width, height: Size the sprite was scaled to (None for natural size)
+
+        Returns:
+            PhotoImage for the sprite
+        """
+        key = self.make_key(image_path, width, height)
+        photo = self.photo_factory(pil_image)
+        size_bytes = pil_image.width * pil_image.height * 4
+
+        # Replace an existing entry for the same key
+        if key in self._entries:
+            self.current_bytes -= self._entries.pop(key)[1]
+
+        # Sprites larger than the whole budget are returned but never cached
+        if size_bytes > self.max_bytes:
+            logger.debug(f"Sprite {key} ({size_bytes} bytes) exceeds cache budget, not caching")
+            return photo
+
+        self._entries[key] = (photo, size_bytes)
+        self.current_bytes += size_bytes
+        self._evict_to_budget()
+
+        return photo
+
+    def contains(self, image_path, width=None, height=None):
+        """Check whether a sprite is cached (does not count as a hit or miss)"""
+        return self.make_key(image_path, width, height) in self._entries
+
+    def _evict_to_budget(self):
+        """Evict least recently used sprites until within the memory budget"""
+        while self.current_bytes > self.max_bytes and self._entries:
+            key, (_, size_bytes) = self._entries.popitem(last=False)
+            self.current_bytes -= size_bytes
+            self.evictions += 1
+            logger.debug(f"Evicted sprite from cache: {key}")
+
+    def clear(self):
+        """Drop all cached sprites (statistics are kept)"""
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def get_stats(self):
+        """Get cache statistics
+
+        Returns:
+            Dict with hits, misses, evictions, entries, bytes, max_bytes and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'hit_rate': (self.hits / lookups) if lookups else 0.0
+        }
+
+    def __len__(self):
+        return len(self._entries)
@@ -197,6 +197,10 @@ def initialize_game():
         logger.info("Starting main loop...")
         root.mainloop()
         
+        # Don't lose a save that is still being written in the background
+        if game.save_load_manager:
+            game.save_load_manager.flush_pending_saves()
+        
     except Exception as e:
         error_msg = (
             f"Failed to start the game:\n{e}\n\n"
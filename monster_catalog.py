@@ -0,0 +1,112 @@
+"""
+Monster catalog indexed by biome and level.
+
+Encounter selection and quest generation both need "monsters in biome X
+with level in [a, b]". Instead of scanning every monster on each call, the
+catalog keeps the monsters of each biome sorted by level and answers range
+queries with bisect in O(log n) plus the size of the result.
+"""
+from bisect import bisect_left, bisect_right
+
+from logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Biome assumed for monsters without a 'biome' field (matches the YAML convention)
+DEFAULT_BIOME = 'grassland'
+
+
+class MonsterCatalog:
+    """
+    Read-only index over a monsters dictionary.
+
+    Monsters are grouped by biome, and each group is sorted by level
+    (ties keep the original YAML order). A combined index covers all biomes.
+    """
+
+    def __init__(self, monsters):
+        """
+        Build the catalog.
+
+        Args:
+            monsters: Dict of monster key -> monster data (as in GameState.monsters)
+        """
+        self.monsters = monsters
+        self._source_size = len(monsters)
+
+        self._by_biome = {}
+        grouped = {}
+        for key, data in monsters.items():
+            grouped.setdefault(data.get('biome', DEFAULT_BIOME), []).append((key, data))
+
+        for biome, entries in grouped.items():
+            self._by_biome[biome] = self._build_index(entries)
+        self._all = self._build_index(list(monsters.items()))
+
+        logger.debug(f"Monster catalog built: {len(monsters)} monsters in {len(self._by_biome)} biomes")
+
+    @staticmethod
+    def _build_index(entries):
+        """Sort entries by level and return (levels, entries) lists for bisect"""
+        entries = sorted(entries, key=lambda entry: entry[1].get('level', 1))
+        levels = [data.get('level', 1) for _, data in entries]
+        return levels, entries
+
+    def in_level_range(self, min_level, max_level, biome=None):
+        """Get monsters with min_level <= level <= max_level
+
+        Args:
+            min_level: Lowest level (inclusive)
+            max_level: Highest level (inclusive)
+            biome: Only this biome (default: all biomes)
+
+        Returns:
+            List of (monster_key, monster_data) tuples sorted by level
+        """
+        if biome is None:
+            levels, entries = self._all
+        else:
+            index = self._by_biome.get(biome)
+            if index is None:
+                return []
+            levels, entries = index
+
+        start = bisect_left(levels, min_level)
+        end = bisect_right(levels, max_level)
+        return entries[start:end]
+
+    def in_biome(self, biome):
+        """Get every monster in a biome, sorted by level"""
+        index = self._by_biome.get(biome)
+        return list(index[1]) if index else []
+
+    def biomes(self):
+        """Get the biomes that have at least one monster"""
+        return list(self._by_biome)
+
+    def is_current(self, monsters):
+        """Check whether the catalog still describes a monsters dictionary
+
+        Replacing the dictionary or adding/removing monsters makes the
+        catalog stale; editing a monster's fields in place does not.
+        """
+        return monsters is self.monsters and len(monsters) == self._source_size
+
+    def __len__(self):
+        return self._source_size
+
+
+def get_monster_catalog(game_state):
+    """Get the monster catalog for a game state, rebuilding it if stale
+
+    Args:
+        game_state: Object with a `monsters` dict (e.g. GameState)
+
+    Returns:
+        MonsterCatalog for game_state.monsters
+    """
+    catalog = getattr(game_state, 'monster_catalog', None)
+    if not isinstance(catalog, MonsterCatalog) or not catalog.is_current(game_state.monsters):
+        catalog = MonsterCatalog(game_state.monsters)
+        game_state.monster_catalog = catalog
+    return catalog
@@ -153,3 +153,49 @@ def is_bundled():
         bool: True if running as bundled executable, False if development mode
     """
     return hasattr(sys, '_MEIPASS')
+
+
+def resource_signature(relative_path):
+    """Get the (mtime_ns, size) signature of a resource file.
+    
+    Build steps record these for their source files so a later run can tell
+    whether the sources changed since the build.
+    
+    Args:
+        relative_path (str): Relative path to resource from project root
+    
+    Returns:
+        list: [mtime_ns, size]
+    
+    Raises:
+        OSError: If the file cannot be read
+    """
+    stat = os.stat(get_resource_path(relative_path))
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def changed_resources(signatures, missing_changed=True):
+    """List resources whose files no longer match their recorded signatures.
+    
+    Files extracted from a PyInstaller bundle get new mtimes on every run
+    but cannot change, so nothing is reported as changed when bundled.
+    
+    Args:
+        signatures (dict): Relative path -> signature from resource_signature()
+        missing_changed (bool): Report files that no longer exist as changed
+    
+    Returns:
+        list: Relative paths of the changed resources
+    """
+    if is_bundled():
+        return []
+    
+    changed = []
+    for relative_path, recorded in signatures.items():
+        try:
+            if resource_signature(relative_path) != list(recorded):
+                changed.append(relative_path)
+        except OSError:
+            if missing_changed:
+                changed.append(relative_path)
+    return changed
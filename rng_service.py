@@ -0,0 +1,143 @@
+"""
+Seedable random number streams for the Monster Game.
+
+Each subsystem (combat, encounters, quests, teleport, town) draws from its
+own independent stream derived from a single session seed, instead of the
+shared global `random` module. Re-running a session with the same seed and
+the same player inputs replays it exactly, and one subsystem drawing more
+numbers never shifts another subsystem's results.
+
+The game streams are stdlib `random.Random` instances because NumPy is not
+bundled with the game. Tools that do use NumPy (e.g. the combat simulator)
+can get matching `SeedSequence` objects for spawning worker streams.
+"""
+import hashlib
+import random
+
+import config
+from logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Subsystems with their own random stream
+STREAM_COMBAT = 'combat'
+STREAM_ENCOUNTERS = 'encounters'
+STREAM_QUESTS = 'quests'
+STREAM_TELEPORT = 'teleport'
+STREAM_TOWN = 'town'
+
+
+def derive_seed(seed, stream_name):
+    """Derive a 64-bit stream seed from the session seed and a stream name
+
+    Args:
+        seed: Session seed (int)
+        stream_name: Name of the subsystem stream
+
+    Returns:
+        int seed for the stream
+    """
+    digest = hashlib.sha256(f"{seed}:{stream_name}".encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big')
+
+
+class RNGService:
+    """
+    Hands out independent, seedable random streams by subsystem name.
+
+    Streams are created lazily and cached, so every caller asking for the
+    same name shares one stream.
+    """
+
+    def __init__(self, seed=None):
+        """
+        Initialize the RNG service.
+
+        Args:
+            seed: Session seed (default: config.RNG_SEED, or a random seed if that is None)
+        """
+        self.seed = None
+        self._streams = {}
+        self.reseed(seed if seed is not None else config.RNG_SEED)
+
+    def reseed(self, seed=None):
+        """Reset all streams from a new session seed
+
+        Args:
+            seed: Session seed (None picks a random one, which is logged for replay)
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 63)
+        self.seed = seed
+
+        # Reseed existing streams in place so holders of a stream see the new sequence
+        for name, stream in self._streams.items():
+            stream.seed(derive_seed(self.seed, name))
+
+        logger.info(f"RNG session seed: {self.seed}")
+
+    def stream(self, name):
+        """Get the random stream for a subsystem
+
+        Args:
+            name: Subsystem name (e.g. STREAM_COMBAT)
+
+        Returns:
+            random.Random dedicated to that subsystem
+        """
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = random.Random(derive_seed(self.seed, name))
+            self._streams[name] = stream
+        return stream
+
+    def numpy_seed_sequence(self, name):
+        """Get a NumPy SeedSequence for a stream (requires NumPy)
+
+        Use `.spawn(n)` on the result to give parallel workers
+        non-overlapping streams.
+
+        Args:
+            name: Stream name
+
+        Returns:
+            numpy.random.SeedSequence
+        """
+        import numpy as np
+        return np.random.SeedSequence(derive_seed(self.seed, name))
+
+    def get_state(self):
+        """Snapshot the seed and the position of every stream
+
+        Returns:
+            Dict suitable for set_state()
+        """
+        return {
+            'seed': self.seed,
+            'streams': {name: stream.getstate() for name, stream in self._streams.items()}
+        }
+
+    def set_state(self, state):
+        """Restore a snapshot taken with get_state()"""
+        self.seed = state['seed']
+        for name, stream_state in state['streams'].items():
+            self.stream(name).setstate(stream_state)
+
+
+def get_stream(context, name):
+    """Get a subsystem stream from a game context, falling back to `random`
+
+    Lets GUI subsystems work with lightweight test contexts that have no
+    RNG service.
+
+    Args:
+        context: Object that may have an `rng_service` attribute (e.g. GameGUI)
+        name: Stream name
+
+    Returns:
+        random.Random stream, or the `random` module itself
+    """
+    service = getattr(context, 'rng_service', None)
+    if not isinstance(service, RNGService):
+        return random
+    return service.stream(name)
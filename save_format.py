@@ -0,0 +1,244 @@
+"""
+Compact binary save format and incremental autosave journal.
+
+Binary saves (.sav) hold the same data as YAML saves as zlib-compressed JSON
+behind a small header:
+
+    magic (4 bytes) | format version (uint16) | CRC32 of payload (uint32) | payload
+
+The autosave journal is append-only. Its first record is a full snapshot of
+every save section; each later record holds only the sections that changed
+since the previous write. Every few appends the journal is compacted back
+into a single snapshot so it never grows without bound.
+
+    magic (4 bytes) | format version (uint16) | records...
+    record: payload length (uint32) | CRC32 of payload (uint32) | payload
+
+A record cut short by a crash is ignored on load, so the journal still
+restores the last complete autosave.
+"""
+import json
+import os
+import struct
+import zlib
+
+import config
+from logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+SAVE_MAGIC = b'MGSV'
+JOURNAL_MAGIC = b'MGJL'
+SAVE_FORMAT_VERSION = 1
+
+_HEADER = struct.Struct('>4sHI')      # magic, version, crc32
+_JOURNAL_HEADER = struct.Struct('>4sH')  # magic, version
+_RECORD_HEADER = struct.Struct('>II')    # length, crc32
+
+# Hero fields stored in their own journal sections
+_HERO_ITEM_FIELDS = ('items', 'item')
+_HERO_QUEST_FIELDS = ('quests', 'completed_quests')
+
+
+class SaveFormatError(Exception):
+    """Raised when a binary save or journal is corrupt or unsupported"""
+
+
+def _encode_payload(data):
+    text = json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=str)
+    return zlib.compress(text.encode('utf-8'))
+
+
+def _decode_payload(payload):
+    return json.loads(zlib.decompress(payload).decode('utf-8'))
+
+
+def encode_save(save_data):
+    """Encode save data in the compact binary format
+
+    Args:
+        save_data: Save dictionary (as written to YAML saves)
+
+    Returns:
+        bytes
+    """
+    payload = _encode_payload(save_data)
+    return _HEADER.pack(SAVE_MAGIC, SAVE_FORMAT_VERSION, zlib.crc32(payload)) + payload
+
+
+def decode_save(data):
+    """Decode a binary save
+
+    Args:
+        data: bytes read from a .sav file
+
+    Returns:
+        Save dictionary
+
+    Raises:
+        SaveFormatError: If the data is not a valid binary save
+    """
+    if len(data) < _HEADER.size:
+        raise SaveFormatError("Save file is truncated")
+    magic, version, crc = _HEADER.unpack_from(data)
+    if magic != SAVE_MAGIC:
+        raise SaveFormatError("Not a binary save file")
+    if version > SAVE_FORMAT_VERSION:
+        raise SaveFormatError(f"Save format version {version} is newer than this game supports")
+    payload = data[_HEADER.size:]
+    if zlib.crc32(payload) != crc:
+        raise SaveFormatError("Save file checksum mismatch (file is corrupt)")
+    return _decode_payload(payload)
+
+
+def split_save_sections(save_data):
+    """Split save data into independently journaled sections
+
+    Returns:
+        Dict of section name -> data ('hero', 'items', 'quests',
+        'achievements', 'game_state', 'save_metadata')
+    """
+    hero = dict(save_data.get('hero', {}))
+    sections = {
+        'items': {field: hero.pop(field) for field in _HERO_ITEM_FIELDS if field in hero},
+        'quests': {field: hero.pop(field) for field in _HERO_QUEST_FIELDS if field in hero},
+    }
+    sections['hero'] = hero
+    for key, value in save_data.items():
+        if key != 'hero':
+            sections[key] = value
+    return sections
+
+
+def join_save_sections(sections):
+    """Rebuild save data from split_save_sections() output"""
+    save_data = {key: value for key, value in sections.items() if key not in ('hero', 'items', 'quests')}
+    hero = dict(sections.get('hero', {}))
+    hero.update(sections.get('items', {}))
+    hero.update(sections.get('quests', {}))
+    save_data['hero'] = hero
+    return save_data
+
+
+def read_journal(path):
+    """Replay an autosave journal
+
+    Args:
+        path: Journal file path
+
+    Returns:
+        Dict of section name -> latest data
+
+    Raises:
+        SaveFormatError: If the file is not a journal or holds no snapshot
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if len(data) < _JOURNAL_HEADER.size:
+        raise SaveFormatError("Journal is truncated")
+    magic, version = _JOURNAL_HEADER.unpack_from(data)
+    if magic != JOURNAL_MAGIC:
+        raise SaveFormatError("Not an autosave journal")
+    if version > SAVE_FORMAT_VERSION:
+        raise SaveFormatError(f"Journal version {version} is newer than this game supports")
+
+    sections = None
+    offset = _JOURNAL_HEADER.size
+    while offset < len(data):
+        if offset + _RECORD_HEADER.size > len(data):
+            logger.warning(f"Ignoring truncated record header at end of {path}")
+            break
+        length, crc = _RECORD_HEADER.unpack_from(data, offset)
+        start = offset + _RECORD_HEADER.size
+        payload = data[start:start + length]
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            logger.warning(f"Ignoring incomplete record at end of {path}")
+            break
+        record = _decode_payload(payload)
+        if record.get('snapshot'):
+            sections = record['sections']
+        elif sections is not None:
+            sections.update(record['sections'])
+        offset = start + length
+
+    if sections is None:
+        raise SaveFormatError("Journal has no snapshot")
+    return sections
+
+
+class AutosaveJournal:
+    """
+    Append-only autosave writer that only records changed sections.
+    """
+
+    def __init__(self, path, compact_every=None):
+        """
+        Initialize the journal writer.
+
+        Args:
+            path: Journal file path
+            compact_every: Appends between compactions (default: config.AUTOSAVE_COMPACT_EVERY)
+        """
+        self.path = str(path)
+        self.compact_every = compact_every or config.AUTOSAVE_COMPACT_EVERY
+        self._written = {}   # section name -> encoded bytes last written
+        self._sections = {}  # section name -> data last written
+        self._appends = 0
+
+    def write(self, sections):
+        """Record the current save sections
+
+        The first write of a session (or after compact_every appends) writes a
+        full snapshot; other writes append only the sections that changed.
+
+        Args:
+            sections: Dict from split_save_sections()
+
+        Returns:
+            Number of bytes written (0 if nothing changed)
+        """
+        encoded = {
+            name: json.dumps(data, sort_keys=True, separators=(',', ':'), default=str)
+            for name, data in sections.items()
+        }
+
+        if not self._written or self._appends >= self.compact_every or not os.path.exists(self.path):
+            return self._write_snapshot(sections, encoded)
+
+        changed = {name: sections[name] for name, text in encoded.items() if self._written.get(name) != text}
+        if not changed:
+            return 0
+
+        record = self._pack_record({'snapshot': False, 'sections': changed})
+        with open(self.path, 'ab') as f:
+            f.write(record)
+        self._written.update({name: encoded[name] for name in changed})
+        self._sections.update(changed)
+        self._appends += 1
+        return len(record)
+
+    def compact(self):
+        """Rewrite the journal as a single snapshot of the last written state"""
+        if self._sections:
+            self._write_snapshot(self._sections, self._written)
+
+    def _write_snapshot(self, sections, encoded):
+        data = _JOURNAL_HEADER.pack(JOURNAL_MAGIC, SAVE_FORMAT_VERSION)
+        data += self._pack_record({'snapshot': True, 'sections': sections})
+
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, self.path)
+
+        self._sections = dict(sections)
+        self._written = dict(encoded)
+        self._appends = 0
+        logger.debug(f"Autosave journal compacted: {len(data)} bytes")
+        return len(data)
+
+    @staticmethod
+    def _pack_record(record):
+        payload = _encode_payload(record)
+        return _RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
@@ -0,0 +1,184 @@
+"""
+Background save writer for the Monster Game.
+
+Serializing a save and fsyncing it to disk on the Tk main thread freezes the
+UI. The SaveWriter takes a snapshot of the save data (built on the main
+thread, where the game state is consistent) and does the encoding, the
+write to a temp file, the fsync and the atomic os.replace on a worker
+thread. Requests for the same file that arrive before the worker gets to
+them are coalesced, so only the newest snapshot is written. Completion
+callbacks run back on the main thread via root.after.
+"""
+import os
+import queue
+import threading
+import time
+
+from logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+def write_file_atomic(path, data):
+    """Write bytes to a file atomically and durably
+
+    The data goes to a temp file next to the target, is fsynced, then
+    replaces the target with os.replace, so readers see either the old file
+    or the complete new one, never a partial write.
+
+    Args:
+        path: Target file path
+        data: bytes to write
+    """
+    path = os.fspath(path)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+class SaveWriter:
+    """
+    Writes save files on a worker thread, newest snapshot wins.
+    """
+
+    def __init__(self, scheduler, poll_interval_ms=30):
+        """
+        Initialize the save writer.
+
+        Args:
+            scheduler: Object with after() method (typically tkinter root)
+            poll_interval_ms: Delay between checks for finished writes
+        """
+        self.scheduler = scheduler
+        self.poll_interval_ms = poll_interval_ms
+
+        self._lock = threading.Condition()
+        self._pending = {}      # path -> (snapshot, encoder, [callbacks]), newest per path
+        self._order = []        # paths in submission order
+        self._in_flight = 0     # jobs taken by the worker but not yet reported
+        self._results = queue.Queue()
+        self._thread = None
+        self._polling = False
+        self._stopped = False
+
+        self.written = 0
+        self.coalesced = 0
+        self.failed = 0
+
+    def submit(self, path, snapshot, encoder, callback=None):
+        """Queue a save
+
+        Args:
+            path: Target file path
+            snapshot: Save data owned by the writer (do not modify after submitting)
+            encoder: Function turning the snapshot into bytes (runs on the worker)
+            callback: Function called as (result) on the main thread when the
+                file is written; result is a dict with 'success' and 'path'
+                or 'error'. Coalesced requests all receive the final result.
+        """
+        path = os.fspath(path)
+        with self._lock:
+            previous = self._pending.get(path)
+            callbacks = previous[2] if previous else []
+            if previous:
+                self.coalesced += 1
+            else:
+                self._order.append(path)
+            if callback:
+                callbacks.append(callback)
+            self._pending[path] = (snapshot, encoder, callbacks)
+            self._ensure_worker()
+            self._lock.notify()
+
+        if not self._polling:
+            self._polling = True
+            self.scheduler.after(self.poll_interval_ms, self._poll)
+
+    def _ensure_worker(self):
+        """Start the worker thread if needed (caller holds the lock)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._thread = threading.Thread(target=self._worker, name="SaveWriter", daemon=True)
+            self._thread.start()
+
+    def _worker(self):
+        """Encode and write queued saves (never touches Tk)"""
+        while True:
+            with self._lock:
+                while not self._order and not self._stopped:
+                    self._lock.wait()
+                if not self._order:
+                    return
+                path = self._order.pop(0)
+                snapshot, encoder, callbacks = self._pending.pop(path)
+                self._in_flight += 1
+
+            start = time.perf_counter()
+            try:
+                write_file_atomic(path, encoder(snapshot))
+                result = {'success': True, 'path': path}
+                logger.debug(f"Saved {path} in {(time.perf_counter() - start) * 1000:.1f}ms")
+            except Exception as e:
+                logger.error(f"Background save to {path} failed: {e}")
+                result = {'success': False, 'path': path, 'error': str(e)}
+            self._results.put((result, callbacks))
+
+            with self._lock:
+                self._in_flight -= 1
+                self._lock.notify_all()
+
+    def _poll(self):
+        """Deliver finished writes to their callbacks (runs on the Tk main thread)"""
+        while True:
+            try:
+                result, callbacks = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if result['success']:
+                self.written += 1
+            else:
+                self.failed += 1
+            for callback in callbacks:
+                try:
+                    callback(result)
+                except Exception as e:
+                    logger.error(f"Save completion callback failed: {e}")
+
+        if self.is_busy() or not self._results.empty():
+            self.scheduler.after(self.poll_interval_ms, self._poll)
+        else:
+            self._polling = False
+
+    def is_busy(self):
+        """Check whether any save is queued or being written"""
+        with self._lock:
+            return bool(self._order) or self._in_flight > 0
+
+    def flush(self, timeout=None):
+        """Block until every queued save has been written (e.g. on exit)
+
+        Callbacks are not run here; they are delivered by the next poll.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            True if all writes finished
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while self._order or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._lock.wait(remaining)
+        return True
+
+    def stop(self):
+        """Let the worker finish queued saves and exit"""
+        with self._lock:
+            self._stopped = True
+            self._lock.notify_all()
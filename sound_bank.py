@@ -0,0 +1,219 @@
+"""
+Sound effect bank for the Monster Game audio system.
+
+Scans sounds/ once at startup, so playing an effect never touches the file
+system to find it, and decodes effects (MP3/WAV into PCM mixer.Sound
+objects) on a background thread. Decoded sounds live in an LRU cache sized
+in bytes of PCM data; the first attack of a new monster type then finds its
+sound already decoded instead of stalling the Tk main thread.
+
+Background music is not decoded here: mixer.music streams it from disk.
+"""
+import os
+import threading
+from collections import OrderedDict
+
+import config
+from logger_utils import get_logger
+from resource_utils import get_resource_path
+
+logger = get_logger(__name__)
+
+# File extensions the mixer can decode
+SOUND_EXTENSIONS = ('.mp3', '.wav', '.ogg')
+
+# Names that mark a file as (streamed) background music rather than an effect
+MUSIC_KEYWORDS = ('music', 'background', 'bgm', 'theme', 'ambient')
+MUSIC_FILES = ('start.mp3',)
+
+
+def is_music_file(sound_file):
+    """Check whether a sound file is background music (streamed, never cached)"""
+    name = sound_file.lower()
+    return sound_file in MUSIC_FILES or any(keyword in name for keyword in MUSIC_KEYWORDS)
+
+
+def pcm_bytes(sound):
+    """Approximate decoded size of a mixer.Sound in bytes"""
+    from pygame import mixer
+    init = mixer.get_init()
+    if not init:
+        return 0
+    frequency, sample_size, channels = init
+    return int(sound.get_length() * frequency) * channels * (abs(sample_size) // 8)
+
+
+class SoundBank:
+    """
+    Index of sounds/ plus a byte-budgeted LRU cache of decoded effects.
+
+    Lookups by file name are dictionary operations. A sound that was not
+    preloaded (or was evicted) is decoded on demand, so get() always returns
+    a playable sound when the file exists.
+    """
+
+    def __init__(self, sounds_dir=None, max_bytes=None, decoder=None, size_of=None):
+        """
+        Initialize the sound bank.
+
+        Args:
+            sounds_dir: Directory to scan (default: the bundled sounds/ directory)
+            max_bytes: Decoded PCM budget in bytes (default: config.SOUND_CACHE_MAX_BYTES)
+            decoder: Callable path -> sound object (default: pygame mixer.Sound)
+            size_of: Callable sound -> size in bytes (default: pcm_bytes)
+        """
+        self.sounds_dir = sounds_dir or get_resource_path(config.DIR_SOUNDS)
+        self.max_bytes = max_bytes if max_bytes is not None else config.SOUND_CACHE_MAX_BYTES
+        self.decoder = decoder
+        self.size_of = size_of or pcm_bytes
+
+        self.paths = {}  # file name -> absolute path
+        self._entries = OrderedDict()  # file name -> (sound, size_in_bytes)
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.preload_thread = None
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def scan(self):
+        """Index every sound file in the sounds directory
+
+        Returns:
+            Number of sound files found
+        """
+        try:
+            names = os.listdir(self.sounds_dir)
+        except OSError as e:
+            logger.error(f"Could not scan sounds directory '{self.sounds_dir}': {e}")
+            names = []
+        self.paths = {name: os.path.join(self.sounds_dir, name) for name in sorted(names)
+                      if name.lower().endswith(SOUND_EXTENSIONS)}
+        logger.debug(f"Sound bank indexed {len(self.paths)} files")
+        return len(self.paths)
+
+    def has(self, sound_file):
+        """Check whether a sound file was found by the last scan"""
+        return sound_file in self.paths
+
+    def path(self, sound_file):
+        """Get the absolute path of an indexed sound file (None if unknown)"""
+        return self.paths.get(sound_file)
+
+    def effect_names(self):
+        """Names of all indexed sound effects (background music excluded)"""
+        return [name for name in self.paths if not is_music_file(name)]
+
+    def _decode(self, sound_file):
+        decoder = self.decoder
+        if decoder is None:
+            from pygame import mixer
+            decoder = mixer.Sound
+        return decoder(self.paths[sound_file])
+
+    def get(self, sound_file):
+        """Get a decoded sound, decoding it now on a cache miss
+
+        Args:
+            sound_file: File name in the sounds directory
+
+        Returns:
+            Sound object, or None if the file is not in the bank
+
+        Raises:
+            Exception: Whatever the decoder raises for an unreadable file
+        """
+        with self._lock:
+            entry = self._entries.get(sound_file)
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(sound_file)
+                return entry[0]
+            if sound_file not in self.paths:
+                return None
+            self.misses += 1
+
+        sound = self._decode(sound_file)
+        self._put(sound_file, sound)
+        logger.debug(f"Decoded sound effect on demand: {sound_file}")
+        return sound
+
+    def contains(self, sound_file):
+        """Check whether a sound is decoded (does not count as a hit or miss)"""
+        with self._lock:
+            return sound_file in self._entries
+
+    def _put(self, sound_file, sound, evict=True):
+        """Insert a decoded sound; returns False if it did not fit"""
+        size_bytes = self.size_of(sound)
+        with self._lock:
+            if sound_file in self._entries:
+                return True
+            # Sounds larger than the whole budget are played but never cached
+            if size_bytes > self.max_bytes:
+                return False
+            if not evict and self.current_bytes + size_bytes > self.max_bytes:
+                return False
+            self._entries[sound_file] = (sound, size_bytes)
+            self.current_bytes += size_bytes
+            while self.current_bytes > self.max_bytes and self._entries:
+                name, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_bytes
+                self.evictions += 1
+                logger.debug(f"Evicted sound from bank: {name}")
+        return True
+
+    def preload(self, sound_files=None):
+        """Decode sound effects on a background thread
+
+        Preloading never evicts: sounds that no longer fit the budget are
+        skipped, so warming the bank cannot push out recently played effects.
+
+        Args:
+            sound_files: Names to decode (default: every indexed effect)
+
+        Returns:
+            The loader thread, or None if there was nothing to load
+        """
+        names = self.effect_names() if sound_files is None else list(dict.fromkeys(sound_files))
+        pending = [name for name in names if self.has(name) and not self.contains(name)]
+        if not pending:
+            return None
+
+        def load_sounds():
+            for sound_file in pending:
+                if self.contains(sound_file):
+                    continue
+                try:
+                    sound = self._decode(sound_file)
+                except Exception as e:
+                    logger.debug(f"Could not preload sound effect '{sound_file}': {e}")
+                    continue
+                if not self._put(sound_file, sound, evict=False):
+                    logger.debug(f"Sound budget full, not preloading {sound_file}")
+
+        self.preload_thread = threading.Thread(target=load_sounds, name="SoundPreloader", daemon=True)
+        self.preload_thread.start()
+        return self.preload_thread
+
+    def get_stats(self):
+        """Get bank statistics
+
+        Returns:
+            Dict with files, hits, misses, evictions, entries, bytes and max_bytes
+        """
+        with self._lock:
+            return {
+                'files': len(self.paths),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,296 @@
+"""
+Sprite atlases for the Monster Game art.
+
+art/ holds over a hundred separate PNGs, and every one of them used to be
+opened and decoded on its own. The build packs them (grouped by size tier)
+into a few atlas pages plus a JSON manifest:
+
+    atlas/manifest.json
+    atlas/sprites_0.png, atlas/sprites_1.png, atlas/large_0.png, ...
+
+At runtime the AtlasStore decodes each page once, the first time one of its
+sprites is needed, and cuts sprites out of it in memory, so warming up the
+sprite cache opens a handful of files instead of one per sprite. Sprites
+missing from the atlas (or whose source PNG changed since the atlas was
+built) are still read from art/ as before.
+
+Build the atlases with:
+    python sprite_atlas.py
+"""
+import json
+import os
+import sys
+import threading
+
+from PIL import Image
+
+import config
+from logger_utils import get_logger
+from resource_utils import (changed_resources, get_resource_path, list_resource_files, resource_exists,
+                            resource_signature)
+
+logger = get_logger(__name__)
+
+ATLAS_VERSION = 1
+ATLAS_DIR = 'atlas'
+ATLAS_MANIFEST = 'manifest.json'
+ATLAS_SOURCE_DIR = 'art'
+
+# Size tiers: (name, largest side that fits the tier); None means no limit
+ATLAS_TIERS = (
+    ('sprites', 256),
+    ('large', None),
+)
+
+
+def _tier_for(size):
+    """Get the tier name for an image size"""
+    largest_side = max(size)
+    for name, limit in ATLAS_TIERS:
+        if limit is None or largest_side <= limit:
+            return name
+    return ATLAS_TIERS[-1][0]
+
+
+def pack_rects(sizes, max_size):
+    """Shelf-pack rectangles into as few square pages as possible
+
+    Rectangles are placed tallest first, left to right along shelves; a new
+    shelf starts when a row is full and a new page when a page is full.
+
+    Args:
+        sizes: List of (width, height)
+        max_size: Page width and height limit
+
+    Returns:
+        (placements, page_sizes): placements[i] is (page, x, y) for sizes[i];
+        page_sizes lists the (width, height) each page actually uses
+
+    Raises:
+        ValueError: If a rectangle is larger than a page
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (sizes[i][1], sizes[i][0]), reverse=True)
+    placements = [None] * len(sizes)
+    page_sizes = []
+    page = -1
+    x = y = shelf_height = max_size  # Forces a new page for the first rectangle
+
+    for index in order:
+        width, height = sizes[index]
+        if width > max_size or height > max_size:
+            raise ValueError(f"{width}x{height} image does not fit a {max_size}px atlas page")
+        if x + width > max_size:
+            # Start a new shelf
+            x, y = 0, y + shelf_height
+            shelf_height = 0
+        if y + height > max_size:
+            # Start a new page
+            page += 1
+            page_sizes.append((0, 0))
+            x = y = shelf_height = 0
+        placements[index] = (page, x, y)
+        used_width, used_height = page_sizes[page]
+        page_sizes[page] = (max(used_width, x + width), max(used_height, y + height))
+        x += width
+        shelf_height = max(shelf_height, height)
+
+    return placements, page_sizes
+
+
+def build_atlases(output_dir=None, source_dir=ATLAS_SOURCE_DIR, max_size=None):
+    """Pack every PNG in the source directory into atlas pages
+
+    Args:
+        output_dir: Where to write pages and manifest (default: ATLAS_DIR in the project)
+        source_dir: Relative directory of the source images
+        max_size: Page size limit (default: config.ATLAS_MAX_SIZE)
+
+    Returns:
+        The manifest dictionary that was written
+    """
+    output_dir = output_dir or get_resource_path(ATLAS_DIR)
+    max_size = max_size or config.ATLAS_MAX_SIZE
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Decode every source once, grouped by tier
+    tiers = {}
+    for fname in sorted(list_resource_files(source_dir, '.png')):
+        rel_path = f"{source_dir}/{fname}"
+        with Image.open(get_resource_path(rel_path)) as img:
+            img.load()
+            mode = img.mode
+            rgba = img.convert('RGBA')
+        tiers.setdefault(_tier_for(rgba.size), []).append((rel_path, mode, rgba))
+
+    manifest = {'version': ATLAS_VERSION, 'max_size': max_size, 'pages': [], 'sprites': {}}
+    for tier_name, _ in ATLAS_TIERS:
+        entries = tiers.get(tier_name)
+        if not entries:
+            continue
+        placements, page_sizes = pack_rects([img.size for _, _, img in entries], max_size)
+
+        first_page = len(manifest['pages'])
+        pages = [Image.new('RGBA', size, (0, 0, 0, 0)) for size in page_sizes]
+        for (rel_path, mode, img), (page, x, y) in zip(entries, placements):
+            pages[page].paste(img, (x, y))
+            manifest['sprites'][rel_path] = {
+                'page': first_page + page,
+                'rect': [x, y, img.width, img.height],
+                'mode': mode,
+                'source': resource_signature(rel_path),
+            }
+
+        for page_number, page_image in enumerate(pages):
+            file_name = f"{tier_name}_{page_number}.png"
+            page_image.save(os.path.join(output_dir, file_name), optimize=True)
+            manifest['pages'].append({'file': file_name, 'size': list(page_image.size)})
+
+    temp_path = os.path.join(output_dir, ATLAS_MANIFEST + '.tmp')
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(temp_path, os.path.join(output_dir, ATLAS_MANIFEST))
+
+    logger.info(f"Packed {len(manifest['sprites'])} sprites into {len(manifest['pages'])} atlas pages")
+    return manifest
+
+
+class AtlasStore:
+    """
+    Serves sprites cut from decoded atlas pages.
+
+    Safe to use from worker threads (only touches PIL, never Tk).
+    """
+
+    def __init__(self, atlas_dir=None):
+        """
+        Initialize the atlas store.
+
+        Args:
+            atlas_dir: Directory with the manifest and pages (default: ATLAS_DIR in the project)
+        """
+        self.atlas_dir = atlas_dir or get_resource_path(ATLAS_DIR)
+        self._lock = threading.Lock()
+        self._manifest = None
+        self._pages = {}  # page index -> decoded RGBA image
+        self.page_loads = 0
+
+    def _load_manifest(self):
+        """Read the manifest once, dropping sprites whose source changed since the build"""
+        manifest = self._manifest
+        if manifest is None:
+            with self._lock:
+                manifest = self._manifest
+                if manifest is None:
+                    manifest = self._read_manifest()
+                    self._manifest = manifest
+        return manifest
+
+    def _read_manifest(self):
+        """Read and check the manifest file (called with the lock held)"""
+        manifest = {'pages': [], 'sprites': {}}
+        try:
+            with open(os.path.join(self.atlas_dir, ATLAS_MANIFEST), 'r', encoding='utf-8') as f:
+                loaded = json.load(f)
+            if loaded.get('version') == ATLAS_VERSION:
+                manifest = loaded
+            else:
+                logger.info("Sprite atlas version mismatch, loading art files directly")
+        except FileNotFoundError:
+            logger.debug(f"No sprite atlas in {self.atlas_dir}, loading art files directly")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read sprite atlas manifest: {e}")
+
+        # Sources that were not shipped are kept: the atlas copy is the only one
+        sources = {rel_path: entry['source'] for rel_path, entry in manifest['sprites'].items()}
+        stale = changed_resources(sources, missing_changed=False)
+        for rel_path in stale:
+            del manifest['sprites'][rel_path]
+        if stale:
+            logger.info(f"{len(stale)} sprites changed since the atlas was built "
+                        f"(run sprite_atlas.py to rebuild)")
+        return manifest
+
+    @staticmethod
+    def _normalize(image_path):
+        return image_path.replace('\\', '/')
+
+    def contains(self, image_path):
+        """Check whether a sprite can be served from the atlas"""
+        return self._normalize(image_path) in self._load_manifest()['sprites']
+
+    def _get_page(self, index):
+        """Decode an atlas page on first use"""
+        page = self._pages.get(index)
+        if page is None:
+            with self._lock:
+                page = self._pages.get(index)
+                if page is None:
+                    file_name = self._manifest['pages'][index]['file']
+                    with Image.open(os.path.join(self.atlas_dir, file_name)) as img:
+                        page = img.convert('RGBA')
+                    self._pages[index] = page
+                    self.page_loads += 1
+                    logger.debug(f"Decoded atlas page {file_name}")
+        return page
+
+    def get(self, image_path):
+        """Cut a sprite out of its atlas page
+
+        Args:
+            image_path: Relative path of the original image (e.g. 'art/ninja.png')
+
+        Returns:
+            New PIL image with the sprite's original mode and size, or None if
+            the sprite is not in the atlas
+        """
+        entry = self._load_manifest()['sprites'].get(self._normalize(image_path))
+        if entry is None:
+            return None
+        try:
+            page = self._get_page(entry['page'])
+        except OSError as e:
+            logger.warning(f"Could not decode atlas page for {image_path}: {e}")
+            return None
+
+        x, y, width, height = entry['rect']
+        sprite = page.crop((x, y, x + width, y + height))
+        if entry['mode'] != 'RGBA':
+            sprite = sprite.convert(entry['mode'])
+        return sprite
+
+    def invalidate(self):
+        """Drop the manifest and decoded pages (e.g. after rebuilding the atlas)"""
+        with self._lock:
+            self._manifest = None
+            self._pages = {}
+
+
+_atlas_store = None
+
+
+def get_atlas_store():
+    """Get the shared atlas store"""
+    global _atlas_store
+    if _atlas_store is None:
+        _atlas_store = AtlasStore()
+    return _atlas_store
+
+
+def sprite_exists(image_path):
+    """Check whether a sprite can be shown, either from its file or from the atlas
+
+    Bundled builds ship packed sprites only inside the atlas, so art checks
+    go through here rather than resource_exists().
+    """
+    return resource_exists(image_path) or get_atlas_store().contains(image_path)
+
+
+def main():
+    manifest = build_atlases()
+    print(f"Packed {len(manifest['sprites'])} sprites into {len(manifest['pages'])} atlas pages "
+          f"in {get_resource_path(ATLAS_DIR)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""
+Runtime sprite variants for the Monster Game GUI.
+
+Elite glows, biome recolors and damage flashes are derived in memory from
+the base sprite instead of being shipped as extra PNGs. A variant is named
+by appending it to the image path after a '#', so every place that takes an
+image path (CanvasSprite.set_image, ImageManager.add_canvas_image, the
+asset preloader) can display a variant unchanged:
+
+    'art/slime_monster.png#elite'         elite glow
+    'art/slime_monster.png#tint:desert'   recolored toward a biome color
+    'art/slime_monster.png#elite+flash'   variants apply left to right
+
+The game shows 'elite' on elite encounters and 'flash' on combat hits;
+'tint' is available for biome recolors but nothing uses it yet.
+
+Recolors run through per-channel lookup tables (Image.point), so each
+variant is one vectorized pass over the pixels. The SpriteCache keys
+entries by (base path, variants, size), so a variant is built once and
+then reused like any other sprite, with no disk I/O beyond the base image.
+"""
+from PIL import Image, ImageColor, ImageFilter
+
+import config
+from logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+VARIANT_SEPARATOR = '#'
+VARIANT_JOINER = '+'
+VARIANT_ARG_SEPARATOR = ':'
+
+# Biome tints for 'tint:<biome>' recolors
+BIOME_TINTS = {
+    'grassland': config.COLOR_BIOME_GRASSLAND,
+    'desert': config.COLOR_BIOME_DESERT,
+    'dungeon': config.COLOR_BIOME_DUNGEON,
+    'ocean': config.COLOR_BIOME_OCEAN,
+    'town': config.COLOR_BIOME_TOWN,
+}
+
+
+def variant_path(image_path, *variants):
+    """Build the image path of a sprite variant
+
+    Args:
+        image_path: Base image path (e.g. 'art/slime_monster.png')
+        *variants: Variant names such as 'elite', 'flash' or 'tint:desert'
+
+    Returns:
+        Path string understood by the sprite cache (the base path if no variants)
+    """
+    base, existing = split_variant_path(image_path)
+    variants = existing + tuple(v for v in variants if v)
+    if not variants:
+        return base
+    return base + VARIANT_SEPARATOR + VARIANT_JOINER.join(variants)
+
+
+def split_variant_path(image_path):
+    """Split an image path into its base path and variant names
+
+    Returns:
+        Tuple of (base_path, variants) where variants is a tuple of names
+    """
+    base, _, spec = image_path.partition(VARIANT_SEPARATOR)
+    variants = tuple(v for v in spec.split(VARIANT_JOINER) if v) if spec else ()
+    return base, variants
+
+
+def monster_sprite_path(monster, image_path):
+    """Get the path to display for one of a monster's images
+
+    Elite monsters (monster['elite'], set when an encounter is rolled as
+    elite by MonsterEncounterGUI) get the elite glow variant.
+
+    Args:
+        monster: Monster data dictionary
+        image_path: One of the monster's image paths (art, art_attack, ...)
+
+    Returns:
+        Image path, with the elite variant appended when needed
+    """
+    if monster.get('elite'):
+        return variant_path(image_path, 'elite')
+    return image_path
+
+
+def _channel_lut(transform):
+    """Build an RGBA lookup table for Image.point from a per-channel function
+
+    Args:
+        transform: Function of (channel_index, value) returning the new value
+                   for the red, green and blue channels; alpha is kept
+
+    Returns:
+        List of 1024 ints (256 per channel, in R, G, B, A order)
+    """
+    lut = []
+    for channel in range(3):
+        lut.extend(max(0, min(255, int(transform(channel, value)))) for value in range(256))
+    lut.extend(range(256))
+    return lut
+
+
+def _mix_lut(color, strength):
+    """LUT that mixes every pixel toward a color by `strength` (0.0-1.0)"""
+    rgb = ImageColor.getrgb(color)[:3]
+    return _channel_lut(lambda c, v: v * (1 - strength) + rgb[c] * strength)
+
+
+def _tint_lut(color, strength):
+    """LUT that multiplies every pixel by a color, keeping highlights and shadows"""
+    rgb = ImageColor.getrgb(color)[:3]
+    return _channel_lut(lambda c, v: v * (1 - strength) + (v * rgb[c] / 255) * strength)
+
+
+def make_damage_flash(img):
+    """Wash the sprite toward the flash color (the frame shown when hit)"""
+    return img.point(_mix_lut(config.DAMAGE_FLASH_COLOR, config.DAMAGE_FLASH_STRENGTH))
+
+
+def make_elite(img):
+    """Tint the sprite and surround it with a soft glow in the elite color"""
+    radius = config.ELITE_GLOW_RADIUS
+    tinted = img.point(_tint_lut(config.ELITE_GLOW_COLOR, config.ELITE_TINT_STRENGTH))
+
+    # Grow the sprite's silhouette, soften it, and use it as the glow's alpha
+    alpha = img.getchannel('A').filter(ImageFilter.MaxFilter(radius * 2 + 1))
+    alpha = alpha.filter(ImageFilter.GaussianBlur(radius / 2))
+    glow = Image.new('RGBA', img.size, ImageColor.getrgb(config.ELITE_GLOW_COLOR))
+    glow.putalpha(alpha.point(lambda a: a * config.ELITE_GLOW_OPACITY))
+    return Image.alpha_composite(glow, tinted)
+
+
+def make_tint(img, biome):
+    """Recolor the sprite toward a biome color (e.g. sand-colored desert monsters)"""
+    color = BIOME_TINTS.get(biome)
+    if color is None:
+        raise ValueError(f"Unknown tint '{biome}'")
+    return img.point(_tint_lut(color, config.BIOME_TINT_STRENGTH))
+
+
+# Variant name -> builder taking (image, *args)
+VARIANT_BUILDERS = {
+    'elite': make_elite,
+    'flash': make_damage_flash,
+    'tint': make_tint,
+}
+
+
+def apply_variants(img, variants):
+    """Apply variants to a decoded sprite, left to right
+
+    Args:
+        img: Decoded PIL image (any mode; converted to RGBA)
+        variants: Variant names, e.g. ('elite', 'tint:desert')
+
+    Returns:
+        New PIL RGBA image (img itself if there are no variants)
+
+    Raises:
+        ValueError: If a variant name is unknown
+    """
+    if not variants:
+        return img
+    img = img.convert('RGBA')
+    for variant in variants:
+        name, *args = variant.split(VARIANT_ARG_SEPARATOR)
+        builder = VARIANT_BUILDERS.get(name)
+        if builder is None:
+            raise ValueError(f"Unknown sprite variant '{variant}'")
+        img = builder(img, *args)
+    return img
@@ -0,0 +1,71 @@
+"""
+Shared Tk stand-ins for tests that run without a display
+"""
+import time
+
+
+class FakeScheduler:
+    """Stand-in for tk root that queues after() and after_idle() callbacks for manual pumping"""
+
+    def __init__(self):
+        self.pending = []
+        self.idle = []
+
+    def after(self, delay_ms, callback):
+        self.pending.append(callback)
+
+    def after_idle(self, callback):
+        self.idle.append(callback)
+
+    def pump(self, timeout=10.0):
+        """Run scheduled callbacks until none are left (like the Tk event loop)"""
+        deadline = time.time() + timeout
+        while self.pending and time.time() < deadline:
+            self.pending.pop(0)()
+            time.sleep(0.001)
+
+    def run_idle(self):
+        """Run queued idle callbacks, including ones they schedule"""
+        while self.idle:
+            self.idle.pop(0)()
+
+
+class FakeCanvas:
+    """Minimal stand-in for tk.Canvas that records item operations"""
+
+    def __init__(self):
+        self.items = {}
+        self.next_id = 1
+        self.created = 0
+        self.deleted = 0
+        self.delete_calls = []
+        self.bg = None
+
+    def create_image(self, x, y, image=None, anchor='nw', tags=None):
+        item_id = self.next_id
+        self.next_id += 1
+        self.items[item_id] = {'coords': (x, y), 'image': image, 'tags': tags, 'state': 'normal'}
+        self.created += 1
+        return item_id
+
+    def coords(self, item_id, x, y):
+        self.items[item_id]['coords'] = (x, y)
+
+    def itemconfig(self, item_id, **options):
+        self.items[item_id].update(options)
+
+    def type(self, item_id):
+        return 'image' if item_id in self.items else ''
+
+    def tag_lower(self, tag):
+        pass
+
+    def delete(self, tag_or_id):
+        self.delete_calls.append(tag_or_id)
+        for item_id in [i for i, item in self.items.items()
+                        if tag_or_id == 'all' or i == tag_or_id or item['tags'] == tag_or_id]:
+            del self.items[item_id]
+            self.deleted += 1
+
+    def configure(self, **options):
+        self.bg = options.get('bg')
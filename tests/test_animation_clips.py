@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test the precomputed combat animation clips
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from animation_clips import ATTACK_TOGGLES, HIT_FLASHES, build_combatant_clips
+from gui_image_manager import ImageManager
+from image_cache import SpriteCache
+
+
+class CountingPhotos:
+    """get_photo stand-in that records every lookup"""
+
+    def __init__(self):
+        self.lookups = []
+
+    def __call__(self, image_path, width, height):
+        self.lookups.append((image_path, width, height))
+        return f"photo:{image_path}@{width}"
+
+
+def test_clips_resolve_every_frame_once():
+    """All frames of a fight are looked up when the clips are built, once each"""
+    print("🧪 Testing clip precomputation")
+    photos = CountingPhotos()
+    clips = build_combatant_clips(photos, 'art/warrior_hero.png', 120,
+                                  attack_image='art/warrior_hero_attack.png',
+                                  death_image='art/warrior_hero_death.png')
+
+    assert [path for path, _, _ in photos.lookups] == [
+        'art/warrior_hero.png', 'art/warrior_hero_attack.png',
+        'art/warrior_hero.png#flash', 'art/warrior_hero_death.png']
+    assert all((width, height) == (120, 120) for _, width, height in photos.lookups)
+
+    assert len(clips.attack) == ATTACK_TOGGLES * 2
+    assert [f.image_path for f in clips.attack.frames[:2]] == ['art/warrior_hero_attack.png', 'art/warrior_hero.png']
+    assert len(clips.hit) == HIT_FLASHES * 2
+    assert clips.hit.frames[0].image_path == 'art/warrior_hero.png#flash'
+    assert clips.death.photo == 'photo:art/warrior_hero_death.png@120'
+    assert clips.normal is clips.attack.frames[1], "Idle frames are shared, not rebuilt"
+    print(f"   ✅ {len(photos.lookups)} lookups for {len(clips.attack) + len(clips.hit) + 2} frames")
+
+
+def test_missing_art_drops_clips():
+    """Missing attack or death art means no clip, and a broken idle image means no clips at all"""
+    print("🧪 Testing missing art")
+    photos = CountingPhotos()
+    clips = build_combatant_clips(photos, 'art/slime_monster.png', 100,
+                                  attack_image='art/no_such_attack.png', death_image=None)
+    assert clips.attack is None and clips.death is None and clips.hit is not None
+
+    def broken(image_path, width, height):
+        raise OSError("cannot decode")
+
+    assert build_combatant_clips(broken, 'art/slime_monster.png', 100) is None
+    print("   ✅ Missing frames are skipped")
+
+
+def test_sprite_plays_frames_without_lookups():
+    """Showing a clip frame only reconfigures the retained canvas item"""
+    print("🧪 Testing frame playback")
+
+    class Canvas:
+        def __init__(self):
+            self.items = {}
+
+        def create_image(self, x, y, image=None, anchor='nw', tags=None):
+            self.items[len(self.items) + 1] = image
+            return len(self.items)
+
+        def itemconfig(self, item_id, image=None):
+            self.items[item_id] = image
+
+    cache = SpriteCache(photo_factory=lambda img: img)
+    canvas = Canvas()
+    manager = ImageManager(canvas, sprite_cache=cache)
+    sprite = manager.create_sprite('art/slime_monster.png', 0, 0, 64, 64)
+    clips = build_combatant_clips(cache.get_photo, 'art/slime_monster.png', 64,
+                                  attack_image='art/slime_monster_attack.png')
+    lookups = cache.get_stats()['hits'] + cache.get_stats()['misses']
+
+    for frame in clips.attack.frames + clips.hit.frames:
+        sprite.show_frame(frame)
+        assert canvas.items[sprite.canvas_id] is frame.photo
+    assert cache.get_stats()['hits'] + cache.get_stats()['misses'] == lookups
+    assert sprite.image_path == 'art/slime_monster.png' and len(canvas.items) == 1
+    print("   ✅ Frames swapped on one canvas item with no cache lookups")
+
+
+if __name__ == "__main__":
+    test_clips_resolve_every_frame_once()
+    test_missing_art_drops_clips()
+    test_sprite_plays_frames_without_lookups()
+    print("\n✅ All animation clip tests passed!")
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test the background asset preloader that warms the sprite cache at startup
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from asset_preloader import (AssetPreloader, collect_character_assets,
+                             collect_fireworks_assets, collect_store_assets, combat_sprite_sizes)
+from game_state import initialize_game_state
+from image_cache import SpriteCache
+from fakes import FakeScheduler
+
+
+def _layout_size(num_images):
+    return None if num_images <= 1 else 100
+
+
+def test_collect_assets_from_game_state():
+    """Hero and monster art should be collected at combat size"""
+    print("🧪 Testing asset collection")
+    game_state = initialize_game_state()
+    requests = collect_character_assets(game_state, 120)
+
+    dragon = next(m for m in game_state.monsters.values() if m.get('finalboss'))
+    assert (dragon['art'], 216, 216) in requests, "Dragon boss should use its larger combat size"
+    for monster in game_state.monsters.values():
+        attack = monster.get('art_attack') or monster.get('attack_art')
+        if attack and not monster.get('finalboss'):
+            assert (attack, 120, 120) in requests
+    print(f"   ✅ Collected {len(requests)} character sprite requests")
+
+
+def test_combat_sprite_sizes_for_shown_image():
+    """Only the Dragon final boss is enlarged, also when shown as a variant"""
+    dragon = {'finalboss': True, 'art': 'art/dragon_endboss.png'}
+    scaled = int(120 * config.DRAGON_BOSS_SCALE)
+    assert combat_sprite_sizes(dragon, 120) == (120, scaled)
+    assert combat_sprite_sizes(dragon, 120, 'art/dragon_endboss.png#elite') == (120, scaled)
+    assert combat_sprite_sizes(dragon, 120, 'art/slime_monster.png') == (120, 120)
+    assert combat_sprite_sizes({'art': 'art/dragon_endboss.png'}, 120) == (120, 120)
+
+
+def test_collect_store_assets_matches_listing_sizes():
+    """Store art should be collected at natural size and listing size"""
+    store_data = {
+        'Weapons': [
+            {'name': 'Sword', 'class': 'Warrior', 'ascii_art': 'art/weak_sword.png'},
+            {'name': 'Potion', 'class': 'All', 'ascii_art': 'art/health_potion.png'},
+        ]
+    }
+    requests = collect_store_assets(store_data, _layout_size)
+    assert ('art/weak_sword.png', None, None) in requests
+    assert ('art/weak_sword.png', 100, 100) in requests
+    assert ('art/health_potion.png', 100, 100) in requests
+    print("   ✅ Store art collected for detail and listing views")
+
+
+def test_preloader_fills_sprite_cache():
+    """Decoded sprites should land in the cache via the main-thread poll"""
+    print("🧪 Testing asset preloader")
+    cache = SpriteCache(photo_factory=lambda img: img)
+    scheduler = FakeScheduler()
+    progress = []
+
+    requests = [('art/slime_monster.png', 120, 120),
+                ('art/slime_monster.png', 120, 120),
+                ('art/missing_sprite.png', 120, 120)] + collect_fireworks_assets()
+
+    preloader = AssetPreloader(cache, scheduler,
+                               progress_callback=lambda done, total: progress.append((done, total)))
+    preloader.start(requests, store_path=config.FILE_STORE, layout_size_callback=_layout_size)
+    scheduler.pump()
+
+    stats = preloader.get_progress()
+    assert stats['finished'], "Preloader should finish"
+    assert stats['failed'] == 1, "Missing sprites should be skipped, not fatal"
+    assert stats['loaded'] + stats['failed'] == stats['total']
+    assert stats['total'] > 6, "Store art should be added to the work list"
+    assert cache.contains('art/slime_monster.png', 120, 120)
+    assert cache.contains('art/victory_fireworks_1.png')
+    assert progress[-1] == (stats['total'], stats['total'])
+
+    # A later lookup is a cache hit, no disk access on the UI thread
+    misses_before = cache.get_stats()['misses']
+    cache.get_photo('art/slime_monster.png', 120, 120)
+    assert cache.get_stats()['misses'] == misses_before
+    print(f"   ✅ Preloaded {stats['loaded']} sprites, skipped {stats['failed']}")
+
+
+if __name__ == "__main__":
+    test_collect_assets_from_game_state()
+    test_combat_sprite_sizes_for_shown_image()
+    test_collect_store_assets_matches_listing_sizes()
+    test_preloader_fills_sprite_cache()
+    print("\n✅ All asset preloader tests passed!")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test the pre-scaled background cache in BackgroundManager
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from gui_background_manager import BackgroundManager
+from fakes import FakeCanvas
+
+
+def _make_manager():
+    canvas = FakeCanvas()
+    decoded = []
+
+    def photo_factory(pil_image):
+        decoded.append(pil_image.size)
+        return pil_image
+
+    manager = BackgroundManager(canvas, photo_factory=photo_factory)
+    return canvas, manager, decoded
+
+
+def test_warm_cache_loads_all_backgrounds_once():
+    """Startup should decode every biome and location background exactly once"""
+    print("🧪 Testing background cache warm-up")
+    canvas, manager, decoded = _make_manager()
+
+    manager.initialize_default_background()
+    expected = len(config.BIOME_BACKGROUNDS) + 3
+    assert len(decoded) == expected, f"Expected {expected} decodes, got {len(decoded)}"
+    assert all(size == (config.CANVAS_WIDTH, config.CANVAS_HEIGHT) for size in decoded)
+
+    # Switching around town and biomes should not decode anything new
+    manager.set_shop_background()
+    manager.set_tavern_background()
+    manager.set_blacksmith_background()
+    manager.set_town_background()
+    for biome in config.BIOME_BACKGROUNDS:
+        manager.set_biome_background(biome)
+    manager.reset_background()
+
+    assert len(decoded) == expected, "Background swaps should reuse cached images"
+    print(f"   ✅ {expected} backgrounds decoded once, swaps reuse the cache")
+
+
+def test_swaps_reuse_single_canvas_item():
+    """Swapping backgrounds should repoint one canvas item and keep the foreground"""
+    print("🧪 Testing background item reuse")
+    canvas, manager, _ = _make_manager()
+
+    manager.initialize_default_background()
+    manager.set_shop_background()
+    manager.set_biome_background('desert')
+
+    background_items = [i for i, item in canvas.items.items() if item['tags'] == 'background']
+    assert len(background_items) == 1, "Only one background item should ever exist"
+    assert canvas.items[manager.bg_item_id]['image'] is manager.background_cache[config.BIOME_BACKGROUNDS['desert']]
+    assert "all" not in canvas.delete_calls, "Background swaps must not wipe the canvas"
+    print("   ✅ Single background item repointed without clearing the canvas")
+
+
+def test_missing_background_falls_back_to_color():
+    """A missing background should hide the image and show the fallback color"""
+    print("🧪 Testing background fallback color")
+    canvas, manager, _ = _make_manager()
+
+    manager.initialize_default_background()
+    manager.set_background_image('art/does_not_exist.png', '#123456')
+
+    assert canvas.bg == '#123456'
+    assert canvas.items[manager.bg_item_id]['state'] == 'hidden'
+
+    manager.reset_background()
+    assert canvas.items[manager.bg_item_id]['state'] == 'normal'
+    print("   ✅ Fallback color shown, background restored afterwards")
+
+
+if __name__ == "__main__":
+    test_warm_cache_loads_all_backgrounds_once()
+    test_swaps_reuse_single_canvas_item()
+    test_missing_background_falls_back_to_color()
+    print("\n✅ All background cache tests passed!")
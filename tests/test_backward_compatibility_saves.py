@@ -5,7 +5,10 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import shutil
+import tempfile
 import tkinter as tk
+from pathlib import Path
 from gui_main import GameGUI
 import yaml
 
@@ -15,6 +18,8 @@ def test_backward_compatibility():
     
     root = tk.Tk()
     gui = GameGUI(root)
+    # Keep test saves out of the real saves/ directory
+    gui.save_load_manager.saves_dir = Path(tempfile.mkdtemp())
     
     # Wait for initialization to complete
     def run_tests():
@@ -54,7 +59,7 @@ def test_backward_compatibility():
             }
             
             # Save the old format file
-            old_save_path = 'saves/test_old_save.yaml'
+            old_save_path = str(gui.save_load_manager.saves_dir / 'test_old_save.yaml')
             with open(old_save_path, 'w', encoding='utf-8') as f:
                 yaml.dump(old_save_data, f, default_flow_style=False, allow_unicode=True, indent=2)
             
@@ -89,10 +94,9 @@ def test_backward_compatibility():
             assert loaded_hero['level'] == 3, f"Level should be 3, got {loaded_hero['level']}"
             assert loaded_hero['gold'] == 150, f"Gold should be 150, got {loaded_hero['gold']}"
             
-            # Clean up test save file
-            if os.path.exists(old_save_path):
-                os.remove(old_save_path)
-                print(f"\n4. Cleaned up test file: test_old_save.yaml")
+            # Clean up test save directory
+            shutil.rmtree(gui.save_load_manager.saves_dir, ignore_errors=True)
+            print(f"\n4. Cleaned up test file: test_old_save.yaml")
             
             print("\n✅ Backward compatibility test passed!")
             print("\nExisting save files will work correctly:")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test retained-mode canvas sprites used by combat and encounter animations
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gui_image_manager import ImageManager, CanvasSprite
+from image_cache import SpriteCache
+from fakes import FakeCanvas
+
+
+def _make_manager():
+    canvas = FakeCanvas()
+    manager = ImageManager(canvas, sprite_cache=SpriteCache(photo_factory=lambda img: img))
+    return canvas, manager
+
+
+def test_sprite_moves_without_recreating():
+    """Moving a sprite should update coords on the same canvas item"""
+    print("🧪 Testing sprite movement")
+    canvas, manager = _make_manager()
+
+    sprite = manager.create_sprite('art/slime_monster.png', 10, 20, 120, 120)
+    assert isinstance(sprite, CanvasSprite)
+
+    for step in range(15):
+        sprite.move_to(10 + step * 5, 20)
+    sprite.move(3, -2)
+
+    assert canvas.created == 1, "Animation frames should not create new canvas items"
+    assert canvas.deleted == 0
+    assert canvas.items[sprite.canvas_id]['coords'] == (10 + 14 * 5 + 3, 18)
+    print(f"   ✅ 16 frames used {canvas.created} canvas item")
+
+
+def test_sprite_set_image_swaps_in_place():
+    """Swapping a sprite's image should reconfigure the existing item"""
+    print("🧪 Testing sprite image swap")
+    canvas, manager = _make_manager()
+
+    sprite = manager.create_sprite('art/slime_monster.png', 0, 0, 100, 100)
+    original = canvas.items[sprite.canvas_id]['image']
+
+    sprite.set_image('art/goblin_monster.png')
+    swapped = canvas.items[sprite.canvas_id]['image']
+    assert swapped is not original
+    assert swapped.size == (100, 100), "Sprite should keep its size when swapping images"
+    assert sprite.image_path == 'art/goblin_monster.png'
+
+    # Toggling back reuses the cached sprite
+    sprite.set_image('art/slime_monster.png')
+    assert canvas.items[sprite.canvas_id]['image'] is original
+    assert canvas.created == 1
+    print("   ✅ Image swapped on the same canvas item")
+
+
+def test_sprite_is_alive_after_clear():
+    """Sprites should report when their item was removed from the canvas"""
+    print("🧪 Testing sprite liveness")
+    canvas, manager = _make_manager()
+
+    sprite = manager.create_sprite('art/slime_monster.png', 0, 0, 50, 50)
+    assert sprite.is_alive()
+    manager.clear_foreground_images()
+    assert not sprite.is_alive()
+    print("   ✅ Cleared sprites are detected")
+
+
+if __name__ == "__main__":
+    test_sprite_moves_without_recreating()
+    test_sprite_set_image_swaps_in_place()
+    test_sprite_is_alive_after_clear()
+    print("\n✅ All canvas sprite tests passed!")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test the headless Monte Carlo combat simulator
+"""
+import sys
+import os
+import random
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+import combat_simulator
+from game_logic import fight_round, load_store
+
+
+def test_parse_levels():
+    """Level specs should accept single levels and ranges"""
+    assert combat_simulator.parse_levels('1-3,5') == [1, 2, 3, 5]
+    assert combat_simulator.parse_levels('4') == [4]
+    try:
+        combat_simulator.parse_levels('0-2')
+        assert False, "Level 0 should be rejected"
+    except ValueError:
+        pass
+    print("   ✅ Level specs parsed")
+
+
+def test_loadouts_and_scaling():
+    """Store gear should replace starting gear bonuses like the shop does"""
+    print("🧪 Testing loadouts and hero scaling")
+    store_data = load_store()
+    loadouts = combat_simulator.build_loadouts('Warrior', store_data)
+    labels = [combat_simulator.loadout_label(l) for l in loadouts]
+    assert labels[0] == 'starting gear'
+    assert 'Excalibur + Golden Plate Mail' in labels
+
+    hero = {'level': 1, 'hp': 15, 'maxhp': 15, 'attack': 10, 'defense': 5}
+    excalibur = next(l for l in loadouts if l['weapon'] == 'Excalibur' and l['armour'] is None)
+    stats = combat_simulator.scale_hero(hero, 3, excalibur)
+    assert stats == {'level': 3, 'hp': 25, 'attack': 10 + 4 + 40, 'defense': 5 + 4}
+    print(f"   ✅ {len(loadouts)} Warrior loadouts, level 3 with Excalibur: {stats}")
+
+
+def test_vectorized_matches_fight_round():
+    """Vectorized fights should agree statistically with the scalar GUI rules"""
+    print("🧪 Testing vectorized fights against fight_round")
+    hero_stats = {'level': 2, 'hp': 20, 'attack': 9, 'defense': 6}
+    monster_stats = {'level': 3, 'hp': 22, 'attack': 9, 'defense': 5}
+    fights = 4000
+
+    random.seed(5)
+    scalar_wins = 0
+    scalar_rounds = 0
+    for _ in range(fights):
+        hero = dict(hero_stats)
+        monster = dict(monster_stats)
+        while hero['hp'] > 0 and monster['hp'] > 0:
+            fight_round(hero, monster, gui_rules=True)
+            scalar_rounds += 1
+        scalar_wins += monster['hp'] <= 0
+
+    result = combat_simulator.simulate_matchup(hero_stats, monster_stats, fights, np.random.default_rng(5))
+    scalar_rate = scalar_wins / fights
+    assert abs(result['win_rate'] - scalar_rate) < 0.05, f"{result['win_rate']:.3f} vs {scalar_rate:.3f}"
+    assert abs(result['mean_rounds'] - scalar_rounds / fights) < 0.3
+    print(f"   ✅ Win rate {result['win_rate']:.3f} (vectorized) vs {scalar_rate:.3f} (scalar)")
+
+
+def test_simulation_is_seedable():
+    """Seeded runs should be identical regardless of worker count"""
+    print("🧪 Testing seeded simulation")
+    heros = {'Tester': {'class': 'Warrior', 'level': 1, 'hp': 15, 'maxhp': 15, 'attack': 10, 'defense': 5}}
+    monsters = {
+        'Slime': {'level': 1, 'hp': 5, 'attack': 2, 'defense': 1},
+        'Ogre': {'level': 2, 'hp': 30, 'attack': 8, 'defense': 4},
+    }
+    matchups = combat_simulator.build_matchups(heros, monsters, load_store(), [1, 2], include_gear=False)
+    assert len(matchups) == 4
+
+    first = combat_simulator.run_simulation(matchups, 500, seed=42, workers=1)
+    second = combat_simulator.run_simulation(matchups, 500, seed=42, workers=2)
+    assert first == second
+    assert all(0.0 <= r['win_rate'] <= 1.0 for r in first)
+    print(f"   ✅ {len(first)} matchups reproducible across worker counts")
+
+
+if __name__ == "__main__":
+    test_parse_levels()
+    test_loadouts_and_scaling()
+    test_vectorized_matches_fight_round()
+    test_simulation_is_seedable()
+    print("\n✅ All combat simulator tests passed!")
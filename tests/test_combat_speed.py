@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Test combat speed scaling and instant fight resolution
+"""
+import sys
+import os
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from animation_scheduler import AnimationScheduler, COMBAT_SPEEDS, SPEED_INSTANT, format_speed
+from gui_combat import CombatGUI
+from rng_service import RNGService, STREAM_COMBAT
+
+
+class FakeRoot:
+    """Records after() delays instead of running a Tk event loop"""
+
+    def __init__(self):
+        self.delays = []
+        self.cancelled = []
+
+    def after(self, delay_ms, callback):
+        self.delays.append(delay_ms)
+        return f"after#{len(self.delays)}"
+
+    def after_cancel(self, after_id):
+        self.cancelled.append(after_id)
+
+
+class FakeDisplay:
+    """Collects printed lines and ignores everything else"""
+
+    def __init__(self):
+        self.lines = []
+        self.images = []
+        self.locked = False
+
+    def print_text(self, text):
+        self.lines.append(text)
+
+    def _print_colored_parts(self, parts):
+        self.lines.append(''.join(text for text, _ in parts))
+
+    def clear_text(self):
+        self.lines = []
+
+    def show_image(self, path):
+        self.images.append(path)
+
+    def lock_interface(self):
+        self.locked = True
+
+    def unlock_interface(self):
+        self.locked = False
+
+
+def make_combat(speed, seed=5):
+    root = FakeRoot()
+    display = FakeDisplay()
+    combat = CombatGUI(
+        text_display=display,
+        image_display=display,
+        audio=SimpleNamespace(play_sound_effect=lambda name: None),
+        interface_control=display,
+        timer=AnimationScheduler(root, speed=speed),
+        game_state=None,
+        rng=RNGService(seed=seed).stream(STREAM_COMBAT),
+    )
+    # No canvas in tests
+    combat._display_combat_images = lambda hero, monster: None
+    combat._return_to_monster_view = lambda monster: None
+    combat._show_hero_death_in_combat = lambda hero: None
+    return combat, root, display
+
+
+def test_delays_scale_with_speed():
+    """Delays should shrink with the speed and drop to zero in instant mode"""
+    print("🧪 Testing delay scaling")
+    root = FakeRoot()
+    scheduler = AnimationScheduler(root)
+    for speed in COMBAT_SPEEDS:
+        scheduler.set_speed(speed)
+        scheduler.after(1500, lambda: None)
+    assert root.delays == [1500, 750, 375, 0]
+
+    scheduler.after_cancel('after#1')
+    assert root.cancelled == ['after#1']
+    print("   ✅ 1500ms → 1500/750/375/0ms")
+
+
+def test_cycle_speed():
+    """The speed key should walk through every speed and wrap around"""
+    print("🧪 Testing speed cycling")
+    scheduler = AnimationScheduler(FakeRoot())
+    seen = [scheduler.cycle_speed() for _ in range(len(COMBAT_SPEEDS))]
+    assert seen == [2, 4, SPEED_INSTANT, 1]
+    assert [format_speed(s) for s in seen] == ['2x', '4x', 'Instant', '1x']
+
+    try:
+        scheduler.set_speed(3)
+        assert False, "Unsupported speed should be rejected"
+    except ValueError:
+        pass
+    print("   ✅ 1x → 2x → 4x → Instant → 1x")
+
+
+def test_instant_fight_resolves_in_one_step():
+    """Instant mode should finish the fight without scheduling any animation"""
+    print("🧪 Testing instant fight")
+    combat, root, display = make_combat(SPEED_INSTANT)
+    hero = {'name': 'Hero', 'hp': 60, 'attack': 14, 'defense': 6, 'level': 3}
+    monster = {'name': 'Goblin', 'hp': 30, 'attack': 6, 'defense': 2, 'level': 1}
+    results = []
+
+    combat.fight(hero, monster, results.append)
+
+    assert results == ['won']
+    assert monster['hp'] == 0 and hero['hp'] > 0
+    assert root.delays == [], "No animation timers in instant mode"
+    assert not display.locked, "Interface must be unlocked after the fight"
+    assert any('resolved instantly' in line for line in display.lines)
+    assert not any('--- Round' in line for line in display.lines), "Only the summary is rendered"
+    print(f"   ✅ {display.lines[1]}")
+
+
+def test_instant_matches_fight_round_rules():
+    """An instant fight should play out exactly like fight_round from the same seed"""
+    print("🧪 Testing instant fight replay")
+    from game_logic import fight_round
+
+    def instant(seed):
+        combat, _, display = make_combat(SPEED_INSTANT, seed)
+        hero = {'name': 'Hero', 'hp': 40, 'attack': 10, 'defense': 5, 'level': 2}
+        monster = {'name': 'Orc', 'hp': 40, 'attack': 10, 'defense': 5, 'level': 2}
+        combat.fight(hero, monster, lambda result: None)
+        return hero['hp'], monster['hp'], combat.round_num - 1
+
+    def replay(seed):
+        rng = RNGService(seed=seed).stream(STREAM_COMBAT)
+        hero = {'hp': 40, 'attack': 10, 'defense': 5, 'level': 2}
+        monster = {'hp': 40, 'attack': 10, 'defense': 5, 'level': 2}
+        rounds = 0
+        while hero['hp'] > 0 and monster['hp'] > 0:
+            fight_round(hero, monster, rng, gui_rules=True)
+            rounds += 1
+        return hero['hp'], monster['hp'], rounds
+
+    for seed in range(10):
+        assert instant(seed) == replay(seed)
+    print("   ✅ Same seed, same outcome")
+
+
+def test_animated_fight_uses_scaled_timers():
+    """At 4x the first round should be scheduled with a quarter of the delay"""
+    print("🧪 Testing animated fight at 4x")
+    combat, root, display = make_combat(4)
+    combat._show_hero_attack_animation = lambda hero: None
+    combat._show_monster_attack_animation = lambda monster: None
+    hero = {'name': 'Hero', 'hp': 60, 'attack': 14, 'defense': 6, 'level': 3}
+    monster = {'name': 'Goblin', 'hp': 30, 'attack': 6, 'defense': 2, 'level': 1}
+
+    combat.fight(hero, monster, lambda result: None)
+
+    assert root.delays == [375]
+    assert '--- Round 1 ---' in display.lines
+    print("   ✅ Round animation scheduled after 375ms")
+
+
+def test_cutscenes_ignore_combat_speed():
+    """The death hold, fireworks and wagon/Shiva cutscene always run at 1x"""
+    print("🧪 Testing unscaled cutscene timers")
+
+    # Losing an instant fight still holds the death screen for 3 seconds
+    combat, root, display = make_combat(SPEED_INSTANT)
+    hero = {'name': 'Hero', 'hp': 5, 'attack': 1, 'defense': 0, 'level': 1}
+    monster = {'name': 'Ogre', 'hp': 500, 'attack': 60, 'defense': 9, 'level': 9}
+    combat.fight(hero, monster, lambda result: None)
+    assert root.delays == [3000]
+
+    # Fireworks frames and the wagon drive are not shortened at 4x
+    combat, root, display = make_combat(4)
+    played = []
+    combat._play = played.append
+    combat.fight_callback = lambda result: None
+    combat._start_victory_fireworks_animation()
+    waits = [item.duration for item in played[0].items if type(item).__name__ == '_Wait']
+    assert waits == [1.5] * 4
+
+    combat.image_display = SimpleNamespace(image_canvas=None)
+    combat._animate_wagon('wagon', 400, 50, 100, {}, 'warrior', 100, 50)
+    assert played[1].duration == 300 * 33 / 10 / 1000.0
+
+    # The 8 second reading pause before Shiva appears is not shortened either
+    combat.text_display = SimpleNamespace(clear_text=lambda: None, text_area=SimpleNamespace(
+        config=lambda **kwargs: None, insert=lambda *args: None, tag_config=lambda *args, **kwargs: None))
+    combat.image_display = SimpleNamespace(image_canvas=SimpleNamespace(delete=lambda tag: None),
+                                           _add_canvas_image=lambda *args, **kwargs: None)
+    combat._trigger_wagon_death({}, 'warrior', 100, 50)
+    assert root.delays[-1] == 8000
+    print("   ✅ 3s death hold, 1.5s fireworks frames, wagon drive and 8s pause at 4x")
+
+
+if __name__ == "__main__":
+    test_delays_scale_with_speed()
+    test_cycle_speed()
+    test_instant_fight_resolves_in_one_step()
+    test_instant_matches_fight_round_rules()
+    test_animated_fight_uses_scaled_timers()
+    test_cutscenes_ignore_combat_speed()
+    print("\n✅ All combat speed tests passed!")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test the compiled content bundle and its YAML fallback
+"""
+import sys
+import os
+import pickle
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import content_bundle
+from content_bundle import ContentError, ContentStore, compile_bundle, validate_section
+
+
+def _compile_to_temp():
+    bundle_path = os.path.join(tempfile.mkdtemp(), 'content.bundle')
+    compile_bundle(bundle_path)
+    return bundle_path
+
+
+def _rewrite_bundle(bundle_path, **changes):
+    with open(bundle_path, 'rb') as fh:
+        bundle = pickle.load(fh)
+    bundle.update(changes)
+    with open(bundle_path, 'wb') as fh:
+        pickle.dump(bundle, fh)
+    return bundle
+
+
+def test_bundle_matches_yaml():
+    """Every section served from the bundle should equal the YAML fallback"""
+    print("🧪 Testing compiled bundle against YAML")
+    store = ContentStore(_compile_to_temp())
+    assert store.using_bundle()
+
+    for section in ('monsters', 'heros', 'store', 'tavern', 'story'):
+        assert store.get(section) == ContentStore._load_yaml_section(section), f"{section} differs"
+    print(f"   ✅ {len(store.get('monsters'))} monsters and all other sections match")
+
+
+def test_sections_are_fresh_copies():
+    """Callers may modify the data they get without affecting later loads"""
+    store = ContentStore(_compile_to_temp())
+    store_data = store.get('store')
+    store_data['Weapons'].clear()
+    assert store.get('store')['Weapons'], "Bundle data should not be shared between callers"
+    print("   ✅ Each get() returns its own copy")
+
+
+def test_stale_bundle_falls_back_to_yaml():
+    """Changed sources, versions or schemas should disable the bundle"""
+    print("🧪 Testing stale bundle detection")
+    bundle_path = _compile_to_temp()
+    bundle = _rewrite_bundle(bundle_path)
+    manifest = dict(bundle['manifest'])
+
+    # Source file changed since compile
+    rel_path = next(iter(manifest))
+    mtime, size = manifest[rel_path]
+    _rewrite_bundle(bundle_path, manifest={**manifest, rel_path: (mtime - 1, size)})
+    store = ContentStore(bundle_path)
+    assert not store.using_bundle()
+    assert store.get('tavern') == ContentStore._load_yaml_section('tavern')
+
+    # ...unless running from the executable, where extracted files get new mtimes
+    sys._MEIPASS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        assert ContentStore(bundle_path).using_bundle()
+    finally:
+        del sys._MEIPASS
+
+    # Source file added since compile
+    missing = dict(manifest)
+    missing.pop(rel_path)
+    _rewrite_bundle(bundle_path, manifest=missing)
+    assert not ContentStore(bundle_path).using_bundle()
+
+    # Old format version or schema
+    _rewrite_bundle(bundle_path, manifest=manifest, version=content_bundle.CONTENT_BUNDLE_VERSION - 1)
+    assert not ContentStore(bundle_path).using_bundle()
+    _rewrite_bundle(bundle_path, version=content_bundle.CONTENT_BUNDLE_VERSION, schema_hash='old')
+    assert not ContentStore(bundle_path).using_bundle()
+
+    # Missing bundle
+    assert not ContentStore(bundle_path + '.missing').using_bundle()
+    print("   ✅ Stale bundles are ignored")
+
+
+def test_validation_rejects_bad_content():
+    """The compiler should refuse content missing required fields"""
+    print("🧪 Testing content validation")
+    validate_section('monsters', {'Slime': {'name': 'Slime', 'hp': 5, 'attack': 1, 'defense': 1, 'level': 1}})
+    bad_cases = [
+        ('monsters', {'Slime': {'name': 'Slime', 'hp': 5}}),
+        ('store', {'Weapons': {'name': 'Sword'}}),
+        ('tavern', {'Drinks': [{'name': 'Beer'}]}),
+        ('story', ['Once upon a time']),
+    ]
+    for section, data in bad_cases:
+        try:
+            validate_section(section, data, 'test.yaml')
+            assert False, f"{section} data should be rejected: {data}"
+        except ContentError as e:
+            assert 'test.yaml' in str(e)
+    print("   ✅ Invalid content rejected")
+
+
+if __name__ == "__main__":
+    test_bundle_matches_yaml()
+    test_sections_are_fresh_copies()
+    test_stale_bundle_falls_back_to_yaml()
+    test_validation_rejects_bad_content()
+    print("\n✅ All content bundle tests passed!")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test that combat damage comes from the single game_logic damage engine
+"""
+import sys
+import os
+import random
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import config
+import game_logic
+from gui_combat import CombatGUI
+
+
+def test_gui_combat_uses_game_logic():
+    """CombatGUI.calculate_damage should match game_logic.damage_calculator roll for roll"""
+    print("🧪 Testing CombatGUI delegates to game_logic")
+    combat = CombatGUI(None, None, None, None, None, None)
+
+    for attack, defense, att_level, def_level in [(10, 5, 1, 1), (25, 5, 7, 1), (5, 40, 1, 9)]:
+        random.seed(1234)
+        gui_rolls = [combat.calculate_damage(attack, defense, att_level, def_level) for _ in range(50)]
+        random.seed(1234)
+        logic_rolls = [game_logic.damage_calculator(attack, defense, att_level, def_level) for _ in range(50)]
+        assert gui_rolls == logic_rolls
+    print("   ✅ GUI and game logic damage rolls are identical")
+
+
+def test_batch_matches_scalar_formula():
+    """The vectorized damage engine should agree with the scalar formula"""
+    print("🧪 Testing batch damage against scalar formula")
+    np = pytest.importorskip('numpy')
+    rng = np.random.default_rng(7)
+    count = 5000
+    attack = rng.integers(1, 80, size=count)
+    defense = rng.integers(0, 60, size=count)
+    att_level = rng.integers(1, 12, size=count)
+    def_level = rng.integers(1, 12, size=count)
+    variance = rng.uniform(config.DAMAGE_VARIANCE_MIN, config.DAMAGE_VARIANCE_MAX, size=count)
+
+    batch = game_logic.damage_calculator_batch(attack, defense, att_level, def_level, variance=variance)
+    for i in range(count):
+        expected, _, _ = game_logic._apply_damage_formula(
+            int(attack[i]), int(defense[i]), int(att_level[i]), int(def_level[i]), float(variance[i]))
+        assert batch[i] == expected, f"Mismatch at {i}: {batch[i]} != {expected}"
+    print(f"   ✅ {count} batch rolls match the scalar formula")
+
+
+def test_batch_broadcasts_single_matchup():
+    """A single matchup can be rolled many times with a seeded generator"""
+    np = pytest.importorskip('numpy')
+    rolls = game_logic.damage_calculator_batch(10, 5, 1, 1, rng=np.random.default_rng(3), variance=None)
+    assert rolls.shape == ()
+    many = game_logic.damage_calculator_batch(np.full(10000, 10), 5, 1, 1, rng=np.random.default_rng(3))
+    assert many.shape == (10000,)
+    assert many.min() >= 1
+    again = game_logic.damage_calculator_batch(np.full(10000, 10), 5, 1, 1, rng=np.random.default_rng(3))
+    assert (many == again).all(), "Seeded batches should be reproducible"
+    print(f"   ✅ 10000 rolls: {many.min()}-{many.max()} (avg {many.mean():.2f})")
+
+
+def test_fight_round_rules():
+    """fight_round keeps the hero-first order by default; GUI rules are opt-in"""
+    print("🧪 Testing fight_round rule sets")
+
+    class FixedRng:
+        """Initiative and variance stand-in: fixed coin flip, 100% damage rolls"""
+
+        def __init__(self, hero_first):
+            self.hero_first = hero_first
+
+        def choice(self, options):
+            return self.hero_first
+
+        def uniform(self, low, high):
+            return 1.0
+
+    def combatants():
+        # Each side kills the other with one full-strength hit
+        hero = {'hp': 5, 'attack': 50, 'defense': 0, 'level': 1}
+        monster = {'hp': 5, 'attack': 50, 'defense': 0, 'level': 1}
+        return hero, monster
+
+    # Default rules: the hero strikes first, and the monster still strikes back
+    hero, monster = combatants()
+    result = game_logic.fight_round(hero, monster, FixedRng(False))
+    assert 'hero_first' not in result
+    assert result['monster_dead'] and result['hero_dead']
+    assert result['hero_damage'] > 0 and result['monster_damage'] > 0
+
+    # GUI rules: a combatant killed by the first strike does not counter-attack
+    hero, monster = combatants()
+    result = game_logic.fight_round(hero, monster, FixedRng(True), gui_rules=True)
+    assert result['hero_first'] and result['monster_dead'] and not result['hero_dead']
+    assert result['monster_damage'] == 0 and hero['hp'] == 5
+
+    hero, monster = combatants()
+    result = game_logic.fight_round(hero, monster, FixedRng(False), gui_rules=True)
+    assert not result['hero_first'] and result['hero_dead'] and not result['monster_dead']
+    assert result['hero_damage'] == 0 and monster['hp'] == 5
+    print("   ✅ Default order unchanged, GUI initiative and no counter-attack when dead")
+
+
+if __name__ == "__main__":
+    test_gui_combat_uses_game_logic()
+    test_batch_matches_scalar_formula()
+    test_batch_broadcasts_single_matchup()
+    test_fight_round_rules()
+    print("\n✅ All damage engine tests passed!")
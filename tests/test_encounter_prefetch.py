@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test predictive prefetch of the next encounter's sprites and sounds
+"""
+import sys
+import os
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gui_image_manager import ImageManager
+from gui_monster_encounter import MonsterEncounterGUI
+from image_cache import SpriteCache
+from fakes import FakeScheduler
+
+
+class FakeAudio:
+    """Records sound preload requests"""
+
+    def __init__(self):
+        self.preloaded = []
+
+    def preload_sound_effects(self, sound_files):
+        self.preloaded.append(list(sound_files))
+
+
+def _make_gui(biome='grassland', level=2):
+    monsters = {
+        'Slime': {'name': 'Slime', 'level': 1, 'biome': 'grassland',
+                  'art': 'art/slime_monster.png', 'attack_sound': 'slime.mp3'},
+        'Goblin': {'name': 'Goblin', 'level': 3, 'biome': 'grassland',
+                   'art': 'art/goblin_monster.png', 'art_attack': 'art/goblin_monster_attack.png'},
+        'Cyclops': {'name': 'Cyclops', 'level': 9, 'biome': 'grassland', 'art': 'art/cyclops_monster.png'},
+        'Mouse': {'name': 'Desert Mouse', 'level': 2, 'biome': 'desert', 'art': 'art/desert_mouse_monster.png'},
+    }
+    hero = {'name': 'Tester', 'class': 'Warrior', 'level': level,
+            'art': 'art/warrior_hero.png', 'art_attack': 'art/warrior_hero_attack.png'}
+    return SimpleNamespace(
+        game_state=SimpleNamespace(monsters=monsters, hero=hero),
+        current_biome=biome,
+        image_manager=ImageManager(None, sprite_cache=SpriteCache(photo_factory=lambda img: img)),
+        root=FakeScheduler(),
+        audio=FakeAudio()
+    )
+
+
+def test_candidate_monsters_match_selection_window():
+    """Candidates should follow the biome and level window used by encounters"""
+    print("🧪 Testing encounter candidate selection")
+    encounter = MonsterEncounterGUI(_make_gui())
+
+    names = sorted(key for key, _ in encounter._get_candidate_monsters())
+    assert names == ['Goblin', 'Slime'], f"Unexpected candidates: {names}"
+
+    key, monster = encounter._select_random_monster()
+    assert key in names
+    print(f"   ✅ Candidates: {names}")
+
+
+def test_prefetch_warms_sprites_and_sounds():
+    """Prefetch should decode every candidate sprite and queue their sounds"""
+    print("🧪 Testing encounter prefetch")
+    gui = _make_gui()
+    encounter = MonsterEncounterGUI(gui)
+
+    encounter.prefetch_encounter_assets()
+    gui.root.pump()
+
+    cache = gui.image_manager.sprite_cache
+    assert cache.contains('art/slime_monster.png', 120, 120)
+    assert cache.contains('art/goblin_monster_attack.png', 120, 120)
+    assert cache.contains('art/warrior_hero.png', 120, 120)
+    assert not cache.contains('art/cyclops_monster.png', 120, 120), "Out-of-range monsters are not prefetched"
+    assert 'slime.mp3' in gui.audio.preloaded[0]
+    assert 'buzzer.mp3' in gui.audio.preloaded[0], "Default attack sound should be warmed"
+    print(f"   ✅ {len(cache)} sprites warmed")
+
+    # Same biome and level: nothing new to do
+    encounter.prefetch_encounter_assets()
+    assert len(gui.audio.preloaded) == 1
+
+    # Changing biome triggers a new prefetch
+    gui.current_biome = 'desert'
+    encounter.prefetch_encounter_assets()
+    gui.root.pump()
+    assert cache.contains('art/desert_mouse_monster.png', 120, 120)
+    assert len(gui.audio.preloaded) == 2
+    print("   ✅ Prefetch reruns only when biome or level changes")
+
+
+if __name__ == "__main__":
+    test_candidate_monsters_match_selection_window()
+    test_prefetch_warms_sprites_and_sounds()
+    print("\n✅ All encounter prefetch tests passed!")
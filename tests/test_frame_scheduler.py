@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Test the fixed-rate frame scheduler, tweens and timelines
+"""
+import sys
+import os
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frame_scheduler import FrameScheduler, Timeline, Tween, ease_out_quad
+from animation_clips import build_combatant_clips
+from gui_combat import CombatGUI, COMBAT_ANIMATION_GROUP
+
+
+class FakeClock:
+    """Manually advanced clock (seconds)"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRoot:
+    """Queues after() callbacks and runs them against a fake clock"""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.queue = []  # (due time, callback)
+        self.after_calls = 0
+
+    def after(self, delay_ms, callback):
+        self.after_calls += 1
+        self.queue.append((self.clock.now + delay_ms / 1000.0, callback))
+
+    def run(self, seconds):
+        """Run every callback that falls due in the next `seconds`"""
+        end = self.clock.now + seconds
+        while self.queue:
+            self.queue.sort(key=lambda item: item[0])
+            due, callback = self.queue[0]
+            if due > end:
+                break
+            self.queue.pop(0)
+            self.clock.now = max(self.clock.now, due)
+            callback()
+        self.clock.now = end
+
+
+def make_scheduler(fps=25):
+    clock = FakeClock()
+    root = FakeRoot(clock)
+    return FrameScheduler(root, fps=fps, clock=clock), root
+
+
+def test_tween_reaches_end_value():
+    """A tween should interpolate, land exactly on its end value and complete once"""
+    print("🧪 Testing tween")
+    frames, root = make_scheduler()
+    values, done = [], []
+    frames.play(Tween(200, values.append, start=0, end=100, on_complete=lambda: done.append(True)))
+
+    root.run(0.5)
+    assert values[0] == 0 and values[-1] == 100
+    assert values == sorted(values)
+    assert done == [True]
+    assert not frames.is_active()
+    print(f"   ✅ {len(values)} frames from 0 to 100")
+
+
+def test_easing():
+    """Ease-out should cover more distance early on"""
+    assert ease_out_quad(0) == 0 and ease_out_quad(1) == 1
+    assert ease_out_quad(0.5) > 0.5
+    print("   ✅ Ease-out curve")
+
+
+def test_one_tick_drives_all_animations():
+    """Overlapping animations must share one tick instead of stacking callbacks"""
+    print("🧪 Testing shared tick")
+    frames, root = make_scheduler(fps=25)  # 40ms frames
+    for _ in range(10):
+        frames.play(Tween(400, lambda value: None))
+
+    root.run(1.0)
+    stats = frames.get_stats()
+    # One after() per frame for all ten animations, and none once they are done
+    assert root.after_calls == stats['frames']
+    assert stats['frames'] <= 12
+    assert stats['active'] == 0 and not root.queue
+    print(f"   ✅ 10 tweens ran in {stats['frames']} ticks")
+
+
+def test_updates_with_same_key_are_coalesced():
+    """Two tweens moving the same sprite should apply only the newest value each frame"""
+    print("🧪 Testing update coalescing")
+    frames, root = make_scheduler()
+    moves = []
+    frames.play(Tween(100, lambda x: moves.append(('old', x)), key='hero'))
+    frames.play(Tween(100, lambda x: moves.append(('new', x)), key='hero'))
+
+    root.run(0.01)
+    assert [who for who, _ in moves] == ['new']
+    assert frames.get_stats()['coalesced'] == 1
+    print("   ✅ One move per sprite per frame")
+
+
+def test_timeline_runs_in_order_without_drift():
+    """Timeline items should follow each other on their own schedule"""
+    print("🧪 Testing timeline")
+    frames, root = make_scheduler(fps=25)
+    clock = frames.clock
+    events = []
+    timeline = Timeline()
+    for step in range(6):
+        timeline.call(lambda s=step: events.append((s, clock())))
+        timeline.wait(250)
+    timeline.call(lambda: events.append(('done', clock())))
+    frames.play(timeline)
+
+    root.run(2.0)
+    assert [name for name, _ in events] == [0, 1, 2, 3, 4, 5, 'done']
+    start = events[0][1]
+    for index, (_, when) in enumerate(events):
+        # Each step fires on the first tick after its due time, never later
+        assert index * 0.25 <= when - start < index * 0.25 + 0.041
+    print("   ✅ 6 toggles 250ms apart, then completion")
+
+
+def test_cancel_group():
+    """Cancelling a group should stop its animations before their callbacks run"""
+    print("🧪 Testing group cancellation")
+    frames, root = make_scheduler()
+    fired = []
+    frames.play(Timeline().wait(100).call(lambda: fired.append('encounter')), group='encounter')
+    frames.play(Timeline().wait(100).call(lambda: fired.append('combat')), group='combat')
+
+    root.run(0.05)
+    assert frames.cancel('encounter') == 1
+    root.run(0.5)
+    assert fired == ['combat']
+    assert frames.get_stats()['cancelled'] == 1
+    assert frames.cancel_all() == 0
+    print("   ✅ Cancelled group never fired")
+
+
+def test_callbacks_can_start_animations():
+    """An animation started from a completion callback should run on the same tick loop"""
+    frames, root = make_scheduler()
+    values = []
+    frames.play(Tween(40, lambda v: None, on_complete=lambda: frames.play(Tween(40, values.append))))
+
+    root.run(0.5)
+    assert values and values[-1] == 1.0
+    assert not frames.is_active()
+    print("   ✅ Chained animations")
+
+
+def test_failing_animation_is_dropped():
+    """An exception in one animation's update must not stop the others"""
+    frames, root = make_scheduler()
+    values = []
+
+    class Broken(Tween):
+        def update(self, now, frame):
+            raise RuntimeError("boom")
+
+    frames.play(Broken(100, values.append))
+    frames.play(Tween(100, values.append))
+    root.run(0.5)
+    assert values[-1] == 1.0
+    print("   ✅ Broken animation dropped")
+
+
+def test_long_frame_stats():
+    """A long frame should show up in the stats and skip missed slots instead of piling up"""
+    frames, root = make_scheduler(fps=25)
+    slow = {'first': True}
+
+    def stall(value):
+        # Simulate one long frame of canvas work
+        if slow['first']:
+            slow['first'] = False
+            frames.clock.now += 0.2
+
+    frames.play(Tween(400, stall))
+    root.run(1.0)
+    stats = frames.get_stats()
+    assert stats['max_frame_ms'] >= 199
+    assert stats['late_frames'] == 0, "Scheduler should skip missed slots instead of running late"
+    print(f"   ✅ Stats: {stats}")
+
+
+class FakeSprite:
+    def __init__(self, x):
+        self.x = x
+        self.image = None
+
+    def is_alive(self):
+        return True
+
+    def move_to(self, x, y):
+        self.x = x
+
+    def set_image(self, image_path, width=None, height=None):
+        self.image = image_path
+
+    def show_frame(self, frame):
+        self.image = frame.image_path
+
+
+def test_combat_attack_animation():
+    """A hero attack should jump forward, toggle six times and jump back on the frame scheduler"""
+    print("🧪 Testing combat attack animation")
+    frames, root = make_scheduler(fps=30)
+    combat = CombatGUI(None, None, SimpleNamespace(play_sound_effect=lambda *a, **k: None),
+                       None, root, None, frames=frames)
+    combat.combat_hero_x, combat.combat_monster_x, combat.combat_y = 100, 300, 50
+    combat.hero_img_size = combat.monster_img_size = 120
+    combat.current_hero_image = 'art/warrior_hero.png'
+    combat.hero_sprite, combat.monster_sprite = FakeSprite(100), FakeSprite(300)
+    lookups = []
+    combat.combat_clips = {'hero': build_combatant_clips(
+        lambda path, w, h: lookups.append(path) or path, 'art/warrior_hero.png', 120, attack_image='art/warrior_hero_attack.png')}
+    built = len(lookups)
+    images = []
+    original_show_frame = combat.hero_sprite.show_frame
+    combat.hero_sprite.show_frame = lambda frame: (images.append(frame.image_path), original_show_frame(frame))
+    redrawn = []
+    combat._display_combat_images_with_sizing = lambda: redrawn.append(combat.combat_hero_x)
+
+    jumped = []
+    combat._start_hero_attack_after_jump = lambda hero: jumped.append(combat.hero_sprite.x)
+
+    combat._animate_hero_jump_forward({})
+    root.run(0.3)
+    assert jumped == [160], "Hero jumps 30% of the way toward the monster"
+
+    combat._toggle_hero_attack_animation()
+    root.run(2.0)
+    assert images == ['art/warrior_hero_attack.png', 'art/warrior_hero.png'] * 3
+    assert len(lookups) == built, "Toggling plays precomputed frames without image lookups"
+    assert redrawn == [100], "Jump back ends at the original position"
+
+    # Leaving combat cancels whatever is still playing
+    combat._animate_hero_jump_forward({})
+    assert frames.cancel(COMBAT_ANIMATION_GROUP) == 1
+    print("   ✅ Jump, toggle, jump back")
+
+
+if __name__ == "__main__":
+    test_tween_reaches_end_value()
+    test_easing()
+    test_one_tick_drives_all_animations()
+    test_updates_with_same_key_are_coalesced()
+    test_timeline_runs_in_order_without_drift()
+    test_cancel_group()
+    test_callbacks_can_start_animations()
+    test_failing_animation_is_dropped()
+    test_long_frame_stats()
+    test_combat_attack_animation()
+    print("\n✅ All frame scheduler tests passed!")
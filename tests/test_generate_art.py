@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Test the parallel, cached art generation driver
+"""
+import sys
+import os
+import json
+import shutil
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'art_generation'))
+
+from generate_art import CACHE_FILE, discover_generators, generate_art
+
+GENERATORS = {
+    # Written for running from the project root
+    'create_root_style.py': "open('art/root.png', 'wb').write(b'root-v1')\n",
+    # Written for running from art_generation/
+    'create_folder_style.py': "open('../art/folder.png', 'wb').write(b'folder')\n",
+    # Written for running from inside art/
+    'create_bare_style.py': "if __name__ == '__main__':\n    open('bare.png', 'wb').write(b'bare')\n",
+    'create_broken.py': "raise RuntimeError('palette missing')\n",
+    'helper_not_a_generator.py': "raise AssertionError('must not run')\n",
+}
+
+
+def make_workspace():
+    root = tempfile.mkdtemp()
+    dirs = {name: os.path.join(root, name) for name in ('generators', 'art', 'cache')}
+    os.makedirs(dirs['generators'])
+    for name, source in GENERATORS.items():
+        with open(os.path.join(dirs['generators'], name), 'w', encoding='utf-8') as f:
+            f.write(source)
+    return root, dirs
+
+
+def run(dirs, **kwargs):
+    results = generate_art(generator_dir=dirs['generators'], art_dir=dirs['art'],
+                           cache_dir=dirs['cache'], jobs=2, **kwargs)
+    return {r['script']: r for r in results}
+
+
+def read(dirs, name):
+    with open(os.path.join(dirs['art'], name), 'rb') as f:
+        return f.read()
+
+
+def test_discovery():
+    root, dirs = make_workspace()
+    try:
+        scripts = discover_generators(dirs['generators'])
+        assert 'helper_not_a_generator.py' not in scripts and len(scripts) == 4
+        assert discover_generators(dirs['generators'], only=['root', 'bare']) == \
+            ['create_bare_style.py', 'create_root_style.py']
+        print("   ✅ Only create_*.py scripts are generators")
+    finally:
+        shutil.rmtree(root)
+
+
+def test_outputs_land_in_art():
+    """Generators written for any working directory should all write into art/"""
+    print("🧪 Testing parallel generation")
+    root, dirs = make_workspace()
+    try:
+        results = run(dirs)
+        assert read(dirs, 'root.png') == b'root-v1'
+        assert read(dirs, 'folder.png') == b'folder'
+        assert read(dirs, 'bare.png') == b'bare'
+        assert not results['create_broken.py']['success']
+        assert 'palette missing' in results['create_broken.py']['error']
+        assert all('seconds' in r for r in results.values())
+        assert not [f for f in os.listdir(dirs['art']) if f.endswith('.tmp')]
+        assert os.listdir(dirs['cache']) == [CACHE_FILE], "Scratch directories are cleaned up"
+        print("   ✅ 3 generators installed, 1 failure reported")
+    finally:
+        shutil.rmtree(root)
+
+
+def test_cache_skips_unchanged():
+    """A second run should only rerun edited generators, failures and damaged outputs"""
+    print("🧪 Testing build cache")
+    root, dirs = make_workspace()
+    try:
+        run(dirs)
+        results = run(dirs)
+        skipped = sorted(name for name, r in results.items() if r['skipped'])
+        assert skipped == ['create_bare_style.py', 'create_folder_style.py', 'create_root_style.py']
+
+        # Edit one generator (a palette tweak) and damage another's output
+        with open(os.path.join(dirs['generators'], 'create_root_style.py'), 'w', encoding='utf-8') as f:
+            f.write("open('art/root.png', 'wb').write(b'root-v2')\n")
+        with open(os.path.join(dirs['art'], 'folder.png'), 'wb') as f:
+            f.write(b'hand edited')
+
+        results = run(dirs)
+        assert not results['create_root_style.py']['skipped']
+        assert not results['create_folder_style.py']['skipped']
+        assert results['create_bare_style.py']['skipped']
+        assert read(dirs, 'root.png') == b'root-v2'
+        assert read(dirs, 'folder.png') == b'folder'
+
+        results = run(dirs, force=True)
+        assert not any(r['skipped'] for r in results.values())
+        print("   ✅ Only changed generators rerun")
+    finally:
+        shutil.rmtree(root)
+
+
+def test_conflicting_outputs():
+    """When two generators write the same file, the later one wins and the cache stays stable"""
+    print("🧪 Testing conflicting outputs")
+    root, dirs = make_workspace()
+    try:
+        with open(os.path.join(dirs['generators'], 'create_zz_override.py'), 'w', encoding='utf-8') as f:
+            f.write("open('art/root.png', 'wb').write(b'override')\n")
+        run(dirs)
+        assert read(dirs, 'root.png') == b'override'
+
+        results = run(dirs)
+        assert results['create_root_style.py']['skipped'] and results['create_zz_override.py']['skipped']
+        with open(os.path.join(dirs['cache'], CACHE_FILE), encoding='utf-8') as f:
+            cache = json.load(f)
+        assert cache['scripts']['create_root_style.py']['overwritten'] == ['root.png']
+        print("   ✅ Later generator wins without rerunning forever")
+    finally:
+        shutil.rmtree(root)
+
+
+def test_shared_module_edits_rerun_generators():
+    """Generators can import raster.py, and editing it invalidates every cached result"""
+    print("🧪 Testing shared helper modules")
+    root, dirs = make_workspace()
+    try:
+        with open(os.path.join(dirs['generators'], 'raster.py'), 'w', encoding='utf-8') as f:
+            f.write("COLOR = b'red'\n")
+        with open(os.path.join(dirs['generators'], 'create_uses_raster.py'), 'w', encoding='utf-8') as f:
+            f.write("import raster\nopen('art/shared.png', 'wb').write(raster.COLOR)\n")
+        results = run(dirs)
+        assert results['create_uses_raster.py']['success'], results['create_uses_raster.py']['error']
+        assert read(dirs, 'shared.png') == b'red'
+        assert 'raster.py' not in discover_generators(dirs['generators'])
+
+        with open(os.path.join(dirs['generators'], 'raster.py'), 'w', encoding='utf-8') as f:
+            f.write("COLOR = b'blue'\n")
+        results = run(dirs)
+        assert not any(r['skipped'] for r in results.values())
+        assert read(dirs, 'shared.png') == b'blue'
+        print("   ✅ Shared module imported and tracked by the cache")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    test_discovery()
+    test_outputs_land_in_art()
+    test_cache_skips_unchanged()
+    test_conflicting_outputs()
+    test_shared_module_edits_rerun_generators()
+    print("\n✅ All art generation driver tests passed!")
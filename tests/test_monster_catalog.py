@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test the biome/level indexed monster catalog
+"""
+import sys
+import os
+import random
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game_state import initialize_game_state
+from gui_quests import QuestManager
+from monster_catalog import MonsterCatalog, get_monster_catalog
+
+
+def _linear_scan(monsters, min_level, max_level, biome=None):
+    """Reference implementation: the old full scan"""
+    return sorted(
+        key for key, value in monsters.items()
+        if (biome is None or value.get('biome', 'grassland') == biome)
+        and min_level <= value['level'] <= max_level
+    )
+
+
+def test_catalog_matches_linear_scan():
+    """Range queries should return exactly what a full scan finds"""
+    print("🧪 Testing catalog range queries against linear scan")
+    rng = random.Random(3)
+    biomes = ['grassland', 'desert', 'dungeon', 'ocean']
+    monsters = {
+        f"Monster {i}": {'level': rng.randint(1, 30), 'biome': rng.choice(biomes)}
+        for i in range(5000)
+    }
+    monsters['Wanderer'] = {'level': 4}  # No biome field defaults to grassland
+    catalog = MonsterCatalog(monsters)
+
+    for _ in range(200):
+        low = rng.randint(1, 30)
+        high = low + rng.randint(0, 5)
+        biome = rng.choice(biomes + [None])
+        found = sorted(key for key, _ in catalog.in_level_range(low, high, biome))
+        assert found == _linear_scan(monsters, low, high, biome)
+
+    assert 'Wanderer' in [key for key, _ in catalog.in_biome('grassland')]
+    assert catalog.in_level_range(1, 5, 'volcano') == []
+    print(f"   ✅ 200 queries over {len(catalog)} monsters match")
+
+
+def test_catalog_built_at_startup_and_rebuilt_when_stale():
+    """initialize_game_state builds the catalog; replacing monsters rebuilds it"""
+    state = initialize_game_state()
+    assert isinstance(state.monster_catalog, MonsterCatalog)
+    assert get_monster_catalog(state) is state.monster_catalog
+
+    state.monsters = {'Slime': {'level': 1, 'biome': 'grassland'}}
+    catalog = get_monster_catalog(state)
+    assert catalog is not None and len(catalog) == 1
+    print("   ✅ Catalog built once and rebuilt when the monster set changes")
+
+
+def test_quest_generation_uses_catalog():
+    """Quest generation should respect biome, level window and existing quests"""
+    print("🧪 Testing quest generation with the catalog")
+    monsters = {
+        'Slime': {'name': 'Slime', 'level': 1, 'biome': 'grassland', 'xp': 1},
+        'Goblin': {'name': 'Goblin', 'level': 3, 'biome': 'grassland', 'xp': 3},
+        'Troll': {'name': 'Troll', 'level': 9, 'biome': 'grassland', 'xp': 9},
+        'Scorpion': {'name': 'Scorpion', 'level': 2, 'biome': 'desert', 'xp': 2},
+    }
+    hero = {'level': 2, 'quests': [], 'completed_quests': []}
+    gui = SimpleNamespace(game_state=SimpleNamespace(monsters=monsters, hero=hero),
+                          current_biome='grassland')
+    quests = QuestManager(gui)
+
+    targets = set()
+    for _ in range(20):
+        quest = quests.generate_kill_monster_quest()
+        targets.add(quest.target)
+    assert targets == {'Slime', 'Goblin'}
+
+    hero['completed_quests'] = ['Slime', 'Goblin']
+    assert quests.generate_kill_monster_quest() == "NO_QUESTS_AVAILABLE_BIOME"
+
+    gui.current_biome = 'ocean'
+    hero['completed_quests'] = []
+    assert quests.generate_kill_monster_quest().target in {'Slime', 'Goblin', 'Scorpion'}
+    print("   ✅ Quest targets come from the right biome and level window")
+
+
+if __name__ == "__main__":
+    test_catalog_matches_linear_scan()
+    test_catalog_built_at_startup_and_rebuilt_when_stale()
+    test_quest_generation_uses_catalog()
+    print("\n✅ All monster catalog tests passed!")
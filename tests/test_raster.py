@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test the vectorized raster primitives used by the art generators
+"""
+import sys
+import os
+import pytest
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'art_generation'))
+
+np = pytest.importorskip('numpy')
+import raster
+
+
+def test_masks():
+    """Shape masks should match the per-pixel tests they replace"""
+    print("🧪 Testing shape masks")
+    shape = (10, 12)
+    rect = raster.rect_mask(shape, 2, 3, 5, 4)
+    assert rect.shape == shape and rect.sum() == 3 and rect[3, 2] and not rect[3, 5]
+
+    circle = raster.circle_mask(shape, 5, 5, 2)
+    assert circle.sum() == sum(1 for y in range(10) for x in range(12) if (x - 5) ** 2 + (y - 5) ** 2 <= 4)
+
+    triangle = raster.polygon_mask(shape, [(0, 0), (4, 0), (0, 4)])
+    assert triangle[0, 0] and triangle[2, 2] and triangle[0, 4] and not triangle[3, 3]
+    # Winding order does not matter
+    assert (triangle == raster.polygon_mask(shape, [(0, 4), (4, 0), (0, 0)])).all()
+
+    points = raster.point_mask(shape, [1, 1, 20, -1], [2, 2, 2, 0])
+    assert points.sum() == 1 and points[2, 1]
+    print("   ✅ rect, circle, polygon and point masks")
+
+
+def test_tapered_rows():
+    """Row spans should stack up or down from the first row and shift per row"""
+    print("🧪 Testing tapered rows")
+    mask, row, dx = raster.tapered_rows((10, 10), 5, 8, 3, lambda row: 2 - row, step=-1)
+    assert [int(mask[y].sum()) for y in (8, 7, 6, 5, 9)] == [5, 3, 1, 0, 0]
+    assert row[6, 0] == 2 and dx[0, 7] == 2
+
+    mask, _, _ = raster.tapered_rows((10, 10), 5, 0, 3, lambda row: row * 0, shift=lambda row: row)
+    assert [int(np.argmax(mask[y])) for y in range(3)] == [5, 6, 7]
+    print("   ✅ Spans taper and shift")
+
+
+def test_outline_and_dither():
+    print("🧪 Testing outline and dithering")
+    square = raster.rect_mask((6, 6), 1, 1, 5, 5)
+    edge = raster.outline(square)
+    assert edge.sum() == 12 and not edge[2, 2] and not edge[0, 0]
+
+    assert raster.ordered_dither((8, 8), 0.0).sum() == 0
+    assert raster.ordered_dither((8, 8), 1.0).sum() == 64
+    assert raster.ordered_dither((8, 8), 0.5).sum() == 32
+    print("   ✅ Outline and Bayer dithering")
+
+
+def test_color_operations():
+    """Blending should truncate like the int() math in the original pixel loops"""
+    print("🧪 Testing color operations")
+    pixels = raster.palette_map(np.array([[0, 1], [1, 0]]), [[1, 2, 3, 255], [4, 5, 6, 255]])
+    assert pixels.shape == (2, 2, 4) and pixels[0, 1].tolist() == [4, 5, 6, 255]
+
+    canvas = raster.new_canvas(4, 2)
+    canvas[:] = [100, 100, 100, 50]
+    mask = raster.rect_mask(canvas.shape, 0, 0, 2, 2)
+    raster.blend(canvas, mask, [200, 0, 0, 100], keep_alpha=True)
+    expected = [int(100 * (1 - 100 / 255) + 200 * 100 / 255), int(100 * (1 - 100 / 255)), int(100 * (1 - 100 / 255))]
+    assert canvas[0, 0, :3].tolist() == expected and canvas[0, 0, 3] == 100
+    assert canvas[0, 3].tolist() == [100, 100, 100, 50]
+
+    raster.plot(canvas, [(3, 1), (9, 9)], [1, 2, 3, 255])
+    assert canvas[1, 3].tolist() == [1, 2, 3, 255]
+
+    raster.add_clamped(canvas, mask, [200, 0, 0])
+    assert canvas[0, 0, 0] == 255
+
+    dst = raster.new_canvas(3, 3)
+    src = np.zeros((2, 2, 4), dtype=np.uint8)
+    src[:] = [255, 0, 0, 255]
+    raster.alpha_composite(dst, src, 2, 2)  # Clipped to the bottom-right pixel
+    assert dst[2, 2].tolist() == [255, 0, 0, 255] and dst[1, 1, 3] == 0
+    print("   ✅ palette_map, blend, plot, add_clamped and alpha_composite")
+
+
+if __name__ == "__main__":
+    test_masks()
+    test_tapered_rows()
+    test_outline_and_dither()
+    test_color_operations()
+    print("\n✅ All raster primitive tests passed!")
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test the per-subsystem seedable RNG streams
+"""
+import sys
+import os
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+
+from game_logic import fight_round
+from gui_combat import CombatGUI
+from rng_service import (RNGService, STREAM_COMBAT, STREAM_ENCOUNTERS, STREAM_QUESTS,
+                         get_stream)
+
+
+def test_same_seed_replays_streams():
+    """Two services with the same seed should produce identical streams"""
+    print("🧪 Testing seeded replay")
+    first = RNGService(seed=2024)
+    second = RNGService(seed=2024)
+
+    for name in (STREAM_COMBAT, STREAM_ENCOUNTERS, STREAM_QUESTS):
+        assert [first.stream(name).random() for _ in range(20)] == \
+               [second.stream(name).random() for _ in range(20)]
+    print("   ✅ Streams replay bit-for-bit")
+
+
+def test_streams_are_independent():
+    """Drawing from one stream must not shift another"""
+    print("🧪 Testing stream independence")
+    busy = RNGService(seed=7)
+    quiet = RNGService(seed=7)
+
+    # Heavy combat use on one service only
+    for _ in range(1000):
+        busy.stream(STREAM_COMBAT).random()
+
+    assert busy.stream(STREAM_QUESTS).random() == quiet.stream(STREAM_QUESTS).random()
+    assert busy.stream(STREAM_COMBAT) is busy.stream(STREAM_COMBAT)
+    assert busy.stream(STREAM_COMBAT).random() != busy.stream(STREAM_ENCOUNTERS).random()
+    print("   ✅ Quest rolls unaffected by combat rolls")
+
+
+def test_state_snapshot_and_reseed():
+    """State snapshots should rewind streams, reseeding should reset them"""
+    service = RNGService(seed=99)
+    combat = service.stream(STREAM_COMBAT)
+    opening = [combat.random() for _ in range(3)]
+
+    state = service.get_state()
+    ahead = [combat.random() for _ in range(5)]
+    service.set_state(state)
+    assert [combat.random() for _ in range(5)] == ahead
+
+    service.reseed(99)
+    assert [combat.random() for _ in range(3)] == opening
+    print("   ✅ Snapshot and reseed restore stream positions")
+
+
+def test_combat_replay_with_injected_stream():
+    """Combat damage and fight rounds should replay from a seeded stream"""
+    print("🧪 Testing combat replay")
+
+    def run_fight(seed):
+        combat = CombatGUI(None, None, None, None, None, None,
+                           rng=RNGService(seed=seed).stream(STREAM_COMBAT))
+        rolls = [combat.calculate_damage(12, 6, 3, 2) for _ in range(10)]
+        hero = {'hp': 30, 'attack': 9, 'defense': 4, 'level': 2}
+        monster = {'hp': 25, 'attack': 8, 'defense': 3, 'level': 2}
+        rounds = []
+        while hero['hp'] > 0 and monster['hp'] > 0:
+            rounds.append(fight_round(hero, monster, combat.rng, gui_rules=True))
+        return rolls, rounds
+
+    assert run_fight(11) == run_fight(11)
+    assert run_fight(11) != run_fight(12)
+    print("   ✅ Same seed, same fight")
+
+
+def test_get_stream_fallback():
+    """Contexts without an RNG service fall back to the random module"""
+    assert get_stream(SimpleNamespace(), STREAM_QUESTS) is random
+    service = RNGService(seed=1)
+    assert get_stream(SimpleNamespace(rng_service=service), STREAM_QUESTS) is service.stream(STREAM_QUESTS)
+    print("   ✅ Fallback to global random for bare contexts")
+
+
+if __name__ == "__main__":
+    test_same_seed_replays_streams()
+    test_streams_are_independent()
+    test_state_snapshot_and_reseed()
+    test_combat_replay_with_injected_stream()
+    test_get_stream_fallback()
+    print("\n✅ All RNG service tests passed!")
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Test the compact binary save format and the autosave journal
+"""
+import sys
+import os
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gui_save_load import SaveLoadManager
+from save_format import (AutosaveJournal, SaveFormatError, decode_save, encode_save,
+                         join_save_sections, read_journal, split_save_sections)
+from yaml_utils import load_yaml_file
+
+
+def _make_hero():
+    return {
+        'name': 'Journal Tester', 'class': 'Magician', 'level': 3, 'xp': 4,
+        'hp': 20, 'maxhp': 25, 'attack': 9, 'defense': 6, 'gold': 120,
+        'items': {'Health Potion': {'data': {'name': 'Health Potion', 'cost': 10}, 'quantity': 2}},
+        'quests': [{'quest_type': 'kill_monster', 'target': 'Goblin', 'description': 'Kill a Goblin',
+                    'reward_xp': 5, 'completed': False, 'status': 'active'}],
+        'completed_quests': ['Slime'],
+    }
+
+
+def _make_manager():
+    gui = SimpleNamespace(current_biome='forest', last_biome='grassland',
+                          game_state=SimpleNamespace(heros={}))
+    manager = SaveLoadManager(gui)
+    manager.saves_dir = Path(tempfile.mkdtemp())
+    return manager
+
+
+def test_binary_save_round_trip():
+    """Binary saves should load like YAML saves and reject corruption"""
+    print("🧪 Testing binary saves")
+    manager = _make_manager()
+    hero = _make_hero()
+    result = manager.save_game(hero, save_name='slot', save_format='binary')
+    assert result['success'] and result['filename'] == 'slot.sav', result
+
+    loaded = manager.load_game(result['path'])
+    assert loaded['success'], loaded
+    assert loaded['hero']['items'] == hero['items']
+    assert loaded['hero']['quests'] == hero['quests']
+    assert loaded['current_biome'] == 'forest'
+
+    yaml_size = len(open(manager.save_game(hero, save_name='slot')['path'], 'rb').read())
+    binary_size = os.path.getsize(result['path'])
+    assert binary_size < yaml_size
+
+    names = sorted(s['filename'] for s in manager.get_available_saves())
+    assert names == ['slot.sav', 'slot.yaml']
+
+    exported = manager.export_save_yaml(result['path'], manager.saves_dir / 'export.yaml')
+    assert load_yaml_file(exported['path'])['hero']['name'] == 'Journal Tester'
+
+    data = bytearray(encode_save({'hero': {'name': 'x'}}))
+    data[-1] ^= 0xFF
+    try:
+        decode_save(bytes(data))
+        assert False, "Corrupt save should be rejected"
+    except SaveFormatError:
+        pass
+    print(f"   ✅ Binary save {binary_size} bytes vs YAML {yaml_size} bytes")
+
+
+def test_sections_round_trip():
+    """Splitting and joining save sections should be lossless"""
+    save_data = {'hero': _make_hero(), 'game_state': {'current_biome': 'desert'}, 'achievements': {'a': 1}}
+    sections = split_save_sections(save_data)
+    assert set(sections) == {'hero', 'items', 'quests', 'game_state', 'achievements'}
+    assert 'items' not in sections['hero']
+    assert join_save_sections(sections) == save_data
+
+
+def test_journal_appends_only_changes():
+    """Autosaves should append small deltas and compact periodically"""
+    print("🧪 Testing autosave journal")
+    path = os.path.join(tempfile.mkdtemp(), 'autosave.journal')
+    journal = AutosaveJournal(path, compact_every=3)
+    save_data = {'hero': _make_hero(), 'game_state': {'current_biome': 'desert'}}
+
+    snapshot_size = journal.write(split_save_sections(save_data))
+    assert snapshot_size > 0
+    assert journal.write(split_save_sections(save_data)) == 0, "Unchanged state writes nothing"
+
+    start = time.perf_counter()
+    delta_sizes = []
+    for fight in range(3):
+        save_data['hero']['xp'] += 1
+        save_data['hero']['gold'] += 10
+        delta_sizes.append(journal.write(split_save_sections(save_data)))
+    elapsed = time.perf_counter() - start
+    assert all(size < snapshot_size for size in delta_sizes)
+    assert join_save_sections(read_journal(path)) == save_data
+
+    # Next write compacts back into a single snapshot
+    save_data['hero']['xp'] += 1
+    size_before = os.path.getsize(path)
+    journal.write(split_save_sections(save_data))
+    assert os.path.getsize(path) < size_before + delta_sizes[0]
+    assert join_save_sections(read_journal(path)) == save_data
+    print(f"   ✅ Snapshot {snapshot_size} bytes, deltas {delta_sizes} bytes, "
+          f"{elapsed / 3 * 1e6:.0f}µs per autosave")
+
+
+def test_journal_survives_torn_write():
+    """A record cut short by a crash should be ignored on load"""
+    path = os.path.join(tempfile.mkdtemp(), 'autosave.journal')
+    journal = AutosaveJournal(path)
+    save_data = {'hero': _make_hero()}
+    journal.write(split_save_sections(save_data))
+    save_data['hero']['gold'] = 999
+    journal.write(split_save_sections(save_data))
+    good = join_save_sections(read_journal(path))
+
+    save_data['hero']['gold'] = 5
+    journal.write(split_save_sections(save_data))
+    with open(path, 'r+b') as f:
+        f.truncate(os.path.getsize(path) - 3)
+    assert join_save_sections(read_journal(path)) == good
+    print("   ✅ Torn journal tail ignored")
+
+
+def test_manager_autosave_is_listed_and_loadable():
+    """The autosave journal should appear on the load screen and load"""
+    manager = _make_manager()
+    hero = _make_hero()
+    assert manager.autosave(hero)['success']
+    hero['gold'] = 500
+    result = manager.autosave(hero)
+    assert 0 < result['bytes'] < 1000
+
+    saves = manager.get_available_saves()
+    assert [s['filename'] for s in saves] == ['autosave.journal']
+    loaded = manager.load_game(saves[0]['path'])
+    assert loaded['success'] and loaded['hero']['gold'] == 500
+    print(f"   ✅ Autosave delta {result['bytes']} bytes, listed and loaded")
+
+
+if __name__ == "__main__":
+    test_binary_save_round_trip()
+    test_sections_round_trip()
+    test_journal_appends_only_changes()
+    test_journal_survives_torn_write()
+    test_manager_autosave_is_listed_and_loadable()
+    print("\n✅ All save format tests passed!")
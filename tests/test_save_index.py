@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test the save-slot metadata index
+"""
+import sys
+import os
+import json
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from gui_save_load import SaveLoadManager
+from yaml_utils import dump_yaml, get_yaml_stats, invalidate_yaml_cache, reset_yaml_stats
+
+
+def _make_manager():
+    manager = SaveLoadManager(SimpleNamespace(current_biome='grassland', last_biome='grassland'))
+    manager.saves_dir = Path(tempfile.mkdtemp())
+    return manager
+
+
+def _write_save(manager, filename, name, level):
+    save_data = {
+        'hero': {'name': name, 'class': 'Warrior', 'level': level},
+        'game_state': {'current_biome': 'desert'},
+        'save_metadata': {'save_date': f"2025-01-01T00:00:{level % 60:02d}"}
+    }
+    with open(manager.saves_dir / filename, 'w', encoding='utf-8') as f:
+        dump_yaml(save_data, f)
+
+
+def test_index_tracks_save_and_delete():
+    """save_game and delete_save should keep the index current"""
+    print("🧪 Testing save index on save/delete")
+    manager = _make_manager()
+    hero = {'name': 'Indexed', 'class': 'Ninja', 'level': 4, 'items': {}, 'quests': []}
+    result = manager.save_game(hero, 'desert', 'slot1')
+    assert result['success'], result
+
+    with open(manager.saves_dir / config.SAVE_INDEX_FILENAME, encoding='utf-8') as f:
+        index = json.load(f)['saves']
+    assert index['slot1.yaml']['hero_name'] == 'Indexed'
+    assert index['slot1.yaml']['current_biome'] == 'desert'
+
+    saves = manager.get_available_saves()
+    assert [(s['hero_name'], s['hero_class'], s['level']) for s in saves] == [('Indexed', 'Ninja', 4)]
+
+    manager.delete_save(result['path'])
+    with open(manager.saves_dir / config.SAVE_INDEX_FILENAME, encoding='utf-8') as f:
+        assert json.load(f)['saves'] == {}
+    assert manager.get_available_saves() == []
+    print("   ✅ Index updated by save and delete")
+
+
+def test_listing_uses_index_and_self_heals():
+    """Unchanged saves are not parsed; outside edits and deletions are picked up"""
+    print("🧪 Testing save listing with 1,000 saves")
+    manager = _make_manager()
+    for i in range(1000):
+        _write_save(manager, f"save_{i:04d}.yaml", f"Hero {i}", i + 1)
+
+    manager.get_available_saves()  # Builds the index
+
+    # Fresh process: nothing cached in memory except the index on disk
+    invalidate_yaml_cache()
+    reset_yaml_stats()
+    start = time.perf_counter()
+    saves = manager.get_available_saves()
+    elapsed = time.perf_counter() - start
+    assert len(saves) == 1000
+    assert get_yaml_stats()['parses'] == 0, "Indexed saves should not be parsed"
+    print(f"   ✅ Listed {len(saves)} saves in {elapsed * 1000:.1f}ms without parsing")
+
+    # Edited outside the game: re-parsed
+    _write_save(manager, "save_0005.yaml", "Renamed Hero", 6)
+    saves = manager.get_available_saves()
+    assert get_yaml_stats()['parses'] == 1
+    assert any(s['hero_name'] == 'Renamed Hero' for s in saves)
+
+    # Deleted outside the game: dropped
+    os.remove(manager.saves_dir / "save_0006.yaml")
+    assert len(manager.get_available_saves()) == 999
+
+    # Corrupt index: rebuilt
+    with open(manager.saves_dir / config.SAVE_INDEX_FILENAME, 'w', encoding='utf-8') as f:
+        f.write("{not json")
+    assert len(manager.get_available_saves()) == 999
+    print("   ✅ Index heals after outside edits, deletions and corruption")
+
+
+if __name__ == "__main__":
+    test_index_tracks_save_and_delete()
+    test_listing_uses_index_and_self_heals()
+    print("\n✅ All save index tests passed!")
@@ -5,7 +5,10 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import shutil
+import tempfile
 import tkinter as tk
+from pathlib import Path
 from gui_main import GameGUI
 
 def test_save_load_art_paths():
@@ -14,6 +17,8 @@ def test_save_load_art_paths():
     
     root = tk.Tk()
     gui = GameGUI(root)
+    # Keep test saves out of the real saves/ directory
+    gui.save_load_manager.saves_dir = Path(tempfile.mkdtemp())
     
     # Wait for initialization to complete
     def run_tests():
@@ -86,11 +91,9 @@ def test_save_load_art_paths():
             assert loaded_hero['level'] == 5, f"Level should be 5, got {loaded_hero['level']}"
             assert loaded_hero['gold'] == 250, f"Gold should be 250, got {loaded_hero['gold']}"
             
-            # Clean up test save file
-            import os
-            if os.path.exists(result['path']):
-                os.remove(result['path'])
-                print(f"\n6. Cleaned up test file: {result['filename']}")
+            # Clean up test save directory
+            shutil.rmtree(gui.save_load_manager.saves_dir, ignore_errors=True)
+            print(f"\n6. Cleaned up test file: {result['filename']}")
             
             print("\n✅ All tests passed! Art paths are correctly preserved through save/load.")
             print("\nThe bug is fixed:")
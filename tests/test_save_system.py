@@ -3,6 +3,9 @@ Quick test of the save/load system
 """
 import sys
 import os
+import shutil
+import tempfile
+from pathlib import Path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from gui_save_load import SaveLoadManager
@@ -21,6 +24,8 @@ def test_save_load_system():
     
     mock_gui = MockGUI()
     save_manager = SaveLoadManager(mock_gui)
+    # Keep test saves out of the real saves/ directory
+    save_manager.saves_dir = Path(tempfile.mkdtemp())
     
     # Create a test hero with some progress
     test_hero = {
@@ -110,6 +115,7 @@ def test_save_load_system():
     print(f"Found {len(available_saves)} save file(s):")
     for save_info in available_saves:
         print(f"   - {save_info['hero_name']} (L{save_info['level']}) - {save_info['filename']}")
+    shutil.rmtree(save_manager.saves_dir, ignore_errors=True)
 
 if __name__ == "__main__":
     test_save_load_system()
\ No newline at end of file
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Test the background save writer
+"""
+import sys
+import os
+import json
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gui_save_load import SaveLoadManager
+from save_writer import SaveWriter
+from fakes import FakeScheduler
+
+
+def _encode(snapshot):
+    return json.dumps(snapshot).encode('utf-8')
+
+
+def test_back_to_back_saves_are_coalesced():
+    """Only the newest snapshot queued behind a running write should be written"""
+    print("🧪 Testing save coalescing")
+    scheduler = FakeScheduler()
+    writer = SaveWriter(scheduler)
+    path = os.path.join(tempfile.mkdtemp(), 'slot.json')
+
+    release = threading.Event()
+    encoded = []
+
+    def slow_encode(snapshot):
+        release.wait(5)
+        encoded.append(snapshot['gold'])
+        return _encode(snapshot)
+
+    results = []
+    writer.submit(path, {'gold': 1}, slow_encode, results.append)
+    time.sleep(0.05)  # Let the worker pick up the first save
+    for gold in (2, 3, 4):
+        writer.submit(path, {'gold': gold}, slow_encode, results.append)
+    release.set()
+
+    assert writer.flush(5)
+    scheduler.pump()
+    assert encoded == [1, 4], f"Expected first and newest writes only, got {encoded}"
+    assert len(results) == 4 and all(r['success'] for r in results)
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f) == {'gold': 4}
+    assert writer.coalesced == 2 and writer.written == 2
+    assert not os.path.exists(path + '.tmp')
+    print(f"   ✅ 4 requests -> {writer.written} writes, all callbacks notified")
+
+
+def test_callbacks_run_on_scheduler():
+    """Completion callbacks must only run from the scheduler (main thread)"""
+    scheduler = FakeScheduler()
+    writer = SaveWriter(scheduler)
+    path = os.path.join(tempfile.mkdtemp(), 'slot.json')
+    calls = []
+    writer.submit(path, {'gold': 1}, _encode, lambda result: calls.append(threading.current_thread()))
+    writer.flush(5)
+    assert calls == [], "Callback ran before the scheduler delivered it"
+    scheduler.pump()
+    assert calls == [threading.current_thread()]
+
+    # Failures are reported, not raised
+    bad_path = os.path.join(tempfile.mkdtemp(), 'missing', 'slot.json')
+    errors = []
+    writer.submit(bad_path, {'gold': 1}, _encode, errors.append)
+    writer.flush(5)
+    scheduler.pump()
+    assert errors and not errors[0]['success']
+    print("   ✅ Callbacks delivered on the scheduler, failures reported")
+
+
+def test_save_game_async():
+    """The save screen path should write a loadable save and index it"""
+    print("🧪 Testing SaveLoadManager.save_game_async")
+    gui = SimpleNamespace(current_biome='desert', last_biome='grassland',
+                          root=FakeScheduler(), game_state=SimpleNamespace(heros={}))
+    manager = SaveLoadManager(gui)
+    manager.saves_dir = Path(tempfile.mkdtemp())
+
+    hero = {'name': 'Async', 'class': 'Ninja', 'level': 2, 'gold': 10, 'items': {}, 'quests': []}
+    results = []
+    manager.save_game_async(hero, save_name='slot', callback=results.append)
+    hero['gold'] = 999  # Changes after the snapshot must not leak into the save
+    assert manager.flush_pending_saves()
+    gui.root.pump()
+
+    assert results and results[0]['success'] and results[0]['filename'] == 'slot.yaml'
+    loaded = manager.load_game(results[0]['path'])
+    assert loaded['hero']['gold'] == 10
+    assert [s['hero_name'] for s in manager.get_available_saves()] == ['Async']
+    print("   ✅ Snapshot saved in the background and indexed")
+
+
+def test_save_game_async_snapshots_nested_data():
+    """Nested lists and dicts changed after the call must not reach the save"""
+    print("🧪 Testing deep save snapshots")
+
+    class Achievements:
+        def __init__(self):
+            self.player_stats = {'monsters_killed': {'Slime': 1}}
+
+        def save_to_dict(self):
+            # Like AchievementManager: a shallow copy sharing the nested dicts
+            return {'player_stats': {**self.player_stats}}
+
+    achievements = Achievements()
+    gui = SimpleNamespace(current_biome='desert', last_biome='grassland', achievements=achievements,
+                          root=FakeScheduler(), game_state=SimpleNamespace(heros={}))
+    manager = SaveLoadManager(gui)
+    manager.saves_dir = Path(tempfile.mkdtemp())
+
+    hero = {'name': 'Deep', 'class': 'Ninja', 'level': 2, 'items': {}, 'quests': [],
+            'completed_quests': ['Kill 3 Slimes']}
+    results = []
+    manager.save_game_async(hero, save_name='slot', callback=results.append)
+    hero['completed_quests'].append('Kill a Dragon')
+    achievements.player_stats['monsters_killed']['Dragon'] = 1
+    assert manager.flush_pending_saves()
+    gui.root.pump()
+
+    saved = manager._read_save_file(results[0]['path'])
+    assert saved['hero']['completed_quests'] == ['Kill 3 Slimes']
+    assert saved['achievements']['player_stats']['monsters_killed'] == {'Slime': 1}
+    print("   ✅ Later quest and kill updates stay out of the saved snapshot")
+
+
+def test_save_screen_locks_buttons_until_written():
+    """Save/Cancel cannot be pressed again while the background write runs"""
+    print("🧪 Testing save screen button lock")
+    events = []
+    choices = []
+    gui = SimpleNamespace(
+        current_biome='desert', last_biome='grassland', root=FakeScheduler(),
+        game_state=SimpleNamespace(heros={}, hero={'name': 'Locky', 'level': 1, 'items': {}, 'quests': []}),
+        clear_text=lambda: None, print_text=lambda text: None, _print_colored_parts=lambda parts: None,
+        set_buttons=lambda labels, callback: choices.append(callback),
+        lock_interface=lambda: events.append('lock'), unlock_interface=lambda: events.append('unlock'),
+        audio=SimpleNamespace(play_sound_effect=lambda name: events.append('sound')),
+        main_menu=lambda: None)
+    manager = SaveLoadManager(gui)
+    manager.saves_dir = Path(tempfile.mkdtemp())
+
+    manager.show_save_interface()
+    choices[-1](1)
+    assert events == ['lock'], "Buttons are locked as soon as saving starts"
+    assert manager.flush_pending_saves()
+    gui.root.pump()
+    assert events == ['lock', 'sound', 'unlock']
+    print("   ✅ Buttons locked from 'Saving...' until the write completed")
+
+
+if __name__ == "__main__":
+    test_back_to_back_saves_are_coalesced()
+    test_callbacks_run_on_scheduler()
+    test_save_game_async()
+    test_save_game_async_snapshots_nested_data()
+    test_save_screen_locks_buttons_until_written()
+    print("\n✅ All save writer tests passed!")
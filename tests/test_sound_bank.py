@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test the sound bank: startup scan, background decoding and the byte budget
+"""
+import sys
+import os
+import shutil
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sound_bank import SoundBank, is_music_file
+
+SOUND_SIZES = {'punch.mp3': 300, 'buzzer.mp3': 200, 'win.wav': 500, 'battle_music.mp3': 900}
+
+
+class FakeSound:
+    def __init__(self, path):
+        self.name = os.path.basename(path)
+        self.size = SOUND_SIZES[self.name]
+
+
+def make_bank(max_bytes=1000):
+    sounds_dir = tempfile.mkdtemp()
+    for name in list(SOUND_SIZES) + ['notes.txt']:
+        open(os.path.join(sounds_dir, name), 'wb').close()
+    decoded = []
+
+    def decoder(path):
+        decoded.append(os.path.basename(path))
+        return FakeSound(path)
+
+    bank = SoundBank(sounds_dir, max_bytes=max_bytes, decoder=decoder, size_of=lambda sound: sound.size)
+    bank.scan()
+    return bank, decoded, sounds_dir
+
+
+def test_scan_and_lookup():
+    """Sounds are indexed once; lookups never touch the file system again"""
+    print("🧪 Testing sound bank scan")
+    bank, decoded, sounds_dir = make_bank()
+    try:
+        assert bank.has('punch.mp3') and not bank.has('notes.txt')
+        assert sorted(bank.effect_names()) == ['buzzer.mp3', 'punch.mp3', 'win.wav']
+        assert is_music_file('battle_music.mp3') and not is_music_file('punch.mp3')
+
+        # Deleting the file after the scan does not matter for a decoded sound
+        first = bank.get('punch.mp3')
+        os.remove(os.path.join(sounds_dir, 'punch.mp3'))
+        assert bank.get('punch.mp3') is first
+        assert decoded == ['punch.mp3']
+        assert bank.get('missing.mp3') is None
+
+        stats = bank.get_stats()
+        assert stats['hits'] == 1 and stats['misses'] == 1 and stats['files'] == 4
+        print(f"   ✅ {stats['files']} files indexed, decoded once")
+    finally:
+        shutil.rmtree(sounds_dir)
+
+
+def test_preload_fills_budget_in_background():
+    """Preloading decodes effects on a thread, skips music and never evicts"""
+    print("🧪 Testing background preload")
+    bank, decoded, sounds_dir = make_bank(max_bytes=600)
+    try:
+        thread = bank.preload()
+        thread.join(5)
+        # buzzer (200) fits, punch (300) fits, win (500) would exceed 600
+        assert bank.contains('buzzer.mp3') and bank.contains('punch.mp3')
+        assert not bank.contains('win.wav') and 'battle_music.mp3' not in decoded
+        assert bank.get_stats()['evictions'] == 0
+        assert bank.preload(['buzzer.mp3', 'punch.mp3']) is None, "Nothing left to load"
+        print(f"   ✅ Preloaded {len(bank)} effects in {bank.current_bytes} bytes")
+    finally:
+        shutil.rmtree(sounds_dir)
+
+
+def test_lru_eviction_by_bytes():
+    """Playing a sound that does not fit evicts the least recently used ones"""
+    print("🧪 Testing byte-budgeted LRU")
+    bank, decoded, sounds_dir = make_bank(max_bytes=800)
+    try:
+        bank.get('punch.mp3')
+        bank.get('buzzer.mp3')
+        bank.get('punch.mp3')  # buzzer is now least recently used
+        bank.get('win.wav')
+        assert bank.current_bytes <= 800
+        assert bank.contains('punch.mp3') and bank.contains('win.wav') and not bank.contains('buzzer.mp3')
+
+        # Too large for the whole budget: returned, never cached
+        assert bank.get('battle_music.mp3').size == 900
+        assert not bank.contains('battle_music.mp3')
+        print(f"   ✅ {bank.get_stats()['evictions']} eviction, {bank.current_bytes} bytes used")
+    finally:
+        shutil.rmtree(sounds_dir)
+
+
+if __name__ == "__main__":
+    test_scan_and_lookup()
+    test_preload_fills_budget_in_background()
+    test_lru_eviction_by_bytes()
+    print("\n✅ All sound bank tests passed!")
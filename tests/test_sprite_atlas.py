@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Test sprite atlas packing and slicing
+"""
+import sys
+import os
+import json
+import shutil
+import tempfile
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+
+import sprite_atlas
+from sprite_atlas import ATLAS_MANIFEST, AtlasStore, build_atlases, pack_rects, sprite_exists
+from resource_utils import get_resource_path, resource_exists
+
+
+def test_pack_rects_no_overlap():
+    """Packed rectangles must stay inside their page and never overlap"""
+    print("🧪 Testing shelf packing")
+    sizes = [(256, 256)] * 70 + [(512, 256), (704, 256), (512, 512), (100, 40)]
+    placements, page_sizes = pack_rects(sizes, 2048)
+
+    boxes = {}
+    for (width, height), (page, x, y) in zip(sizes, placements):
+        assert x + width <= page_sizes[page][0] <= 2048
+        assert y + height <= page_sizes[page][1] <= 2048
+        for other in boxes.get(page, []):
+            ox, oy, ow, oh = other
+            assert x >= ox + ow or ox >= x + width or y >= oy + oh or oy >= y + height, "Overlap"
+        boxes.setdefault(page, []).append((x, y, width, height))
+
+    assert len(page_sizes) == 2
+    print(f"   ✅ {len(sizes)} sprites on {len(page_sizes)} pages: {page_sizes}")
+
+
+def test_pack_rects_rejects_oversized():
+    try:
+        pack_rects([(4096, 10)], 2048)
+        assert False, "Oversized image should be rejected"
+    except ValueError:
+        print("   ✅ Oversized image rejected")
+
+
+def test_atlas_round_trip():
+    """Every sprite cut from the atlas should match its source PNG exactly"""
+    print("🧪 Testing atlas round trip")
+    output_dir = tempfile.mkdtemp()
+    try:
+        manifest = build_atlases(output_dir)
+        art_files = [f for f in os.listdir(get_resource_path('art')) if f.endswith('.png')]
+        assert len(manifest['sprites']) == len(art_files)
+        assert len(manifest['pages']) < len(art_files) // 10
+
+        store = AtlasStore(output_dir)
+        for rel_path in manifest['sprites']:
+            sprite = store.get(rel_path)
+            with Image.open(get_resource_path(rel_path)) as original:
+                original.load()
+                assert sprite.mode == original.mode and sprite.size == original.size, rel_path
+                assert sprite.tobytes() == original.tobytes(), rel_path
+
+        # Each page is decoded once no matter how many sprites are cut from it
+        assert store.page_loads == len(manifest['pages'])
+        assert store.get('art/not_a_sprite.png') is None
+        assert store.contains('art\\ninja.png') == store.contains('art/ninja.png')
+        print(f"   ✅ {len(manifest['sprites'])} sprites from {store.page_loads} decoded pages")
+    finally:
+        shutil.rmtree(output_dir)
+
+
+def test_stale_and_missing_atlas():
+    """Changed sources and missing atlases should fall back to the art files"""
+    print("🧪 Testing atlas fallback")
+    output_dir = tempfile.mkdtemp()
+    try:
+        assert AtlasStore(output_dir).get('art/ninja.png') is None, "No atlas built yet"
+
+        manifest = build_atlases(output_dir)
+        rel_path = next(iter(manifest['sprites']))
+        manifest['sprites'][rel_path]['source'] = [0, 0]
+        with open(os.path.join(output_dir, ATLAS_MANIFEST), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+
+        store = AtlasStore(output_dir)
+        assert not store.contains(rel_path), "Changed source must not be served from the atlas"
+        assert store.get(rel_path) is None
+        other = [path for path in manifest['sprites'] if path != rel_path][0]
+        assert store.get(other) is not None
+        print("   ✅ Stale sprite served from disk, others from the atlas")
+    finally:
+        shutil.rmtree(output_dir)
+
+
+def test_sprite_exists_sees_atlas_only_sprites():
+    """A bundled build ships packed sprites only inside the atlas"""
+    print("🧪 Testing sprite_exists with atlas-only sprites")
+    store = AtlasStore(tempfile.mkdtemp())
+    store._manifest = {'pages': [], 'sprites': {'art/packed_only.png': {}}}
+    previous = sprite_atlas._atlas_store
+    sprite_atlas._atlas_store = store
+    try:
+        assert sprite_exists('art/packed_only.png')
+        assert sprite_exists('art/bandit.png'), "Sprites on disk still count"
+        assert not sprite_exists('art/nowhere.png')
+        assert not resource_exists('art/packed_only.png'), "resource_exists only looks at files"
+    finally:
+        sprite_atlas._atlas_store = previous
+        shutil.rmtree(store.atlas_dir)
+    print("   ✅ Packed sprite reported as existing")
+
+
+def test_manifest_loaded_once_across_threads():
+    """The preloader thread and the Tk thread can both hit the first manifest load"""
+    print("🧪 Testing concurrent manifest loading")
+
+    class CountingStore(AtlasStore):
+        reads = 0
+
+        def _read_manifest(self):
+            CountingStore.reads += 1
+            time.sleep(0.05)  # Keep the first load open while the others arrive
+            return {'pages': [], 'sprites': {'art/packed_only.png': {}}}
+
+    store = CountingStore(tempfile.mkdtemp())
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(store.contains('art/packed_only.png')))
+               for _ in range(8)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        shutil.rmtree(store.atlas_dir)
+
+    assert CountingStore.reads == 1, f"Manifest read {CountingStore.reads} times"
+    assert results == [True] * 8
+    print("   ✅ Manifest read once for 8 threads")
+
+
+if __name__ == "__main__":
+    test_pack_rects_no_overlap()
+    test_pack_rects_rejects_oversized()
+    test_atlas_round_trip()
+    test_stale_and_missing_atlas()
+    test_sprite_exists_sees_atlas_only_sprites()
+    test_manifest_loaded_once_across_threads()
+    print("\n✅ All sprite atlas tests passed!")
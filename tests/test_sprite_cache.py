@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test the decoded sprite cache used by ImageManager.add_canvas_image
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from image_cache import SpriteCache, decode_sprite
+
+
+def _fake_photo(pil_image):
+    """Stand-in for ImageTk.PhotoImage so the test runs without a display"""
+    return pil_image
+
+
+def test_sprite_cache_hits_and_misses():
+    """Repeated lookups for the same path and size should be cache hits"""
+    print("🧪 Testing sprite cache hit/miss counters")
+    cache = SpriteCache(photo_factory=_fake_photo)
+
+    first = cache.get_photo('art/slime_monster.png', 120, 120)
+    second = cache.get_photo('art/slime_monster.png', 120, 120)
+
+    assert first is second, "Second lookup should reuse the cached sprite"
+    assert first.size == (120, 120)
+    stats = cache.get_stats()
+    assert stats['hits'] == 1 and stats['misses'] == 1
+    print(f"   ✅ {stats['hits']} hit, {stats['misses']} miss")
+
+    # A different size is a different cache entry
+    cache.get_photo('art/slime_monster.png', 60, 60)
+    assert cache.get_stats()['misses'] == 2
+    assert cache.contains('art/slime_monster.png', 120, 120)
+    assert cache.contains('art/slime_monster.png', 60, 60)
+    print("   ✅ Sprites are keyed by (path, width, height)")
+
+
+def test_sprite_cache_lru_eviction():
+    """The cache should stay under budget by evicting least recently used sprites"""
+    print("🧪 Testing sprite cache LRU eviction")
+    sprite_bytes = 100 * 100 * 4
+    cache = SpriteCache(max_bytes=sprite_bytes * 2, photo_factory=_fake_photo)
+
+    cache.get_photo('art/slime_monster.png', 100, 100)
+    cache.get_photo('art/goblin_monster.png', 100, 100)
+    # Touch the slime so the goblin becomes least recently used
+    cache.get_photo('art/slime_monster.png', 100, 100)
+    cache.get_photo('art/bunny_monster.png', 100, 100)
+
+    stats = cache.get_stats()
+    assert stats['bytes'] <= stats['max_bytes']
+    assert stats['evictions'] == 1
+    assert cache.contains('art/slime_monster.png', 100, 100)
+    assert not cache.contains('art/goblin_monster.png', 100, 100)
+    assert cache.contains('art/bunny_monster.png', 100, 100)
+    print(f"   ✅ Evicted LRU sprite, {stats['entries']} entries using {stats['bytes']} bytes")
+
+
+def test_decode_sprite_natural_size():
+    """decode_sprite without a size should keep the natural image dimensions"""
+    img = decode_sprite('art/crossed_swords.png')
+    assert img.width > 0 and img.height > 0
+    scaled = decode_sprite('art/crossed_swords.png', 32, 32)
+    assert scaled.size == (32, 32)
+    print("   ✅ decode_sprite handles natural and scaled sizes")
+
+
+if __name__ == "__main__":
+    test_sprite_cache_hits_and_misses()
+    test_sprite_cache_lru_eviction()
+    test_decode_sprite_natural_size()
+    print("\n✅ All sprite cache tests passed!")
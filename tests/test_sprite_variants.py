@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Test runtime sprite variants (elite glow, biome tint, damage flash)
+"""
+import sys
+import os
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+
+import config
+from gui_monster_encounter import MonsterEncounterGUI
+from image_cache import SpriteCache, decode_sprite
+from sprite_variants import apply_variants, monster_sprite_path, split_variant_path, variant_path
+
+
+def _fake_photo(pil_image):
+    """Stand-in for ImageTk.PhotoImage so the test runs without a display"""
+    return pil_image
+
+
+def _dot_sprite():
+    """A 20x20 transparent sprite with an opaque grey square in the middle"""
+    img = Image.new('RGBA', (20, 20), (0, 0, 0, 0))
+    img.paste((100, 100, 100, 255), (8, 8, 12, 12))
+    return img
+
+
+def test_variant_paths():
+    print("🧪 Testing variant paths")
+    path = variant_path('art/slime_monster.png', 'elite')
+    assert path == 'art/slime_monster.png#elite'
+    assert variant_path(path, 'flash') == 'art/slime_monster.png#elite+flash'
+    assert variant_path('art/slime_monster.png') == 'art/slime_monster.png'
+    assert split_variant_path('art/slime_monster.png#elite+tint:desert') == \
+        ('art/slime_monster.png', ('elite', 'tint:desert'))
+    assert split_variant_path('art/slime_monster.png') == ('art/slime_monster.png', ())
+
+    assert monster_sprite_path({'elite': True}, 'art/slime_monster.png') == 'art/slime_monster.png#elite'
+    assert monster_sprite_path({}, 'art/slime_monster.png') == 'art/slime_monster.png'
+    print("   ✅ Variants round-trip through image paths")
+
+
+def test_variant_pixels():
+    """Variants recolor through LUTs and keep the sprite's size"""
+    print("🧪 Testing variant pixels")
+    base = _dot_sprite()
+
+    flash = apply_variants(base, ('flash',))
+    assert flash.size == base.size
+    assert flash.getpixel((10, 10))[0] > 100 and flash.getpixel((10, 10))[3] == 255
+    assert flash.getpixel((0, 0))[3] == 0, "Flash keeps transparency"
+
+    elite = apply_variants(base, ('elite',))
+    assert elite.getpixel((6, 10))[3] > 0, "Glow spreads past the sprite's edge"
+    assert elite.getpixel((0, 0))[3] == 0, "Glow fades before the corners"
+    assert elite.getpixel((10, 10))[3] == 255
+
+    tinted = apply_variants(base, ('tint:desert',))
+    red, green, blue, _ = tinted.getpixel((10, 10))
+    assert red > blue, "Desert tint warms the sprite"
+
+    assert apply_variants(base, ()) is base
+    try:
+        apply_variants(base, ('sparkles',))
+        assert False, "Unknown variants should raise"
+    except ValueError:
+        pass
+    print("   ✅ Flash, elite glow and biome tint")
+
+
+def test_variants_are_cached_separately():
+    """The cache keys variants by (base, variants, size) next to their base sprite"""
+    print("🧪 Testing variant caching")
+    cache = SpriteCache(photo_factory=_fake_photo)
+
+    base = cache.get_photo('art/slime_monster.png', 64, 64)
+    elite = cache.get_photo('art/slime_monster.png#elite', 64, 64)
+    assert elite is not base and elite.size == base.size
+    assert cache.get_photo('art/slime_monster.png#elite', 64, 64) is elite
+    assert cache.contains('art/slime_monster.png#elite', 64, 64)
+    assert SpriteCache.make_key('art/slime_monster.png#elite', 64, 64) == \
+        ('art/slime_monster.png', ('elite',), 64, 64)
+
+    stats = cache.get_stats()
+    assert stats['hits'] == 1 and stats['misses'] == 2 and stats['entries'] == 2
+    assert decode_sprite('art/slime_monster.png#flash', 32, 32).size == (32, 32)
+    print("   ✅ Variant built once, then served from the sprite cache")
+
+
+def test_elite_encounter_shows_glow():
+    """An encounter rolled as elite gets boosted stats and is drawn with the glow"""
+    print("🧪 Testing elite encounters")
+
+    class FixedRoll:
+        """Encounter stream stand-in: first candidate, fixed elite roll"""
+
+        def __init__(self, roll):
+            self.roll = roll
+
+        def choice(self, options):
+            return options[0]
+
+        def random(self):
+            return self.roll
+
+    slime = {'name': 'Slime', 'level': 1, 'biome': 'grassland', 'art': 'art/slime_monster.png',
+             'hp': 10, 'maxhp': 10, 'attack': 4, 'defense': 2}
+    hero = {'name': 'Tester', 'class': 'Warrior', 'level': 1, 'art': 'art/warrior_hero.png'}
+    gui = SimpleNamespace(game_state=SimpleNamespace(monsters={'Slime': slime}, hero=hero),
+                          current_biome='grassland')
+
+    def encounter(roll):
+        encounter_gui = MonsterEncounterGUI(gui)
+        encounter_gui.rng = FixedRoll(roll)
+        encounter_gui._animate_character_entrances = lambda: None
+        _, monster = encounter_gui._select_random_monster()
+        encounter_gui._display_hero_vs_monster_images(hero, monster)
+        return monster, encounter_gui.current_monster_image
+
+    monster, image = encounter(config.ELITE_ENCOUNTER_CHANCE + 0.01)
+    assert not monster.get('elite') and image == 'art/slime_monster.png'
+
+    monster, image = encounter(0.0)
+    assert monster['elite'] and image == 'art/slime_monster.png#elite'
+    assert monster['maxhp'] == int(10 * config.ELITE_STAT_MULTIPLIER)
+    assert monster['attack'] == int(4 * config.ELITE_STAT_MULTIPLIER)
+    assert slime['maxhp'] == 10, "The catalog entry is not modified"
+
+    # The displayed sprite carries the glow where the plain sprite is transparent
+    cache = SpriteCache(photo_factory=_fake_photo)
+    plain = cache.get_photo('art/slime_monster.png', 64, 64)
+    glowing = cache.get_photo(image, 64, 64)
+    halo = [xy for xy in ((x, y) for x in range(64) for y in range(64))
+            if plain.getpixel(xy)[3] == 0 and glowing.getpixel(xy)[3] > 0]
+    assert halo, "Elite sprite should have glow pixels outside the base silhouette"
+    print(f"   ✅ Elite roll boosts stats and adds {len(halo)} glow pixels")
+
+
+if __name__ == "__main__":
+    test_variant_paths()
+    test_variant_pixels()
+    test_variants_are_cached_separately()
+    test_elite_encounter_shows_glow()
+    print("\n✅ All sprite variant tests passed!")
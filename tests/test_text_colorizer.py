@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test the precompiled, cached text colorizer against the original algorithm
+"""
+import sys
+import os
+import random
+import re
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from text_colorizer import COLOR_PATTERNS, DEFAULT_TEXT_COLOR, benchmark, colorize
+
+SAMPLE_LINES = [
+    "⚔️  A wild Goblin King appears!",
+    "💀 Goblin King attacks for 7 damage!",
+    "You hit the monster for 12 damage!",
+    "  hp: 25/40 HP",
+    "Hero HP: 18/30 HP",
+    "⭐ Your hero has reached level 4! ⭐",
+    "📈 Stats improved: HP +5, Attack +2, Defense +2",
+    "💰 Your Gold: 150",
+    "💰 150",
+    "You earned 35 gold and 6 XP",
+    "  xp: 4/10",
+    "  level: 3",
+    "Attack: 14  Defense: 9",
+    "  attack: 14",
+    "  defense: 9",
+    "1. Excalibur - 500 gold (Attack +40)",
+    "Select a save file to load:",
+    "✓ You chose: Shadow Billy Bob!",
+    "🏃 You ran away safely!",
+    "Level 5 Carnivorous Bunny Rabbit",
+    "",
+    "No saved games found.",
+    "💀 You took 5 damage from Goblin King!",
+    "to: 7 HP to Level 2",
+]
+
+# Building blocks for randomized lines: numbers, keywords, names and separators
+FUZZ_TOKENS = ['12', '7', '25/40', '+5', 'HP', 'hp:', 'damage', 'for', 'gold', '💰', '⚔️', 'Level',
+               'level:', 'XP', 'xp:', 'Attack:', 'attack:', 'Defense:', 'defense:', 'Goblin',
+               'King', 'Bunny', 'to', 'the', 'a', 'You', 'hit', '!', '/', ',', '(', ')', '-']
+FUZZ_SEPARATORS = [' ', ' ', '  ', '', ': ']
+
+
+def legacy_process_text_colors(text):
+    """The original GameGUI._process_text_colors algorithm"""
+    all_matches = []
+    for pattern, color in COLOR_PATTERNS:
+        for match in re.finditer(pattern, text, re.IGNORECASE):
+            all_matches.append((match.start(), match.end(), match.group(), color))
+    all_matches.sort()
+
+    filtered_matches = []
+    for start, end, group, color in all_matches:
+        overlap = any(start < prev_end and end > prev_start
+                      for prev_start, prev_end, _, _ in filtered_matches)
+        if not overlap:
+            filtered_matches.append((start, end, group, color))
+
+    result = []
+    last_end = 0
+    for start, end, group, color in filtered_matches:
+        if start > last_end:
+            result.append((text[last_end:start], DEFAULT_TEXT_COLOR))
+        result.append((text[start:end], color))
+        last_end = end
+    if last_end < len(text):
+        result.append((text[last_end:], DEFAULT_TEXT_COLOR))
+    if not result:
+        result.append((text, DEFAULT_TEXT_COLOR))
+    return result
+
+
+def test_matches_legacy_output():
+    """Game lines should be colored exactly as before"""
+    print("🧪 Testing colorizer against the legacy algorithm")
+    for line in SAMPLE_LINES:
+        assert list(colorize(line)) == legacy_process_text_colors(line), f"Mismatch for {line!r}"
+    print(f"   ✅ {len(SAMPLE_LINES)} lines match")
+
+
+def test_randomized_lines_match_legacy():
+    """Randomly assembled lines should be colored exactly as before"""
+    print("🧪 Testing colorizer on randomized lines")
+    rng = random.Random(2024)
+    count = 20000
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(1, 10)):
+            parts.append(rng.choice(FUZZ_TOKENS))
+            parts.append(rng.choice(FUZZ_SEPARATORS))
+        line = ''.join(parts)
+        assert list(colorize.__wrapped__(line)) == legacy_process_text_colors(line), f"Mismatch for {line!r}"
+    print(f"   ✅ {count} random lines match")
+
+
+def test_segments_cover_text():
+    """Segments must reassemble to the original line"""
+    for line in SAMPLE_LINES:
+        assert ''.join(part for part, _ in colorize(line)) == line
+    assert colorize("hp: 25/40 HP") is colorize("hp: 25/40 HP"), "Repeated lines should hit the cache"
+
+
+def test_benchmark_faster_than_legacy():
+    """The precompiled colorizer should beat the original, even uncached"""
+    print("🧪 Benchmarking colorizer")
+    repeat = 200
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for line in SAMPLE_LINES:
+            legacy_process_text_colors(line)
+    legacy_us = (time.perf_counter() - start) / (repeat * len(SAMPLE_LINES)) * 1e6
+
+    results = benchmark(SAMPLE_LINES, repeat=repeat)
+    assert results['uncached_us'] < legacy_us
+    assert results['cached_us'] < results['uncached_us']
+    print(f"   ✅ legacy {legacy_us:.1f}µs, uncached {results['uncached_us']:.1f}µs, "
+          f"cached {results['cached_us']:.2f}µs per line")
+
+
+if __name__ == "__main__":
+    test_matches_legacy_output()
+    test_randomized_lines_match_legacy()
+    test_segments_cover_text()
+    test_benchmark_faster_than_legacy()
+    print("\n✅ All text colorizer tests passed!")
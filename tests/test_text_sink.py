@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Test the buffered text sink used by print_text
+"""
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gui_text_sink import TextSink
+from fakes import FakeScheduler
+
+
+class FakeText:
+    """Records the Text widget calls the sink makes"""
+
+    def __init__(self):
+        self.content = []     # (text, tags) in insertion order
+        self.inserts = 0
+        self.tag_configs = []
+        self.state = 'disabled'
+
+    def tag_config(self, tag_name, **options):
+        self.tag_configs.append((tag_name, options))
+
+    def insert(self, index, *args):
+        self.inserts += 1
+        assert self.state == 'normal', "Text area must be writable during insert"
+        for text, tags in zip(args[::2], args[1::2]):
+            self.content.append((text, tags))
+
+    def index(self, index):
+        assert index == 'end-1c'
+        return f"{self.get_text().count(chr(10)) + 1}.0"
+
+    def delete(self, start, end):
+        if end == 'end':
+            self.content = []
+            return
+        # Delete whole lines: '1.0' up to 'N.0'
+        lines_to_delete = int(end.split('.')[0]) - 1
+        remaining = []
+        for text, tags in self.content:
+            while lines_to_delete and '\n' in text:
+                text = text[text.index('\n') + 1:]
+                lines_to_delete -= 1
+            if lines_to_delete:
+                continue
+            if text:
+                remaining.append((text, tags))
+        self.content = remaining
+
+    def see(self, index):
+        pass
+
+    def config(self, state=None):
+        self.state = state
+
+    def get_text(self):
+        return ''.join(text for text, _ in self.content)
+
+
+def test_screen_is_one_insert():
+    """A screen of many lines should reach the widget in one insert"""
+    print("🧪 Testing batched text insert")
+    text_area = FakeText()
+    scheduler = FakeScheduler()
+    sink = TextSink(text_area, scheduler)
+
+    for i in range(40):
+        sink.write_line([(f"Line {i}: ", '#00ff00'), (f"{i} gold", '#ffd700')])
+    assert text_area.inserts == 0, "Nothing should be inserted before idle"
+    assert len(scheduler.idle) == 1, "Only one idle flush should be scheduled"
+
+    scheduler.run_idle()
+    assert text_area.inserts == 1
+    assert text_area.state == 'disabled'
+    assert text_area.get_text().splitlines()[3] == "Line 3: 3 gold"
+    assert ("3 gold", ('color_ffd700',)) in text_area.content
+    assert len(text_area.tag_configs) == 2, "Each color tag is configured once"
+    print(f"   ✅ 40 lines -> {text_area.inserts} insert, {len(text_area.tag_configs)} tag configs")
+
+
+def test_flush_and_clear():
+    """Explicit flushes keep order; clear drops buffered text"""
+    text_area = FakeText()
+    scheduler = FakeScheduler()
+    sink = TextSink(text_area, scheduler)
+
+    sink.write_line([("first", '#00ff00')])
+    sink.flush()
+    assert text_area.get_text() == "first\n"
+    sink.write_line([("second", '#00ff00'), ("", '#ff0000')])
+    scheduler.run_idle()
+    assert text_area.get_text() == "first\nsecond\n"
+    assert len(text_area.tag_configs) == 1, "Empty segments don't create tags"
+
+    sink.write_line([("stale", '#00ff00')])
+    sink.clear()
+    sink.write_line([("fresh", '#00ff00')])
+    scheduler.run_idle()
+    assert text_area.get_text() == "fresh\n"
+    assert not sink.has_pending()
+    print("   ✅ Flush keeps order, clear drops stale lines")
+
+
+def test_scrollback_trimmed_in_batches():
+    """Old lines should be trimmed in batches down to the limit"""
+    print("🧪 Testing scrollback limit")
+    text_area = FakeText()
+    scheduler = FakeScheduler()
+    transcript_path = os.path.join(tempfile.mkdtemp(), 'transcript.txt')
+    sink = TextSink(text_area, scheduler, max_lines=100, trim_batch=20, transcript_path=transcript_path)
+
+    for i in range(120):
+        sink.write_line([(f"Round {i}: ", '#00ff00'), (f"{i} damage", '#ff8800')])
+        sink.flush()
+    assert sink.trimmed_lines == 0, "Nothing trimmed until the batch is exceeded"
+
+    for i in range(120, 125):
+        sink.write_line([(f"Round {i}: ", '#00ff00'), (f"{i} damage", '#ff8800')])
+        sink.flush()
+    lines = text_area.get_text().splitlines()
+    assert sink.trimmed_lines == 21, sink.trimmed_lines
+    assert len(lines) == 104
+    assert lines[0] == "Round 21: 21 damage" and lines[-1] == "Round 124: 124 damage"
+    assert ("124 damage", ('color_ff8800',)) in text_area.content, "Tags survive on remaining lines"
+
+    sink.close()
+    with open(transcript_path, encoding='utf-8') as f:
+        transcript = f.read().splitlines()
+    assert len(transcript) == 125 and transcript[0] == "Round 0: 0 damage"
+    print(f"   ✅ {sink.trimmed_lines} lines trimmed, transcript kept all {len(transcript)}")
+
+
+if __name__ == "__main__":
+    test_screen_is_one_insert()
+    test_flush_and_clear()
+    test_scrollback_trimmed_in_batches()
+    print("\n✅ All text sink tests passed!")
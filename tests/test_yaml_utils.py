@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test the shared YAML access layer and its parse cache
+"""
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import yaml
+
+import yaml_utils
+from yaml_utils import dump_yaml, get_yaml_stats, load_yaml_file, reset_yaml_stats
+
+
+def _write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def test_cache_hits_until_file_changes():
+    """Unchanged files should be parsed once; edits should be picked up"""
+    print("🧪 Testing YAML parse cache")
+    path = os.path.join(tempfile.mkdtemp(), 'menu.yaml')
+    _write(path, "Drinks:\n  - name: Beer\n    cost: 10\n")
+    reset_yaml_stats()
+
+    first = load_yaml_file(path)
+    second = load_yaml_file(path)
+    assert first == second == {'Drinks': [{'name': 'Beer', 'cost': 10}]}
+    stats = get_yaml_stats()
+    assert stats['parses'] == 1 and stats['cache_hits'] == 1
+
+    # Callers get their own copy by default
+    first['Drinks'].clear()
+    assert load_yaml_file(path)['Drinks'], "Cached data must not be modified through a copy"
+
+    _write(path, "Drinks:\n  - name: Mead\n    cost: 25\n")
+    assert load_yaml_file(path)['Drinks'][0]['name'] == 'Mead'
+    assert get_yaml_stats()['parses'] == 2
+    print(f"   ✅ {get_yaml_stats()}")
+
+
+def test_legacy_python_tags():
+    """Python tags should only load when explicitly allowed"""
+    path = os.path.join(tempfile.mkdtemp(), 'legacy.yaml')
+    _write(path, "biome: !!python/tuple [grassland, desert]\n")
+    try:
+        load_yaml_file(path)
+        assert False, "Safe loader should reject python tags"
+    except yaml.constructor.ConstructorError:
+        pass
+    assert load_yaml_file(path, allow_python_tags=True) == {'biome': ('grassland', 'desert')}
+    print("   ✅ Legacy saves load with allow_python_tags")
+
+
+def test_dump_round_trip():
+    """Dumped YAML should load back to the same data"""
+    data = {'hero': {'name': 'Tester', 'items': {}, 'quests': []}, 'gold': 50}
+    text = dump_yaml(data, default_flow_style=False, allow_unicode=True, indent=2)
+    assert yaml.safe_load(text) == data
+
+    class Opaque:
+        pass
+    # Objects the safe dumper cannot represent still get written
+    assert 'Opaque' in dump_yaml({'thing': Opaque()})
+    print(f"   ✅ Round trip ok (libyaml: {yaml_utils.HAS_LIBYAML})")
+
+
+if __name__ == "__main__":
+    test_cache_hits_until_file_changes()
+    test_legacy_python_tags()
+    test_dump_round_trip()
+    print("\n✅ All YAML utility tests passed!")
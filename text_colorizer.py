@@ -0,0 +1,142 @@
+"""
+Text colorizer for the game's text area.
+
+Colors numbers and names in printed lines (HP, damage, gold, levels, XP,
+stats, character names). Every pattern is scanned independently, and overlaps
+are resolved exactly like the original GameGUI._process_text_colors: the
+match that starts first wins, then the shortest one. Patterns are compiled
+at import time, lines without digits skip the numeric patterns, and results
+are memoized in a bounded LRU cache because menus and status lines repeat
+constantly.
+
+Run this module to benchmark it:
+    python text_colorizer.py
+"""
+import re
+import time
+from functools import lru_cache
+
+import config
+
+# Color for text that matches no pattern
+DEFAULT_TEXT_COLOR = '#00ff00'
+
+# (pattern, color) in priority order; every pattern is case-insensitive
+COLOR_PATTERNS = [
+    # Health and HP related
+    (r'\b(\d+)\s*HP\b', config.COLOR_HP),
+    (r'\bhp:\s*(\d+)', config.COLOR_HP),
+    (r'\b(\d+)/(\d+)\s*HP\b', config.COLOR_HP),
+
+    # Damage numbers
+    (r'\b(\d+)\s*damage\b', config.COLOR_DAMAGE),
+    (r'\bfor\s+(\d+)\s+damage', config.COLOR_DAMAGE),
+
+    # Gold and currency
+    (r'💰\s*(\d+)', config.COLOR_GOLD),
+    (r'\b(\d+)\s*gold\b', config.COLOR_GOLD),
+
+    # Experience and levels
+    (r'\bLevel\s*(\d+)', config.COLOR_LEVEL),
+    (r'\blevel:\s*(\d+)', config.COLOR_LEVEL),
+    (r'\b(\d+)\s*XP\b', config.COLOR_XP),
+    (r'\bxp:\s*(\d+)', config.COLOR_XP),
+
+    # Attack and Defense stats
+    (r'\bAttack:\s*(\d+)', config.COLOR_ATTACK),
+    (r'\battack:\s*(\d+)', config.COLOR_ATTACK),
+    (r'\bDefense:\s*(\d+)', config.COLOR_DEFENSE),
+    (r'\bdefense:\s*(\d+)', config.COLOR_DEFENSE),
+
+    # Names and important identifiers
+    (r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\b', '#ffaa00'),  # Orange for character names (2+ words)
+    (r'⚔️\s*([^!]+)!', '#ffaa00'),  # Orange for monster names in encounters
+]
+
+# Compiled patterns, each with a flag for whether it can only match a line containing a digit
+_COMPILED_PATTERNS = [(re.compile(pattern, re.IGNORECASE), color, r'\d' in pattern)
+                      for pattern, color in COLOR_PATTERNS]
+_DIGIT = re.compile(r'\d')
+
+
+@lru_cache(maxsize=config.TEXT_COLOR_CACHE_SIZE)
+def colorize(text):
+    """Split a line into colored segments
+
+    Args:
+        text: Line to colorize
+
+    Returns:
+        Tuple of (text, color) tuples covering the whole line
+    """
+    has_digit = _DIGIT.search(text) is not None
+    matches = []
+    for regex, color, needs_digit in _COMPILED_PATTERNS:
+        if needs_digit and not has_digit:
+            continue
+        for match in regex.finditer(text):
+            matches.append((match.start(), match.end(), match.group(), color))
+    # Earliest start first, then shortest; ties fall back to the text and color like the original
+    matches.sort()
+
+    result = []
+    last_end = 0
+    for start, end, group, color in matches:
+        # Accepted matches are disjoint and sorted, so this is the only overlap to check
+        if start < last_end:
+            continue
+        # Add text before match with default color
+        if start > last_end:
+            result.append((text[last_end:start], DEFAULT_TEXT_COLOR))
+        result.append((group, color))
+        last_end = end
+
+    # Add remaining text with default color
+    if last_end < len(text) or not result:
+        result.append((text[last_end:], DEFAULT_TEXT_COLOR))
+    return tuple(result)
+
+
+def benchmark(lines=None, repeat=2000):
+    """Time colorize() on uncached and cached lines
+
+    Args:
+        lines: Sample lines (default: typical menu, combat and shop lines)
+        repeat: Passes over the sample lines
+
+    Returns:
+        Dict with microseconds per line for uncached and cached calls
+    """
+    lines = lines or [
+        "⚔️  A wild Goblin King appears!",
+        "💀 Goblin King attacks for 7 damage!",
+        "You hit the monster for 12 damage!",
+        "  hp: 25/40 HP",
+        "⭐ Your hero has reached level 4! ⭐",
+        "💰 Your Gold: 150",
+        "You earned 35 gold and 6 XP",
+        "Attack: 14  Defense: 9",
+        "1. Excalibur - 500 gold (Attack +40)",
+        "Select a save file to load:",
+    ]
+
+    colorize.cache_clear()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for line in lines:
+            colorize.__wrapped__(line)
+    uncached = (time.perf_counter() - start) / (repeat * len(lines))
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for line in lines:
+            colorize(line)
+    cached = (time.perf_counter() - start) / (repeat * len(lines))
+
+    return {'uncached_us': uncached * 1e6, 'cached_us': cached * 1e6}
+
+
+if __name__ == "__main__":
+    results = benchmark()
+    print(f"colorize: {results['uncached_us']:.2f}µs/line uncached, "
+          f"{results['cached_us']:.2f}µs/line cached")
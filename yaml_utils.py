@@ -0,0 +1,169 @@
+"""
+Shared YAML access layer for the Monster Game.
+
+Uses the libyaml C loader and dumper when PyYAML was built with them (they
+are several times faster than the pure-Python versions), and keeps a
+process-wide parse cache keyed on (path, mtime, size), so re-opening the
+shop or tavern, or re-listing saves, does not parse unchanged files again.
+Parse counts and timings are available through get_yaml_stats().
+"""
+import copy
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import yaml
+
+import config
+from logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Prefer the libyaml bindings, fall back to pure Python
+SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+SafeDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+# Only for legacy saves that contain python/object tags (e.g. BiomeType enums)
+LegacyLoader = getattr(yaml, 'CLoader', yaml.Loader)
+LegacyDumper = getattr(yaml, 'CDumper', yaml.Dumper)
+
+HAS_LIBYAML = SafeLoader is not yaml.SafeLoader
+
+
+class _YAMLCache:
+    """LRU of parsed YAML documents keyed by absolute path"""
+
+    def __init__(self, max_files):
+        self.max_files = max_files
+        self._entries = OrderedDict()  # path -> ((mtime_ns, size), data)
+        self._lock = threading.Lock()
+        self.parses = 0
+        self.hits = 0
+        self.parse_time = 0.0
+
+    def get(self, path, signature):
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[0] != signature:
+                return None, False
+            self._entries.move_to_end(path)
+            self.hits += 1
+            return entry[1], True
+
+    def put(self, path, signature, data, elapsed):
+        with self._lock:
+            self.parses += 1
+            self.parse_time += elapsed
+            self._entries[path] = (signature, data)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_files:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path=None):
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+    def reset_stats(self):
+        with self._lock:
+            self.parses = 0
+            self.hits = 0
+            self.parse_time = 0.0
+
+
+_cache = _YAMLCache(config.YAML_CACHE_MAX_FILES)
+
+
+def load_yaml_file(path, allow_python_tags=False, copy_result=True):
+    """Load a YAML file through the parse cache
+
+    Args:
+        path: File path (str or Path)
+        allow_python_tags: Retry with the full loader if the safe loader
+            rejects python/object tags (legacy saves only)
+        copy_result: Return a deep copy so the caller may modify it. Read-only
+            callers can pass False to skip the copy.
+
+    Returns:
+        Parsed YAML data
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file cannot be parsed
+    """
+    path = os.path.abspath(os.fspath(path))
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    data, hit = _cache.get(path, signature)
+    if not hit:
+        start = time.perf_counter()
+        with open(path, 'r', encoding='utf-8') as fh:
+            text = fh.read()
+        try:
+            data = yaml.load(text, Loader=SafeLoader)
+        except yaml.constructor.ConstructorError:
+            if not allow_python_tags:
+                raise
+            logger.debug(f"Loading {path} with the legacy loader (python tags)")
+            data = yaml.load(text, Loader=LegacyLoader)
+        elapsed = time.perf_counter() - start
+        _cache.put(path, signature, data, elapsed)
+        logger.debug(f"Parsed {path} in {elapsed * 1000:.1f}ms")
+
+    return copy.deepcopy(data) if copy_result else data
+
+
+def dump_yaml(data, stream=None, **kwargs):
+    """Dump data as YAML with the fast safe dumper
+
+    Falls back to the full dumper (with a warning) if the data holds objects
+    the safe dumper cannot represent, so a save is never lost.
+
+    Args:
+        data: Data to dump
+        stream: Open text file to write to (default: return a string)
+        **kwargs: Passed to yaml.dump (e.g. default_flow_style, indent)
+
+    Returns:
+        YAML string if no stream was given, otherwise None
+    """
+    try:
+        text = yaml.dump(data, Dumper=SafeDumper, **kwargs)
+    except yaml.representer.RepresenterError as e:
+        logger.warning(f"Data is not plain YAML, using the full dumper: {e}")
+        text = yaml.dump(data, Dumper=LegacyDumper, **kwargs)
+    if stream is None:
+        return text
+    stream.write(text)
+    return None
+
+
+def invalidate_yaml_cache(path=None):
+    """Drop one file (or every file) from the parse cache"""
+    _cache.invalidate(os.path.abspath(os.fspath(path)) if path is not None else None)
+
+
+def get_yaml_stats():
+    """Get parse cache metrics
+
+    Returns:
+        Dict with parses, cache hits, total/average parse time and whether
+        libyaml is in use
+    """
+    parses = _cache.parses
+    return {
+        'libyaml': HAS_LIBYAML,
+        'parses': parses,
+        'cache_hits': _cache.hits,
+        'cached_files': len(_cache._entries),
+        'parse_time_ms': _cache.parse_time * 1000,
+        'avg_parse_ms': (_cache.parse_time * 1000 / parses) if parses else 0.0,
+    }
+
+
+def reset_yaml_stats():
+    """Reset the parse counters (cached documents are kept)"""
+    _cache.reset_stats()